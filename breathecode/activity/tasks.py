@@ -0,0 +1,28 @@
+from celery import shared_task, Task
+from django.utils.dateparse import parse_datetime
+from breathecode.utils import getLogger
+
+logger = getLogger(__name__)
+
+
+class BaseTaskWithRetry(Task):
+    autoretry_for = (Exception, )
+    #                                           seconds
+    retry_kwargs = {'max_retries': 5, 'countdown': 60 * 5}
+    retry_backoff = True
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def save_student_activities(self, activities, ids=None):
+    from breathecode.services import Datastore
+    from .views import ACTIVITY_WRITE_CHUNK_SIZE
+
+    logger.debug(f'Starting save_student_activities with {len(activities)} activities')
+
+    for activity in activities:
+        activity['created_at'] = parse_datetime(activity['created_at'])
+
+    datastore = Datastore()
+
+    # the ids were allocated before, so a retry overwrites the chunks that were saved
+    datastore.update_multi('student_activity', activities, chunk_size=ACTIVITY_WRITE_CHUNK_SIZE, ids=ids)
@@ -5,6 +5,7 @@ from django.utils import timezone
 from datetime import timedelta
 from unittest.mock import MagicMock, call, patch
 
+from django.contrib.auth.models import User
 from django.urls.base import reverse_lazy
 from rest_framework import status
 
@@ -337,6 +338,67 @@ class MediaTestSuite(MediaTestCase):
                              cohort='miami-downtown-pt-xx',
                          )])
 
+    """
+    🔽🔽🔽 With cursor
+    """
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'fetch_page', new=MagicMock(return_value=(generate_data(5), 'next-cursor')))
+    @patch.object(Datastore, 'fetch', new=MagicMock())
+    @patch.object(Datastore, 'count', new=MagicMock())
+    def test_get_activities_with_cursor(self):
+        from breathecode.services.google_cloud import Datastore as mock
+
+        self.headers(academy=1)
+        cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
+        self.generate_models(authenticate=True,
+                             profile_academy=True,
+                             capability='classroom_activity',
+                             role='potato',
+                             cohort_kwargs=cohort_kwargs)
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1}) + '?limit=5&cursor=potato'
+        response = self.client.get(url)
+
+        json = response.json()
+        for r in json['results']:
+            del r['created_at']
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json, {
+                'count':
+                None,
+                'first':
+                'http://testserver/v1/activity/academy/cohort/1?cursor=&limit=5',
+                'next':
+                'http://testserver/v1/activity/academy/cohort/1?cursor=next-cursor&limit=5',
+                'previous':
+                None,
+                'last':
+                None,
+                'results': [{
+                    'academy_id': 0,
+                    'cohort': None,
+                    'data': None,
+                    'day': 13,
+                    'email': 'konan@naruto.io',
+                    'slug': 'breathecode_login',
+                    'user_agent': 'bc/test',
+                    'user_id': 1
+                } for _ in range(0, 5)]
+            })
+
+        self.assertEqual(mock.fetch_page.call_args_list, [
+            call(order_by=['-created_at'],
+                 cursor='potato',
+                 limit=5,
+                 kind='student_activity',
+                 cohort='miami-downtown-pt-xx'),
+        ])
+        self.assertEqual(mock.fetch.call_args_list, [])
+        self.assertEqual(mock.count.call_args_list, [])
+
     """
     🔽🔽🔽 Without cohort
     """
@@ -481,3 +543,161 @@ class MediaTestSuite(MediaTestCase):
         json = response.json()
         self.assertEqual(json, {'detail': 'user-not-exists', 'status_code': 400})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    """
+    🔽🔽🔽 Post many activities
+    """
+
+    def __generate_classroom__(self, students):
+        self.headers(academy=1)
+        cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
+        model = self.generate_models(authenticate=True,
+                                     profile_academy=True,
+                                     capability='classroom_activity',
+                                     role='potato',
+                                     cohort=True,
+                                     cohort_user=True,
+                                     cohort_kwargs=cohort_kwargs,
+                                     cohort_user_kwargs={'role': 'TEACHER'})
+
+        cohort_users = [{'user_id': n + 2, 'cohort_id': 1, 'role': 'STUDENT'} for n in range(0, students)]
+        self.bc.database.create(user=students, cohort_user=cohort_users)
+
+        return model
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update', new=MagicMock())
+    @patch.object(Datastore, 'update_multi', new=MagicMock())
+    def test_post_activities__one_write_for_all_the_students(self):
+        from breathecode.services.google_cloud import Datastore as mock
+
+        self.__generate_classroom__(students=3)
+        activity = {
+            'slug': 'classroom_attendance',
+            'user_agent': 'bc/test',
+            'cohort': 'miami-downtown-pt-xx',
+            'data': '{"day": "13"}',
+        }
+        data = [{**activity, 'user_id': n} for n in range(2, 5)]
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+
+        response = self.client.post(url, data, format='json')
+
+        json = response.json()
+        for r in json:
+            self.assertDatetime(r['created_at'])
+            del r['created_at']
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(json, [{
+            **activity,
+            'academy_id': 1,
+            'email': user.email,
+            'user_id': user.id,
+        } for user in User.objects.filter(id__in=[2, 3, 4])])
+
+        self.assertEqual(mock.update.call_args_list, [])
+        self.assertEqual(len(mock.update_multi.call_args_list), 1)
+
+        args, kwargs = mock.update_multi.call_args_list[0]
+        self.assertEqual(args[0], 'student_activity')
+        self.assertEqual([x['user_id'] for x in args[1]], [2, 3, 4])
+        self.assertEqual(kwargs, {'chunk_size': 500})
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update_multi', new=MagicMock())
+    def test_post_activities__queries_do_not_grow_with_the_students(self):
+        self.__generate_classroom__(students=2)
+        activity = {
+            'slug': 'classroom_attendance',
+            'user_agent': 'bc/test',
+            'cohort': 'miami-downtown-pt-xx',
+            'data': '{"day": "13"}',
+        }
+        data = [{**activity, 'user_id': n} for n in range(2, 4)]
+
+        def grow():
+            cohort_users = [{'user_id': n, 'cohort_id': 1, 'role': 'STUDENT'} for n in range(4, 14)]
+            self.bc.database.create(user=10, cohort_user=cohort_users)
+            data.extend([{**activity, 'user_id': n} for n in range(4, 14)])
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+
+        # the view removes the user_id of the payload
+        self.bc.check.constant_queries(lambda: self.client.post(url, [{
+            **x
+        } for x in data], format='json'), grow)
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'allocate_ids', new=MagicMock(return_value=[10, 11]))
+    @patch.object(Datastore, 'update_multi', new=MagicMock())
+    @patch('breathecode.activity.views.ACTIVITY_ASYNC_WRITES', True)
+    def test_post_activities__async_writes(self):
+        from breathecode.services.google_cloud import Datastore as mock
+
+        self.__generate_classroom__(students=2)
+        activity = {'slug': 'breathecode_login', 'user_agent': 'bc/test'}
+        data = [{**activity, 'user_id': n} for n in range(2, 4)]
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mock.update_multi.call_args_list), 1)
+
+        args, kwargs = mock.update_multi.call_args_list[0]
+        self.assertEqual([x['user_id'] for x in args[1]], [2, 3])
+        self.assertEqual([self.bc.datetime.to_iso_string(x['created_at']) for x in args[1]],
+                         [x['created_at'] for x in response.json()])
+
+        # the keys are allocated before the task, so its retries do not duplicate the activities
+        self.assertEqual(kwargs, {'chunk_size': 500, 'ids': [10, 11]})
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update_multi', new=MagicMock())
+    def test_post_activities__student_not_found(self):
+        from breathecode.services.google_cloud import Datastore as mock
+
+        self.__generate_classroom__(students=1)
+        activity = {'slug': 'breathecode_login', 'user_agent': 'bc/test'}
+        data = [{**activity, 'user_id': 2}, {**activity, 'user_id': 300}]
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.json(), {'detail': 'not-found-in-cohort', 'status_code': 400})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(mock.update_multi.call_args_list, [])
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update_multi', new=MagicMock())
+    def test_post_activities__user_id_as_string(self):
+        from breathecode.services.google_cloud import Datastore as mock
+
+        self.__generate_classroom__(students=2)
+        activity = {'slug': 'breathecode_login', 'user_agent': 'bc/test'}
+        data = [{**activity, 'user_id': '2'}, {**activity, 'user_id': 3}]
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([x['user_id'] for x in response.json()], [2, 3])
+        self.assertEqual(len(mock.update_multi.call_args_list), 1)
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'update_multi', new=MagicMock())
+    def test_post_activities__bad_user_id(self):
+        from breathecode.services.google_cloud import Datastore as mock
+
+        self.__generate_classroom__(students=1)
+        activity = {'slug': 'breathecode_login', 'user_agent': 'bc/test'}
+        data = [{**activity, 'user_id': 2}, {**activity, 'user_id': 'potato'}]
+
+        url = reverse_lazy('activity:academy_cohort_id', kwargs={'cohort_id': 1})
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.json(), {'detail': 'bad-user-id', 'status_code': 400})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(mock.update_multi.call_args_list, [])
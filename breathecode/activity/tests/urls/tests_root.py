@@ -39,8 +39,29 @@ DATASTORE_PRIVATE_SEED = [
     },
 ]
 
+DATASTORE_SORTED_PRIVATE_SEED = [
+    {
+        'slug': 'academy',
+        'created_at': '2021-01-05'
+    },
+    {
+        'slug': 'academy',
+        'created_at': '2021-01-02'
+    },
+]
+DATASTORE_SORTED_SHARED_SEED = [
+    {
+        'slug': 'public',
+        'created_at': '2021-01-04'
+    },
+    {
+        'slug': 'public',
+        'created_at': '2021-01-01'
+    },
+]
+
 
-def datastore_fetch_mock(first_fetch=[], second_fetch=[]):
+def datastore_iterate_mock(first_fetch=[], second_fetch=[]):
     class Vars():
         fetch_call_counter = 0
         fetch_call_one = first_fetch
@@ -107,10 +128,10 @@ class MediaTestSuite(MediaTestCase):
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__without_data(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -126,9 +147,9 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', academy_id=1),
-            call(kind='student_activity', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=1),
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=0),
         ])
 
     """
@@ -137,11 +158,11 @@ class MediaTestSuite(MediaTestCase):
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
     @patch.object(Datastore,
-                  'fetch',
-                  new=datastore_fetch_mock(first_fetch=[], second_fetch=DATASTORE_SHARED_SEED))
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=[], second_fetch=DATASTORE_SHARED_SEED))
     def test_type__just_have_public_activities(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -169,18 +190,18 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', academy_id=1),
-            call(kind='student_activity', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=1),
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=0),
         ])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
     @patch.object(Datastore,
-                  'fetch',
-                  new=datastore_fetch_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
     def test_type__just_have_activities_from_current_academy(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -208,19 +229,19 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', academy_id=1),
-            call(kind='student_activity', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=1),
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=0),
         ])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
     @patch.object(Datastore,
-                  'fetch',
-                  new=datastore_fetch_mock(first_fetch=DATASTORE_PRIVATE_SEED,
-                                           second_fetch=DATASTORE_SHARED_SEED))
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=DATASTORE_PRIVATE_SEED,
+                                             second_fetch=DATASTORE_SHARED_SEED))
     def test_type__have_activities_public_and_from_current_academy(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -259,9 +280,9 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', academy_id=1),
-            call(kind='student_activity', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=1),
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', academy_id=0),
         ])
 
     """
@@ -269,10 +290,60 @@ class MediaTestSuite(MediaTestCase):
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore,
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=DATASTORE_SORTED_PRIVATE_SEED,
+                                             second_fetch=DATASTORE_SORTED_SHARED_SEED))
+    def test_type__activities_are_merged_by_date__with_limit(self):
+        self.headers(academy=1)
+        self.generate_models(authenticate=True,
+                             profile_academy=True,
+                             capability='read_activity',
+                             role='potato')
+
+        url = reverse_lazy('activity:root') + '?limit=3'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = [
+            DATASTORE_SORTED_PRIVATE_SEED[0],
+            DATASTORE_SORTED_SHARED_SEED[0],
+            DATASTORE_SORTED_PRIVATE_SEED[1],
+        ]
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
+    def test_type__bad_limit(self):
+        from breathecode.services.google_cloud import Datastore as mock
+        mock.iterate.call_args_list = []
+
+        self.headers(academy=1)
+        self.generate_models(authenticate=True,
+                             profile_academy=True,
+                             capability='read_activity',
+                             role='potato')
+
+        url = reverse_lazy('activity:root') + '?limit=-1'
+        response = self.client.get(url)
+
+        json = response.json()
+        expected = {
+            'detail': 'bad-limit',
+            'status_code': 400,
+        }
+
+        self.assertEqual(json, expected)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(mock.iterate.call_args_list, [])
+
+    @patch.object(Datastore, '__init__', new=lambda x: None)
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__bad_slug_by_querystring(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -291,13 +362,13 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.fetch.call_args_list, [])
+        self.assertEqual(mock.iterate.call_args_list, [])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__slug_by_querystring__its_not_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -313,18 +384,26 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', slug='lesson_opened', academy_id=1),
-            call(kind='student_activity', slug='lesson_opened', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 slug='lesson_opened',
+                 academy_id=1),
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 slug='lesson_opened',
+                 academy_id=0),
         ])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
     @patch.object(Datastore,
-                  'fetch',
-                  new=datastore_fetch_mock(first_fetch=[], second_fetch=DATASTORE_SHARED_SEED))
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=[], second_fetch=DATASTORE_SHARED_SEED))
     def test_type__with_data__slug_by_querystring__its_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -352,9 +431,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', slug='breathecode_login', academy_id=1),
-            call(kind='student_activity', slug='breathecode_login', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 slug='breathecode_login',
+                 academy_id=1),
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 slug='breathecode_login',
+                 academy_id=0),
         ])
 
     """
@@ -362,10 +449,10 @@ class MediaTestSuite(MediaTestCase):
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__bad_cohort_by_querystring(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -384,13 +471,13 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.fetch.call_args_list, [])
+        self.assertEqual(mock.iterate.call_args_list, [])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__cohort_by_querystring__its_not_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
@@ -409,18 +496,26 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', cohort='miami-downtown-pt-xx', academy_id=1),
-            call(kind='student_activity', cohort='miami-downtown-pt-xx', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 cohort='miami-downtown-pt-xx',
+                 academy_id=1),
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 cohort='miami-downtown-pt-xx',
+                 academy_id=0),
         ])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
     @patch.object(Datastore,
-                  'fetch',
-                  new=datastore_fetch_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
     def test_type__with_data__cohort_by_querystring__its_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
@@ -451,9 +546,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', cohort='miami-downtown-pt-xx', academy_id=1),
-            call(kind='student_activity', cohort='miami-downtown-pt-xx', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 cohort='miami-downtown-pt-xx',
+                 academy_id=1),
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 cohort='miami-downtown-pt-xx',
+                 academy_id=0),
         ])
 
     """
@@ -461,10 +564,10 @@ class MediaTestSuite(MediaTestCase):
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__bad_user_id_by_querystring(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -483,13 +586,13 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.fetch.call_args_list, [])
+        self.assertEqual(mock.iterate.call_args_list, [])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__user_id_is_string_by_querystring(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -508,13 +611,13 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.fetch.call_args_list, [])
+        self.assertEqual(mock.iterate.call_args_list, [])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__user_id_by_querystring__its_not_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
@@ -533,18 +636,18 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', user_id=1, academy_id=1),
-            call(kind='student_activity', user_id=1, academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', user_id=1, academy_id=1),
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', user_id=1, academy_id=0),
         ])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
     @patch.object(Datastore,
-                  'fetch',
-                  new=datastore_fetch_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
     def test_type__with_data__user_id_by_querystring__its_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
@@ -575,9 +678,9 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', user_id=1, academy_id=1),
-            call(kind='student_activity', user_id=1, academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', user_id=1, academy_id=1),
+            call(order_by=['-created_at'], batch_size=100, kind='student_activity', user_id=1, academy_id=0),
         ])
 
     """
@@ -585,10 +688,10 @@ class MediaTestSuite(MediaTestCase):
     """
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__bad_email_by_querystring(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         self.generate_models(authenticate=True,
@@ -607,13 +710,13 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(mock.fetch.call_args_list, [])
+        self.assertEqual(mock.iterate.call_args_list, [])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
-    @patch.object(Datastore, 'fetch', new=datastore_fetch_mock(first_fetch=[], second_fetch=[]))
+    @patch.object(Datastore, 'iterate', new=datastore_iterate_mock(first_fetch=[], second_fetch=[]))
     def test_type__with_data__email_by_querystring__its_not_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
@@ -634,18 +737,26 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', email='konan@naruto.io', academy_id=1),
-            call(kind='student_activity', email='konan@naruto.io', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 email='konan@naruto.io',
+                 academy_id=1),
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 email='konan@naruto.io',
+                 academy_id=0),
         ])
 
     @patch.object(Datastore, '__init__', new=lambda x: None)
     @patch.object(Datastore,
-                  'fetch',
-                  new=datastore_fetch_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
+                  'iterate',
+                  new=datastore_iterate_mock(first_fetch=DATASTORE_PRIVATE_SEED, second_fetch=[]))
     def test_type__with_data__email_by_querystring__its_exist(self):
         from breathecode.services.google_cloud import Datastore as mock
-        mock.fetch.call_args_list = []
+        mock.iterate.call_args_list = []
 
         self.headers(academy=1)
         cohort_kwargs = {'slug': 'miami-downtown-pt-xx'}
@@ -678,9 +789,17 @@ class MediaTestSuite(MediaTestCase):
 
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(mock.fetch.call_args_list, [
-            call(kind='student_activity', email='konan@naruto.io', academy_id=1),
-            call(kind='student_activity', email='konan@naruto.io', academy_id=0),
+        self.assertEqual(mock.iterate.call_args_list, [
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 email='konan@naruto.io',
+                 academy_id=1),
+            call(order_by=['-created_at'],
+                 batch_size=100,
+                 kind='student_activity',
+                 email='konan@naruto.io',
+                 academy_id=0),
         ])
 
     """
@@ -1,3 +1,6 @@
+import os
+import heapq
+from itertools import islice
 from breathecode.activity.models import Activity
 from django.contrib.auth.models import User
 from django.db.models import Q
@@ -21,6 +24,12 @@ from google.cloud.ndb.query import OR
 # https://cloud.google.com/datastore/docs/concepts/entities
 # https://googleapis.dev/python/datastore/latest/index.html
 
+# the bulk activities are saved in a celery task instead of during the request
+ACTIVITY_ASYNC_WRITES = os.getenv('ACTIVITY_ASYNC_WRITES', 'FALSE').upper() in ['TRUE', '1']
+
+# entities per put_multi request, Datastore accepts up to 500
+ACTIVITY_WRITE_CHUNK_SIZE = int(os.getenv('ACTIVITY_WRITE_CHUNK_SIZE', 500))
+
 ACTIVITIES = {
     'breathecode_login': 'Every time it logs in',
     'online_platform_registration': 'First day using breathecode',
@@ -234,23 +243,31 @@ class ActivityMeView(APIView):
         if (user_id or email) and not user:
             raise ValidationException('User not exists', slug='user-not-exists')
 
-        datastore = Datastore()
+        # without limit all the activities are returned
+        limit = None
+        if request.GET.get('limit'):
+            try:
+                limit = int(request.GET.get('limit'))
+            except ValueError:
+                raise ValidationException('limit is not a interger', slug='bad-limit')
 
-        # limit = request.GET.get('limit')
-        # if limit:
-        #     kwargs['limit'] = int(limit)
+            if limit < 1:
+                raise ValidationException('limit must be greater than 0', slug='bad-limit')
 
-        # offset = request.GET.get('offset')
-        # if offset:
-        #     kwargs['offset'] = int(offset)
+        datastore = Datastore()
 
-        academy_iter = datastore.fetch(**kwargs, academy_id=int(academy_id))
-        public_iter = datastore.fetch(**kwargs, academy_id=0)
+        # both iterators are sorted by the newest, so they are merged while they are requested
+        batch_size = min(limit, 100) if limit else 100
+        order_by = ['-created_at']
+        academy_iter = datastore.iterate(order_by=order_by,
+                                         batch_size=batch_size,
+                                         **kwargs,
+                                         academy_id=int(academy_id))
+        public_iter = datastore.iterate(order_by=order_by, batch_size=batch_size, **kwargs, academy_id=0)
 
-        query_iter = academy_iter + public_iter
-        query_iter.sort(key=lambda x: x['created_at'], reverse=True)
+        query_iter = heapq.merge(academy_iter, public_iter, key=lambda x: x['created_at'], reverse=True)
 
-        return Response(query_iter)
+        return Response(list(islice(query_iter, limit)))
 
     @capable_of('crud_activity')
     def post(self, request, academy_id=None):
@@ -285,18 +302,23 @@ class ActivityClassroomView(APIView, HeaderLimitOffsetPagination):
         if isinstance(data, list) == False:
             data = [data]
 
-        new_activities = []
-        for activity in data:
-            student_id = activity['user_id']
+        # all the students of the activities are got with one query
+        student_ids = [get_student_id(activity) for activity in data]
+        cohort_users = CohortUser.objects.filter(role='STUDENT',
+                                                 user__id__in=student_ids,
+                                                 cohort__id=cu.cohort.id).select_related('user')
+        students = {x.user.id: x.user for x in cohort_users}
+
+        activities = []
+        for student_id, activity in zip(student_ids, data):
             del activity['user_id']
-            cohort_user = CohortUser.objects.filter(role='STUDENT',
-                                                    user__id=student_id,
-                                                    cohort__id=cu.cohort.id).first()
-            if cohort_user is None:
+
+            if student_id not in students:
                 raise ValidationException('Student not found in this cohort', slug='not-found-in-cohort')
 
-            new_activities.append(add_student_activity(cohort_user.user, activity, academy_id))
+            activities.append((students[student_id], activity))
 
+        new_activities = add_student_activities(activities, academy_id)
         return Response(new_activities, status=status.HTTP_201_CREATED)
 
     @capable_of('classroom_activity')
@@ -343,6 +365,15 @@ class ActivityClassroomView(APIView, HeaderLimitOffsetPagination):
         datastore = Datastore()
         #academy_iter = datastore.fetch(**kwargs, academy_id=int(academy_id))
 
+        if self.cursor_query_param in request.GET:
+            page, next_cursor = datastore.fetch_page(order_by=['-created_at'],
+                                                     cursor=request.GET.get(self.cursor_query_param),
+                                                     limit=self.get_limit(request),
+                                                     **kwargs)
+
+            page = self.paginate_cursor_page(page, request, next_cursor)
+            return self.get_paginated_response(page)
+
         limit = request.GET.get('limit')
         offset = request.GET.get('offset')
 
@@ -371,9 +402,8 @@ class ActivityClassroomView(APIView, HeaderLimitOffsetPagination):
             return Response(page, status=status.HTTP_200_OK)
 
 
-def add_student_activity(user, data, academy_id):
-    from breathecode.services import Datastore
-
+def build_student_activity(user, data, academy_id, cohorts=None):
+    """Validate the activity and return the fields of its entity, `cohorts` keeps the cohorts already checked"""
     validate_activity_fields(data)
     validate_require_activity_fields(data)
 
@@ -387,18 +417,23 @@ def add_student_activity(user, data, academy_id):
     validate_if_activity_need_field_data(data)
     validate_activity_have_correct_data_field(data)
 
-    if 'cohort' in data:
+    if cohorts is None:
+        cohorts = {}
+
+    if 'cohort' in data and (academy_id, data['cohort']) not in cohorts:
         _query = Cohort.objects.filter(academy__id=academy_id)
         if data['cohort'].isnumeric():
             _query = _query.filter(id=data['cohort'])
         else:
             _query = _query.filter(slug=data['cohort'])
 
-        if not _query.exists():
-            raise ValidationException(f"Cohort {str(data['cohort'])} doesn't exist in this academy",
-                                      slug='cohort-not-exists')
+        cohorts[(academy_id, data['cohort'])] = _query.exists()
 
-    fields = {
+    if 'cohort' in data and not cohorts[(academy_id, data['cohort'])]:
+        raise ValidationException(f"Cohort {str(data['cohort'])} doesn't exist in this academy",
+                                  slug='cohort-not-exists')
+
+    return {
         **data,
         'created_at': generate_created_at(),
         'slug': slug,
@@ -407,12 +442,52 @@ def add_student_activity(user, data, academy_id):
         'academy_id': int(academy_id),
     }
 
+
+def add_student_activity(user, data, academy_id):
+    from breathecode.services import Datastore
+
+    fields = build_student_activity(user, data, academy_id)
+
     datastore = Datastore()
     datastore.update('student_activity', fields)
 
     return fields
 
 
+def get_student_id(activity):
+    """The user_id of the payload could be a string, like "12", the students are indexed by int"""
+
+    try:
+        return int(activity['user_id'])
+
+    except (KeyError, TypeError, ValueError):
+        raise ValidationException('user_id is not a interger', slug='bad-user-id')
+
+
+def add_student_activities(activities, academy_id):
+    """
+    Validate all the activities before save any of them, then save them in chunks with `put_multi`,
+    `activities` is a list of tuples `(user, data)`.
+    """
+    from breathecode.services import Datastore
+    from .tasks import save_student_activities
+
+    cohorts = {}
+    result = [build_student_activity(user, data, academy_id, cohorts) for user, data in activities]
+
+    datastore = Datastore()
+
+    if ACTIVITY_ASYNC_WRITES:
+        # the task can be retried after save some chunks, with the keys allocated it doesn't duplicate them
+        ids = datastore.allocate_ids('student_activity', len(result))
+        save_student_activities.delay([{**x, 'created_at': x['created_at'].isoformat()} for x in result], ids)
+
+    else:
+        datastore.update_multi('student_activity', result, chunk_size=ACTIVITY_WRITE_CHUNK_SIZE)
+
+    return result
+
+
 class StudentActivityView(APIView, HeaderLimitOffsetPagination):
     @capable_of('read_activity')
     def get(self, request, student_id=None, academy_id=None):
@@ -452,6 +527,15 @@ class StudentActivityView(APIView, HeaderLimitOffsetPagination):
         datastore = Datastore()
         #academy_iter = datastore.fetch(**kwargs, academy_id=int(academy_id))
 
+        if self.cursor_query_param in request.GET:
+            page, next_cursor = datastore.fetch_page(order_by=['-created_at'],
+                                                     cursor=request.GET.get(self.cursor_query_param),
+                                                     limit=self.get_limit(request),
+                                                     **kwargs)
+
+            page = self.paginate_cursor_page(page, request, next_cursor)
+            return self.get_paginated_response(page)
+
         limit = request.GET.get('limit')
         offset = request.GET.get('offset')
 
@@ -488,9 +572,7 @@ class StudentActivityView(APIView, HeaderLimitOffsetPagination):
         if isinstance(data, list) == False:
             data = [data]
 
-        new_activities = []
         for activity in data:
-
             if 'cohort' not in activity:
                 raise ValidationException(
                     'Every activity specified for each student must have a cohort (slug)',
@@ -498,14 +580,23 @@ class StudentActivityView(APIView, HeaderLimitOffsetPagination):
             elif activity['cohort'].isnumeric():
                 raise ValidationException('Cohort must be a slug, not a numeric ID', slug='invalid-cohort')
 
-            student_id = activity['user_id']
+        # all the students of the activities are got with one query
+        student_ids = [get_student_id(activity) for activity in data]
+        cohort_slugs = [activity['cohort'] for activity in data]
+        cohort_users = CohortUser.objects.filter(role='STUDENT',
+                                                 user__id__in=student_ids,
+                                                 cohort__slug__in=cohort_slugs)
+        cohort_users = cohort_users.select_related('user', 'cohort')
+        students = {(x.user.id, x.cohort.slug): x.user for x in cohort_users}
+
+        activities = []
+        for student_id, activity in zip(student_ids, data):
             del activity['user_id']
-            cohort_user = CohortUser.objects.filter(role='STUDENT',
-                                                    user__id=student_id,
-                                                    cohort__slug=activity['cohort']).first()
-            if cohort_user is None:
+
+            if (student_id, activity['cohort']) not in students:
                 raise ValidationException('Student not found in this cohort', slug='not-found-in-cohort')
 
-            new_activities.append(add_student_activity(cohort_user.user, activity, academy_id))
+            activities.append((students[(student_id, activity['cohort'])], activity))
 
+        new_activities = add_student_activities(activities, academy_id)
         return Response(new_activities, status=status.HTTP_201_CREATED)
@@ -1,16 +1,26 @@
 import inspect
+import io
 import os
+import sys
+import gzip
 import json
+import time
 import importlib
 import traceback
 
+from base64 import b64encode
 from breathecode.tests.mixins import DatetimeMixin
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from django.db import connections
 from django.db.models import Model
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from breathecode.settings import INSTALLED_APPS
 from pathlib import Path
 from decimal import Decimal
+from uuid import UUID
 
 PROJECT = 'breathecode'
 MODULES = [
@@ -18,11 +28,298 @@ MODULES = [
     if x.startswith('breathecode.') and x != 'breathecode.admin_styles'
 ]
 
+BACKUP_PAGE_SIZE = int(os.getenv('BACKUP_PAGE_SIZE', 2000))
+FORMATS = ['json', 'ndjson']
+
+# file extension of each compression
+COMPRESSIONS = {
+    'gzip': 'gz',
+    'zstd': 'zst',
+}
+
+datetime_mixin = DatetimeMixin()
+
 
 def db_backup_bucket():
     return os.getenv('DB_BACKUP_BUCKET')
 
 
+def find_models(module_name, exclude=[]):
+    path = f'breathecode.{module_name}.models'
+    module = importlib.import_module(path)
+    models = []
+
+    for x in dir(module):
+        CurrentModel = getattr(module, x)
+        if not inspect.isclass(CurrentModel):
+            continue
+
+        if not issubclass(CurrentModel, Model):
+            continue
+
+        if (hasattr(CurrentModel, 'Meta') and hasattr(CurrentModel.Meta, 'abstract')
+                and CurrentModel.__name__ != 'User'):
+            continue
+
+        if (hasattr(CurrentModel, 'Meta') and hasattr(CurrentModel.Meta, 'proxy')
+                and CurrentModel.__name__ != 'User'):
+            continue
+
+        if CurrentModel.__name__ in exclude or CurrentModel.__name__ in models:
+            continue
+
+        models.append(CurrentModel.__name__)
+
+    return models
+
+
+def get_model(module_name, model_name):
+    path = f'breathecode.{module_name}.models'
+
+    try:
+        module = importlib.import_module(path)
+    except ModuleNotFoundError:
+        raise CommandError(f'module `{module_name}` not found or it not have models too')
+
+    if not hasattr(module, model_name):
+        raise CommandError(f'module `{module_name}` not have a model called `{model_name}`')
+
+    return getattr(module, model_name)
+
+
+def get_backup_name(module_name, model_name, format='json', compress=None, since=None):
+    name = f'{module_name}.{model_name.lower()}'
+
+    if since:
+        name += f'.since-{since.strftime("%Y%m%d%H%M%S")}'
+
+    name += f'.{format}'
+
+    if compress:
+        name += f'.{COMPRESSIONS[compress]}'
+
+    return name
+
+
+def parse_since(value):
+    if not value:
+        return None
+
+    since = parse_datetime(value)
+    if since is None:
+        raise CommandError(f'`{value}` is not a valid ISO 8601 datetime')
+
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, timezone.utc)
+
+    return since
+
+
+def prepare_row(data):
+    private_attrs = [x for x in data if x.startswith('_')]
+    datetime_attrs = [x for x in data if isinstance(data[x], datetime)]
+    decimal_attrs = [x for x in data if isinstance(data[x], Decimal)]
+    timedelta_attrs = [x for x in data if isinstance(data[x], timedelta)]
+
+    for key in private_attrs:
+        del data[key]
+
+    for key in datetime_attrs:
+        data[key] = datetime_mixin.datetime_to_iso(data[key])
+
+    for key in decimal_attrs:
+        data[key] = float(data[key])
+
+    for key in timedelta_attrs:
+        data[key] = str(data[key])
+
+    return data
+
+
+def serialize_value(value):
+    """`json.dumps` fallback for the values that `prepare_row` doesn't cover"""
+    if isinstance(value, date):
+        return value.isoformat()
+
+    if isinstance(value, UUID):
+        return str(value)
+
+    if isinstance(value, (bytes, memoryview)):
+        return b64encode(bytes(value)).decode('ascii')
+
+    raise TypeError(f'Object of type {value.__class__.__name__} is not JSON serializable')
+
+
+def iter_pages(queryset, page_size=BACKUP_PAGE_SIZE):
+    """Read the rows page by page using the primary key, it never keeps more than one page in memory"""
+    pk = queryset.model._meta.pk.attname
+    queryset = queryset.order_by('pk')
+    last = None
+
+    while True:
+        page = queryset if last is None else queryset.filter(pk__gt=last)
+        rows = list(page.values()[:page_size])
+
+        if not rows:
+            return
+
+        yield rows
+
+        if len(rows) < page_size:
+            return
+
+        last = rows[-1][pk]
+
+
+def open_compressor(raw, compress=None):
+    if compress == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='wb')
+
+    if compress == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise CommandError('zstd compression requires the `zstandard` package')
+
+        return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+
+    return raw
+
+
+def open_decompressor(raw, compress=None):
+    if compress == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='rb')
+
+    if compress == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise CommandError('zstd compression requires the `zstandard` package')
+
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+
+    return raw
+
+
+def get_backup_path():
+    return Path(os.getcwd()) / 'backup'
+
+
+def open_backup_writer(mode, name, compress=None, directory=None):
+    if mode == 'storage':
+        backup_path = Path(directory) if directory else get_backup_path()
+        os.makedirs(backup_path, exist_ok=True)
+        return open(backup_path / name, 'wb')
+
+    if mode == 'bucket':
+        from ....services.google_cloud import Storage
+
+        storage = Storage()
+        cloud_file = storage.file(db_backup_bucket(), name)
+        content_type = 'application/octet-stream' if compress else 'application/json'
+        return cloud_file.stream_upload(content_type=content_type)
+
+    raise CommandError(f'mode `{mode}` can\'t be written as a file')
+
+
+def open_backup_reader(mode, name, directory=None):
+    if mode == 'storage':
+        backup_path = Path(directory) if directory else get_backup_path()
+        return open(backup_path / name, 'rb')
+
+    if mode == 'bucket':
+        from ....services.google_cloud import Storage
+
+        storage = Storage()
+        return storage.file(db_backup_bucket(), name).stream_read()
+
+    raise CommandError(f'mode `{mode}` can\'t be read as a file')
+
+
+def write_rows(file, pages, format='json'):
+    rows = 0
+
+    if format == 'json':
+        file.write('[')
+
+    for page in pages:
+        for row in page:
+            line = json.dumps(prepare_row(row), default=serialize_value)
+
+            if format == 'ndjson':
+                file.write(line + '\n')
+
+            else:
+                file.write((', ' if rows else '') + line)
+
+            rows += 1
+
+    if format == 'json':
+        file.write(']')
+
+    return rows
+
+
+def backup_model(mode,
+                 module_name,
+                 model_name,
+                 format='json',
+                 compress=None,
+                 since=None,
+                 page_size=BACKUP_PAGE_SIZE,
+                 directory=None) -> dict:
+    """Stream the rows of a model to its backup, it returns the stats of the backup"""
+    CurrentModel = get_model(module_name, model_name)
+    name = get_backup_name(module_name, model_name, format=format, compress=compress, since=since)
+    start = time.perf_counter()
+
+    queryset = CurrentModel._base_manager.all()
+    if since:
+        queryset = queryset.filter(updated_at__gte=since)
+
+    pages = iter_pages(queryset, page_size)
+
+    if mode == 'console':
+        rows = write_rows(sys.stdout, pages, format)
+        if format == 'json':
+            sys.stdout.write('\n')
+
+    else:
+        raw = open_backup_writer(mode, name, compress, directory)
+
+        try:
+            compressor = open_compressor(raw, compress)
+            file = io.TextIOWrapper(compressor, encoding='utf-8')
+            rows = write_rows(file, pages, format)
+
+            # it flushes the compressor, the raw file is closed below
+            file.close()
+
+        finally:
+            if not raw.closed:
+                raw.close()
+
+    return {
+        'module': module_name,
+        'model': model_name,
+        'name': name,
+        'rows': rows,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def init_backup_worker():
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'breathecode.settings')
+    django.setup()
+
+
+def has_updated_at(module_name, model_name):
+    CurrentModel = get_model(module_name, model_name)
+    return any(x.name == 'updated_at' for x in CurrentModel._meta.concrete_fields)
+
+
 class Command(BaseCommand, DatetimeMixin):
     help = 'Backup models'
 
@@ -30,6 +327,21 @@ class Command(BaseCommand, DatetimeMixin):
         parser.add_argument('mode', type=str, choices=['storage', 'console', 'bucket'])
         parser.add_argument('module', nargs='?', type=str, default='')
         parser.add_argument('model', nargs='?', type=str, default='')
+        parser.add_argument('--format',
+                            type=str,
+                            choices=FORMATS,
+                            default='json',
+                            help='json keeps the legacy array, ndjson writes one row per line')
+        parser.add_argument('--compress', type=str, choices=list(COMPRESSIONS), default=None)
+        parser.add_argument('--since',
+                            type=str,
+                            default=None,
+                            help='Only backup the rows updated after this ISO 8601 datetime')
+        parser.add_argument('--workers',
+                            type=int,
+                            default=1,
+                            help='Number of processes that backup the models concurrently')
+        parser.add_argument('--page-size', type=int, default=BACKUP_PAGE_SIZE)
 
     def handle(self, *args, **options):
         self.all_model_names = []
@@ -40,122 +352,94 @@ class Command(BaseCommand, DatetimeMixin):
         module_name = options['module']
         model_name = options['model']
         self.mode = options['mode']
+        self.format = options.get('format', 'json')
+        self.compress = options.get('compress')
+        self.since = parse_since(options.get('since'))
+        self.page_size = options.get('page_size') or BACKUP_PAGE_SIZE
+
+        if self.mode == 'console' and self.compress:
+            raise CommandError('the console mode can\'t be compressed')
 
         if module_name and model_name:
-            self.backup(module_name, model_name)
+            jobs = [(module_name, model_name)]
 
         elif module_name:
-            for model_name in self.find_modules(module_name):
-                self.backup(module_name, model_name)
+            jobs = [(module_name, x) for x in self.find_modules(module_name)]
 
         else:
-            for module_name in MODULES:
-                for model_name in self.find_modules(module_name):
-                    self.backup(module_name, model_name)
-
-    def find_modules(self, module_name):
-        path = f'breathecode.{module_name}.models'
-        module = importlib.import_module(path)
-        models = []
-
-        for x in dir(module):
-            CurrentModel = getattr(module, x)
-            if not inspect.isclass(CurrentModel):
-                continue
+            jobs = [(module, x) for module in MODULES for x in self.find_modules(module)]
 
-            if not issubclass(CurrentModel, Model):
-                continue
+        if self.since:
+            skipped = [x for x in jobs if not has_updated_at(*x)]
+            for module, model in skipped:
+                self.stdout.write(f'{module}.{model} was skipped because it has not a updated_at field')
 
-            if (hasattr(CurrentModel, 'Meta') and hasattr(CurrentModel.Meta, 'abstract')
-                    and CurrentModel.__name__ != 'User'):
-                continue
+            jobs = [x for x in jobs if x not in skipped]
 
-            if (hasattr(CurrentModel, 'Meta') and hasattr(CurrentModel.Meta, 'proxy')
-                    and CurrentModel.__name__ != 'User'):
-                continue
+        workers = options.get('workers') or 1
+        if workers > 1 and len(jobs) > 1 and self.mode != 'console':
+            self.backup_concurrently(jobs, workers)
 
-            if CurrentModel.__name__ in self.all_model_names:
-                continue
-
-            self.all_model_names.append(CurrentModel.__name__)
-            models.append(CurrentModel.__name__)
+        else:
+            for module, model in jobs:
+                self.backup(module, model)
 
+    def find_modules(self, module_name):
+        models = find_models(module_name, exclude=self.all_model_names)
+        self.all_model_names += models
         return models
 
+    def get_backup_kwargs(self):
+        return {
+            'format': self.format,
+            'compress': self.compress,
+            'since': self.since,
+            'page_size': self.page_size,
+        }
+
     def backup(self, module_name, model_name):
         self.module_name = module_name
         self.model_name = model_name
-        path = f'breathecode.{self.module_name}.models'
-
-        try:
-            module = importlib.import_module(path)
-        except ModuleNotFoundError:
-            return self.stderr.write(
-                self.style.ERROR(f'module `{self.module_name}` not found or it not have models too'))
-
-        if not hasattr(module, self.model_name):
-            return self.stderr.write(
-                self.style.ERROR(f'module `{self.module_name}` not have a model called `{self.model_name}`'))
-
-        CurrentModel = getattr(module, self.model_name)
-        results = CurrentModel.objects.all()
-        dicts = [self.prepare_data(x) for x in results]
 
         try:
-            if self.mode == 'storage':
-                self.backup_in_storage(json.dumps(dicts))
+            stats = backup_model(self.mode, module_name, model_name, **self.get_backup_kwargs())
 
-            elif self.mode == 'console':
-                self.backup_in_console(json.dumps(dicts))
-
-            elif self.mode == 'bucket':
-                self.backup_in_bucket(json.dumps(dicts))
+        except CommandError as e:
+            return self.stderr.write(self.style.ERROR(str(e)))
 
         except Exception as e:
-            print(dicts)
             traceback.print_exc()
             raise Exception(str(e))
 
-    def prepare_data(self, model):
-        data = vars(model)
-        private_attrs = [x for x in data if x.startswith('_')]
-        datetime_attrs = [x for x in data if isinstance(data[x], datetime)]
-        decimal_attrs = [x for x in data if isinstance(data[x], Decimal)]
-        timedelta_attrs = [x for x in data if isinstance(data[x], timedelta)]
-
-        for key in private_attrs:
-            del data[key]
+        if self.mode != 'console':
+            self.log_stats(stats)
 
-        for key in datetime_attrs:
-            data[key] = self.datetime_to_iso(data[key])
+    def backup_concurrently(self, jobs, workers):
+        # the processes must open their own connections
+        connections.close_all()
 
-        for key in decimal_attrs:
-            data[key] = float(data[key])
+        errors = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_backup_worker) as executor:
+            futures = {
+                executor.submit(backup_model, self.mode, module, model, **self.get_backup_kwargs()):
+                (module, model)
+                for module, model in jobs
+            }
 
-        for key in timedelta_attrs:
-            data[key] = str(data[key])
+            for future in as_completed(futures):
+                module, model = futures[future]
 
-        return data
+                try:
+                    self.log_stats(future.result())
 
-    def backup_in_storage(self, data):
-        current_path = Path(os.getcwd())
-        backup_path = current_path / 'backup'
-        file_path = current_path / 'backup' / f'{self.module_name}.{self.model_name.lower()}.json'
+                except Exception as e:
+                    errors.append(f'{module}.{model}')
+                    self.stderr.write(self.style.ERROR(f'{module}.{model} failed: {str(e)}'))
 
-        if not os.path.exists(current_path / 'backup'):
-            os.mkdir(backup_path)
+        if errors:
+            raise CommandError(f'the backup of {", ".join(errors)} failed')
 
-        with open(file_path, 'w') as file:
-            file.write(data)
-
-    def backup_in_console(self, data):
-        print(data)
-
-    def backup_in_bucket(self, data):
-        from ....services.google_cloud import Storage
-
-        storage = Storage()
-        name = f'{self.module_name}.{self.model_name.lower()}.json'
-
-        cloud_file = storage.file(db_backup_bucket(), name)
-        cloud_file.upload(data)
+    def log_stats(self, stats):
+        rate = stats['rows'] / stats['seconds'] if stats['seconds'] else 0
+        self.stdout.write(f'{stats["name"]}: {stats["rows"]} rows in {stats["seconds"]:.2f}s '
+                          f'({rate:.0f} rows/s)')
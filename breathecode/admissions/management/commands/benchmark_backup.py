@@ -0,0 +1,64 @@
+import json, os, tempfile, time, tracemalloc
+from django.core.management.base import BaseCommand
+from .backup import BACKUP_PAGE_SIZE, COMPRESSIONS, FORMATS, backup_model, get_model, prepare_row
+
+
+def legacy_backup(CurrentModel, path):
+    """The old engine, it loads every instance before dumping them as a single string"""
+    dicts = [prepare_row(vars(x)) for x in CurrentModel.objects.all()]
+
+    with open(path, 'w') as file:
+        file.write(json.dumps(dicts, default=str))
+
+    return len(dicts)
+
+
+def measure(function, *args, **kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return result, seconds, peak
+
+
+class Command(BaseCommand):
+    help = 'Compare the throughput and peak memory of the legacy backup against the streaming one'
+
+    def add_arguments(self, parser):
+        parser.add_argument('module', type=str)
+        parser.add_argument('model', type=str)
+        parser.add_argument('--format', type=str, choices=FORMATS, default='ndjson')
+        parser.add_argument('--compress', type=str, choices=list(COMPRESSIONS), default='gzip')
+        parser.add_argument('--page-size', type=int, default=BACKUP_PAGE_SIZE)
+
+    def handle(self, *args, **options):
+        CurrentModel = get_model(options['module'], options['model'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            rows, legacy, legacy_peak = measure(legacy_backup, CurrentModel,
+                                                os.path.join(directory, 'legacy.json'))
+
+            stats, streaming, streaming_peak = measure(backup_model,
+                                                       'storage',
+                                                       options['module'],
+                                                       options['model'],
+                                                       format=options['format'],
+                                                       compress=options['compress'],
+                                                       page_size=options['page_size'],
+                                                       directory=directory)
+
+            size = os.path.getsize(os.path.join(directory, stats['name']))
+            legacy_size = os.path.getsize(os.path.join(directory, 'legacy.json'))
+
+        self.stdout.write(f'{rows} rows of {options["module"]}.{options["model"]}')
+        self.stdout.write(f'legacy: {legacy:.2f}s ({rows / legacy:.0f} rows/s), '
+                          f'peak memory {legacy_peak / 1024 / 1024:.1f}MB, {legacy_size / 1024:.0f}KB')
+        self.stdout.write(f'streaming: {streaming:.2f}s ({rows / streaming:.0f} rows/s), '
+                          f'peak memory {streaming_peak / 1024 / 1024:.1f}MB, {size / 1024:.0f}KB')
@@ -0,0 +1,152 @@
+import io
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from .backup import (BACKUP_PAGE_SIZE, COMPRESSIONS, FORMATS, MODULES, find_models, get_backup_name,
+                     get_model, open_backup_reader, open_decompressor, parse_since)
+
+
+def iter_backup_pages(file, format='json', page_size=BACKUP_PAGE_SIZE):
+    if format == 'json':
+        # the legacy format is a single array, it can't be read line by line
+        rows = json.load(file)
+        for index in range(0, len(rows), page_size):
+            yield rows[index:index + page_size]
+
+        return
+
+    page = []
+    for line in file:
+        if not line.strip():
+            continue
+
+        page.append(json.loads(line))
+
+        if len(page) == page_size:
+            yield page
+            page = []
+
+    if page:
+        yield page
+
+
+def restore_rows(CurrentModel, rows) -> int:
+    """Insert the rows that don't exist and update the others, it keeps the backed up timestamps"""
+    fields = {x.attname: x for x in CurrentModel._meta.concrete_fields}
+    update_fields = [x.name for x in fields.values() if not x.primary_key]
+    auto_fields = [
+        x.name for x in fields.values() if getattr(x, 'auto_now', False) or getattr(x, 'auto_now_add', False)
+    ]
+
+    instances = [
+        CurrentModel(**{key: fields[key].to_python(value)
+                        for key, value in row.items() if key in fields}) for row in rows
+    ]
+
+    manager = CurrentModel._base_manager
+    existing = set(manager.filter(pk__in=[x.pk for x in instances]).values_list('pk', flat=True))
+
+    to_create = [x for x in instances if x.pk not in existing]
+    to_update = [x for x in instances if x.pk in existing]
+
+    if to_create:
+        manager.bulk_create(to_create)
+
+        # bulk_create overrides the auto_now fields, bulk_update doesn't
+        if auto_fields:
+            manager.bulk_update(to_create, auto_fields)
+
+    if to_update and update_fields:
+        manager.bulk_update(to_update, update_fields)
+
+    return len(instances)
+
+
+def restore_model(mode,
+                  module_name,
+                  model_name,
+                  format='json',
+                  compress=None,
+                  since=None,
+                  page_size=BACKUP_PAGE_SIZE,
+                  directory=None) -> int:
+    CurrentModel = get_model(module_name, model_name)
+    name = get_backup_name(module_name, model_name, format=format, compress=compress, since=since)
+    rows = 0
+
+    raw = open_backup_reader(mode, name, directory)
+
+    try:
+        file = io.TextIOWrapper(open_decompressor(raw, compress), encoding='utf-8')
+
+        with transaction.atomic():
+            for page in iter_backup_pages(file, format, page_size):
+                rows += restore_rows(CurrentModel, page)
+
+            # the primary keys were set explicitly
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(no_style(), [CurrentModel]):
+                    cursor.execute(sql)
+
+    finally:
+        if not raw.closed:
+            raw.close()
+
+    return rows
+
+
+class Command(BaseCommand):
+    help = 'Restore the models from a backup'
+
+    def add_arguments(self, parser):
+        parser.add_argument('mode', type=str, choices=['storage', 'bucket'])
+        parser.add_argument('module', nargs='?', type=str, default='')
+        parser.add_argument('model', nargs='?', type=str, default='')
+        parser.add_argument('--format', type=str, choices=FORMATS, default='json')
+        parser.add_argument('--compress', type=str, choices=list(COMPRESSIONS), default=None)
+        parser.add_argument('--since',
+                            type=str,
+                            default=None,
+                            help='Restore the incremental backup made with the same --since')
+        parser.add_argument('--page-size', type=int, default=BACKUP_PAGE_SIZE)
+
+    def handle(self, *args, **options):
+        module_name = options['module']
+        model_name = options['model']
+        since = parse_since(options.get('since'))
+        all_model_names = []
+
+        if module_name and model_name:
+            jobs = [(module_name, model_name)]
+
+        elif module_name:
+            jobs = [(module_name, x) for x in find_models(module_name)]
+
+        else:
+            jobs = []
+            for module in MODULES:
+                models = find_models(module, exclude=all_model_names)
+                all_model_names += models
+                jobs += [(module, x) for x in models]
+
+        for module, model in jobs:
+            try:
+                rows = restore_model(options['mode'],
+                                     module,
+                                     model,
+                                     format=options.get('format', 'json'),
+                                     compress=options.get('compress'),
+                                     since=since,
+                                     page_size=options.get('page_size') or BACKUP_PAGE_SIZE)
+
+            except FileNotFoundError:
+                self.stderr.write(self.style.ERROR(f'{module}.{model} has not a backup'))
+                continue
+
+            except CommandError as e:
+                self.stderr.write(self.style.ERROR(str(e)))
+                continue
+
+            self.stdout.write(f'{module}.{model}: {rows} rows restored')
@@ -0,0 +1,13 @@
+from django.db import migrations
+from breathecode.utils.search import create_search_indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admissions', '0039_syllabus_main_technologies'),
+    ]
+
+    operations = [
+        create_search_indexes('admissions_cohort', ['slug', 'name']),
+    ]
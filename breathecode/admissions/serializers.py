@@ -1,7 +1,7 @@
 import logging
 import serpy
 from breathecode.admissions.actions import ImportCohortTimeSlots
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from breathecode.assignments.models import Task
 from breathecode.utils import ValidationException, localize_query, SerpyExtensions
 from rest_framework import serializers
@@ -101,6 +101,8 @@ class GetSyllabusScheduleSerializer(serpy.Serializer):
 
 
 class GetSmallSyllabusScheduleSerializer(serpy.Serializer):
+    relations = ['syllabus']
+
     id = serpy.Field()
     name = serpy.Field()
     syllabus = serpy.MethodField()
@@ -155,6 +157,8 @@ class GetBigAcademySerializer(serpy.Serializer):
 
 class SyllabusVersionSmallSerializer(serpy.Serializer):
     """The serializer schema definition."""
+    relations = ['syllabus']
+
     # Use a Field subclass like IntField if you need more validation.
     version = serpy.Field()
     slug = serpy.MethodField()
@@ -261,6 +265,8 @@ class SmallCohortTimeSlotSerializer(serpy.Serializer):
 
 class GetCohortSerializer(serpy.Serializer):
     """The serializer schema definition."""
+    relations = [Prefetch('cohorttimeslot_set')]
+
     # Use a Field subclass like IntField if you need more validation.
     id = serpy.Field()
     slug = serpy.Field()
@@ -281,8 +287,8 @@ class GetCohortSerializer(serpy.Serializer):
     timeslots = serpy.MethodField()
 
     def get_timeslots(self, obj):
-        timeslots = CohortTimeSlot.objects.filter(cohort__id=obj.id)
-        return SmallCohortTimeSlotSerializer(timeslots, many=True).data
+        # it uses the prefetched timeslots if they were prefetched
+        return SmallCohortTimeSlotSerializer(obj.cohorttimeslot_set.all(), many=True).data
 
 
 class PublicCohortSerializer(serpy.Serializer):
@@ -0,0 +1,134 @@
+"""
+Test backup and restore_backup
+"""
+import gzip, json, os, tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.utils import timezone
+from ...mixins import AdmissionsTestCase
+from ....management.commands.backup import Command
+from ....management.commands.restore_backup import Command as RestoreCommand
+from ....models import Academy
+
+
+class BackupTestSuite(AdmissionsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def read_backup(self, name):
+        path = os.path.join(self.directory.name, 'backup', name)
+        opener = gzip.open if name.endswith('.gz') else open
+
+        with opener(path, 'rt') as file:
+            return file.read()
+
+    def run_command(self, command, *args, **options):
+        command.stdout = StringIO()
+        command.stderr = StringIO()
+
+        with patch('os.getcwd', lambda: self.directory.name):
+            command.handle(*args, **options)
+
+        return command
+
+    """
+    🔽🔽🔽 json format
+    """
+
+    def test_backup__json__is_the_legacy_array(self):
+        model = self.generate_models(academy=3)
+
+        self.run_command(Command(), mode='storage', module='admissions', model='Academy', page_size=2)
+
+        content = json.loads(self.read_backup('admissions.academy.json'))
+        self.assertEqual([x['id'] for x in content], [x.id for x in model.academy])
+        self.assertEqual([x['slug'] for x in content], [x.slug for x in model.academy])
+        self.assertEqual(content[0]['created_at'], self.datetime_to_iso(model.academy[0].created_at))
+
+    """
+    🔽🔽🔽 ndjson format
+    """
+
+    def test_backup__ndjson__gzip(self):
+        model = self.generate_models(academy=3)
+
+        command = self.run_command(Command(),
+                                   mode='storage',
+                                   module='admissions',
+                                   model='Academy',
+                                   format='ndjson',
+                                   compress='gzip',
+                                   page_size=2)
+
+        lines = self.read_backup('admissions.academy.ndjson.gz').splitlines()
+        self.assertEqual([json.loads(x)['id'] for x in lines], [x.id for x in model.academy])
+        self.assertTrue(command.stdout.getvalue().startswith('admissions.academy.ndjson.gz: 3 rows in '))
+
+    """
+    🔽🔽🔽 incremental backup
+    """
+
+    def test_backup__since(self):
+        model = self.generate_models(academy=3)
+        since = timezone.now() - timedelta(hours=1)
+
+        Academy.objects.filter(id=model.academy[0].id).update(updated_at=since - timedelta(days=1))
+
+        self.run_command(Command(),
+                         mode='storage',
+                         module='admissions',
+                         model='Academy',
+                         format='ndjson',
+                         since=since.isoformat())
+
+        name = f'admissions.academy.since-{since.strftime("%Y%m%d%H%M%S")}.ndjson'
+        lines = self.read_backup(name).splitlines()
+        self.assertEqual([json.loads(x)['id'] for x in lines], [x.id for x in model.academy[1:]])
+
+    def test_backup__since__model_without_updated_at(self):
+        command = self.run_command(Command(),
+                                   mode='storage',
+                                   module='admissions',
+                                   model='Country',
+                                   since=timezone.now().isoformat())
+
+        self.assertEqual(command.stdout.getvalue(),
+                         'admissions.Country was skipped because it has not a updated_at field')
+
+    """
+    🔽🔽🔽 restore
+    """
+
+    def test_restore__ndjson__gzip(self):
+        model = self.generate_models(academy=3)
+        academies = self.bc.database.list_of('admissions.Academy')
+
+        self.run_command(Command(),
+                         mode='storage',
+                         module='admissions',
+                         model='Academy',
+                         format='ndjson',
+                         compress='gzip')
+
+        Academy.objects.filter(id=model.academy[0].id).delete()
+        Academy.objects.filter(id=model.academy[1].id).update(name='they-killed-kenny')
+
+        command = self.run_command(RestoreCommand(),
+                                   mode='storage',
+                                   module='admissions',
+                                   model='Academy',
+                                   format='ndjson',
+                                   compress='gzip',
+                                   page_size=2)
+
+        self.assertEqual(command.stdout.getvalue(), 'admissions.Academy: 3 rows restored')
+        self.assertEqual(self.bc.database.list_of('admissions.Academy'), academies)
+
+    def test_restore__without_backup(self):
+        command = self.run_command(RestoreCommand(), mode='storage', module='admissions', model='Academy')
+
+        self.assertEqual(command.stdout.getvalue(), '')
+        self.assertIn('admissions.Academy has not a backup', command.stderr.getvalue())
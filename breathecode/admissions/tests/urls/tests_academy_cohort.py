@@ -1998,18 +1998,25 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
     @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
     def test_academy_cohort_with_data_testing_cache(self):
         """Test /cohort without auth"""
-        cache_keys = [
-            'Cohort__resource=None&academy_id=1&upcoming=None&stage=None&academy='
-            'None&location=None&like=None&limit=None&offset=None'
-        ]
+        cache_kwargs = {
+            'resource': None,
+            'academy_id': 1,
+            'upcoming': None,
+            'stage': None,
+            'academy': None,
+            'location': None,
+            'like': None,
+            'limit': None,
+            'offset': None,
+        }
 
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         old_models = self.check_academy_cohort__with_data()
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
         self.check_academy_cohort__with_data(old_models)
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
         self.assertEqual(self.all_cohort_time_slot_dict(), [])
 
     @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
@@ -2017,15 +2024,22 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
         """Test /cohort without auth"""
         from breathecode.admissions.signals import cohort_saved
 
-        cache_keys = [
-            'Cohort__resource=None&academy_id=1&upcoming=None&stage=None&academy='
-            'None&location=None&like=None&limit=None&offset=None'
-        ]
+        cache_kwargs = {
+            'resource': None,
+            'academy_id': 1,
+            'upcoming': None,
+            'stage': None,
+            'academy': None,
+            'location': None,
+            'like': None,
+            'limit': None,
+            'offset': None,
+        }
 
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         old_models = self.check_academy_cohort__with_data()
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
         self.headers(academy=1)
 
@@ -2092,7 +2106,7 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
         }
 
         self.assertEqual(json, expected)
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         self.assertEqual(self.all_cohort_dict(), [
             {
@@ -2119,6 +2133,71 @@ class AcademyCohortTestSuite(AdmissionsTestCase):
         ]
 
         self.check_academy_cohort__with_data(base)
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
         self.assertEqual(cohort_saved.send.call_args_list,
                          [call(instance=cohort, sender=cohort.__class__, created=True)])
+
+    """
+    🔽🔽🔽 Queries
+    """
+
+    def test_academy_cohort__queries_do_not_grow_with_the_cohorts(self):
+        self.headers(academy=1)
+        url = reverse_lazy('admissions:academy_cohort')
+        model = self.generate_models(authenticate=True,
+                                     cohort=True,
+                                     cohort_time_slot=True,
+                                     profile_academy=True,
+                                     capability='read_cohort',
+                                     role='potato',
+                                     syllabus=True,
+                                     syllabus_version=True,
+                                     syllabus_schedule=True)
+
+        base = {
+            'academy': model.academy,
+            'syllabus': model.syllabus,
+            'syllabus_version': model.syllabus_version,
+            'syllabus_schedule': model.syllabus_schedule,
+        }
+
+        def grow():
+            for _ in range(0, 3):
+                self.generate_models(cohort=True, cohort_time_slot=True, models=base)
+
+        self.bc.check.constant_queries(lambda: self.client.get(url), grow)
+
+    """
+    🔽🔽🔽 Search
+    """
+
+    def test_academy_cohort__with_search(self):
+        self.headers(academy=1)
+        model = self.generate_models(authenticate=True,
+                                     profile_academy=True,
+                                     capability='read_cohort',
+                                     role='potato',
+                                     syllabus=True,
+                                     syllabus_version=True,
+                                     syllabus_schedule=True,
+                                     skip_cohort=True)
+
+        cohorts = [('kenny-dies', 'South Park'), ('cartman', 'Eric Cartman'), ('stan', 'Stan Marsh')]
+        for slug, name in cohorts:
+            cohort = {'slug': slug, 'name': name}
+            self.generate_models(cohort=cohort,
+                                 academy=model.academy,
+                                 syllabus=model.syllabus,
+                                 syllabus_version=model.syllabus_version,
+                                 syllabus_schedule=model.syllabus_schedule)
+
+        base_url = reverse_lazy('admissions:academy_cohort')
+
+        response = self.client.get(f'{base_url}?search=cartman')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([x['slug'] for x in response.json()], ['cartman'])
+
+        # like is kept as an alias of search
+        response = self.client.get(f'{base_url}?like=park')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([x['slug'] for x in response.json()], ['kenny-dies'])
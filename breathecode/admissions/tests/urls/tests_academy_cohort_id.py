@@ -1316,15 +1316,22 @@ class AcademyCohortIdTestSuite(AdmissionsTestCase):
         """Test /cohort without auth"""
         from breathecode.admissions.signals import cohort_saved
 
-        cache_keys = [
-            'Cohort__resource=None&academy_id=1&upcoming=None&stage=None&academy='
-            'None&location=None&like=None&limit=None&offset=None'
-        ]
+        cache_kwargs = {
+            'resource': None,
+            'academy_id': 1,
+            'upcoming': None,
+            'stage': None,
+            'academy': None,
+            'location': None,
+            'like': None,
+            'limit': None,
+            'offset': None,
+        }
 
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         old_models = self.check_academy_cohort__with_data()
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
         self.headers(academy=1)
 
@@ -1348,7 +1355,7 @@ class AcademyCohortIdTestSuite(AdmissionsTestCase):
         response = self.client.delete(url)
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
         self.assertEqual(self.bc.database.list_of('admissions.Cohort'),
                          [{
                              **self.model_to_dict(model, 'cohort'),
@@ -1366,7 +1373,7 @@ class AcademyCohortIdTestSuite(AdmissionsTestCase):
 
         self.check_academy_cohort__with_data(base, deleted=True)
 
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
         self.assertEqual(cohort_saved.send.call_args_list, [])
 
     @patch('breathecode.admissions.signals.cohort_saved.send', MagicMock())
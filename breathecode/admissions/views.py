@@ -29,7 +29,7 @@ from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework import status
 from breathecode.utils import (localize_query, capable_of, ValidationException, HeaderLimitOffsetPagination,
-                               GenerateLookupsMixin)
+                               GenerateLookupsMixin, prefetch_serializer, SearchBackend)
 from rest_framework.exceptions import ParseError, PermissionDenied, ValidationError
 from breathecode.utils import DatetimeInteger
 
@@ -96,6 +96,7 @@ def get_cohorts(request, id=None):
         sort = '-kickoff_date'
 
     items = items.order_by(sort)
+    items = prefetch_serializer(items, PublicCohortSerializer)
 
     serializer = PublicCohortSerializer(items, many=True)
 
@@ -287,6 +288,8 @@ class AcademyCohortUserView(APIView, HeaderLimitOffsetPagination, GenerateLookup
     """
     List all snippets, or create a new snippet.
     """
+    cursor_count = 'cached'
+
     @capable_of('read_cohort')
     def get(self, request, format=None, cohort_id=None, user_id=None, academy_id=None):
         if user_id is not None:
@@ -688,6 +691,7 @@ class AcademyCohortView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMix
     """
     permission_classes = [IsAuthenticated]
     cache = CohortCache()
+    search_backend = SearchBackend(['slug', 'name'])
 
     @capable_of('read_cohort')
     def get(self, request, cohort_id=None, academy_id=None):
@@ -695,7 +699,7 @@ class AcademyCohortView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMix
         academy = request.GET.get('academy', None)
         stage = request.GET.get('stage', None)
         location = request.GET.get('location', None)
-        like = request.GET.get('like', None)
+        like = request.GET.get('search', request.GET.get('like', None))
         cache_kwargs = {
             'resource': cohort_id,
             'academy_id': academy_id,
@@ -712,11 +716,13 @@ class AcademyCohortView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMix
             return Response(cache, status=status.HTTP_200_OK)
 
         if cohort_id is not None:
+            items = prefetch_serializer(Cohort.objects.filter(academy__id=academy_id), GetCohortSerializer)
+
             item = None
             if cohort_id.isnumeric():
-                item = Cohort.objects.filter(id=int(cohort_id), academy__id=academy_id).first()
+                item = items.filter(id=int(cohort_id)).first()
             else:
-                item = Cohort.objects.filter(slug=cohort_id, academy__id=academy_id).first()
+                item = items.filter(slug=cohort_id).first()
 
             if item is None:
                 return Response(status=status.HTTP_404_NOT_FOUND)
@@ -741,15 +747,16 @@ class AcademyCohortView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMix
         else:
             items = items.exclude(stage='DELETED')
 
-        if like is not None:
-            items = items.filter(Q(name__icontains=like) | Q(slug__icontains=like))
-
         sort = request.GET.get('sort', None)
         if sort is None or sort == '':
             sort = '-kickoff_date'
 
         items = items.order_by(sort)
 
+        # an explicit sort has priority over the relevance
+        items = self.search_backend.filter(items, like, rank=not request.GET.get('sort'))
+        items = prefetch_serializer(items, GetCohortSerializer)
+
         page = self.paginate_queryset(items, request)
         serializer = GetCohortSerializer(page, many=True)
 
@@ -1,4 +1,5 @@
-import requests, os, logging
+import requests, os, logging, threading
+from concurrent.futures import ThreadPoolExecutor
 
 from breathecode.utils.validation_exception import ValidationException
 from .models import Task, User
@@ -8,6 +9,33 @@ logger = logging.getLogger(__name__)
 
 HOST = os.environ.get('OLD_BREATHECODE_API')
 
+# students whose tasks are fetched at the same time from the old API
+TASK_SYNC_MAX_WORKERS = int(os.getenv('TASK_SYNC_MAX_WORKERS', 8))
+TASK_SYNC_BATCH_SIZE = int(os.getenv('TASK_SYNC_BATCH_SIZE', 500))
+
+_lock = threading.Lock()
+_session = None
+_session_pid = None
+
+TASK_TYPE = {
+    'assignment': 'PROJECT',
+    'quiz': 'QUIZ',
+    'lesson': 'LESSON',
+    'replit': 'EXERCISE',
+}
+
+REVISION_STATUS = {
+    'None': 'PENDING',
+    'pending': 'PENDING',
+    'approved': 'APPROVED',
+    'rejected': 'REJECTED',
+}
+
+TASK_STATUS = {
+    'pending': 'PENDING',
+    'done': 'DONE',
+}
+
 NOTIFICATION_STRINGS = {
     'en': {
         'teacher': {
@@ -52,79 +80,156 @@ def deliver_task(github_url, live_url=None, task_id=None, task=None):
     return task
 
 
-def sync_student_tasks(user, cohort=None):
+def get_session():
+    """Get the keep-alive session of this process, it is shared by all the requests to the old API"""
+    from requests.adapters import HTTPAdapter
 
-    if cohort is None:
-        cu = CohortUser.objects.filter(user=user).exclude(cohort__slug__contains='prework').first()
-        if cu is not None:
-            cohort = cu.cohort
+    global _session, _session_pid
 
-    response = requests.get(f'{HOST}/student/{user.email}/task/')
-    if response.status_code != 200:
-        raise Exception(f'Student {user.email} not found on the old API')
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            adapter = HTTPAdapter(pool_connections=TASK_SYNC_MAX_WORKERS, pool_maxsize=TASK_SYNC_MAX_WORKERS)
 
-    tasks = response.json()
-    task_type = {
-        'assignment': 'PROJECT',
-        'quiz': 'QUIZ',
-        'lesson': 'LESSON',
-        'replit': 'EXERCISE',
-    }
-
-    revision_status = {
-        'None': 'PENDING',
-        'pending': 'PENDING',
-        'approved': 'APPROVED',
-        'rejected': 'REJECTED',
-    }
-
-    task_status = {
-        'pending': 'PENDING',
-        'done': 'DONE',
-    }
+            _session = requests.Session()
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+            _session_pid = os.getpid()
 
-    syncronized = []
-    for _task in tasks['data']:
+        return _session
+
+
+def fetch_student_tasks(user, session=None):
+    """Get the tasks of the student from the old API, it raises if any of them is invalid"""
+
+    if session is None:
+        session = get_session()
+
+    response = session.get(f'{HOST}/student/{user.email}/task/')
+    if response.status_code != 200:
+        raise Exception(f'Student {user.email} not found on the old API')
 
-        if _task['type'] not in task_type:
+    tasks = response.json()['data']
+    for _task in tasks:
+        if _task['type'] not in TASK_TYPE:
             raise Exception(f"Invalid task_type {_task['type']}")
-        if _task['status'] not in task_status:
+        if _task['status'] not in TASK_STATUS:
             raise Exception(f"Invalid status {_task['status']}")
-        if str(_task['revision_status']) not in revision_status:
+        if str(_task['revision_status']) not in REVISION_STATUS:
             raise Exception(f"Invalid revision_status {_task['revision_status']}")
 
-        task = Task.objects.filter(user_id=user.id, associated_slug=_task['associated_slug']).first()
+    return tasks
+
+
+def merge_student_tasks(user, cohort, tasks, index):
+    """
+    Match the tasks of the old API with the existing ones, `index` has the tasks keyed by
+    `(user_id, associated_slug)` and the missing ones are added to it without being saved.
+    """
+
+    syncronized = []
+    created = []
+    for _task in tasks:
+        key = (user.id, _task['associated_slug'])
+
+        task = index.get(key)
         if task is None:
             task = Task(user=user, )
-            task.task_status = task_status[_task['status']]
+            task.task_status = TASK_STATUS[_task['status']]
             task.live_url = _task['live_url']
             task.github_url = _task['github_url']
             task.associated_slug = _task['associated_slug']
             task.title = _task['title']
-            task.task_type = task_type[_task['type']]
-            task.revision_status = revision_status[str(_task['revision_status'])]
+            task.task_type = TASK_TYPE[_task['type']]
+            task.revision_status = REVISION_STATUS[str(_task['revision_status'])]
             task.description = _task['description']
             task.cohort = cohort
-            task.save()
-            task.save()
+
+            index[key] = task
+            created.append(task)
+
         syncronized.append(task)
+
+    return syncronized, created
+
+
+def save_new_tasks(tasks):
+    """Create the tasks with one query, the ids are set on the instances"""
+
+    if not tasks:
+        return
+
+    Task.objects.bulk_create(tasks, batch_size=TASK_SYNC_BATCH_SIZE)
+
+    # only postgres returns the ids of the rows inserted in bulk
+    if tasks[0].pk is not None:
+        return
+
+    users = {x.user_id for x in tasks}
+    slugs = {x.associated_slug for x in tasks}
+    rows = Task.objects.filter(user__id__in=users, associated_slug__in=slugs).order_by('id')
+
+    ids = {}
+    for pk, user_id, associated_slug in rows.values_list('id', 'user_id', 'associated_slug'):
+        ids.setdefault((user_id, associated_slug), pk)
+
+    for task in tasks:
+        task.id = ids.get((task.user_id, task.associated_slug))
+        task._state.adding = False
+
+
+def sync_student_tasks(user, cohort=None):
+
+    if cohort is None:
+        cu = CohortUser.objects.filter(user=user).exclude(cohort__slug__contains='prework').first()
+        if cu is not None:
+            cohort = cu.cohort
+
+    tasks = fetch_student_tasks(user)
+    index = {(x.user_id, x.associated_slug): x for x in Task.objects.filter(user__id=user.id)}
+
+    syncronized, created = merge_student_tasks(user, cohort, tasks, index)
+    save_new_tasks(created)
+
     logger.debug(f'Added {len(syncronized)} tasks for student {user.email}')
     return syncronized
 
 
 def sync_cohort_tasks(cohort):
+    """
+    Sync the tasks of all the active students of the cohort, their task lists are fetched
+    concurrently from the old API and the missing tasks are created with one query.
+    """
 
-    synchronized = []
     cohort_users = CohortUser.objects.filter(cohort__id=cohort.id,
                                              role='STUDENT',
-                                             educational_status__in=['ACTIVE'])
-    for cu in cohort_users:
+                                             educational_status__in=['ACTIVE']).select_related('user')
+    users = [cu.user for cu in cohort_users]
+    session = get_session()
+
+    def fetch(user):
         try:
-            tasks = sync_student_tasks(cu.user, cohort=cohort)
-            synchronized = synchronized + tasks
-        except:
+            return fetch_student_tasks(user, session=session)
+        except Exception as e:
+            logger.error(f'Error syncing the tasks of {user.email}: {str(e)}')
+            return None
+
+    with ThreadPoolExecutor(max_workers=TASK_SYNC_MAX_WORKERS) as executor:
+        responses = list(executor.map(fetch, users))
+
+    index = {(x.user_id, x.associated_slug): x
+             for x in Task.objects.filter(user__id__in=[x.id for x in users])}
+
+    synchronized = []
+    created = []
+    for user, tasks in zip(users, responses):
+        if tasks is None:
             continue
 
+        student_tasks, student_created = merge_student_tasks(user, cohort, tasks, index)
+        synchronized += student_tasks
+        created += student_created
+
+    save_new_tasks(created)
     return synchronized
 
 
@@ -0,0 +1,47 @@
+import os
+from django.core.cache import cache
+
+__all__ = ['CohortStudentCache']
+
+# the signals invalidate the cohorts on each change, this bounds the changes made with `update()`
+COHORT_STUDENT_CACHE_TTL = int(os.getenv('COHORT_STUDENT_CACHE_TTL', 60 * 60))
+
+
+class CohortStudentCache:
+    """
+    Ids of the students of each cohort, used to filter the tasks by the cohorts of their users
+    without join the cohort users of each task.
+    """
+    def __generate_key__(self, cohort_id: int) -> str:
+        return f'CohortStudent__{cohort_id}'
+
+    def get(self, cohort_ids: list[int]) -> set[int]:
+        """Get the ids of the students of all the cohorts, the missing cohorts are loaded in one query."""
+        from breathecode.admissions.models import CohortUser
+
+        cohort_ids = set(cohort_ids)
+        keys = {self.__generate_key__(x): x for x in cohort_ids}
+        cached = cache.get_many(keys.keys())
+
+        students = {keys[key]: value for key, value in cached.items()}
+        missing = [x for x in cohort_ids if x not in students]
+
+        if missing:
+            rows = CohortUser.objects.filter(cohort__id__in=missing, role='STUDENT')
+
+            loaded = {x: set() for x in missing}
+            for cohort_id, user_id in rows.values_list('cohort__id', 'user__id'):
+                loaded[cohort_id].add(user_id)
+
+            entries = {self.__generate_key__(x): y for x, y in loaded.items()}
+            cache.set_many(entries, timeout=COHORT_STUDENT_CACHE_TTL)
+            students.update(loaded)
+
+        result = set()
+        for user_ids in students.values():
+            result |= user_ids
+
+        return result
+
+    def clear(self, *cohort_ids: int) -> None:
+        cache.delete_many([self.__generate_key__(x) for x in cohort_ids])
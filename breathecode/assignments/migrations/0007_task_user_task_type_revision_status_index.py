@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 21:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assignments', '0006_cohortproxy_userproxy'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'task_type', 'revision_status', 'created_at'],
+                               name='assignments_user_id_f0e438_idx'),
+        ),
+    ]
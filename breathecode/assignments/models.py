@@ -50,6 +50,9 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
     updated_at = models.DateTimeField(auto_now=True, editable=False)
 
+    class Meta:
+        indexes = [models.Index(fields=['user', 'task_type', 'revision_status', 'created_at'])]
+
 
 class UserProxy(User):
     class Meta:
@@ -1,5 +1,8 @@
 import logging
+from django.db.models.signals import post_delete, post_save
+from breathecode.admissions.models import CohortUser
 from breathecode.admissions.signals import syllabus_asset_slug_updated
+from .caches import CohortStudentCache
 from .models import Task
 from django.dispatch import receiver
 
@@ -18,3 +21,9 @@ def process_syllabus_asset_slug_updated(sender, **kwargs):
     logger.debug(
         f'{asset_type} slug {from_slug} was replaced with {to_slug} on all the syllabus, as a sideeffect we are replacing the slug also on the student tasks'
     )
+
+
+@receiver(post_save, sender=CohortUser)
+@receiver(post_delete, sender=CohortUser)
+def cohort_user_changed(sender, instance, **kwargs):
+    CohortStudentCache().clear(instance.cohort_id)
@@ -0,0 +1,126 @@
+"""
+Test the sync of the tasks of the cohorts
+"""
+from unittest.mock import patch
+from breathecode.tests.mocks.requests import REQUESTS_PATH, apply_requests_request_mock
+from ..mixins import AssignmentsTestCase
+from ... import actions
+from ...actions import sync_cohort_tasks, sync_student_tasks
+
+
+def get_url(email):
+    return f'{actions.HOST}/student/{email}/task/'
+
+
+def get_task(slug, **kwargs):
+    return {
+        'type': 'assignment',
+        'status': 'done',
+        'revision_status': 'approved',
+        'associated_slug': slug,
+        'title': slug.capitalize(),
+        'live_url': None,
+        'github_url': f'https://github.com/4geeks/{slug}',
+        'description': '',
+        **kwargs,
+    }
+
+
+def get_students(how_many):
+    return {
+        'user': [{
+            'email': f'student{n}@4geeks.com'
+        } for n in range(1, how_many + 1)],
+        'cohort_user': [{
+            'user_id': n,
+            'role': 'STUDENT',
+            'educational_status': 'ACTIVE',
+        } for n in range(1, how_many + 1)],
+    }
+
+
+class SyncCohortTasksTestSuite(AssignmentsTestCase):
+    """
+    🔽🔽🔽 sync_student_tasks
+    """
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([(200, get_url('student1@4geeks.com'), {
+               'data': [get_task('kenny'),
+                        get_task('cartman', type='quiz', status='pending')]
+           })]))
+    def test_sync_student_tasks(self):
+        model = self.bc.database.create(**get_students(1), task={'associated_slug': 'kenny'})
+
+        tasks = sync_student_tasks(model.user, cohort=model.cohort)
+
+        self.assertEqual([(x.id, x.associated_slug) for x in tasks], [(1, 'kenny'), (2, 'cartman')])
+
+        db = self.bc.database.list_of('assignments.Task')
+        fields = ['user_id', 'cohort_id', 'associated_slug', 'task_type', 'task_status', 'revision_status']
+
+        self.assertEqual([tuple(x[field] for field in fields) for x in db], [
+            tuple(db[0][field] for field in fields),
+            (1, 1, 'cartman', 'QUIZ', 'PENDING', 'APPROVED'),
+        ])
+
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([(200, get_url('student1@4geeks.com'), {
+               'data': [get_task('kenny', type='video')]
+           })]))
+    def test_sync_student_tasks__invalid_task_type(self):
+        model = self.bc.database.create(**get_students(1))
+
+        with self.assertRaisesMessage(Exception, 'Invalid task_type video'):
+            sync_student_tasks(model.user, cohort=model.cohort)
+
+        self.assertEqual(self.bc.database.list_of('assignments.Task'), [])
+
+    """
+    🔽🔽🔽 sync_cohort_tasks
+    """
+
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([
+               (200, get_url('student1@4geeks.com'), {
+                   'data': [get_task('kenny'), get_task('cartman')]
+               }),
+               (200, get_url('student2@4geeks.com'), {
+                   'data': [get_task('kenny'), get_task('stan')]
+               }),
+               (200, get_url('student3@4geeks.com'), {
+                   'data': [get_task('kenny', status='lost')]
+               }),
+           ]))
+    def test_sync_cohort_tasks(self):
+        import requests
+
+        model = self.bc.database.create(**get_students(3), task={'associated_slug': 'kenny', 'user_id': 1})
+
+        # cohort users, the existing tasks and the bulk insert, sqlite also needs to get the new ids
+        with self.assertNumQueries(4):
+            tasks = sync_cohort_tasks(model.cohort)
+
+        self.assertEqual(sorted([x[0][1] for x in requests.Session.request.call_args_list]),
+                         [get_url(f'student{n}@4geeks.com') for n in range(1, 4)])
+
+        self.assertEqual([(x.id, x.user_id, x.associated_slug) for x in tasks], [
+            (1, 1, 'kenny'),
+            (2, 1, 'cartman'),
+            (3, 2, 'kenny'),
+            (4, 2, 'stan'),
+        ])
+
+        db = self.bc.database.list_of('assignments.Task')
+        self.assertEqual([(x['user_id'], x['cohort_id'], x['associated_slug']) for x in db], [
+            (1, 1, 'kenny'),
+            (1, 1, 'cartman'),
+            (2, 1, 'kenny'),
+            (2, 1, 'stan'),
+        ])
+
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([]))
+    def test_sync_cohort_tasks__students_not_found(self):
+        model = self.bc.database.create(**get_students(2))
+
+        self.assertEqual(sync_cohort_tasks(model.cohort), [])
+        self.assertEqual(self.bc.database.list_of('assignments.Task'), [])
@@ -10,6 +10,7 @@ from rest_framework import status
 
 from breathecode.services.google_cloud import Datastore
 
+from ...caches import CohortStudentCache
 from ..mixins import AssignmentsTestCase
 
 
@@ -1364,3 +1365,43 @@ class MediaTestSuite(AssignmentsTestCase):
         self.assertEqual(json, expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(self.bc.database.list_of('assignments.Task'), self.bc.format.to_dict(model.task))
+
+    """
+    🔽🔽🔽 Pagination
+    """
+
+    def test_task__with_limit(self):
+        model = self.bc.database.create(profile_academy=1, user=1, task=3)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('assignments:task') + '?limit=2&offset=1'
+        response = self.client.get(url)
+
+        json = response.json()
+
+        self.assertEqual(json['count'], 3)
+        self.assertEqual([x['id'] for x in json['results']], [2, 3])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    """
+    🔽🔽🔽 Students of the cohorts
+    """
+
+    def test_task__query_stu_cohort__students_are_cached(self):
+        cohort_users = [{'role': 'STUDENT', 'user_id': 1, 'cohort_id': 1}]
+        model = self.bc.database.create(profile_academy=1, task=1, cohort=1, cohort_user=cohort_users)
+        self.bc.request.authenticate(model.user)
+
+        url = reverse_lazy('assignments:task') + '?stu_cohort=1'
+        self.client.get(url)
+
+        self.assertEqual(CohortStudentCache().get([1]), {1})
+
+        # the cohort is invalidated when its users change
+        self.bc.database.create(user=1, cohort_user={'role': 'STUDENT', 'user_id': 2, 'cohort_id': 1})
+
+        response = self.client.get(url)
+        json = response.json()
+
+        self.assertEqual([x['id'] for x in json], [1])
+        self.assertEqual(CohortStudentCache().get([1]), {1, 2})
@@ -2,17 +2,18 @@ from breathecode.authenticate.models import ProfileAcademy
 import logging
 from django.shortcuts import render
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from rest_framework.views import APIView
 from django.contrib.auth.models import AnonymousUser
 from django.contrib import messages
-from breathecode.utils import ValidationException, capable_of, localize_query
+from breathecode.utils import ValidationException, capable_of, localize_query, HeaderLimitOffsetPagination
 from breathecode.admissions.models import Academy, CohortUser, Cohort
 from breathecode.authenticate.models import Token
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework import status
 from breathecode.utils import APIException
+from .caches import CohortStudentCache
 from .models import Task
 from .actions import deliver_task
 from .forms import DeliverAssigntmentForm
@@ -23,10 +24,13 @@ import breathecode.assignments.tasks as tasks
 logger = logging.getLogger(__name__)
 
 
-class TaskTeacherView(APIView):
+class TaskTeacherView(APIView, HeaderLimitOffsetPagination):
+    """
+    Tasks of the students of the academies of the user, the filters by the cohorts of the students
+    use the cached ids of the students of each cohort and EXISTS instead of join the cohort users.
+    """
     def get(self, request, task_id=None, user_id=None):
         items = Task.objects.all()
-        logger.debug(f'Found {items.count()} tasks')
 
         profile_ids = ProfileAcademy.objects.filter(user=request.user.id).values_list('academy__id',
                                                                                       flat=True)
@@ -57,28 +61,25 @@ class TaskTeacherView(APIView):
         # tasks from users that belong to these cohort
         stu_cohort = request.GET.get('stu_cohort', None)
         if stu_cohort is not None:
-            ids = stu_cohort.split(',')
-
             stu_cohorts = stu_cohort.split(',')
             ids = [x for x in stu_cohorts if x.isnumeric()]
             slugs = [x for x in stu_cohorts if not x.isnumeric()]
 
-            items = items.filter(
-                Q(user__cohortuser__cohort__id__in=ids) | Q(user__cohortuser__cohort__slug__in=slugs),
-                user__cohortuser__role='STUDENT',
-            )
+            cohort_ids = Cohort.objects.filter(Q(id__in=ids) | Q(slug__in=slugs)).values_list('id', flat=True)
+            items = items.filter(user__id__in=CohortStudentCache().get(cohort_ids))
 
         edu_status = request.GET.get('edu_status', None)
         if edu_status is not None:
-            items = items.filter(user__cohortuser__educational_status__in=edu_status.split(','))
+            cohort_users = CohortUser.objects.filter(user=OuterRef('user'),
+                                                     educational_status__in=edu_status.split(','))
+            items = items.filter(Exists(cohort_users))
 
         # tasks from users that belong to these cohort
         teacher = request.GET.get('teacher', None)
         if teacher is not None:
             teacher_cohorts = CohortUser.objects.filter(user__id__in=teacher.split(','),
                                                         role='TEACHER').values_list('cohort__id', flat=True)
-            items = items.filter(user__cohortuser__cohort__id__in=teacher_cohorts,
-                                 user__cohortuser__role='STUDENT').distinct()
+            items = items.filter(user__id__in=CohortStudentCache().get(teacher_cohorts))
 
         task_status = request.GET.get('task_status', None)
         if task_status is not None:
@@ -92,10 +93,14 @@ class TaskTeacherView(APIView):
         if task_type is not None:
             items = items.filter(task_type__in=task_type.split(','))
 
-        items = items.order_by('created_at')
+        items = items.select_related('user').order_by('created_at')
 
-        serializer = TaskGETSerializer(items, many=True)
-        return Response(serializer.data)
+        page = self.paginate_queryset(items, request)
+        serializer = TaskGETSerializer(page, many=True)
+        if self.is_paginate(request):
+            return self.get_paginated_response(serializer.data)
+        else:
+            return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
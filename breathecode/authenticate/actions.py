@@ -1,6 +1,7 @@
-import os, string, logging, urllib.parse, random
+import os, string, logging, urllib.parse, random, time
 from django.contrib.auth.models import User
 from django.utils import timezone
+from .caches import TokenCache
 from .models import DeviceId, Token, Role, ProfileAcademy
 from breathecode.notify.actions import send_email_message
 from breathecode.admissions.models import Academy
@@ -23,17 +24,35 @@ def create_user(github_id=None, email=None):
     return user
 
 
-def delete_tokens(users=None, status='expired'):
+def delete_tokens(users=None, status='expired', batch_size=1000, sleep=0):
+    """
+    Delete the tokens in batches of `batch_size`, it waits `sleep` seconds between each batch to avoid
+    saturate the database when it's run by the background sweep.
+    """
     now = timezone.now()
 
     tokens = Token.objects.all()
     if users is not None:
-        tokens = tokens.filter(user__id__in=[users])
+        tokens = tokens.filter(user__id__in=users)
     if status == 'expired':
-        tokens = Token.objects.filter(expires_at__lt=now)
+        tokens = tokens.filter(expires_at__lt=now)
+
+    count = 0
+    while True:
+        batch = list(tokens.order_by('id').values_list('id', 'key')[:batch_size])
+        if not batch:
+            break
+
+        Token.objects.filter(id__in=[id for id, _ in batch]).delete()
+        TokenCache().clear(*[key for _, key in batch])
+        count += len(batch)
+
+        if len(batch) < batch_size:
+            break
+
+        if sleep:
+            time.sleep(sleep)
 
-    count = len(tokens)
-    tokens.delete()
     return count
 
 
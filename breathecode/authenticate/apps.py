@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class AuthenticateConfig(AppConfig):
+    name = 'breathecode.authenticate'
+
+    def ready(self):
+        from . import receivers
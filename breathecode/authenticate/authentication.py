@@ -1,6 +1,9 @@
 # authentication.py
 
+from django.contrib.auth.models import User
+from django.db import router
 from rest_framework.authentication import TokenAuthentication
+from .caches import TokenCache
 from .models import Token
 from rest_framework.exceptions import AuthenticationFailed
 from django.utils import timezone
@@ -13,11 +16,28 @@ class ExpiringTokenAuthentication(TokenAuthentication):
     and password for new one to be created.
     '''
     def authenticate_credentials(self, key, request=None):
-        token = Token.objects.select_related('user').filter(key=key).first()
-        if token is None:
-            raise AuthenticationFailed({'error': 'Invalid or Inactive Token', 'is_authenticated': False})
+        cache = TokenCache()
+        data = cache.get(key)
 
-        if not token.user.is_active:
+        if data is None:
+            token = Token.objects.select_related('user').filter(key=key).first()
+            if token is None:
+                raise AuthenticationFailed({'error': 'Invalid or Inactive Token', 'is_authenticated': False})
+
+            cache.set(token)
+            user = token.user
+
+        else:
+            # the password is not cached, it's deferred and loaded just if it's used
+            fields = [x.attname for x in User._meta.concrete_fields if x.attname in data['user']]
+            user = User.from_db(router.db_for_read(User), fields, [data['user'][x] for x in fields])
+            token = Token(id=data['id'],
+                          key=key,
+                          user_id=user.id,
+                          token_type=data['token_type'],
+                          expires_at=data['expires_at'])
+
+        if not user.is_active:
             raise AuthenticationFailed({'error': 'Invalid or innactive user', 'is_authenticated': False})
 
         now = timezone.now()
@@ -26,4 +46,4 @@ class ExpiringTokenAuthentication(TokenAuthentication):
                 'error': 'Token expired at ' + str(token.expires_at),
                 'is_authenticated': False
             })
-        return token.user, token
+        return user, token
@@ -0,0 +1,154 @@
+import os, time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+from django.core.cache import cache
+from django.db.models import Q
+
+__all__ = ['CapabilityCache', 'TokenCache']
+
+# the local snapshots are not invalidated by the signals of others processes, this is the max staleness
+LOCAL_TTL = int(os.getenv('CAPABILITY_CACHE_LOCAL_TTL', 10))
+# max number of users kept in the local memory, the least recently used are evicted first
+LOCAL_SIZE = int(os.getenv('CAPABILITY_CACHE_LOCAL_SIZE', 1000))
+SHARED_TTL = 60 * 60 * 24
+
+
+class CapabilityCache:
+    """
+    Snapshot of the capabilities and permissions of each user.
+
+    The snapshot is a set of `(academy_id, capability)` pairs and a set of permission codenames, it is
+    kept in a local memory of the process and in the shared cache (Redis), so in the steady state
+    `capable_of` and `has_permission` are a set lookup without hit the database.
+    """
+
+    # user_id -> (expires_at, snapshot), ordered from the least to the most recently used
+    __local__: OrderedDict[int, tuple[float, dict[str, frozenset]]] = OrderedDict()
+    __lock__ = Lock()
+
+    def __version_key__(self) -> str:
+        return 'Capability__version'
+
+    def __generate_key__(self, user_id: int, version: int) -> str:
+        return f'Capability__v{version}__user={user_id}'
+
+    def __get_version__(self) -> int:
+        version_key = self.__version_key__()
+        version = cache.get(version_key)
+
+        if version is None:
+            cache.add(version_key, int(time.time() * 1000), timeout=None)
+            version = cache.get(version_key)
+
+        return version
+
+    def __load__(self, user_id: int) -> dict[str, frozenset]:
+        from .models import ProfileAcademy, Permission
+
+        capabilities = ProfileAcademy.objects.filter(user__id=user_id,
+                                                     role__capabilities__slug__isnull=False).values_list(
+                                                         'academy__id', 'role__capabilities__slug')
+
+        permissions = Permission.objects.filter(Q(user__id=user_id)
+                                                | Q(group__user__id=user_id)).values_list('codename',
+                                                                                          flat=True)
+
+        return {
+            'capabilities': frozenset([(academy_id, slug) for academy_id, slug in capabilities]),
+            'permissions': frozenset(permissions),
+        }
+
+    def get(self, user_id: int) -> dict[str, frozenset]:
+        """Get the snapshot of one user, it's loaded from the database just when it's not cached."""
+
+        now = time.time()
+        with CapabilityCache.__lock__:
+            local = CapabilityCache.__local__.get(user_id)
+            if local and local[0] > now:
+                CapabilityCache.__local__.move_to_end(user_id)
+                return local[1]
+
+        key = self.__generate_key__(user_id, self.__get_version__())
+
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = self.__load__(user_id)
+            cache.set(key, snapshot, timeout=SHARED_TTL)
+
+        with CapabilityCache.__lock__:
+            CapabilityCache.__local__[user_id] = (now + LOCAL_TTL, snapshot)
+            CapabilityCache.__local__.move_to_end(user_id)
+
+            while len(CapabilityCache.__local__) > LOCAL_SIZE:
+                CapabilityCache.__local__.popitem(last=False)
+
+        return snapshot
+
+    def has_capability(self, user_id: int, academy_id: int, capability: str) -> bool:
+        if user_id is None:
+            return False
+
+        return (int(academy_id), capability) in self.get(user_id)['capabilities']
+
+    def has_permission(self, user_id: int, permission: str) -> bool:
+        if user_id is None:
+            return False
+
+        return permission in self.get(user_id)['permissions']
+
+    def clear_user(self, user_id: int) -> None:
+        """Invalidate the snapshot of one user."""
+
+        with CapabilityCache.__lock__:
+            CapabilityCache.__local__.pop(user_id, None)
+
+        cache.delete(self.__generate_key__(user_id, self.__get_version__()))
+
+    def clear(self) -> None:
+        """Invalidate the snapshots of all the users, used when a role or a capability change."""
+
+        with CapabilityCache.__lock__:
+            CapabilityCache.__local__.clear()
+
+        try:
+            cache.incr(self.__version_key__())
+
+        except ValueError:
+            # the counter does not exists yet or it was evicted
+            if not cache.add(self.__version_key__(), int(time.time() * 1000), timeout=None):
+                cache.incr(self.__version_key__())
+
+
+class TokenCache:
+    """
+    Short lived cache of the tokens used by `ExpiringTokenAuthentication`.
+
+    It saves `(id, token_type, expires_at)` and the fields of the user but its password by token key, it
+    must be cleared when a token is destroyed or when its user is changed.
+    """
+
+    ttl: int = int(os.getenv('TOKEN_CACHE_TTL', 60))
+
+    def __generate_key__(self, key: str) -> str:
+        return f'Token__key={key}'
+
+    def get(self, key: str) -> Optional[dict]:
+        return cache.get(self.__generate_key__(key))
+
+    def set(self, token) -> None:
+        data = {
+            'id': token.id,
+            'user': {
+                field.attname: getattr(token.user, field.attname)
+                for field in token.user._meta.concrete_fields if field.attname != 'password'
+            },
+            'token_type': token.token_type,
+            'expires_at': token.expires_at,
+        }
+
+        cache.set(self.__generate_key__(token.key), data, timeout=self.ttl)
+
+    def clear(self, *keys: str) -> None:
+        if keys:
+            cache.delete_many([self.__generate_key__(key) for key in keys])
@@ -8,6 +8,20 @@ from ...actions import delete_tokens
 class Command(BaseCommand):
     help = 'Delete expired temporal and login tokens'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size',
+                            action='store',
+                            dest='batch_size',
+                            type=int,
+                            default=1000,
+                            help='How many tokens are deleted per query')
+        parser.add_argument('--sleep',
+                            action='store',
+                            dest='sleep',
+                            type=float,
+                            default=0.5,
+                            help='Seconds to wait between each batch')
+
     def handle(self, *args, **options):
-        count = delete_tokens()
+        count = delete_tokens(batch_size=options['batch_size'], sleep=options['sleep'])
         print(f'{count} tokens were deleted')
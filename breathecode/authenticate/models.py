@@ -1,7 +1,6 @@
 from datetime import datetime
 from typing import Any
 from django.contrib.auth.models import User, Group, Permission
-from django.core.exceptions import MultipleObjectsReturned
 from django.conf import settings
 from django.db.models import Q
 from django.db import models
@@ -10,8 +9,8 @@ import rest_framework.authtoken.models
 from django.utils import timezone
 from django.core.validators import RegexValidator
 
-from breathecode.authenticate.exceptions import (BadArguments, InvalidTokenType, TokenNotFound,
-                                                 TryToGetOrCreateAOneTimeToken)
+from breathecode.authenticate.exceptions import BadArguments, InvalidTokenType, TokenNotFound
+from .caches import TokenCache
 from .signals import invite_accepted
 from breathecode.admissions.models import Academy, Cohort
 
@@ -290,8 +289,6 @@ class Token(rest_framework.authtoken.models.Token):
         utc_now = timezone.now()
         kwargs['token_type'] = token_type
 
-        cls.delete_expired_tokens(utc_now)
-
         if token_type not in TOKEN_TYPE:
             raise InvalidTokenType(f'Invalid token_type, correct values are {", ".join(TOKEN_TYPE)}')
 
@@ -312,16 +309,13 @@ class Token(rest_framework.authtoken.models.Token):
         token = None
         created = False
 
-        try:
-            if token_type == 'one_time':
-                raise TryToGetOrCreateAOneTimeToken()
-
-            token, created = Token.objects.get_or_create(user=user, **kwargs)
-
-        except MultipleObjectsReturned:
-            token = Token.objects.filter(user=user, **kwargs).first()
+        # the expired tokens are deleted in background, they must be ignored here
+        if token_type != 'one_time':
+            token = Token.objects.filter(
+                user=user, **kwargs).filter(Q(expires_at__gt=utc_now)
+                                            | Q(expires_at__isnull=True)).first()
 
-        except TryToGetOrCreateAOneTimeToken:
+        if token is None:
             created = True
             token = Token.objects.create(user=user, **kwargs)
 
@@ -330,7 +324,6 @@ class Token(rest_framework.authtoken.models.Token):
     @classmethod
     def get_valid(cls, token: str):
         utc_now = timezone.now()
-        cls.delete_expired_tokens(utc_now)
 
         # find among any non-expired token
         return Token.objects.filter(key=token).filter(Q(expires_at__gt=utc_now)
@@ -343,6 +336,7 @@ class Token(rest_framework.authtoken.models.Token):
             raise TokenNotFound()
 
         token.delete()
+        TokenCache().clear(hash)
 
     class Meta:
         # ensure user and name are unique
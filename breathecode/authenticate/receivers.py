@@ -0,0 +1,69 @@
+import logging
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from .caches import CapabilityCache, TokenCache
+from .models import User, Group, Permission, ProfileAcademy, Role, Capability, Token
+
+logger = logging.getLogger(__name__)
+
+M2M_ACTIONS = ['post_add', 'post_remove', 'post_clear']
+
+
+@receiver(post_save, sender=ProfileAcademy)
+@receiver(post_delete, sender=ProfileAcademy)
+def profile_academy_changed(sender, instance, **kwargs):
+    if instance.user_id:
+        logger.debug(f'Clearing the capability snapshot of the user {instance.user_id}')
+        CapabilityCache().clear_user(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    CapabilityCache().clear_user(instance.id)
+
+
+@receiver(post_save, sender=User)
+@receiver(pre_delete, sender=User)
+def user_tokens_changed(sender, instance, **kwargs):
+    # the tokens cache the fields of its user, and the tokens of a deactivated or deleted user can't be
+    # served from the cache
+    keys = Token.objects.filter(user__id=instance.id).values_list('key', flat=True)
+    TokenCache().clear(*keys)
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    # a revoked token can't keep working until the cache expires
+    TokenCache().clear(instance.key)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=Capability)
+@receiver(post_delete, sender=Capability)
+@receiver(post_delete, sender=Permission)
+def role_or_capability_changed(sender, **kwargs):
+    logger.debug('Clearing the capability snapshots of all the users')
+    CapabilityCache().clear()
+
+
+@receiver(m2m_changed, sender=Role.capabilities.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def role_capabilities_changed(sender, action, **kwargs):
+    if action in M2M_ACTIONS:
+        CapabilityCache().clear()
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def user_permissions_changed(sender, instance, action, reverse, **kwargs):
+    if action not in M2M_ACTIONS:
+        return
+
+    # the relation was changed from the side of the group or the permission
+    if reverse:
+        CapabilityCache().clear()
+
+    else:
+        CapabilityCache().clear_user(instance.id)
@@ -152,6 +152,8 @@ class AcademySmallSerializer(serpy.Serializer):
 
 class UserSmallSerializer(serpy.Serializer):
     """The serializer schema definition."""
+    relations = ['credentialsgithub', 'profile']
+
     # Use a Field subclass like IntField if you need more validation.
     id = serpy.Field()
     email = serpy.Field()
@@ -175,6 +177,8 @@ class UserSmallSerializer(serpy.Serializer):
 
 class UserSuperSmallSerializer(serpy.Serializer):
     """The serializer schema definition."""
+    relations = ['profile']
+
     # Use a Field subclass like IntField if you need more validation.
     id = serpy.Field()
     email = serpy.Field()
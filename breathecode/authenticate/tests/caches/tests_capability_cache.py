@@ -0,0 +1,104 @@
+"""
+Test cases for CapabilityCache
+"""
+from unittest.mock import patch
+from ..mixins.new_auth_test_case import AuthTestCase
+from ...caches import CapabilityCache
+
+
+class CapabilityCacheTestSuite(AuthTestCase):
+    """
+    🔽🔽🔽 has_capability
+    """
+    def test_has_capability__without_user(self):
+        cache = CapabilityCache()
+        self.assertEqual(cache.has_capability(None, 1, 'read_cohort'), False)
+
+    def test_has_capability__without_profile_academy(self):
+        model = self.generate_models(user=True, academy=True)
+        cache = CapabilityCache()
+
+        self.assertEqual(cache.has_capability(model.user.id, 1, 'read_cohort'), False)
+
+    def test_has_capability__with_profile_academy(self):
+        model = self.generate_models(user=True, profile_academy=True, capability='read_cohort', role='potato')
+        cache = CapabilityCache()
+
+        self.assertEqual(cache.has_capability(model.user.id, 1, 'read_cohort'), True)
+        self.assertEqual(cache.has_capability(model.user.id, '1', 'read_cohort'), True)
+        self.assertEqual(cache.has_capability(model.user.id, 2, 'read_cohort'), False)
+        self.assertEqual(cache.has_capability(model.user.id, 1, 'crud_cohort'), False)
+
+    def test_has_capability__without_queries_in_the_steady_state(self):
+        model = self.generate_models(user=True, profile_academy=True, capability='read_cohort', role='potato')
+        cache = CapabilityCache()
+        cache.has_capability(model.user.id, 1, 'read_cohort')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(cache.has_capability(model.user.id, 1, 'read_cohort'), True)
+
+    """
+    🔽🔽🔽 invalidation
+    """
+
+    def test_has_capability__profile_academy_deleted(self):
+        model = self.generate_models(user=True, profile_academy=True, capability='read_cohort', role='potato')
+        cache = CapabilityCache()
+        cache.has_capability(model.user.id, 1, 'read_cohort')
+
+        model.profile_academy.delete()
+
+        self.assertEqual(cache.has_capability(model.user.id, 1, 'read_cohort'), False)
+
+    def test_has_capability__capability_removed_from_role(self):
+        model = self.generate_models(user=True, profile_academy=True, capability='read_cohort', role='potato')
+        cache = CapabilityCache()
+        cache.has_capability(model.user.id, 1, 'read_cohort')
+
+        model.role.capabilities.remove(model.capability)
+
+        self.assertEqual(cache.has_capability(model.user.id, 1, 'read_cohort'), False)
+
+    """
+    🔽🔽🔽 has_permission
+    """
+
+    def test_has_permission__without_permission(self):
+        model = self.generate_models(user=True)
+        permission = self.generate_models(permission=True).permission
+        cache = CapabilityCache()
+
+        self.assertEqual(cache.has_permission(model.user.id, permission.codename), False)
+
+    def test_has_permission__with_permission(self):
+        model = self.generate_models(user=True, permission=True)
+        cache = CapabilityCache()
+
+        self.assertEqual(cache.has_permission(model.user.id, model.permission.codename), True)
+
+    def test_has_permission__with_permission_added_to_the_user(self):
+        model = self.generate_models(user=True)
+        permission = self.generate_models(permission=True).permission
+        cache = CapabilityCache()
+        cache.has_permission(model.user.id, permission.codename)
+
+        model.user.user_permissions.add(permission)
+
+        self.assertEqual(cache.has_permission(model.user.id, permission.codename), True)
+
+    """
+    🔽🔽🔽 Local memory
+    """
+
+    @patch('breathecode.authenticate.caches.LOCAL_SIZE', 2)
+    def test_get__the_least_recently_used_are_evicted(self):
+        model = self.bc.database.create(user=3)
+        cache = CapabilityCache()
+        CapabilityCache.__local__.clear()
+
+        cache.get(model.user[0].id)
+        cache.get(model.user[1].id)
+        cache.get(model.user[0].id)
+        cache.get(model.user[2].id)
+
+        self.assertEqual(list(CapabilityCache.__local__), [model.user[0].id, model.user[2].id])
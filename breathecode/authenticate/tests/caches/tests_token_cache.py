@@ -0,0 +1,116 @@
+"""
+Test cases for TokenCache
+"""
+import pickle
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.urls.base import reverse_lazy
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from ..mixins.new_auth_test_case import AuthTestCase
+from ...actions import delete_tokens
+from ...authentication import ExpiringTokenAuthentication
+from ...caches import TokenCache
+from ...models import Token
+
+
+class TokenCacheTestSuite(AuthTestCase):
+    """
+    🔽🔽🔽 authenticate_credentials
+    """
+    def test_authenticate_credentials__token_cached(self):
+        model = self.generate_models(user=True, token=True, token_kwargs={'token_type': 'login'})
+        authentication = ExpiringTokenAuthentication()
+        authentication.authenticate_credentials(model.token.key)
+
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate_credentials(model.token.key)
+
+            self.assertEqual(type(user), User)
+            self.assertEqual(user.id, model.user.id)
+            self.assertEqual(user.email, model.user.email)
+            self.assertEqual(user.is_authenticated, True)
+            self.assertEqual(token.id, model.token.id)
+
+        self.assertEqual(user.password, model.user.password)
+        self.assertEqual(pickle.loads(pickle.dumps(user)).id, model.user.id)
+
+    def test_authenticate_credentials__token_expired_in_the_cache(self):
+        expires_at = timezone.now() - timedelta(seconds=1)
+        model = self.generate_models(user=True, token=True, token_kwargs={'expires_at': expires_at})
+        TokenCache().set(model.token)
+
+        with self.assertRaises(AuthenticationFailed):
+            ExpiringTokenAuthentication().authenticate_credentials(model.token.key)
+
+    """
+    🔽🔽🔽 invalidation
+    """
+
+    def test_validate_and_destroy__clear_the_cache(self):
+        model = self.generate_models(user=True, token=True, token_kwargs={'token_type': 'one_time'})
+        TokenCache().set(model.token)
+
+        Token.validate_and_destroy(model.user, model.token.key)
+
+        self.assertEqual(TokenCache().get(model.token.key), None)
+
+    def test_user_deactivated__clear_the_cache(self):
+        model = self.generate_models(user=True, token=True, token_kwargs={'token_type': 'login'})
+        TokenCache().set(model.token)
+
+        model.user.is_active = False
+        model.user.save()
+
+        self.assertEqual(TokenCache().get(model.token.key), None)
+
+    def test_user_changed__clear_the_cache(self):
+        model = self.generate_models(user=True, token=True, token_kwargs={'token_type': 'login'})
+        TokenCache().set(model.token)
+
+        model.user.email = 'konan@naruto.io'
+        model.user.save()
+
+        self.assertEqual(TokenCache().get(model.token.key), None)
+
+    def test_token_deleted__clear_the_cache(self):
+        model = self.generate_models(user=True, token=True, token_kwargs={'token_type': 'login'})
+        TokenCache().set(model.token)
+
+        Token.objects.filter(user=model.user).delete()
+
+        self.assertEqual(TokenCache().get(model.token.key), None)
+
+    def test_token_deleted__unauthorized_in_the_next_request(self):
+        model = self.generate_models(user=True, token=True, token_kwargs={'token_type': 'login'})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {model.token.key}')
+
+        url = reverse_lazy('authenticate:user_me')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        Token.objects.filter(user=model.user).delete()
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    """
+    🔽🔽🔽 delete_tokens
+    """
+
+    def test_delete_tokens__in_batches(self):
+        expires_at = timezone.now() - timedelta(seconds=1)
+        base = self.generate_models(user=True)
+        models = [
+            self.generate_models(token=True, token_kwargs={'expires_at': expires_at}, models=base)
+            for _ in range(0, 3)
+        ]
+        valid = self.generate_models(token=True, token_kwargs={'token_type': 'permanent'}, models=base)
+
+        for model in models:
+            TokenCache().set(model.token)
+
+        self.assertEqual(delete_tokens(batch_size=2), 3)
+        self.assertEqual([x['id'] for x in self.all_token_dict()], [valid.token.id])
+        self.assertEqual([TokenCache().get(x.token.key) for x in models], [None, None, None])
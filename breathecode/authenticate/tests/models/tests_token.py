@@ -348,9 +348,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[-1]['created']
+        expires_at = db[-1]['expires_at']
+        token = db[-1]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -360,11 +360,13 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(days=1) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[-1]['created']
+        del db[-1]['expires_at']
+        del db[-1]['key']
 
-        self.assertEqual(db, [{'id': 2, 'token_type': 'login', 'user_id': 1}])
+        # the expired tokens are deleted by the background sweep
+        self.assertEqual([x['id'] for x in db], [1, 2])
+        self.assertEqual(db[-1], {'id': 2, 'token_type': 'login', 'user_id': 1})
 
     def test_get_or_create__token_type_temporal__token_exists(self):
         start = timezone.now()
@@ -376,9 +378,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[-1]['created']
+        expires_at = db[-1]['expires_at']
+        token = db[-1]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -388,11 +390,13 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(minutes=10) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[-1]['created']
+        del db[-1]['expires_at']
+        del db[-1]['key']
 
-        self.assertEqual(db, [{'id': 2, 'token_type': 'temporal', 'user_id': 1}])
+        # the expired tokens are deleted by the background sweep
+        self.assertEqual([x['id'] for x in db], [1, 2])
+        self.assertEqual(db[-1], {'id': 2, 'token_type': 'temporal', 'user_id': 1})
 
     def test_get_or_create__token_type_one_time__token_exists(self):
         start = timezone.now()
@@ -464,9 +468,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[-1]['created']
+        expires_at = db[-1]['expires_at']
+        token = db[-1]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -476,11 +480,13 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(days=1) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[-1]['created']
+        del db[-1]['expires_at']
+        del db[-1]['key']
 
-        self.assertEqual(db, [{'id': 3, 'token_type': 'login', 'user_id': 1}])
+        # the expired tokens are deleted by the background sweep
+        self.assertEqual([x['id'] for x in db], [1, 2, 3])
+        self.assertEqual(db[-1], {'id': 3, 'token_type': 'login', 'user_id': 1})
 
     def test_get_or_create__token_type_temporal__token_exists__token_expired(self):
         start = timezone.now()
@@ -495,9 +501,9 @@ class TokenTestSuite(AuthTestCase):
         end = timezone.now()
 
         db = self.all_token_dict()
-        created = db[0]['created']
-        expires_at = db[0]['expires_at']
-        token = db[0]['key']
+        created = db[-1]['created']
+        expires_at = db[-1]['expires_at']
+        token = db[-1]['key']
 
         self.assertGreater(created, start)
         self.assertLess(created, end)
@@ -507,11 +513,13 @@ class TokenTestSuite(AuthTestCase):
         self.assertGreater(expires_at, end + timedelta(minutes=10) - timedelta(seconds=10))
         self.assertToken(token)
 
-        del db[0]['created']
-        del db[0]['expires_at']
-        del db[0]['key']
+        del db[-1]['created']
+        del db[-1]['expires_at']
+        del db[-1]['key']
 
-        self.assertEqual(db, [{'id': 3, 'token_type': 'temporal', 'user_id': 1}])
+        # the expired tokens are deleted by the background sweep
+        self.assertEqual([x['id'] for x in db], [1, 2, 3])
+        self.assertEqual(db[-1], {'id': 3, 'token_type': 'temporal', 'user_id': 1})
 
     """
     🔽🔽🔽 validate_and_destroy bad arguments
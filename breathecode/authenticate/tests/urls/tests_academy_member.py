@@ -1260,3 +1260,24 @@ class AuthenticateTestSuite(AuthTestCase):
             'status': 'INVITED',
             'user_id': 1
         }])
+
+    """
+    🔽🔽🔽 Queries
+    """
+
+    def test_academy_member__queries_do_not_grow_with_the_members(self):
+        self.headers(academy=1)
+        url = reverse_lazy('authenticate:academy_member')
+        model = self.generate_models(authenticate=True,
+                                     role='hitman',
+                                     capability='read_member',
+                                     profile_academy=True,
+                                     profile=True)
+
+        base = {'academy': model.academy, 'role': model.role}
+
+        def grow():
+            for _ in range(0, 3):
+                self.generate_models(user=True, profile_academy=True, profile=True, models=base)
+
+        self.bc.check.constant_queries(lambda: self.client.get(url), grow)
@@ -25,6 +25,7 @@ from datetime import datetime
 
 from breathecode.mentorship.models import MentorProfile
 from breathecode.mentorship.serializers import GETMentorSmallSerializer
+from .caches import TokenCache
 from .authentication import ExpiringTokenAuthentication
 
 from .forms import PickPasswordForm, PasswordChangeCustomForm, ResetPasswordForm, LoginForm, InviteForm
@@ -44,7 +45,7 @@ from breathecode.admissions.models import Academy, CohortUser
 from breathecode.notify.models import SlackTeam
 from breathecode.notify.actions import send_email_message
 from breathecode.utils import (capable_of, ValidationException, HeaderLimitOffsetPagination,
-                               GenerateLookupsMixin)
+                               GenerateLookupsMixin, prefetch_serializer)
 from breathecode.utils.views import private_view, render_message, set_query_parameter
 from breathecode.utils.find_by_full_name import query_like_by_full_name
 from breathecode.utils.views import set_query_parameter
@@ -113,8 +114,12 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        Token.objects.filter(token_type='login').delete()
+        tokens = Token.objects.filter(user__id=request.user.id, token_type='login')
+        keys = list(tokens.values_list('key', flat=True))
+
+        tokens.delete()
         request.auth.delete()
+        TokenCache().clear(request.auth.key, *keys)
         return Response({
             'message': 'User tokens successfully deleted',
         })
@@ -165,6 +170,7 @@ class MemberView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMixin):
             items = query_like_by_full_name(like=like, items=items)
 
         items = items.exclude(user__email__contains='@token.com')
+        items = prefetch_serializer(items, GetProfileAcademySmallSerializer)
 
         if not is_many:
             items = items.first()
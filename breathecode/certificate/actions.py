@@ -3,9 +3,13 @@ Certificate actions
 """
 import hashlib
 import requests, os, logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from urllib.parse import urlencode
-from breathecode.admissions.models import CohortUser, FULLY_PAID, UP_TO_DATE
+from breathecode.admissions.models import Cohort, CohortUser, FULLY_PAID, UP_TO_DATE
 from breathecode.assignments.models import Task
 from breathecode.utils import ValidationException, APIException
 from .models import ERROR, PERSISTED, Specialty, UserSpecialty, LayoutDesign
@@ -15,6 +19,9 @@ logger = logging.getLogger(__name__)
 ENVIRONMENT = os.getenv('ENV', None)
 BUCKET_NAME = 'certificates-breathecode'
 
+# max of screenshots that are taken at the same time, each one is a blocking request to screenshotmachine
+CERTIFICATE_SCREENSHOT_WORKERS = int(os.getenv('CERTIFICATE_SCREENSHOT_WORKERS', 4))
+
 strings = {
     'es': {
         'Main Instructor': 'Instructor Principal',
@@ -36,6 +43,78 @@ def certificate_set_default_issued_at():
     return query
 
 
+def get_layout_design(cohort, layout=None) -> LayoutDesign:
+    layout_design = LayoutDesign.objects.filter(slug=layout).first() if layout else None
+
+    if layout_design is None:
+        layout_design = LayoutDesign.objects.filter(is_default=True, academy=cohort.academy).first()
+
+    if layout_design is None:
+        layout_design = LayoutDesign.objects.filter(slug='default').first()
+
+    if layout_design is None:
+        raise ValidationException('No layout was specified and there is no default layout for this academy',
+                                  slug='no-default-layout')
+
+    return layout_design
+
+
+def get_main_teacher(cohort):
+    main_teacher = CohortUser.objects.filter(cohort__id=cohort.id, role='TEACHER').select_related('user')
+    main_teacher = main_teacher.first()
+
+    if main_teacher is None or main_teacher.user is None:
+        raise ValidationException('This cohort does not have a main teacher, please assign it first',
+                                  slug='without-main-teacher')
+
+    return main_teacher.user
+
+
+def get_certificate_error(cohort, cohort_user, tasks_count_pending: int) -> Optional[ValidationException]:
+    """Get the reason because a student can't get its certificate, None if the student can get it."""
+
+    if tasks_count_pending:
+        return ValidationException(f'The student has {tasks_count_pending} '
+                                   'pending tasks',
+                                   slug='with-pending-tasks')
+
+    if not (cohort_user.finantial_status == FULLY_PAID or cohort_user.finantial_status == UP_TO_DATE):
+        message = 'The student must have finantial status FULLY_PAID or UP_TO_DATE'
+        return ValidationException(message, slug='bad-finantial-status')
+
+    if cohort_user.educational_status != 'GRADUATED':
+        return ValidationException('The student must have educational '
+                                   'status GRADUATED',
+                                   slug='bad-educational-status')
+
+    if cohort.current_day != cohort.syllabus_version.syllabus.duration_in_days:
+        return ValidationException(
+            'Cohort current day should be '
+            f'{cohort.syllabus_version.syllabus.duration_in_days}',
+            slug='cohort-not-finished')
+
+    if cohort.stage != 'ENDED':
+        return ValidationException(
+            f"The student cohort stage has to be 'ENDED' before you can issue any certificates",
+            slug='cohort-without-status-ended')
+
+    return None
+
+
+def build_certificate(user, cohort, specialty, utc_now) -> UserSpecialty:
+    uspe = UserSpecialty(
+        user=user,
+        cohort=cohort,
+        token=hashlib.sha1((str(user.id) + str(utc_now)).encode('UTF-8')).hexdigest(),
+        specialty=specialty,
+        signed_by_role=strings[cohort.language]['Main Instructor'],
+    )
+    if specialty.expiration_day_delta is not None:
+        uspe.expires_at = utc_now + timezone.timedelta(days=specialty.expiration_day_delta)
+
+    return uspe
+
+
 def generate_certificate(user, cohort=None, layout=None):
     query = {'user__id': user.id}
 
@@ -66,117 +145,253 @@ def generate_certificate(user, cohort=None, layout=None):
         raise ValidationException('This user already has a certificate created', slug='already-exists')
 
     if uspe is None:
-        utc_now = timezone.now()
-        uspe = UserSpecialty(
-            user=user,
-            cohort=cohort,
-            token=hashlib.sha1((str(user.id) + str(utc_now)).encode('UTF-8')).hexdigest(),
-            specialty=specialty,
-            signed_by_role=strings[cohort.language]['Main Instructor'],
-        )
-        if specialty.expiration_day_delta is not None:
-            uspe.expires_at = utc_now + timezone.timedelta(days=specialty.expiration_day_delta)
-
-    layout = LayoutDesign.objects.filter(slug=layout).first()
-
-    if layout is None:
-        layout = LayoutDesign.objects.filter(is_default=True, academy=cohort.academy).first()
-
-    if layout is None:
-        layout = LayoutDesign.objects.filter(slug='default').first()
-
-    if layout is None:
-        raise ValidationException('No layout was specified and there is no default layout for this academy',
-                                  slug='no-default-layout')
+        uspe = build_certificate(user, cohort, specialty, timezone.now())
 
-    uspe.layout = layout
+    uspe.layout = get_layout_design(cohort, layout)
 
     # validate for teacher
-    main_teacher = CohortUser.objects.filter(cohort__id=cohort.id, role='TEACHER').first()
-    if main_teacher is None or main_teacher.user is None:
-        raise ValidationException('This cohort does not have a main teacher, please assign it first',
-                                  slug='without-main-teacher')
-
-    main_teacher = main_teacher.user
+    main_teacher = get_main_teacher(cohort)
     uspe.signed_by = main_teacher.first_name + ' ' + main_teacher.last_name
 
-    try:
-        uspe.academy = cohort.academy
-        tasks_count_pending = Task.objects.filter(user__id=user.id,
-                                                  task_type='PROJECT',
-                                                  revision_status='PENDING').count()
-
-        if tasks_count_pending:
-            raise ValidationException(f'The student has {tasks_count_pending} '
-                                      'pending tasks',
-                                      slug='with-pending-tasks')
-
-        if not (cohort_user.finantial_status == FULLY_PAID or cohort_user.finantial_status == UP_TO_DATE):
-            message = 'The student must have finantial status FULLY_PAID or UP_TO_DATE'
-            raise ValidationException(message, slug='bad-finantial-status')
-
-        if cohort_user.educational_status != 'GRADUATED':
-            raise ValidationException('The student must have educational '
-                                      'status GRADUATED',
-                                      slug='bad-educational-status')
-
-        if cohort.current_day != cohort.syllabus_version.syllabus.duration_in_days:
-            raise ValidationException(
-                'Cohort current day should be '
-                f'{cohort.syllabus_version.syllabus.duration_in_days}',
-                slug='cohort-not-finished')
-
-        if cohort.stage != 'ENDED':
-            raise ValidationException(
-                f"The student cohort stage has to be 'ENDED' before you can issue any certificates",
-                slug='cohort-without-status-ended')
+    uspe.academy = cohort.academy
+    tasks_count_pending = Task.objects.filter(user__id=user.id,
+                                              task_type='PROJECT',
+                                              revision_status='PENDING').count()
+
+    error = get_certificate_error(cohort, cohort_user, tasks_count_pending)
+
+    if error:
+        uspe.status = ERROR
+        uspe.status_text = str(error)
 
+    else:
         if not uspe.issued_at:
             uspe.issued_at = timezone.now()
 
         uspe.status = PERSISTED
         uspe.status_text = 'Certificate successfully queued for PDF generation'
-        uspe.save()
 
-    except ValidationException as e:
-        message = str(e)
-        uspe.status = ERROR
-        uspe.status_text = message
-        uspe.save()
+    uspe.save()
 
     return uspe
 
 
+def generate_cohort_certificates(cohort: Cohort, layout=None, strict=True) -> list[UserSpecialty]:
+    """
+    Generate the certificates of all the students of a cohort.
+
+    The specialty, the layout and the main teacher are got once per cohort, the students and its pending
+    tasks are got with one query, the certificates are written with `bulk_create` and `bulk_update`, and
+    the screenshots are taken in a background task. If `strict` is false, the students that already have
+    a certificate are skipped instead of raise an exception.
+    """
+
+    if cohort.syllabus_version is None:
+        raise ValidationException(
+            f'The cohort has no syllabus assigned, please set a syllabus for cohort: {cohort.name}',
+            slug='missing-syllabus-version')
+
+    specialty = Specialty.objects.filter(syllabus__id=cohort.syllabus_version.syllabus_id).first()
+    if not specialty:
+        raise ValidationException('Specialty has no Syllabus assigned', slug='missing-specialty')
+
+    pending_tasks = Task.objects.filter(user__id=OuterRef('user__id'),
+                                        task_type='PROJECT',
+                                        revision_status='PENDING').order_by().values('user__id')
+    pending_tasks = pending_tasks.annotate(total=Count('id')).values('total')
+
+    cohort_users = CohortUser.objects.filter(cohort__id=cohort.id, role='STUDENT').select_related('user')
+    cohort_users = list(
+        cohort_users.annotate(tasks_count_pending=Coalesce(
+            Subquery(pending_tasks, output_field=IntegerField()), 0)).order_by('id'))
+
+    user_ids = [x.user.id for x in cohort_users]
+    certificates = {}
+    existing = UserSpecialty.objects.filter(cohort__id=cohort.id, user__id__in=user_ids)
+    existing = existing.select_related('specialty').order_by('id')
+    for certificate in existing:
+        certificates.setdefault(certificate.user_id, certificate)
+
+    students = []
+    for cohort_user in cohort_users:
+        uspe = certificates.get(cohort_user.user.id)
+
+        if uspe is not None and uspe.status == 'PERSISTED' and uspe.preview_url:
+            if strict:
+                raise ValidationException('This user already has a certificate created',
+                                          slug='already-exists')
+
+            continue
+
+        students.append((cohort_user, uspe))
+
+    if not students:
+        return []
+
+    layout_design = get_layout_design(cohort, layout)
+    main_teacher = get_main_teacher(cohort)
+
+    utc_now = timezone.now()
+    to_create = []
+    to_update = []
+
+    for cohort_user, uspe in students:
+        if uspe is None:
+            uspe = build_certificate(cohort_user.user, cohort, specialty, utc_now)
+            to_create.append(uspe)
+
+        else:
+            uspe.cohort = cohort
+            uspe.updated_at = utc_now
+            to_update.append(uspe)
+
+        uspe.layout = layout_design
+        uspe.signed_by = main_teacher.first_name + ' ' + main_teacher.last_name
+        uspe.academy = cohort.academy
+
+        error = get_certificate_error(cohort, cohort_user, cohort_user.tasks_count_pending)
+
+        if error:
+            uspe.status = ERROR
+            uspe.status_text = str(error)
+
+        else:
+            if not uspe.issued_at:
+                uspe.issued_at = utc_now
+
+            uspe.status = PERSISTED
+            uspe.status_text = 'Certificate successfully queued for PDF generation'
+
+        # the same that UserSpecialty.save does before write
+        if not uspe.is_cleaned:
+            uspe.clean()
+
+        hash = uspe.generate_update_hash()
+        uspe._hash_was_updated = uspe.update_hash != hash
+        uspe.update_hash = hash
+
+    UserSpecialty.objects.bulk_create(to_create)
+    UserSpecialty.objects.bulk_update(to_update, [
+        'status', 'status_text', 'layout', 'signed_by', 'academy', 'issued_at', 'expires_at', 'token',
+        'update_hash', 'updated_at'
+    ])
+
+    # the ids of the new rows are not returned by every database
+    changed = {x.user_id: x for x in to_create + to_update}
+    result = UserSpecialty.objects.filter(cohort__id=cohort.id, user__id__in=changed.keys()).select_related(
+        'user', 'specialty', 'academy', 'cohort__schedule', 'cohort__syllabus_version__syllabus', 'layout')
+    result = {x.user_id: x for x in result.order_by('-id')}
+    result = [result[cohort_user.user.id] for cohort_user, _ in students]
+
+    take_ids = []
+    reset_ids = []
+    for certificate in result:
+        if not changed[certificate.user_id]._hash_was_updated or certificate.status != PERSISTED:
+            continue
+
+        if certificate.preview_url:
+            reset_ids.append(certificate.id)
+
+        else:
+            take_ids.append(certificate.id)
+
+    from .tasks import take_screenshots
+
+    if take_ids:
+        take_screenshots.delay(take_ids)
+
+    if reset_ids:
+        take_screenshots.delay(reset_ids, reset=True)
+
+    return result
+
+
+def get_certificate_screenshot_url(token: str) -> Optional[str]:
+    """Take the screenshot of a certificate if it doesn't exist yet, it returns None if it couldn't be taken."""
+
+    storage = Storage()
+    file = storage.file(BUCKET_NAME, token)
+
+    # if the file does not exist
+    if file.blob is None:
+        query_string = urlencode({
+            'key': os.environ.get('SCREENSHOT_MACHINE_KEY'),
+            'url': f'https://certificate.breatheco.de/preview/{token}',
+            'device': 'desktop',
+            'cacheLimit': '0',
+            'dimension': '1024x707',
+        })
+        r = requests.get(f'https://api.screenshotmachine.com?{query_string}', stream=True)
+        if r.status_code == 200:
+            file.upload(r.content, public=True)
+        else:
+            print('Invalid reponse code: ', r.status_code)
+
+    if file.blob is None:
+        return None
+
+    return file.url()
+
+
 def certificate_screenshot(certificate_id: int):
 
     certificate = UserSpecialty.objects.get(id=certificate_id)
     if not certificate.preview_url:
-        file_name = f'{certificate.token}'
-
-        storage = Storage()
-        file = storage.file(BUCKET_NAME, file_name)
-
-        # if the file does not exist
-        if file.blob is None:
-            query_string = urlencode({
-                'key': os.environ.get('SCREENSHOT_MACHINE_KEY'),
-                'url': f'https://certificate.breatheco.de/preview/{certificate.token}',
-                'device': 'desktop',
-                'cacheLimit': '0',
-                'dimension': '1024x707',
-            })
-            r = requests.get(f'https://api.screenshotmachine.com?{query_string}', stream=True)
-            if r.status_code == 200:
-                file.upload(r.content, public=True)
-            else:
-                print('Invalid reponse code: ', r.status_code)
+        url = get_certificate_screenshot_url(certificate.token)
 
         # after created, lets save the URL
-        if file.blob is not None:
-            certificate.preview_url = file.url()
+        if url is not None:
+            certificate.preview_url = url
             certificate.save()
 
 
+def certificate_screenshots(certificate_ids: list[int],
+                            reset=False,
+                            max_workers=CERTIFICATE_SCREENSHOT_WORKERS) -> list[UserSpecialty]:
+    """
+    Take the screenshots of many certificates at the same time, the requests to Google Cloud and
+    screenshotmachine are done in a pool of threads and the urls are saved with one query. If `reset` is
+    true, the previous screenshots are removed first.
+    """
+
+    certificates = UserSpecialty.objects.filter(id__in=certificate_ids)
+    certificates = [x for x in certificates if reset or not x.preview_url]
+
+    def take(certificate: UserSpecialty):
+        try:
+            if reset and certificate.preview_url:
+                Storage().file(BUCKET_NAME, certificate.token).delete()
+
+            return certificate, get_certificate_screenshot_url(certificate.token)
+
+        except Exception:
+            logger.exception(f'Error taking the screenshot of the certificate {certificate.id}')
+            return certificate, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(take, certificates))
+
+    utc_now = timezone.now()
+    updated = []
+
+    for certificate, url in results:
+        if url is not None:
+            certificate.preview_url = url
+
+        elif reset:
+            certificate.preview_url = ''
+
+        else:
+            continue
+
+        certificate.updated_at = utc_now
+        updated.append(certificate)
+
+    # the preview_url is not part of the update_hash, so the signal would not do anything
+    UserSpecialty.objects.bulk_update(updated, ['preview_url', 'updated_at'])
+    return updated
+
+
 def remove_certificate_screenshot(certificate_id):
     certificate = UserSpecialty.objects.get(id=certificate_id)
     if not certificate.preview_url:
@@ -1,6 +1,6 @@
 from breathecode.utils import getLogger
 from celery import shared_task, Task
-from breathecode.admissions.models import CohortUser
+from breathecode.admissions.models import Cohort, CohortUser
 
 # Get an instance of a logger
 logger = getLogger(__name__)
@@ -56,19 +56,33 @@ def reset_screenshot(self, certificate_id):
     return True
 
 
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def take_screenshots(self, certificate_ids, reset=False):
+    logger.debug(f'Starting take_screenshots of {len(certificate_ids)} certificates')
+    from .actions import certificate_screenshots
+
+    certificate_screenshots(certificate_ids, reset=reset)
+
+
 @shared_task(bind=True, base=BaseTaskWithRetry)
 def generate_cohort_certificates(self, cohort_id):
     logger.debug('Starting generate_cohort_certificates')
-    from .actions import generate_certificate
+    from .actions import generate_cohort_certificates
 
-    cohort_users = CohortUser.objects.filter(cohort__id=cohort_id, role='STUDENT')
+    cohort = Cohort.objects.filter(id=cohort_id).select_related('academy',
+                                                                'syllabus_version__syllabus').first()
 
-    logger.debug(f'Generating certificate for {str(cohort_users.count())} students that GRADUATED')
-    for cu in cohort_users:
-        try:
-            generate_certificate(cu.user, cu.cohort)
-        except Exception:
-            logger.exception(f'Error generating certificate for {str(cu.user.id)} cohort {str(cu.cohort.id)}')
+    if not cohort:
+        logger.error(f'Cohort {cohort_id} not found', slug='cohort-not-found')
+        return
+
+    try:
+        certificates = generate_cohort_certificates(cohort, strict=False)
+        logger.debug(f'Generated {len(certificates)} certificates of the cohort {cohort_id}')
+
+    except Exception:
+        logger.exception(f'Error generating the certificates of the cohort {cohort_id}',
+                         slug='error-generating-certificates')
 
 
 @shared_task(bind=True, base=BaseTaskWithRetry)
@@ -0,0 +1,91 @@
+"""
+Tasks tests
+"""
+from unittest.mock import MagicMock, call, patch
+import breathecode.certificate.actions as actions
+import breathecode.certificate.signals as signals
+from ..mixins import CertificateTestCase
+
+certificate_screenshots = actions.certificate_screenshots
+
+
+def get_url(token):
+    return f'https://xyz/{token}' if token != 'broken' else None
+
+
+class ActionCertificateScreenshotsTestCase(CertificateTestCase):
+    """
+    🔽🔽🔽 Without preview_url
+    """
+    @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.actions.Storage', MagicMock())
+    @patch('breathecode.certificate.actions.get_certificate_screenshot_url', MagicMock(side_effect=get_url))
+    def test_certificate_screenshots__without_preview_url(self):
+        tokens = ['a', 'broken', 'c']
+        user_specialties = [{'token': token, 'preview_url': None} for token in tokens]
+        self.bc.database.create(user_specialty=user_specialties)
+        signals.user_specialty_saved.send.call_args_list = []
+
+        # the certificates and the update of the urls
+        with self.assertNumQueries(2):
+            certificate_screenshots([1, 2, 3], max_workers=2)
+
+        self.assertEqual(sorted(actions.get_certificate_screenshot_url.call_args_list), [
+            call('a'),
+            call('broken'),
+            call('c'),
+        ])
+
+        self.assertEqual([x['preview_url'] for x in self.bc.database.list_of('certificate.UserSpecialty')], [
+            'https://xyz/a',
+            None,
+            'https://xyz/c',
+        ])
+
+        self.assertEqual(actions.Storage.call_args_list, [])
+        self.assertEqual(signals.user_specialty_saved.send.call_args_list, [])
+
+    """
+    🔽🔽🔽 With preview_url
+    """
+
+    @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.actions.Storage', MagicMock())
+    @patch('breathecode.certificate.actions.get_certificate_screenshot_url', MagicMock(side_effect=get_url))
+    def test_certificate_screenshots__with_preview_url(self):
+        user_specialties = [{'token': token, 'preview_url': f'https://old/{token}'} for token in ['a', 'b']]
+        self.bc.database.create(user_specialty=user_specialties)
+
+        certificate_screenshots([1, 2])
+
+        self.assertEqual(actions.get_certificate_screenshot_url.call_args_list, [])
+        self.assertEqual([x['preview_url'] for x in self.bc.database.list_of('certificate.UserSpecialty')], [
+            'https://old/a',
+            'https://old/b',
+        ])
+
+    @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.actions.Storage', MagicMock())
+    @patch('breathecode.certificate.actions.get_certificate_screenshot_url', MagicMock(side_effect=get_url))
+    def test_certificate_screenshots__with_preview_url__reset(self):
+        tokens = ['a', 'broken']
+        user_specialties = [{'token': token, 'preview_url': f'https://old/{token}'} for token in tokens]
+        self.bc.database.create(user_specialty=user_specialties)
+
+        certificate_screenshots([1, 2], reset=True)
+
+        self.assertEqual(sorted(actions.get_certificate_screenshot_url.call_args_list), [
+            call('a'),
+            call('broken'),
+        ])
+
+        # the old screenshots were removed
+        self.assertEqual(sorted(actions.Storage.return_value.file.call_args_list), [
+            call(actions.BUCKET_NAME, 'a'),
+            call(actions.BUCKET_NAME, 'broken'),
+        ])
+
+        self.assertEqual([x['preview_url'] for x in self.bc.database.list_of('certificate.UserSpecialty')], [
+            'https://xyz/a',
+            '',
+        ])
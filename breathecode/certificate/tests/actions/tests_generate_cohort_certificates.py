@@ -0,0 +1,136 @@
+"""
+Tasks tests
+"""
+from unittest.mock import MagicMock, call, patch
+from ...actions import generate_cohort_certificates
+import breathecode.certificate.signals as signals
+import breathecode.certificate.tasks as tasks
+from ..mixins import CertificateTestCase
+
+GRADUATED = {'role': 'STUDENT', 'finantial_status': 'UP_TO_DATE', 'educational_status': 'GRADUATED'}
+
+
+def get_models_kwargs(students=3):
+    cohort_users = [{**GRADUATED, 'user_id': n} for n in range(1, students + 1)]
+    cohort_users.append({'role': 'TEACHER', 'user_id': students + 1})
+
+    return {
+        'user': students + 1,
+        'cohort': {
+            'stage': 'ENDED',
+            'current_day': 9545799
+        },
+        'syllabus': {
+            'duration_in_days': 9545799
+        },
+        'syllabus_version': 1,
+        'specialty': 1,
+        'layout_design': {
+            'slug': 'default'
+        },
+        'cohort_user': cohort_users,
+    }
+
+
+class ActionGenerateCohortCertificatesTestCase(CertificateTestCase):
+    """
+    🔽🔽🔽 Without main teacher
+    """
+    @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
+    def test_generate_cohort_certificates__without_main_teacher(self):
+        kwargs = get_models_kwargs()
+        kwargs['cohort_user'] = kwargs['cohort_user'][:-1]
+        model = self.bc.database.create(**kwargs)
+
+        with self.assertRaisesMessage(Exception, 'without-main-teacher'):
+            generate_cohort_certificates(model.cohort)
+
+        self.assertEqual(self.bc.database.list_of('certificate.UserSpecialty'), [])
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [])
+
+    """
+    🔽🔽🔽 Many students
+    """
+
+    @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
+    def test_generate_cohort_certificates__with_many_students(self):
+        kwargs = get_models_kwargs(students=3)
+        task = {'user_id': 2, 'task_type': 'PROJECT', 'revision_status': 'PENDING'}
+        model = self.bc.database.create(**kwargs, task=task)
+
+        # the specialty, the students with its pending tasks, the certificates, the default layouts of the
+        # academy and the whole site, the main teacher, the insert and the certificates with its relationships
+        with self.assertNumQueries(8):
+            result = generate_cohort_certificates(model.cohort)
+
+        self.assertEqual([x.user.id for x in result], [1, 2, 3])
+        self.assertEqual([(x['user_id'], x['status'], x['status_text'], x['layout_id'])
+                          for x in self.bc.database.list_of('certificate.UserSpecialty')], [
+                              (1, 'PERSISTED', 'Certificate successfully queued for PDF generation', 1),
+                              (2, 'ERROR', 'with-pending-tasks', 1),
+                              (3, 'PERSISTED', 'Certificate successfully queued for PDF generation', 1),
+                          ])
+
+        teacher = model.user[3]
+        self.assertEqual({x.signed_by for x in result}, {f'{teacher.first_name} {teacher.last_name}'})
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [call([1, 3])])
+        self.assertEqual(signals.user_specialty_saved.send.call_args_list, [])
+
+    """
+    🔽🔽🔽 With certificates
+    """
+
+    @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
+    def test_generate_cohort_certificates__with_one_certificate_already_created(self):
+        kwargs = get_models_kwargs(students=2)
+        user_specialty = {'user_id': 1, 'status': 'PERSISTED', 'preview_url': 'https://potato.io'}
+        model = self.bc.database.create(**kwargs, user_specialty=user_specialty)
+        signals.user_specialty_saved.send.call_args_list = []
+
+        with self.assertRaisesMessage(Exception, 'already-exists'):
+            generate_cohort_certificates(model.cohort)
+
+        self.assertEqual([(x['user_id'], x['status'], x['preview_url'])
+                          for x in self.bc.database.list_of('certificate.UserSpecialty')], [
+                              (1, 'PERSISTED', 'https://potato.io'),
+                          ])
+
+        result = generate_cohort_certificates(model.cohort, strict=False)
+
+        self.assertEqual([x.user.id for x in result], [2])
+        self.assertEqual([(x['user_id'], x['status'], x['preview_url'])
+                          for x in self.bc.database.list_of('certificate.UserSpecialty')], [
+                              (1, 'PERSISTED', 'https://potato.io'),
+                              (2, 'PERSISTED', None),
+                          ])
+
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [call([2])])
+        self.assertEqual(signals.user_specialty_saved.send.call_args_list, [])
+
+    @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
+    def test_generate_cohort_certificates__retry_the_certificates_with_errors(self):
+        kwargs = get_models_kwargs(students=2)
+        user_specialties = [{
+            'user_id': n,
+            'status': 'ERROR',
+            'preview_url': None,
+            'token': str(n),
+        } for n in range(1, 3)]
+        model = self.bc.database.create(**kwargs, user_specialty=user_specialties)
+
+        # the certificates are updated in one query
+        with self.assertNumQueries(8):
+            result = generate_cohort_certificates(model.cohort)
+
+        self.assertEqual([x.id for x in result], [1, 2])
+        self.assertEqual([(x['id'], x['status'])
+                          for x in self.bc.database.list_of('certificate.UserSpecialty')], [
+                              (1, 'PERSISTED'),
+                              (2, 'PERSISTED'),
+                          ])
+
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [call([1, 2])])
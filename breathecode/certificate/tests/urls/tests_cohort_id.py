@@ -13,6 +13,7 @@ from breathecode.tests.mocks import (
 )
 from ..mixins import CertificateTestCase
 import breathecode.certificate.signals as signals
+import breathecode.certificate.tasks as tasks
 
 
 class CertificateTestSuite(CertificateTestCase):
@@ -159,6 +160,7 @@ class CertificateTestSuite(CertificateTestCase):
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
     def test_generate_certificate_with_everything_but_schedule(self):
         """ Should be ok because cohorts dont need specialy mode to generate certificates """
         self.headers(academy=1)
@@ -190,13 +192,8 @@ class CertificateTestSuite(CertificateTestCase):
         response = self.client.post(url, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        user_specialty = self.bc.database.get('certificate.UserSpecialty', 1, dict=False)
-        self.assertEqual(
-            signals.user_specialty_saved.send.call_args_list,
-            [
-                # Action
-                call(instance=user_specialty, sender=user_specialty.__class__),
-            ])
+        self.assertEqual(signals.user_specialty_saved.send.call_args_list, [])
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
@@ -293,6 +290,7 @@ class CertificateTestSuite(CertificateTestCase):
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
     def test_generate_certificate_test_without_cohort_user_finantial_status(self):
         self.headers(academy=1)
         cohort_kwargs = {'stage': 'ENDED'}
@@ -416,9 +414,8 @@ class CertificateTestSuite(CertificateTestCase):
             [
                 # Mixer
                 call(instance=model.user_specialty, sender=model.user_specialty.__class__),
-                # Action
-                call(instance=model.user_specialty, sender=model.user_specialty.__class__),
             ])
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
@@ -547,6 +544,7 @@ class CertificateTestSuite(CertificateTestCase):
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
     def test_generate_certificate_test_with_final_cohort(self):
         self.headers(academy=1)
         cohort_kwargs = {'stage': 'ENDED'}
@@ -671,14 +669,14 @@ class CertificateTestSuite(CertificateTestCase):
             [
                 # Mixer
                 call(instance=model.user_specialty, sender=model.user_specialty.__class__),
-                # Action
-                call(instance=model.user_specialty, sender=model.user_specialty.__class__),
             ])
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch('breathecode.certificate.signals.user_specialty_saved.send', MagicMock())
+    @patch('breathecode.certificate.tasks.take_screenshots.delay', MagicMock())
     def test_generate_certificate_good_request(self):
         """Test /certificate/cohort/id status: 201"""
 
@@ -815,6 +813,5 @@ class CertificateTestSuite(CertificateTestCase):
             [
                 # Mixer
                 call(instance=model.user_specialty, sender=model.user_specialty.__class__),
-                # Action
-                call(instance=model.user_specialty, sender=model.user_specialty.__class__),
             ])
+        self.assertEqual(tasks.take_screenshots.delay.call_args_list, [call([1], reset=True)])
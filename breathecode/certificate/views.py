@@ -11,7 +11,7 @@ from rest_framework import status, serializers
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from .tasks import take_screenshot, generate_one_certificate
-from .actions import generate_certificate
+from .actions import generate_certificate, generate_cohort_certificates
 from breathecode.utils.find_by_full_name import query_like_by_full_name
 
 logger = logging.getLogger(__name__)
@@ -116,35 +116,30 @@ class CertificateCohortView(APIView):
         cohort_users = CohortUser.objects.filter(cohort__id=cohort_id,
                                                  role='STUDENT',
                                                  cohort__academy__id=academy_id)
-        all_certs = []
-        cohort__users = []
 
-        if cohort_users.count() == 0:
+        cohort_user = cohort_users.select_related('cohort__academy',
+                                                  'cohort__syllabus_version__syllabus').first()
+
+        if cohort_user is None:
             raise ValidationException('There are no users with STUDENT role in this cohort',
                                       code=400,
                                       slug='no-user-with-student-role')
 
-        for cohort_user in cohort_users:
-            cohort = cohort_user.cohort
-            if cohort.stage != 'ENDED' or cohort.never_ends != False:
-                raise ValidationException('Cohort stage must be ENDED or never ends',
-                                          code=400,
-                                          slug='cohort-stage-must-be-ended')
-
-            if not cohort.syllabus_version:
-                raise ValidationException(
-                    f'The cohort has no syllabus assigned, please set a syllabus for cohort: {cohort.name}',
-                    slug='cohort-has-no-syllabus-version-assigned')
+        cohort = cohort_user.cohort
+        if cohort.stage != 'ENDED' or cohort.never_ends != False:
+            raise ValidationException('Cohort stage must be ENDED or never ends',
+                                      code=400,
+                                      slug='cohort-stage-must-be-ended')
 
-            else:
-                cohort__users.append(cohort_user)
+        if not cohort.syllabus_version:
+            raise ValidationException(
+                f'The cohort has no syllabus assigned, please set a syllabus for cohort: {cohort.name}',
+                slug='cohort-has-no-syllabus-version-assigned')
 
-        for cu in cohort__users:
-            cert = generate_certificate(cu.user, cu.cohort, layout_slug)
-            serializer = UserSpecialtySerializer(cert, many=False)
-            all_certs.append(serializer.data)
+        certificates = generate_cohort_certificates(cohort, layout_slug)
+        serializer = UserSpecialtySerializer(certificates, many=True)
 
-        return Response(all_certs, status=status.HTTP_201_CREATED)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 class CertificateAcademyView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMixin):
@@ -1,4 +1,6 @@
-from typing import Any
+import os
+from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from pyparsing import Literal
 import pytz
 import re
@@ -15,6 +17,9 @@ from django.db.models import QuerySet
 
 logger = logging.getLogger(__name__)
 
+# max number of descriptions requested to eventbrite at the same time
+EVENTBRITE_MAX_WORKERS = int(os.getenv('EVENTBRITE_MAX_WORKERS', 8))
+
 status_map = {
     'draft': 'DRAFT',
     'live': 'ACTIVE',
@@ -73,20 +78,7 @@ def create_or_update_venue(data, org, force_update=False):
     if venue and not force_update:
         return
 
-    kwargs = {
-        'title': data['name'],
-        'street_address': data['address']['address_1'],
-        'country': data['address']['country'],
-        'city': data['address']['city'],
-        'state': data['address']['region'],
-        'zip_code': data['address']['postal_code'],
-        'latitude': data['latitude'],
-        'longitude': data['longitude'],
-        'eventbrite_id': data['id'],
-        'eventbrite_url': data['resource_uri'],
-        'academy': org.academy,
-        # 'organization': org,
-    }
+    kwargs = get_venue_kwargs_from_eventbrite(data, org)
 
     try:
         if venue is None:
@@ -104,6 +96,23 @@ def create_or_update_venue(data, org, force_update=False):
     return venue
 
 
+def get_venue_kwargs_from_eventbrite(data, org):
+    return {
+        'title': data['name'],
+        'street_address': data['address']['address_1'],
+        'country': data['address']['country'],
+        'city': data['address']['city'],
+        'state': data['address']['region'],
+        'zip_code': data['address']['postal_code'],
+        'latitude': data['latitude'],
+        'longitude': data['longitude'],
+        'eventbrite_id': data['id'],
+        'eventbrite_url': data['resource_uri'],
+        'academy': org.academy,
+        # 'organization': org,
+    }
+
+
 def export_event_description_to_eventbrite(event: Event) -> None:
     if not event:
         logger.error(f'Event is not being provided')
@@ -222,16 +231,16 @@ def sync_org_events(org):
         logger.error(f'The organization {org} not have a academy assigned')
         return
 
+    started_at = timezone.now()
     client = Eventbrite(org.eventbrite_key)
-    result = client.get_organization_events(org.eventbrite_id)
 
     try:
-
-        for data in result['events']:
-            update_or_create_event(data, org)
+        result = client.get_organization_events(org.eventbrite_id, changed_since=org.synced_at)
+        bulk_update_or_create_events(result['events'], org)
 
         org.sync_status = 'PERSISTED'
         org.sync_desc = f"Success with {len(result['events'])} events..."
+        org.synced_at = started_at
         org.save()
 
     except Exception as e:
@@ -248,6 +257,138 @@ def sync_org_events(org):
     return True
 
 
+def get_event_descriptions_from_eventbrite(client: Eventbrite,
+                                           eventbrite_ids: list[str],
+                                           max_workers=EVENTBRITE_MAX_WORKERS) -> dict[str, Optional[str]]:
+    """Get the descriptions of many events at the same time, the description is None if it can't be got"""
+    def get_description(eventbrite_id):
+        try:
+            data = client.get_event_description(eventbrite_id)
+            return eventbrite_id, data['modules'][0]['data']['body']['text']
+
+        except:
+            logger.warning(f'The event {eventbrite_id} is coming from eventbrite not have a description')
+            return eventbrite_id, None
+
+    if not eventbrite_ids:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(executor.map(get_description, eventbrite_ids))
+
+
+def bulk_create_or_update_venues(venues: list[dict], org) -> dict[str, Venue]:
+    """Create the venues that don't exist, like `create_or_update_venue` it doesn't update the existing ones"""
+    ids = list({x['id'] for x in venues})
+
+    # the eventbrite id is unique, even between academies
+    instances = {x.eventbrite_id: x for x in Venue.objects.filter(eventbrite_id__in=ids)}
+
+    new_venues = {}
+    for data in venues:
+        if data['id'] not in instances and data['id'] not in new_venues:
+            new_venues[data['id']] = Venue(**get_venue_kwargs_from_eventbrite(data, org))
+
+    if new_venues:
+        Venue.objects.bulk_create(new_venues.values())
+        created = Venue.objects.filter(eventbrite_id__in=new_venues.keys())
+        instances.update({x.eventbrite_id: x for x in created})
+
+    return {key: value for key, value in instances.items() if value.academy_id == org.academy.id}
+
+
+def bulk_create_or_update_organizers(organizers: list[dict], org) -> dict[str, Organizer]:
+    """Create the organizers that don't exist and update the name and description of the other ones"""
+    organizers = {x['id']: x for x in organizers}
+    instances = Organizer.objects.filter(eventbrite_id__in=organizers.keys()).select_related('academy')
+    result = {x.eventbrite_id: x for x in instances}
+
+    new_organizers = []
+    for eventbrite_id, data in organizers.items():
+        if eventbrite_id in result:
+            result[eventbrite_id].name = data['name']
+            result[eventbrite_id].description = data['description']['text']
+
+        else:
+            new_organizers.append(
+                Organizer(name=data['name'],
+                          description=data['description']['text'],
+                          eventbrite_id=eventbrite_id,
+                          organization=org))
+
+    if result:
+        now = timezone.now()
+        for organizer in result.values():
+            organizer.updated_at = now
+
+        Organizer.objects.bulk_update(result.values(), ['name', 'description', 'updated_at'])
+
+    if new_organizers:
+        Organizer.objects.bulk_create(new_organizers)
+        created = Organizer.objects.filter(eventbrite_id__in=[x.eventbrite_id for x in new_organizers])
+        created = created.select_related('academy')
+        result.update({x.eventbrite_id: x for x in created})
+
+    return result
+
+
+def bulk_update_or_create_events(events: list[dict], org) -> list[Event]:
+    """
+    Same than `update_or_create_event` for many events, the venues, organizers and events are saved with
+    a few queries and the descriptions are requested to eventbrite at the same time.
+    """
+    events = [x for x in events if x is not None]
+    if not events:
+        return []
+
+    for data in events:
+        if data['status'] not in status_map:
+            raise Exception('Uknown eventbrite status ' + data['status'])
+
+    now = get_current_iso_string()
+    client = Eventbrite(org.eventbrite_key)
+
+    venues = bulk_create_or_update_venues([x['venue'] for x in events if x.get('venue')], org)
+    organizers = bulk_create_or_update_organizers([x['organizer'] for x in events if x.get('organizer')], org)
+    descriptions = get_event_descriptions_from_eventbrite(client, [x['id'] for x in events])
+
+    ids = [x['id'] for x in events]
+    instances = Event.objects.filter(eventbrite_id__in=ids, organization__id=org.id)
+    instances = {x.eventbrite_id: x for x in instances}
+
+    new_events = []
+    for data in events:
+        event = instances.get(data['id'])
+        if event is None:
+            event = Event(sync_with_eventbrite=True)
+            instances[data['id']] = event
+            new_events.append(event)
+
+        venue = venues.get(data['venue']['id']) if data.get('venue') else None
+        organizer = organizers.get(data['organizer']['id']) if data.get('organizer') else None
+
+        set_event_fields_from_eventbrite(event, data, org, venue, organizer)
+        event.eventbrite_sync_description = now
+        event.eventbrite_sync_status = 'PERSISTED'
+
+        if descriptions.get(data['id']) is not None:
+            event.description = descriptions[data['id']]
+            event.eventbrite_sync_description = timezone.now()
+
+    updated_events = [x for x in instances.values() if x.id]
+    if updated_events:
+        updated_at = timezone.now()
+        for event in updated_events:
+            event.updated_at = updated_at
+
+        Event.objects.bulk_update(updated_events, EVENTBRITE_EVENT_FIELDS + ['updated_at'])
+
+    if new_events:
+        Event.objects.bulk_create(new_events)
+
+    return list(instances.values())
+
+
 # use for mocking purpose
 def get_current_iso_string():
     from django.utils import timezone
@@ -310,47 +451,9 @@ def update_or_create_event(data, org):
         else:
             print('Event without organizer', data)
 
-        kwargs = {
-            'title': data['name']['text'],
-            'description': data['description']['text'],
-            'excerpt': data['description']['text'],
-            'starting_at': data['start']['utc'],
-            'ending_at': data['end']['utc'],
-            'capacity': data['capacity'],
-            'online_event': data['online_event'],
-            'eventbrite_id': data['id'],
-            'eventbrite_url': data['url'],
-            'status': status_map[data['status']],
-            'eventbrite_status': data['status'],
-            'currency': data['currency'],
-            'organization': org,
-            # organizer: organizer,
-            'venue': venue,
-        }
-
-        if event is None:
-            event = Event(**kwargs)
-            event.sync_with_eventbrite = True
-
-        else:
-            for attr in kwargs:
-                setattr(event, attr, kwargs[attr])
-
-        if 'published' in data:
-            event.published_at = data['published']
-
-        if 'logo' in data and data['logo'] is not None:
-            event.banner = data['logo']['url']
-
-        if not event.url:
-            event.url = event.eventbrite_url
-
-        # look for the academy ownership based on organizer first
-        if organizer is not None and organizer.academy is not None:
-            event.academy = organizer.academy
-
-        elif org.academy is not None:
-            event.academy = org.academy
+        instance = event or Event(sync_with_eventbrite=True)
+        set_event_fields_from_eventbrite(instance, data, org, venue, organizer)
+        event = instance
 
         event.eventbrite_sync_description = now
         event.eventbrite_sync_status = 'PERSISTED'
@@ -368,6 +471,54 @@ def update_or_create_event(data, org):
     return event
 
 
+# fields of the events that are set with the data of eventbrite
+EVENTBRITE_EVENT_FIELDS = [
+    'title', 'description', 'excerpt', 'starting_at', 'ending_at', 'capacity', 'online_event',
+    'eventbrite_id', 'eventbrite_url', 'status', 'eventbrite_status', 'currency', 'organization', 'venue',
+    'published_at', 'banner', 'url', 'academy', 'eventbrite_sync_description', 'eventbrite_sync_status'
+]
+
+
+def set_event_fields_from_eventbrite(event: Event, data: dict, org: Organization, venue: Optional[Venue],
+                                     organizer: Optional[Organizer]) -> None:
+    kwargs = {
+        'title': data['name']['text'],
+        'description': data['description']['text'],
+        'excerpt': data['description']['text'],
+        'starting_at': data['start']['utc'],
+        'ending_at': data['end']['utc'],
+        'capacity': data['capacity'],
+        'online_event': data['online_event'],
+        'eventbrite_id': data['id'],
+        'eventbrite_url': data['url'],
+        'status': status_map[data['status']],
+        'eventbrite_status': data['status'],
+        'currency': data['currency'],
+        'organization': org,
+        # organizer: organizer,
+        'venue': venue,
+    }
+
+    for attr in kwargs:
+        setattr(event, attr, kwargs[attr])
+
+    if 'published' in data:
+        event.published_at = data['published']
+
+    if 'logo' in data and data['logo'] is not None:
+        event.banner = data['logo']['url']
+
+    if not event.url:
+        event.url = event.eventbrite_url
+
+    # look for the academy ownership based on organizer first
+    if organizer is not None and organizer.academy is not None:
+        event.academy = organizer.academy
+
+    elif org.academy is not None:
+        event.academy = org.academy
+
+
 def publish_event_from_eventbrite(data, org: Organization) -> None:
     if not data:  #skip if no data
         logger.debug('Ignored event')
@@ -1,7 +1,64 @@
+import hashlib, os, time, urllib.parse
+from typing import Optional
+from django.core.cache import cache
 from breathecode.utils import Cache
 
+__all__ = ['EventCache', 'ICalCache']
+
+ICAL_CACHE_TTL = int(os.getenv('ICAL_CACHE_TTL', 60 * 60 * 24))
+
 
 class EventCache(Cache):
     model = 'Event'
     depends = ['User', 'Academy', 'Organization', 'Venue', 'EventType']
     parents = ['EventCheckin']
+
+
+class ICalCache:
+    """
+    Rendered iCal feeds.
+
+    Each feed is stored with its ETag and its Last-Modified date, all the feeds share one version
+    counter that is bumped by the signals of the models that are rendered in them, so a calendar client
+    that polls a feed that was not changed gets a 304 without hit the database.
+    """
+    def __version_key__(self) -> str:
+        return 'ICal__version'
+
+    def __get_version__(self) -> int:
+        version_key = self.__version_key__()
+        version = cache.get(version_key)
+
+        if version is None:
+            cache.add(version_key, int(time.time() * 1000), timeout=None)
+            version = cache.get(version_key)
+
+        return version
+
+    def __generate_key__(self, name: str, **kwargs) -> str:
+        credentials = urllib.parse.urlencode(sorted(kwargs.items()))
+        return f'ICal__v{self.__get_version__()}__{name}__{credentials}'
+
+    def get(self, name: str, **kwargs) -> Optional[dict]:
+        return cache.get(self.__generate_key__(name, **kwargs))
+
+    def set(self, name: str, content: bytes, ttl: int = ICAL_CACHE_TTL, **kwargs) -> dict:
+        data = {
+            'content': content,
+            'etag': hashlib.sha1(content).hexdigest(),
+            'last_modified': int(time.time()),
+        }
+
+        cache.set(self.__generate_key__(name, **kwargs), data, timeout=ttl)
+        return data
+
+    def clear(self) -> None:
+        version_key = self.__version_key__()
+
+        try:
+            cache.incr(version_key)
+
+        except ValueError:
+            # the counter does not exists yet or it was evicted
+            if not cache.add(version_key, int(time.time() * 1000), timeout=None):
+                cache.incr(version_key)
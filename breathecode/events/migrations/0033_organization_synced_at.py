@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 20:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0032_alter_event_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='synced_at',
+            field=models.DateTimeField(
+                blank=True,
+                default=None,
+                help_text=
+                'Start of the last successful sync, the next sync just get the events changed after it',
+                null=True),
+        ),
+    ]
@@ -31,6 +31,11 @@ class Organization(models.Model):
         default=PENDING,
         help_text='One of: PENDING, PERSISTED or ERROR depending on how the eventbrite sync status')
     sync_desc = models.TextField(max_length=255, null=True, default=None, blank=True)
+    synced_at = models.DateTimeField(
+        null=True,
+        default=None,
+        blank=True,
+        help_text='Start of the last successful sync, the next sync just get the events changed after it')
 
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
     updated_at = models.DateTimeField(auto_now=True, editable=False)
@@ -1,7 +1,10 @@
 import logging
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from breathecode.admissions.models import Academy, Cohort, CohortTimeSlot, CohortUser
 from breathecode.events.signals import event_saved
 from breathecode.events.models import Event
+from .caches import ICalCache
 from .tasks import async_export_event_to_eventbrite
 
 logger = logging.getLogger(__name__)
@@ -12,3 +15,15 @@ def post_save_event(sender, instance: Event, **kwargs):
     logger.debug('Procesing event save')
     if instance.sync_with_eventbrite and instance.eventbrite_sync_status == 'PENDING':
         async_export_event_to_eventbrite.delay(instance.id)
+
+
+@receiver(post_save, sender=Academy)
+@receiver(post_delete, sender=Academy)
+@receiver(post_save, sender=Cohort)
+@receiver(post_delete, sender=Cohort)
+@receiver(post_save, sender=CohortTimeSlot)
+@receiver(post_delete, sender=CohortTimeSlot)
+@receiver(post_save, sender=CohortUser)
+@receiver(post_delete, sender=CohortUser)
+def cohort_schedule_changed(sender, **kwargs):
+    ICalCache().clear()
@@ -0,0 +1,131 @@
+import breathecode.events.actions as actions
+from unittest.mock import MagicMock, patch
+from django.utils import timezone
+from breathecode.tests.mocks.eventbrite.constants.events import EVENTBRITE_EVENTS
+from breathecode.tests.mocks.requests import REQUESTS_PATH, apply_requests_request_mock
+from ..mixins import EventTestCase
+
+bulk_update_or_create_events = actions.bulk_update_or_create_events
+sync_desc = '2021-11-23 09:10:58.295264+00:00'
+eventbrite_description_url = 'https://www.eventbriteapi.com/v3/events/:id/structured_content/'
+eventbrite_description = {'modules': [{'data': {'body': {'text': 'They Killed Kenny'}}}]}
+
+UTC_NOW = timezone.now()
+
+
+def get_events(how_many):
+    event = EVENTBRITE_EVENTS['events'][0]
+    return [{
+        **event,
+        'id': str(n),
+        'url': f'https://www.eventbrite.com/e/{n}',
+    } for n in range(1, how_many + 1)]
+
+
+def get_description_url(id):
+    return eventbrite_description_url.replace(':id', str(id))
+
+
+class BulkUpdateOrCreateEventsTestSuite(EventTestCase):
+    """
+    🔽🔽🔽 Without events
+    """
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([]))
+    def test_bulk_update_or_create_events__without_events(self):
+        import requests
+
+        model = self.generate_models(academy=True, organization=True)
+
+        self.assertEqual(bulk_update_or_create_events([], model.organization), [])
+        self.assertEqual(self.bc.database.list_of('events.Event'), [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
+
+    """
+    🔽🔽🔽 With events
+    """
+
+    @patch.object(actions, 'get_current_iso_string', MagicMock(return_value=sync_desc))
+    @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([(200, get_description_url(n), eventbrite_description)
+                                        for n in range(1, 3)]))
+    def test_bulk_update_or_create_events__create_events(self):
+        import requests
+
+        model = self.generate_models(academy=True, organization=True)
+        events = get_events(3)
+
+        # the description of the third event is not found
+        bulk_update_or_create_events(events, model.organization)
+
+        self.assertEqual(sorted([x[0][1] for x in requests.Session.request.call_args_list]),
+                         [get_description_url(n) for n in range(1, 4)])
+
+        venues = self.bc.database.list_of('events.Venue')
+        organizers = self.bc.database.list_of('events.Organizer')
+
+        self.assertEqual([(x['eventbrite_id'], x['academy_id']) for x in venues], [('1', 1)])
+        self.assertEqual([(x['eventbrite_id'], x['organization_id']) for x in organizers], [('1', 1)])
+
+        db = self.bc.database.list_of('events.Event')
+        fields = ['eventbrite_id', 'venue_id', 'academy_id', 'sync_with_eventbrite', 'eventbrite_sync_status']
+
+        self.assertEqual([tuple(x[field] for field in fields) for x in db],
+                         [(str(n), 1, 1, True, 'PERSISTED') for n in range(1, 4)])
+
+        self.assertEqual([x['description'] for x in db], [
+            'They Killed Kenny',
+            'They Killed Kenny',
+            events[2]['description']['text'],
+        ])
+        self.assertEqual([x['eventbrite_sync_description'] for x in db], [
+            str(UTC_NOW),
+            str(UTC_NOW),
+            sync_desc,
+        ])
+
+    @patch.object(actions, 'get_current_iso_string', MagicMock(return_value=sync_desc))
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([(200, get_description_url(1), eventbrite_description)]))
+    def test_bulk_update_or_create_events__update_events(self):
+        event_kwargs = {'eventbrite_id': '1', 'title': 'Kenny', 'sync_with_eventbrite': False}
+        organizer_kwargs = {'eventbrite_id': '1', 'name': 'Kenny'}
+        model = self.generate_models(academy=True,
+                                     organization=True,
+                                     event=True,
+                                     organizer=True,
+                                     event_kwargs=event_kwargs,
+                                     organizer_kwargs=organizer_kwargs)
+
+        data = get_events(1)[0]
+
+        # get and create the venues, get and update the organizers, and get and update the events
+        with self.assertNumQueries(7):
+            bulk_update_or_create_events([data], model.organization)
+
+        db = self.bc.database.list_of('events.Event')
+        self.assertEqual(db, [{
+            **self.model_to_dict(model, 'event'),
+            'title': data['name']['text'],
+            'description': 'They Killed Kenny',
+            'excerpt': data['description']['text'],
+            'starting_at': self.iso_to_datetime(data['start']['utc']),
+            'ending_at': self.iso_to_datetime(data['end']['utc']),
+            'capacity': data['capacity'],
+            'online_event': data['online_event'],
+            'eventbrite_url': data['url'],
+            'url': data['url'],
+            'status': 'ACTIVE',
+            'eventbrite_status': data['status'],
+            'currency': data['currency'],
+            'venue_id': 1,
+            'banner': data['logo']['url'],
+            'published_at': self.iso_to_datetime(data['published']),
+            'academy_id': 1,
+            'eventbrite_sync_status': 'PERSISTED',
+            'eventbrite_sync_description': db[0]['eventbrite_sync_description'],
+        }])
+
+        organizers = self.bc.database.list_of('events.Organizer')
+        self.assertEqual([(x['name'], x['description']) for x in organizers],
+                         [(data['organizer']['name'], data['organizer']['description']['text'])])
@@ -32,7 +32,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (400, eventbrite_post_url, eventbrite_bad_post_event),
                (200, eventbrite_get_url, eventbrite_get_event),
@@ -47,7 +47,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         self.assertEqual(logging.Logger.error.call_args_list, [call('Event is not being provided')])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [])
-        self.assertEqual(requests.request.call_args_list, [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
 
     """
     🔽🔽🔽 Without eventbrite id
@@ -56,7 +56,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (400, eventbrite_post_url, eventbrite_bad_post_event),
                (200, eventbrite_get_url, eventbrite_get_event),
@@ -76,7 +76,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         ])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [db])
-        self.assertEqual(requests.request.call_args_list, [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
 
     """
     🔽🔽🔽 With Event
@@ -85,7 +85,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (400, eventbrite_post_url, eventbrite_bad_post_event),
                (200, eventbrite_get_url, eventbrite_get_event),
@@ -106,7 +106,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         ])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [db])
-        self.assertEqual(requests.request.call_args_list, [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
 
     """
     🔽🔽🔽 Empty description
@@ -115,7 +115,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (400, eventbrite_post_url, eventbrite_bad_post_event),
                (200, eventbrite_get_url, eventbrite_get_event),
@@ -137,7 +137,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         self.assertEqual(logging.Logger.error.call_args_list, [])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [db])
-        self.assertEqual(requests.request.call_args_list, [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
 
     """
     🔽🔽🔽 The eventbrite response is changed and now emit a exception
@@ -146,7 +146,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (400, eventbrite_post_url, eventbrite_bad_post_event),
                (200, eventbrite_get_url, {}),
@@ -173,7 +173,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
             'eventbrite_sync_status': 'ERROR',
         }])
 
-        self.assertEqual(requests.request.call_args_list, [
+        self.assertEqual(requests.Session.request.call_args_list, [
             call('GET',
                  'https://www.eventbriteapi.com/v3/events/1/structured_content/',
                  headers={'Authorization': f'Bearer {model.organization.eventbrite_key}'},
@@ -187,7 +187,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (400, eventbrite_post_url, eventbrite_bad_post_event),
                (200, eventbrite_get_url, eventbrite_get_event),
@@ -215,7 +215,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
                 'eventbrite_sync_status': 'ERROR',
                 'eventbrite_sync_description': 'Could not create event description in eventbrite',
             }])
-        self.assertEqual(requests.request.call_args_list, [
+        self.assertEqual(requests.Session.request.call_args_list, [
             call('GET',
                  'https://www.eventbriteapi.com/v3/events/1/structured_content/',
                  headers={'Authorization': f'Bearer {model.organization.eventbrite_key}'},
@@ -248,7 +248,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (200, eventbrite_post_url, eventbrite_good_post_event),
                (200, eventbrite_get_url, eventbrite_get_event),
@@ -274,7 +274,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
                              'eventbrite_sync_description': str(UTC_NOW),
                          }])
 
-        self.assertEqual(requests.request.call_args_list, [
+        self.assertEqual(requests.Session.request.call_args_list, [
             call('GET',
                  'https://www.eventbriteapi.com/v3/events/1/structured_content/',
                  headers={'Authorization': f'Bearer {model.organization.eventbrite_key}'},
@@ -43,7 +43,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'error', log_mock())
     @patch.object(actions, 'get_current_iso_string', get_current_iso_string_mock())
     @patch.object(actions, 'export_event_description_to_eventbrite', MagicMock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (201, eventbrite_post_url, eventbrite_event),
                (200, eventbrite_put_url, eventbrite_event),
@@ -72,7 +72,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'error', log_mock())
     @patch.object(actions, 'get_current_iso_string', get_current_iso_string_mock())
     @patch.object(actions, 'export_event_description_to_eventbrite', MagicMock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (201, eventbrite_post_url, eventbrite_event),
                (200, eventbrite_put_url, eventbrite_event),
@@ -111,7 +111,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(actions, 'get_current_iso_string', get_current_iso_string_mock())
     @patch.object(actions, 'export_event_description_to_eventbrite', MagicMock())
     @patch.object(Eventbrite, 'request', MagicMock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (201, eventbrite_post_url, eventbrite_event),
                (200, eventbrite_put_url, eventbrite_event),
@@ -170,7 +170,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(actions, 'get_current_iso_string', get_current_iso_string_mock())
     @patch.object(actions, 'export_event_description_to_eventbrite', MagicMock())
     @patch.object(Eventbrite, 'request', MagicMock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (201, eventbrite_post_url, eventbrite_event),
                (200, eventbrite_put_url, eventbrite_event),
@@ -229,7 +229,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(actions, 'get_current_iso_string', get_current_iso_string_mock())
     @patch.object(actions, 'export_event_description_to_eventbrite', MagicMock())
     @patch.object(Eventbrite, 'request', MagicMock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([
                (201, eventbrite_post_url, eventbrite_event),
                (200, eventbrite_put_url, eventbrite_event),
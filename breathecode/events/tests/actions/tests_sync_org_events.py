@@ -1,4 +1,5 @@
 import logging
+import pytz
 
 from datetime import datetime
 from unittest.mock import MagicMock, call, patch
@@ -11,6 +12,7 @@ import breathecode.events.actions as actions
 sync_org_events = actions.sync_org_events
 
 eventbrite_events_endpoint = get_eventbrite_events_url('1')
+eventbrite_changed_events_endpoint = eventbrite_events_endpoint + '&changed_since=2022-01-01T00%3A00%3A00Z'
 
 
 def log_mock():
@@ -20,12 +22,12 @@ def log_mock():
     return MagicMock(side_effect=log)
 
 
-def update_or_create_event_mock(raise_error=False):
-    def update_or_create_event(self, *args, **kwargs):
+def bulk_update_or_create_events_mock(raise_error=False):
+    def bulk_update_or_create_events(self, *args, **kwargs):
         if raise_error:
             raise Exception('Random error in creating')
 
-    return MagicMock(side_effect=update_or_create_event)
+    return MagicMock(side_effect=bulk_update_or_create_events)
 
 
 def export_event_to_eventbrite_mock(raise_error=False):
@@ -42,9 +44,9 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     """
     @patch.object(logging.Logger, 'info', log_mock())
     @patch.object(logging.Logger, 'error', log_mock())
-    @patch.object(actions, 'update_or_create_event', update_or_create_event_mock())
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
     @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_events_endpoint, EVENTBRITE_EVENTS)]))
     def test_sync_org_events__without_academy(self):
         """Test /answer without auth"""
@@ -58,7 +60,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         sync_org_events(model['organization'])
 
         self.assertEqual(actions.export_event_to_eventbrite.call_args_list, [])
-        self.assertEqual(actions.update_or_create_event.call_args_list, [])
+        self.assertEqual(actions.bulk_update_or_create_events.call_args_list, [])
         self.assertEqual(logging.Logger.info.call_args_list, [])
         self.assertEqual(logging.Logger.error.call_args_list,
                          [call('The organization Nameless not have a academy assigned')])
@@ -67,14 +69,14 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         self.assertEqual(self.all_event_dict(), [])
 
     """
-    🔽🔽🔽 With academy, call update_or_create_event
+    🔽🔽🔽 With academy, call bulk_update_or_create_events
     """
 
     @patch.object(logging.Logger, 'info', log_mock())
     @patch.object(logging.Logger, 'error', log_mock())
-    @patch.object(actions, 'update_or_create_event', update_or_create_event_mock())
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
     @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_events_endpoint, EVENTBRITE_EVENTS)]))
     def test_sync_org_events(self):
         """Test /answer without auth"""
@@ -88,8 +90,8 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         sync_org_events(model['organization'])
 
         self.assertEqual(actions.export_event_to_eventbrite.call_args_list, [])
-        self.assertEqual(actions.update_or_create_event.call_args_list,
-                         [call(EVENTBRITE_EVENTS['events'][0], model.organization)])
+        self.assertEqual(actions.bulk_update_or_create_events.call_args_list,
+                         [call(EVENTBRITE_EVENTS['events'], model.organization)])
 
         self.assertEqual(logging.Logger.info.call_args_list, [])
         self.assertEqual(logging.Logger.error.call_args_list, [])
@@ -103,9 +105,10 @@ class SyncOrgVenuesTestSuite(EventTestCase):
 
     @patch.object(logging.Logger, 'info', log_mock())
     @patch.object(logging.Logger, 'error', log_mock())
-    @patch.object(actions, 'update_or_create_event', update_or_create_event_mock(raise_error=True))
+    @patch.object(actions, 'bulk_update_or_create_events',
+                  bulk_update_or_create_events_mock(raise_error=True))
     @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_events_endpoint, EVENTBRITE_EVENTS)]))
     def test_sync_org_events__raise_error(self):
         """Test /answer without auth"""
@@ -121,8 +124,8 @@ class SyncOrgVenuesTestSuite(EventTestCase):
 
         self.assertEqual(str(cm.exception), 'Random error in creating')
         self.assertEqual(actions.export_event_to_eventbrite.call_args_list, [])
-        self.assertEqual(actions.update_or_create_event.call_args_list,
-                         [call(EVENTBRITE_EVENTS['events'][0], model.organization)])
+        self.assertEqual(actions.bulk_update_or_create_events.call_args_list,
+                         [call(EVENTBRITE_EVENTS['events'], model.organization)])
 
         self.assertEqual(logging.Logger.info.call_args_list, [])
         self.assertEqual(logging.Logger.error.call_args_list, [])
@@ -142,9 +145,9 @@ class SyncOrgVenuesTestSuite(EventTestCase):
 
     @patch.object(logging.Logger, 'info', log_mock())
     @patch.object(logging.Logger, 'error', log_mock())
-    @patch.object(actions, 'update_or_create_event', update_or_create_event_mock())
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
     @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_events_endpoint, EVENTBRITE_EVENTS)]))
     def test_sync_org_events__call_export_event_to_eventbrite__without_events(self):
         """Test /answer without auth"""
@@ -158,8 +161,8 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         sync_org_events(model['organization'])
 
         self.assertEqual(actions.export_event_to_eventbrite.call_args_list, [])
-        self.assertEqual(actions.update_or_create_event.call_args_list,
-                         [call(EVENTBRITE_EVENTS['events'][0], model.organization)])
+        self.assertEqual(actions.bulk_update_or_create_events.call_args_list,
+                         [call(EVENTBRITE_EVENTS['events'], model.organization)])
 
         self.assertEqual(logging.Logger.info.call_args_list, [])
         self.assertEqual(logging.Logger.error.call_args_list, [])
@@ -173,9 +176,9 @@ class SyncOrgVenuesTestSuite(EventTestCase):
 
     @patch.object(logging.Logger, 'info', log_mock())
     @patch.object(logging.Logger, 'error', log_mock())
-    @patch.object(actions, 'update_or_create_event', update_or_create_event_mock())
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
     @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_events_endpoint, EVENTBRITE_EVENTS)]))
     def test_sync_org_events__call_export_event_to_eventbrite__with_event(self):
         """Test /answer without auth"""
@@ -196,11 +199,120 @@ class SyncOrgVenuesTestSuite(EventTestCase):
 
         self.assertEqual(actions.export_event_to_eventbrite.call_args_list,
                          [call(model.event, model.organization)])
-        self.assertEqual(actions.update_or_create_event.call_args_list,
-                         [call(EVENTBRITE_EVENTS['events'][0], model.organization)])
+        self.assertEqual(actions.bulk_update_or_create_events.call_args_list,
+                         [call(EVENTBRITE_EVENTS['events'], model.organization)])
 
         self.assertEqual(logging.Logger.info.call_args_list, [])
         self.assertEqual(logging.Logger.error.call_args_list, [])
 
         self.assertEqual(self.all_organization_dict(), [self.model_to_dict(model, 'organization')])
         self.assertEqual(self.all_event_dict(), [self.model_to_dict(model, 'event')])
+
+    """
+    🔽🔽🔽 With academy, the last sync was successful
+    """
+
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
+    @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([(200, eventbrite_changed_events_endpoint, EVENTBRITE_EVENTS)]))
+    def test_sync_org_events__just_the_events_changed_since_the_last_sync(self):
+        import requests
+        import breathecode.events.actions as actions
+
+        synced_at = datetime(2022, 1, 1, tzinfo=pytz.UTC)
+        organization_kwargs = {'eventbrite_id': '1', 'synced_at': synced_at}
+        model = self.generate_models(academy=True, organization=True, organization_kwargs=organization_kwargs)
+
+        sync_org_events(model['organization'])
+
+        self.assertEqual(actions.bulk_update_or_create_events.call_args_list,
+                         [call(EVENTBRITE_EVENTS['events'], model.organization)])
+        self.assertEqual([x[0][1] for x in requests.Session.request.call_args_list],
+                         [eventbrite_changed_events_endpoint])
+
+        organization = self.bc.database.list_of('events.Organization')[0]
+        self.assertEqual(organization['sync_status'], 'PERSISTED')
+        self.assertGreater(organization['synced_at'], synced_at)
+
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
+    @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([(200, eventbrite_changed_events_endpoint, EVENTBRITE_EVENTS)]))
+    def test_sync_org_events__the_last_sync_with_microseconds(self):
+        import requests
+
+        synced_at = datetime(2022, 1, 1, 0, 0, 0, 123456, tzinfo=pytz.UTC)
+        organization_kwargs = {'eventbrite_id': '1', 'synced_at': synced_at}
+        model = self.generate_models(academy=True, organization=True, organization_kwargs=organization_kwargs)
+
+        sync_org_events(model['organization'])
+
+        self.assertEqual([x[0][1] for x in requests.Session.request.call_args_list],
+                         [eventbrite_changed_events_endpoint])
+
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
+    @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([(400, eventbrite_changed_events_endpoint, {
+               'status_code':
+               400,
+               'error':
+               'ARGUMENTS_ERROR',
+               'error_description':
+               'There are errors with your arguments: changed_since - INVALID',
+           })]))
+    def test_sync_org_events__the_request_was_rejected(self):
+        synced_at = datetime(2022, 1, 1, tzinfo=pytz.UTC)
+        organization_kwargs = {'eventbrite_id': '1', 'synced_at': synced_at}
+        model = self.generate_models(academy=True, organization=True, organization_kwargs=organization_kwargs)
+
+        with self.assertRaisesMessage(Exception,
+                                      'There are errors with your arguments: changed_since - INVALID'):
+            sync_org_events(model['organization'])
+
+        organization = self.bc.database.list_of('events.Organization')[0]
+        self.assertEqual(
+            (organization['sync_status'], organization['sync_desc'], organization['synced_at']),
+            ('ERROR', 'Error: There are errors with your arguments: changed_since - INVALID', synced_at))
+
+    """
+    🔽🔽🔽 With academy, the events have many pages
+    """
+
+    @patch.object(actions, 'bulk_update_or_create_events', bulk_update_or_create_events_mock())
+    @patch.object(actions, 'export_event_to_eventbrite', export_event_to_eventbrite_mock())
+    @patch(REQUESTS_PATH['session_request'],
+           apply_requests_request_mock([
+               (200, eventbrite_events_endpoint, {
+                   'pagination': {
+                       'has_more_items': True,
+                       'continuation': 'kenny'
+                   },
+                   'events': [{
+                       'id': '1'
+                   }],
+               }),
+               (200, eventbrite_events_endpoint + '&continuation=kenny', {
+                   'pagination': {
+                       'has_more_items': False
+                   },
+                   'events': [{
+                       'id': '2'
+                   }],
+               }),
+           ]))
+    def test_sync_org_events__the_pages_are_merged(self):
+        import breathecode.events.actions as actions
+
+        organization_kwargs = {'eventbrite_id': '1'}
+        model = self.generate_models(academy=True, organization=True, organization_kwargs=organization_kwargs)
+
+        sync_org_events(model['organization'])
+
+        self.assertEqual(actions.bulk_update_or_create_events.call_args_list,
+                         [call([{
+                             'id': '1'
+                         }, {
+                             'id': '2'
+                         }], model.organization)])
@@ -24,7 +24,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     🔽🔽🔽 Without academy
     """
     @patch.object(actions, 'create_or_update_venue', create_or_update_venue_mock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, get_eventbrite_venues_url('1'), EVENTBRITE_VENUES)]))
     def test_sync_org_venues__without_academy(self):
         import logging
@@ -49,7 +49,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     """
 
     @patch.object(actions, 'create_or_update_venue', create_or_update_venue_mock())
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, get_eventbrite_venues_url('1'), EVENTBRITE_VENUES)]))
     def test_sync_org_venues__with_academy(self):
         import logging
@@ -30,7 +30,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_get_url, eventbrite_bad_get_event)]))
     def test_update_event_description_from_eventbrite__without_event(self):
         import logging
@@ -42,7 +42,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         self.assertEqual(logging.Logger.error.call_args_list, [call('Event is not being provided')])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [])
-        self.assertEqual(requests.request.call_args_list, [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
 
     """
     🔽🔽🔽 Without eventbrite id
@@ -51,7 +51,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_get_url, eventbrite_bad_get_event)]))
     def test_update_event_description_from_eventbrite__without_eventbrite_id(self):
         import logging
@@ -68,7 +68,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         ])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [db])
-        self.assertEqual(requests.request.call_args_list, [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
 
     """
     🔽🔽🔽 With Event
@@ -77,7 +77,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_get_url, eventbrite_bad_get_event)]))
     def test_update_event_description_from_eventbrite__with_event(self):
         import logging
@@ -95,7 +95,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         ])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [db])
-        self.assertEqual(requests.request.call_args_list, [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
 
     """
     🔽🔽🔽 Without description in eventbrite
@@ -104,7 +104,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_get_url, eventbrite_bad_get_event)]))
     def test_update_event_description_from_eventbrite__without_event_in_eventbrite(self):
         import logging
@@ -123,7 +123,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
         self.assertEqual(logging.Logger.error.call_args_list, [])
 
         self.assertEqual(self.bc.database.list_of('events.Event'), [db])
-        self.assertEqual(requests.request.call_args_list, [
+        self.assertEqual(requests.Session.request.call_args_list, [
             call('GET',
                  'https://www.eventbriteapi.com/v3/events/1/structured_content/',
                  headers={'Authorization': f'Bearer {model.organization.eventbrite_key}'},
@@ -137,7 +137,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
     @patch.object(logging.Logger, 'warning', MagicMock())
     @patch.object(logging.Logger, 'error', MagicMock())
     @patch.object(timezone, 'now', MagicMock(return_value=UTC_NOW))
-    @patch(REQUESTS_PATH['request'],
+    @patch(REQUESTS_PATH['session_request'],
            apply_requests_request_mock([(200, eventbrite_get_url, eventbrite_good_get_event)]))
     def test_update_event_description_from_eventbrite__with_event_in_eventbrite(self):
         import logging
@@ -161,7 +161,7 @@ class SyncOrgVenuesTestSuite(EventTestCase):
                              'eventbrite_sync_description': str(UTC_NOW),
                          }])
 
-        self.assertEqual(requests.request.call_args_list, [
+        self.assertEqual(requests.Session.request.call_args_list, [
             call('GET',
                  'https://www.eventbriteapi.com/v3/events/1/structured_content/',
                  headers={'Authorization': f'Bearer {model.organization.eventbrite_key}'},
@@ -1362,18 +1362,25 @@ class AcademyEventTestSuite(EventTestCase):
 
     def test_all_academy_events_with_data_testing_cache(self):
         """Test /cohort without auth"""
-        cache_keys = [
-            'Event__academy_id=1&event_id=None&city=None&'
-            'country=None&zip_code=None&upcoming=None&past=None&limit=None&offset=None'
-        ]
+        cache_kwargs = {
+            'academy_id': 1,
+            'event_id': None,
+            'city': None,
+            'country': None,
+            'zip_code': None,
+            'upcoming': None,
+            'past': None,
+            'limit': None,
+            'offset': None,
+        }
 
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         old_models = self.check_all_academy_events()
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
         self.check_all_academy_events(old_models)
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
     def test_academy_event_type_no_results(self):
         self.headers(academy=1)
@@ -1389,15 +1396,22 @@ class AcademyEventTestSuite(EventTestCase):
 
     def test_academy_cohort_with_data_testing_cache_and_remove_in_post(self):
         """Test /cohort without auth"""
-        cache_keys = [
-            'Event__academy_id=1&event_id=None&city=None&'
-            'country=None&zip_code=None&upcoming=None&past=None&limit=None&offset=None'
-        ]
+        cache_kwargs = {
+            'academy_id': 1,
+            'event_id': None,
+            'city': None,
+            'country': None,
+            'zip_code': None,
+            'upcoming': None,
+            'past': None,
+            'limit': None,
+            'offset': None,
+        }
 
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         old_model = self.check_all_academy_events()
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
         self.headers(academy=1)
 
@@ -1502,7 +1516,7 @@ class AcademyEventTestSuite(EventTestCase):
             'slug': model['event'].slug,
             'currency': 'USD',
         }])
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         base = [
             self.generate_models(authenticate=True, models=old_model[0]),
@@ -1510,7 +1524,7 @@ class AcademyEventTestSuite(EventTestCase):
         ]
 
         self.check_all_academy_events(base)
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
     def test_academy_event_type_with_results(self):
         self.headers(academy=1)
@@ -1567,3 +1581,27 @@ class AcademyEventTestSuite(EventTestCase):
         self.assertEqual(self.all_event_type_dict(), [{
             **self.model_to_dict(model, 'event_type'),
         }])
+
+    """
+    🔽🔽🔽 Queries
+    """
+
+    def test_all_academy_events__queries_do_not_grow_with_the_events(self):
+        self.headers(academy=1)
+        url = reverse_lazy('events:academy_event')
+        model = self.generate_models(authenticate=True,
+                                     organization=True,
+                                     profile_academy=True,
+                                     capability='read_event',
+                                     role='potato',
+                                     event=True,
+                                     event_type=True,
+                                     venue=True)
+
+        base = {'academy': model.academy, 'organization': model.organization}
+
+        def grow():
+            for _ in range(0, 3):
+                self.generate_models(event=True, event_type=True, venue=True, models=base)
+
+        self.bc.check.constant_queries(lambda: self.client.get(url), grow)
@@ -766,15 +766,22 @@ class AcademyEventIdTestSuite(EventTestCase):
     @patch('breathecode.marketing.signals.downloadable_saved.send', MagicMock())
     def test_academy_cohort_with_data_testing_cache_and_remove_in_put(self):
         """Test /cohort without auth"""
-        cache_keys = [
-            'Event__academy_id=1&event_id=None&city=None&'
-            'country=None&zip_code=None&upcoming=None&past=None&limit=None&offset=None'
-        ]
+        cache_kwargs = {
+            'academy_id': 1,
+            'event_id': None,
+            'city': None,
+            'country': None,
+            'zip_code': None,
+            'upcoming': None,
+            'past': None,
+            'limit': None,
+            'offset': None,
+        }
 
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
 
         old_model = self.check_all_academy_events()
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
 
         self.headers(academy=1)
 
@@ -853,7 +860,7 @@ class AcademyEventIdTestSuite(EventTestCase):
             'starting_at': current_date,
             'ending_at': current_date,
         }])
-        self.assertEqual(self.cache.keys(), [])
+        self.assertEqual(self.cache.get(**cache_kwargs), None)
         event = old_model[0]['event']
 
         for x in data:
@@ -868,4 +875,4 @@ class AcademyEventIdTestSuite(EventTestCase):
         ]
 
         self.check_all_academy_events(base)
-        self.assertEqual(self.cache.keys(), cache_keys)
+        self.assertNotEqual(self.cache.get(**cache_kwargs), None)
@@ -1102,3 +1102,50 @@ class AcademyCohortTestSuite(EventTestCase):
 
         self.assertEqual(response.content.decode('utf-8'), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    """
+    🔽🔽🔽 Cache
+    """
+
+    def test_ical_cohorts__with_two__with_teacher__rendered_with_constant_queries(self):
+        device_id_kwargs = {'name': 'server'}
+        teacher_kwargs = {'role': 'TEACHER'}
+        cohort_kwargs = {'ending_date': timezone.now() + timedelta(days=30)}
+        cohort_time_slot_kwargs = {
+            'timezone': 'America/Bogota',
+            'starting_at': 191109111330,
+            'ending_at': 191109111330,
+        }
+
+        base = self.generate_models(academy=True,
+                                    skip_cohort=True,
+                                    device_id=True,
+                                    device_id_kwargs=device_id_kwargs)
+
+        for _ in range(0, 2):
+            model = self.generate_models(cohort=True, cohort_kwargs=cohort_kwargs, academy=base.academy)
+            cohort = model.cohort
+            self.generate_models(cohort=cohort,
+                                 cohort_time_slot=True,
+                                 cohort_time_slot_kwargs=cohort_time_slot_kwargs)
+            self.generate_models(cohort=cohort, cohort_user=True, cohort_user_kwargs=teacher_kwargs)
+
+        url = reverse_lazy('events:academy_id_ical_cohorts')
+        args = {'academy': '1'}
+
+        # validate and represent the academies, the server id, the cohorts with its academies, the
+        # timeslots and the teachers
+        with self.assertNumQueries(6):
+            response = self.client.get(url + '?' + urllib.parse.urlencode(args))
+
+        content = response.content.decode('utf-8')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(content.count('BEGIN:VEVENT'), 6)
+        self.assertEqual(content.count('ORGANIZER'), 6)
+
+        # the second time is served from the cache, the academies are still validated
+        with self.assertNumQueries(1):
+            response = self.client.get(url + '?' + urllib.parse.urlencode(args),
+                                       HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
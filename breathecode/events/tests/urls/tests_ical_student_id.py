@@ -634,3 +634,91 @@ class AcademyCohortTestSuite(EventTestCase):
 
         self.assertEqual(response.content.decode('utf-8'), expected)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    """
+    🔽🔽🔽 Cache
+    """
+
+    def test_ical_cohort__with_two__with_teacher__rendered_with_constant_queries(self):
+        device_id_kwargs = {'name': 'server'}
+        teacher_kwargs = {'role': 'TEACHER'}
+        cohort_time_slot_kwargs = {
+            'timezone': 'America/Bogota',
+            'starting_at': 191109111330,
+            'ending_at': 191109111330,
+        }
+
+        base = self.generate_models(academy=True,
+                                    skip_cohort=True,
+                                    device_id=True,
+                                    device_id_kwargs=device_id_kwargs)
+        student = self.generate_models(user=True)
+
+        for _ in range(0, 2):
+            cohort = self.generate_models(cohort=True, academy=base.academy).cohort
+            self.generate_models(user=student.user, cohort=cohort, cohort_user=True)
+            self.generate_models(cohort=cohort,
+                                 cohort_time_slot=True,
+                                 cohort_time_slot_kwargs=cohort_time_slot_kwargs)
+            self.generate_models(cohort=cohort, cohort_user=True, cohort_user_kwargs=teacher_kwargs)
+
+        url = reverse_lazy('events:ical_student_id', kwargs={'user_id': student.user.id})
+
+        # the user, the server id, the timeslots with its cohorts and academies, and the teachers
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content.decode('utf-8').count('BEGIN:VEVENT'), 2)
+        self.assertEqual(response.content.decode('utf-8').count('ORGANIZER'), 2)
+
+        # the second time is served from the cache
+        with self.assertNumQueries(1):
+            cached = self.client.get(url)
+
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached['ETag'], response['ETag'])
+        self.assertEqual(cached['Last-Modified'], response['Last-Modified'])
+
+    def test_ical_cohort__not_modified(self):
+        device_id_kwargs = {'name': 'server'}
+        self.generate_models(academy=True,
+                             device_id=True,
+                             device_id_kwargs=device_id_kwargs,
+                             cohort_user=True)
+
+        url = reverse_lazy('events:ical_student_id', kwargs={'user_id': 1})
+        response = self.client.get(url)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_ical_cohort__invalidated_when_a_timeslot_is_added(self):
+        device_id_kwargs = {'name': 'server'}
+        model = self.generate_models(academy=True,
+                                     device_id=True,
+                                     device_id_kwargs=device_id_kwargs,
+                                     cohort_user=True)
+
+        url = reverse_lazy('events:ical_student_id', kwargs={'user_id': 1})
+        response = self.client.get(url)
+        self.assertEqual(response.content.decode('utf-8').count('BEGIN:VEVENT'), 0)
+
+        cohort_time_slot_kwargs = {
+            'timezone': 'America/Bogota',
+            'starting_at': 191109111330,
+            'ending_at': 191109111330,
+        }
+        self.generate_models(cohort_time_slot=True,
+                             cohort_time_slot_kwargs=cohort_time_slot_kwargs,
+                             models=model)
+
+        updated = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(updated.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(updated['ETag'], response['ETag'])
+        self.assertEqual(updated.content.decode('utf-8').count('BEGIN:VEVENT'), 1)
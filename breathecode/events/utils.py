@@ -1,5 +1,34 @@
 import os
+import pytz
 import urllib
+import threading
+
+__all__ = ['Eventbrite', 'get_session']
+
+# max number of connections kept alive with eventbrite
+EVENTBRITE_POOL_SIZE = int(os.getenv('EVENTBRITE_POOL_SIZE', 10))
+
+_lock = threading.Lock()
+_session = None
+_session_pid = None
+
+
+def get_session():
+    """Get the keep-alive session of this process, it is shared by all the Eventbrite clients"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    global _session, _session_pid
+
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            adapter = HTTPAdapter(pool_connections=EVENTBRITE_POOL_SIZE, pool_maxsize=EVENTBRITE_POOL_SIZE)
+
+            _session = requests.Session()
+            _session.mount('https://', adapter)
+            _session_pid = os.getpid()
+
+        return _session
 
 
 class Eventbrite(object):
@@ -20,41 +49,50 @@ class Eventbrite(object):
         pass
 
     def request(self, _type, url, headers={}, query_string=None, data=None):
-        import requests
-
+        """Request to Eventbrite, the lists of the continuation pages are merged in the result"""
         _headers = {**self.headers, **headers}
-        _query_string = '?' + urllib.parse.urlencode(query_string) if query_string else ''
-
-        response = requests.request(_type, self.host + url + _query_string, headers=_headers, data=data)
-        result = response.json()
-
-        if 'status_code' in result and result['status_code'] >= 400:
-            raise Exception(result['error_description'])
-
-        if 'pagination' in result:
-            print('has more items?', result['pagination']['has_more_items'])
-            if result['pagination']['has_more_items']:
-                print('Continuation: ', result['pagination']['continuation'])
-                new_result = self.request(_type,
-                                          url,
-                                          query_string={
-                                              **query_string, 'continuation':
-                                              result['pagination']['continuation']
-                                          })
-                for key in new_result:
-                    print(key, type(new_result[key]) == 'list')
-                    if type(new_result[key]) == 'list':
-                        new_result[key] = result[key] + new_result[key]
-                result.update(new_result)
-
-        return result
+        query_string = {**query_string} if query_string else {}
+        result = None
+
+        while True:
+            _query_string = '?' + urllib.parse.urlencode(query_string) if query_string else ''
+
+            response = get_session().request(_type,
+                                             self.host + url + _query_string,
+                                             headers=_headers,
+                                             data=data)
+            page = response.json()
+
+            if 'status_code' in page and page['status_code'] >= 400:
+                raise Exception(page['error_description'])
+
+            if result is None:
+                result = page
+
+            else:
+                for key in page:
+                    if isinstance(page[key], list) and isinstance(result.get(key), list):
+                        result[key] = result[key] + page[key]
+
+                    else:
+                        result[key] = page[key]
+
+            if 'pagination' not in page or not page['pagination'].get('has_more_items'):
+                return result
+
+            query_string['continuation'] = page['pagination']['continuation']
 
     def get_my_organizations(self):
         data = self.request('GET', f'/users/me/organizations/')
         return data
 
-    def get_organization_events(self, organization_id):
+    def get_organization_events(self, organization_id, changed_since=None):
         query_string = {'expand': 'organizer,venue', 'status': 'live'}
+
+        # just the events that were changed after the last sync, eventbrite expects YYYY-MM-DDThh:mm:ssZ
+        if changed_since:
+            query_string['changed_since'] = changed_since.astimezone(pytz.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
         data = self.request('GET',
                             f'/organizations/{str(organization_id)}/events/',
                             query_string=query_string)
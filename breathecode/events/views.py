@@ -2,16 +2,19 @@ from breathecode.events.actions import fix_datetime_weekday, update_timeslots_ou
 import os
 
 from django.contrib.auth.models import User
+from django.db.models import Prefetch
 from django.db.models.query_utils import Q
 from breathecode.authenticate.actions import server_id
-from breathecode.events.caches import EventCache
-from breathecode.utils import APIException
+from breathecode.events.caches import EventCache, ICalCache, ICAL_CACHE_TTL
+from breathecode.utils import APIException, prefetch_serializer
 from datetime import datetime, timedelta
 import logging
 import re
 import pytz
 
 from django.http.response import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from breathecode.utils.cache import Cache
 from django.shortcuts import render
 from django.utils import timezone
@@ -45,6 +48,9 @@ FRIDAY = 4
 SATURDAY = 5
 SUNDAY = 6
 
+# the feeds filtered by `upcoming=true` change with the time, they are cached at most this time
+ICAL_UPCOMING_CACHE_TTL = int(os.getenv('ICAL_UPCOMING_CACHE_TTL', 60 * 15))
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -118,6 +124,7 @@ class EventView(APIView):
                 lookup['starting_at__lte'] = timezone.now()
 
         items = items.filter(**lookup).order_by('-created_at')
+        items = prefetch_serializer(items, EventSmallSerializer)
 
         serializer = EventSmallSerializer(items, many=True)
         return Response(serializer.data)
@@ -189,6 +196,7 @@ class AcademyEventView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMixi
                 lookup['starting_at__lte'] = timezone.now()
 
         items = items.filter(**lookup).order_by('-starting_at')
+        items = prefetch_serializer(items, EventSmallSerializerNoAcademy)
 
         page = self.paginate_queryset(items, request)
         serializer = EventSmallSerializerNoAcademy(page, many=True)
@@ -527,26 +535,63 @@ def ical_academies_repr(slugs=None, ids=None):
     return ret
 
 
+def ical_response(request, name: str, render, ttl=ICAL_CACHE_TTL, **kwargs):
+    """Serve a rendered iCal feed from the cache, it answers 304 if the client has the same version."""
+
+    cache = ICalCache()
+    data = cache.get(name, **kwargs)
+
+    if data is None:
+        data = cache.set(name, render(), ttl=ttl, **kwargs)
+
+    etag = quote_etag(data['etag'])
+    response = get_conditional_response(request, etag=etag, last_modified=data['last_modified'])
+
+    if response is None:
+        response = HttpResponse(data['content'], content_type='text/calendar')
+        response['Content-Disposition'] = 'attachment; filename="calendar.ics"'
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(data['last_modified'])
+    return response
+
+
+def ical_teachers_prefetch(lookup: str) -> Prefetch:
+    teachers = CohortUser.objects.filter(role='TEACHER').select_related('user').order_by('id')
+    return Prefetch(lookup, queryset=teachers, to_attr='teachers')
+
+
 class ICalStudentView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, user_id):
-        items = Cohort.objects.all()
-
-        if not User.objects.filter(id=user_id).count():
+        if not User.objects.filter(id=user_id).exists():
             raise ValidationException('Student not exist', 404, slug='student-not-exist')
 
+        upcoming = request.GET.get('upcoming') == 'true'
+
+        # the upcoming feed depends on the current time, so it can't live as long as the others
+        ttl = min(ICAL_CACHE_TTL, ICAL_UPCOMING_CACHE_TTL) if upcoming else ICAL_CACHE_TTL
+        return ical_response(request,
+                             'student',
+                             lambda: self.render(user_id, upcoming),
+                             ttl=ttl,
+                             user_id=user_id,
+                             upcoming=upcoming)
+
+    def render(self, user_id, upcoming) -> bytes:
         cohort_ids = (CohortUser.objects.filter(user_id=user_id).values_list(
             'cohort_id', flat=True).exclude(cohort__stage='DELETED'))
 
         items = CohortTimeSlot.objects.filter(cohort__id__in=cohort_ids).order_by('id')
-        items = items
 
-        upcoming = request.GET.get('upcoming')
-        if upcoming == 'true':
+        if upcoming:
             now = timezone.now()
             items = items.filter(cohort__kickoff_date__gte=now)
 
+        items = items.select_related('cohort__academy').prefetch_related(
+            ical_teachers_prefetch('cohort__cohortuser_set'))
+
         key = server_id()
 
         calendar = iCalendar()
@@ -595,7 +640,7 @@ class ICalStudentView(APIView):
 
                 event.add('rrule', {'freq': item.recurrency_type, 'until': until_date + delta})
 
-            teacher = CohortUser.objects.filter(role='TEACHER', cohort__id=item.cohort.id).first()
+            teacher = item.cohort.teachers[0] if item.cohort.teachers else None
 
             if teacher:
                 organizer = vCalAddress(f'MAILTO:{teacher.user.email}')
@@ -618,34 +663,19 @@ class ICalStudentView(APIView):
 
             calendar.add_component(event)
 
-        calendar_text = calendar.to_ical()
-
-        response = HttpResponse(calendar_text, content_type='text/calendar')
-        response['Content-Disposition'] = 'attachment; filename="calendar.ics"'
-        return response
+        return calendar.to_ical()
 
 
 class ICalCohortsView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        items = Cohort.objects.all()
-
         ids = request.GET.get('academy', '')
         slugs = request.GET.get('academy_slug', '')
 
         ids = ids.split(',') if ids else []
         slugs = slugs.split(',') if slugs else []
 
-        if ids:
-            items = Cohort.objects.filter(academy__id__in=ids).order_by('id')
-
-        elif slugs:
-            items = Cohort.objects.filter(academy__slug__in=slugs).order_by('id')
-
-        else:
-            items = []
-
         if not ids and not slugs:
             raise ValidationException(
                 'You need to specify at least one academy or academy_slug (comma separated) in the querystring'
@@ -655,13 +685,35 @@ class ICalCohortsView(APIView):
                 or Academy.objects.filter(slug__in=slugs).count() != len(slugs)):
             raise ValidationException('Some academy not exist')
 
+        upcoming = request.GET.get('upcoming') == 'true'
+
+        # the upcoming feed depends on the current time, so it can't live as long as the others
+        ttl = min(ICAL_CACHE_TTL, ICAL_UPCOMING_CACHE_TTL) if upcoming else ICAL_CACHE_TTL
+        return ical_response(request,
+                             'cohorts',
+                             lambda: self.render(ids, slugs, upcoming),
+                             ttl=ttl,
+                             academy=','.join(ids),
+                             academy_slug=','.join(slugs),
+                             upcoming=upcoming)
+
+    def render(self, ids, slugs, upcoming) -> bytes:
+        if ids:
+            items = Cohort.objects.filter(academy__id__in=ids).order_by('id')
+
+        else:
+            items = Cohort.objects.filter(academy__slug__in=slugs).order_by('id')
+
         items = items.exclude(stage='DELETED')
 
-        upcoming = request.GET.get('upcoming')
-        if upcoming == 'true':
+        if upcoming:
             now = timezone.now()
             items = items.filter(kickoff_date__gte=now)
 
+        items = items.select_related('academy').prefetch_related(
+            Prefetch('cohorttimeslot_set', queryset=CohortTimeSlot.objects.order_by('id')),
+            ical_teachers_prefetch('cohortuser_set'))
+
         academies_repr = ical_academies_repr(ids=ids, slugs=slugs)
         key = server_id()
 
@@ -702,7 +754,7 @@ class ICalCohortsView(APIView):
             event.add('dtstart', item.kickoff_date)
 
             timeslots = update_timeslots_out_of_range(item.kickoff_date, item.ending_date,
-                                                      CohortTimeSlot.objects.filter(cohort__id=item.id))
+                                                      item.cohorttimeslot_set.all())
 
             first_timeslot = timeslots[0] if timeslots else None
             if first_timeslot:
@@ -750,7 +802,7 @@ class ICalCohortsView(APIView):
 
             event.add('dtstamp', item.created_at)
 
-            teacher = CohortUser.objects.filter(role='TEACHER', cohort__id=item.id).first()
+            teacher = item.teachers[0] if item.teachers else None
 
             if teacher:
                 organizer = vCalAddress(f'MAILTO:{teacher.user.email}')
@@ -791,11 +843,7 @@ class ICalCohortsView(APIView):
             if has_last_day:
                 calendar.add_component(event_last_day)
 
-        calendar_text = calendar.to_ical()
-
-        response = HttpResponse(calendar_text, content_type='text/calendar')
-        response['Content-Disposition'] = 'attachment; filename="calendar.ics"'
-        return response
+        return calendar.to_ical()
 
 
 class ICalEventView(APIView):
@@ -68,6 +68,8 @@ class GetAnswerView(APIView, HeaderLimitOffsetPagination):
     """
     List all snippets, or create a new snippet.
     """
+    cursor_count = 'cached'
+
     @capable_of('read_nps_answers')
     def get(self, request, format=None, academy_id=None):
 
@@ -1,6 +1,8 @@
 import os, re, json, logging
 from itertools import chain
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 from .models import Freelancer, Issue, Bill, RepositoryIssueWebhook
 from breathecode.authenticate.models import CredentialsGithub
 from schema import Schema, And, Use, Optional, SchemaError
@@ -170,23 +172,21 @@ def change_status(issue, status):
     return None
 
 
-def generate_freelancer_bill(freelancer):
+# fields written by the bill engine, the issues are saved with one bulk_update per bill
+FREELANCER_BILL_ISSUE_FIELDS = ['bill', 'status_message', 'updated_at']
+BILL_BATCH_SIZE = int(os.getenv('BILL_BATCH_SIZE', 500))
 
-    Issue.objects.filter(bill__isnull=False,
-                         freelancer__id=freelancer.id).exclude(status='DONE').update(bill=None)
 
-    open_bill = Bill.objects.filter(freelancer__id=freelancer.id, status='DUE').first()
-    if open_bill is None:
-        open_bill = Bill(freelancer=freelancer, )
-        open_bill.save()
+def bill_freelancer_issues(freelancer, open_bill, issues):
+    """Account the done issues of a bill in one pass and save the issues and the bill in one transaction"""
 
-    done_issues = Issue.objects.filter(freelancer__id=freelancer.id,
-                                       status='DONE').filter(Q(bill__isnull=True) | Q(bill__status='DUE'))
+    utc_now = timezone.now()
     total = {'minutes': 0, 'hours': 0, 'price': 0}
 
-    for issue in done_issues:
+    for issue in issues:
         issue.bill = open_bill
         issue.status_message = ''
+        issue.updated_at = utc_now
 
         if issue.status != 'DONE':
             issue.status_message += 'Issue is still ' + issue.status
@@ -197,18 +197,68 @@ def generate_freelancer_bill(freelancer):
             total['hours'] = total['hours'] + issue.duration_in_hours
             total['minutes'] = total['minutes'] + issue.duration_in_minutes
 
-        issue.save()
-
     total['price'] = total['hours'] * freelancer.price_per_hour
 
     open_bill.total_duration_in_hours = total['hours']
     open_bill.total_duration_in_minutes = total['minutes']
     open_bill.total_price = total['price']
-    open_bill.save()
+
+    with transaction.atomic():
+        Issue.objects.bulk_update(issues, FREELANCER_BILL_ISSUE_FIELDS, batch_size=BILL_BATCH_SIZE)
+        open_bill.save()
 
     return open_bill
 
 
+def generate_freelancer_bill(freelancer):
+    return generate_freelancer_bills([freelancer])[0]
+
+
+def generate_freelancer_bills(freelancers):
+    """
+    Generate the bills of many freelancers, their open bills and their done issues are loaded with
+    one query each. A freelancer whose bill fails doesn't stop the others, a ValueError with the
+    failed ones is raised at the end.
+    """
+
+    freelancers = {x.id: x for x in freelancers}
+
+    Issue.objects.filter(bill__isnull=False,
+                         freelancer__id__in=freelancers).exclude(status='DONE').update(bill=None)
+
+    # the oldest due bill of each freelancer
+    open_bills = {}
+    for bill in Bill.objects.filter(freelancer__id__in=freelancers, status='DUE').order_by('id'):
+        open_bills.setdefault(bill.freelancer_id, bill)
+
+    issues = Issue.objects.filter(freelancer__id__in=freelancers, status='DONE')
+    issues = issues.filter(Q(bill__isnull=True) | Q(bill__status='DUE')).order_by('id')
+
+    done_issues = {}
+    for issue in issues:
+        done_issues.setdefault(issue.freelancer_id, []).append(issue)
+
+    bills = []
+    errors = []
+    for freelancer_id, freelancer in freelancers.items():
+        try:
+            open_bill = open_bills.get(freelancer_id)
+            if open_bill is None:
+                open_bill = Bill(freelancer=freelancer, )
+                open_bill.save()
+
+            bills.append(bill_freelancer_issues(freelancer, open_bill, done_issues.get(freelancer_id, [])))
+
+        except Exception as e:
+            logger.exception(f'The bill of the freelancer {freelancer_id} could not be generated')
+            errors.append(f'{freelancer} ({str(e)})')
+
+    if errors:
+        raise ValueError('The bills of these freelancers could not be generated: ' + ', '.join(errors))
+
+    return bills
+
+
 def run_hook(modeladmin, request, queryset):
     # TODO: ActiveCampaign and acp_ids is not defined
     for hook in queryset.all():
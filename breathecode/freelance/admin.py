@@ -21,12 +21,10 @@ sync_issues.short_description = 'Sync open issues'
 
 
 def generate_bill(modeladmin, request, queryset):
-    freelancers = queryset.all()
-    for freelancer in freelancers:
-        try:
-            actions.generate_freelancer_bill(freelancer)
-        except ValueError as err:
-            messages.error(request, err)
+    try:
+        actions.generate_freelancer_bills(queryset.all())
+    except ValueError as err:
+        messages.error(request, err)
 
 
 generate_bill.short_description = 'Generate bill'
@@ -45,8 +43,7 @@ def mark_as(queryset, status, request):
             i.status = status
             i.save()
 
-        for freelancer_id in freelancers:
-            actions.generate_freelancer_bill(freelancers[freelancer_id])
+        actions.generate_freelancer_bills(freelancers.values())
     except Exception as e:
         messages.error(request, e)
 
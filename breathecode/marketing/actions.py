@@ -1,22 +1,57 @@
 import os, re, requests, logging
 from typing import Optional
 from itertools import chain
+from urllib import parse
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, DateTimeField, F, IntegerField, Min, Q, Sum, Value, When
 from django.utils import timezone
-from .models import FormEntry, Tag, Automation, ActiveCampaignAcademy, AcademyAlias
+from .models import (LEAD_ROLLUP_FIELDS, FormEntry, LeadRollup, Tag, Automation, ActiveCampaignAcademy,
+                     AcademyAlias, ShortLink)
 from rest_framework.exceptions import APIException, ValidationError, PermissionDenied
 from activecampaign.client import Client
 from rest_framework.decorators import api_view, permission_classes
 from .serializers import FormEntrySerializer
 from breathecode.notify.actions import send_email_message
 from breathecode.authenticate.models import CredentialsFacebook
-from breathecode.services.activecampaign import AC_Old_Client, ActiveCampaign
+from breathecode.services.activecampaign import AC_Old_Client, AC_Client, ActiveCampaign, get_session
 from breathecode.utils.validation_exception import ValidationException
 from breathecode.marketing.models import Tag
+from breathecode.monitoring.actions import test_link
+from .caches import LinkClicksCache
 
 logger = logging.getLogger(__name__)
 
 SAVE_LEADS = os.getenv('SAVE_LEADS')
 GOOGLE_CLOUD_KEY = os.getenv('GOOGLE_CLOUD_KEY')
+LEADS_MAX_WORKERS = int(os.getenv('LEADS_MAX_WORKERS', 8))
+
+# seconds that the clicks wait in the cache before being saved
+LINK_CLICKS_FLUSH_INTERVAL = int(os.getenv('LINK_CLICKS_FLUSH_INTERVAL', 60))
+
+# seconds between two tests of the destination of the same link
+LINK_CHECK_INTERVAL = int(os.getenv('LINK_CHECK_INTERVAL', 60 * 60))
+LINK_CHECK_LIMIT = int(os.getenv('LINK_CHECK_LIMIT', 100))
+LINK_CHECK_MAX_WORKERS = int(os.getenv('LINK_CHECK_MAX_WORKERS', 10))
+
+# days before today rebuilt by the nightly reconciliation of the lead rollups
+LEAD_ROLLUP_RECONCILE_DAYS = int(os.getenv('LEAD_ROLLUP_RECONCILE_DAYS', 3))
+LEAD_ROLLUP_BATCH_SIZE = int(os.getenv('LEAD_ROLLUP_BATCH_SIZE', 1000))
+
+# fields of the leads report -> fields of the rollups
+LEAD_REPORT_FIELDS = {
+    'created_at__date': 'date',
+    'academy': 'academy',
+    'academy__slug': 'academy__slug',
+    'location': 'location',
+    'course': 'course',
+    'utm_source': 'utm_source',
+    'utm_medium': 'utm_medium',
+    'utm_campaign': 'utm_campaign',
+    'utm_content': 'utm_content',
+}
 
 acp_ids = {
     # "strong": "49",
@@ -49,7 +84,10 @@ def set_optional(contact, key, data, custom_key=None):
     return contact
 
 
-def get_lead_tags(ac_academy, form_entry):
+TAG_TYPES = ['STRONG', 'SOFT', 'DISCOVERY', 'OTHER']
+
+
+def get_lead_tags(ac_academy, form_entry, tags_by_slug=None):
     if 'tags' not in form_entry or form_entry['tags'] == '':
         raise Exception('You need to specify tags for this entry')
     else:
@@ -57,12 +95,19 @@ def get_lead_tags(ac_academy, form_entry):
         if len(_tags) == 0 or _tags[0] == '':
             raise Exception('The contact tags are empty', 400)
 
-    strong_tags = Tag.objects.filter(slug__in=_tags, tag_type='STRONG', ac_academy=ac_academy)
-    soft_tags = Tag.objects.filter(slug__in=_tags, tag_type='SOFT', ac_academy=ac_academy)
-    dicovery_tags = Tag.objects.filter(slug__in=_tags, tag_type='DISCOVERY', ac_academy=ac_academy)
-    other_tags = Tag.objects.filter(slug__in=_tags, tag_type='OTHER', ac_academy=ac_academy)
+    # the tags of the academy could be preloaded by register_leads_in_bulk
+    if tags_by_slug is not None:
+        found = [tags_by_slug[x] for x in _tags if x in tags_by_slug]
+        tags = [x for tag_type in TAG_TYPES for x in found if x.tag_type == tag_type]
+
+    else:
+        strong_tags = Tag.objects.filter(slug__in=_tags, tag_type='STRONG', ac_academy=ac_academy)
+        soft_tags = Tag.objects.filter(slug__in=_tags, tag_type='SOFT', ac_academy=ac_academy)
+        dicovery_tags = Tag.objects.filter(slug__in=_tags, tag_type='DISCOVERY', ac_academy=ac_academy)
+        other_tags = Tag.objects.filter(slug__in=_tags, tag_type='OTHER', ac_academy=ac_academy)
+
+        tags = list(chain(strong_tags, soft_tags, dicovery_tags, other_tags))
 
-    tags = list(chain(strong_tags, soft_tags, dicovery_tags, other_tags))
     if len(tags) != len(_tags):
         message = 'Some tag applied to the contact not found or have tag_type different than [STRONG, SOFT, DISCOVER, OTHER]: '
         message += f'Check for the follow tags:  {",".join(_tags)}'
@@ -72,13 +117,22 @@ def get_lead_tags(ac_academy, form_entry):
     return tags
 
 
-def get_lead_automations(ac_academy, form_entry):
+def get_lead_automations(ac_academy, form_entry, automations_by_slug=None):
     _automations = []
     if 'automations' not in form_entry or form_entry['automations'] == '':
         return []
     else:
         _automations = form_entry['automations'].split(',')
 
+    # the automations of the academy could be preloaded by register_leads_in_bulk
+    if automations_by_slug is not None:
+        automations = [automations_by_slug[x] for x in _automations if x in automations_by_slug]
+        if len(automations) == 0:
+            _name = form_entry['automations']
+            raise Exception(f'The specified automation {_name} was not found for this AC Academy')
+
+        return automations
+
     automations = Automation.objects.filter(slug__in=_automations, ac_academy=ac_academy)
     count = automations.count()
     if count == 0:
@@ -140,15 +194,9 @@ def add_to_active_campaign(contact, academy_id: int, automation_id: int):
         # # entry.automation_objects.add(auto)
 
 
-def register_new_lead(form_entry=None):
-    if form_entry is None:
-        raise Exception('You need to specify the form entry data')
-
-    if 'location' not in form_entry or form_entry['location'] is None:
-        raise Exception('Missing location information')
-
+def get_ac_academy_by_location(location: str) -> Optional[ActiveCampaignAcademy]:
     ac_academy = None
-    alias = AcademyAlias.objects.filter(active_campaign_slug=form_entry['location']).first()
+    alias = AcademyAlias.objects.filter(active_campaign_slug=location).first()
 
     try:
         if alias is not None:
@@ -157,12 +205,29 @@ def register_new_lead(form_entry=None):
         pass
 
     if ac_academy is None:
-        ac_academy = ActiveCampaignAcademy.objects.filter(academy__slug=form_entry['location']).first()
+        ac_academy = ActiveCampaignAcademy.objects.filter(academy__slug=location).first()
+
+    return ac_academy
+
+
+def prepare_lead(form_entry, ac_academy=None, tags_by_slug=None, automations_by_slug=None):
+    """
+    Validate the lead and build the contact that will be sent to Active Campaign, it returns
+    `(ac_academy, entry, contact, automations, tags)`
+    """
+    if form_entry is None:
+        raise Exception('You need to specify the form entry data')
+
+    if 'location' not in form_entry or form_entry['location'] is None:
+        raise Exception('Missing location information')
+
+    if ac_academy is None:
+        ac_academy = get_ac_academy_by_location(form_entry['location'])
 
     if ac_academy is None:
         raise Exception(f"No academy found with slug {form_entry['location']}")
 
-    automations = get_lead_automations(ac_academy, form_entry)
+    automations = get_lead_automations(ac_academy, form_entry, automations_by_slug)
 
     if automations:
         logger.debug('found automations')
@@ -170,7 +235,7 @@ def register_new_lead(form_entry=None):
     else:
         logger.debug('automations not found')
 
-    tags = get_lead_tags(ac_academy, form_entry)
+    tags = get_lead_tags(ac_academy, form_entry, tags_by_slug)
     logger.debug('found tags')
     logger.debug(set(t.slug for t in tags))
     LEAD_TYPE = tags[0].tag_type
@@ -244,51 +309,186 @@ def register_new_lead(form_entry=None):
                 # "data": { **form_entry, **address },
             })
 
-    # ENV Variable to fake lead storage
-    if SAVE_LEADS == 'FALSE':
-        logger.debug('Ignoring leads because SAVE_LEADS is FALSE on the env variables')
-        return form_entry
+    return ac_academy, entry, contact, automations, tags
 
-    logger.debug('ready to send contact with following details: ', contact)
-    old_client = AC_Old_Client(ac_academy.ac_url, ac_academy.ac_key)
-    response = old_client.contacts.create_contact(contact)
-    contact_id = response['subscriber_id']
 
-    # save contact_id from active campaign
-    entry.ac_contact_id = contact_id
-    entry.save()
+def send_lead(contact, automations, tags, old_client, client) -> dict:
+    """
+    Network side of the lead registration, it doesn't touch the database, then it can run in a
+    thread, the failures are returned in `error` to keep what was saved in Active Campaign
+    """
+    result = {'contact_id': None, 'automations': [], 'tags': [], 'error': None}
+
+    logger.debug('ready to send contact with following details: ', contact)
+    try:
+        response = old_client.contacts.create_contact(contact)
+    except Exception as e:
+        result['error'] = e
+        return result
 
     if 'subscriber_id' not in response:
         logger.error('error adding contact', response)
-        raise APIException('Could not save contact in CRM')
+        result['error'] = APIException('Could not save contact in CRM')
+        return result
 
-    client = Client(ac_academy.ac_url, ac_academy.ac_key)
-    if automations:
-        for automation_id in automations:
+    contact_id = response['subscriber_id']
+    result['contact_id'] = contact_id
+
+    try:
+        for automation_id in automations or []:
             data = {'contactAutomation': {'contact': contact_id, 'automation': automation_id}}
             response = client.contacts.add_a_contact_to_an_automation(data)
             if 'contacts' not in response:
                 logger.error(f'error triggering automation with id {str(automation_id)}', response)
-                raise APIException('Could not add contact to Automation')
-            else:
-                logger.debug(f'Triggered automation with id {str(automation_id)}', response)
-                auto = Automation.objects.filter(acp_id=automation_id, ac_academy=ac_academy).first()
-                entry.automation_objects.add(auto)
+                result['error'] = APIException('Could not add contact to Automation')
+                return result
+
+            logger.debug(f'Triggered automation with id {str(automation_id)}', response)
+            result['automations'].append(automation_id)
+
+        for t in tags:
+            data = {'contactTag': {'contact': contact_id, 'tag': t.acp_id}}
+            response = client.contacts.add_a_tag_to_contact(data)
+            if 'contacts' in response:
+                result['tags'].append(t.id)
+
+    except Exception as e:
+        result['error'] = e
+
+    return result
+
 
-    for t in tags:
-        data = {'contactTag': {'contact': contact_id, 'tag': t.acp_id}}
-        response = client.contacts.add_a_tag_to_contact(data)
-        if 'contacts' in response:
-            entry.tag_objects.add(t.id)
+def save_lead(ac_academy, entry, result: dict) -> None:
+    """Write back in the FormEntry what was saved in Active Campaign"""
+
+    if result['contact_id'] is None:
+        return
+
+    # save contact_id from active campaign
+    entry.ac_contact_id = result['contact_id']
+
+    if result['automations']:
+        automations = Automation.objects.filter(acp_id__in=result['automations'], ac_academy=ac_academy)
+        entry.automation_objects.add(*automations)
+
+    if result['tags']:
+        entry.tag_objects.add(*result['tags'])
+
+    if result['error'] is None:
+        entry.storage_status = 'PERSISTED'
 
-    entry.storage_status = 'PERSISTED'
     entry.save()
 
+
+def register_new_lead(form_entry=None):
+    ac_academy, entry, contact, automations, tags = prepare_lead(form_entry)
+
+    # ENV Variable to fake lead storage
+    if SAVE_LEADS == 'FALSE':
+        logger.debug('Ignoring leads because SAVE_LEADS is FALSE on the env variables')
+        return form_entry
+
+    old_client = AC_Old_Client(ac_academy.ac_url, ac_academy.ac_key)
+    client = Client(ac_academy.ac_url, ac_academy.ac_key)
+
+    result = send_lead(contact, automations, tags, old_client, client)
+    save_lead(ac_academy, entry, result)
+
+    if result['error'] is not None:
+        raise result['error']
+
     form_entry['storage_status'] = 'PERSISTED'
 
     return entry
 
 
+def register_leads_in_bulk(entries, max_workers: int = LEADS_MAX_WORKERS) -> dict:
+    """
+    Persist many leads at once, the entries are grouped by ActiveCampaignAcademy, each group reuses
+    one keep-alive session and its Active Campaign calls run in a bounded thread pool, the database
+    is only touched from the caller thread.
+    """
+    stats = {'persisted': 0, 'failed': 0}
+    groups = {}
+    academies = {}
+
+    for entry in entries:
+        location = entry.location
+        if location not in academies:
+            academies[location] = get_ac_academy_by_location(location) if location else None
+
+        ac_academy = academies[location]
+        if ac_academy is None:
+            logger.error(f'No academy found with slug {location} (FormEntry {entry.id})')
+            stats['failed'] += 1
+            continue
+
+        if ac_academy.id not in groups:
+            groups[ac_academy.id] = (ac_academy, [])
+
+        groups[ac_academy.id][1].append(entry)
+
+    for ac_academy, group in groups.values():
+        tags_by_slug = {
+            x.slug: x
+            for x in Tag.objects.filter(ac_academy=ac_academy).select_related('automation')
+        }
+        automations_by_slug = {x.slug: x.acp_id for x in Automation.objects.filter(ac_academy=ac_academy)}
+
+        jobs = []
+        for entry in group:
+            form_entry = entry.toFormData()
+            try:
+                _, entry, contact, automations, tags = prepare_lead(form_entry,
+                                                                    ac_academy=ac_academy,
+                                                                    tags_by_slug=tags_by_slug,
+                                                                    automations_by_slug=automations_by_slug)
+            except Exception as e:
+                logger.error(f'FormEntry {entry.id} could not be prepared: {str(e)}')
+                stats['failed'] += 1
+                continue
+
+            jobs.append((entry, form_entry, contact, automations, tags))
+
+        if SAVE_LEADS == 'FALSE':
+            logger.debug('Ignoring leads because SAVE_LEADS is FALSE on the env variables')
+            continue
+
+        session = get_session(pool_size=max_workers)
+        old_client = AC_Old_Client(ac_academy.ac_url, ac_academy.ac_key, session=session)
+        client = AC_Client(ac_academy.ac_url, ac_academy.ac_key, session=session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(lambda job: send_lead(job[2], job[3], job[4], old_client, client),
+                                       jobs)
+
+                for (entry, form_entry, *_), result in zip(jobs, results):
+                    try:
+                        save_lead(ac_academy, entry, result)
+                    except Exception as e:
+                        logger.error(f'FormEntry {entry.id} could not be saved: {str(e)}')
+                        stats['failed'] += 1
+                        continue
+
+                    if result['error'] is not None:
+                        logger.error(f'FormEntry {entry.id} could not be persisted: {str(result["error"])}')
+                        stats['failed'] += 1
+                        continue
+
+                    stats['persisted'] += 1
+
+                    try:
+                        save_get_geolocal(entry, form_entry)
+                    except Exception as e:
+                        logger.error(f'FormEntry {entry.id} could not be geolocated: {str(e)}')
+
+        finally:
+            session.close()
+
+    return stats
+
+
 def test_ac_connection(ac_academy):
     client = Client(ac_academy.ac_url, ac_academy.ac_key)
     response = client.tags.list_all_tags(limit=1)
@@ -508,3 +708,216 @@ def delete_tag(tag, include_other_academies=False):
     except:
         logger.exception(f'There was an error deleting tag for {tag.slug}')
         return False
+
+
+def get_short_link_destination(short_link):
+    params = {}
+    if short_link.utm_source is not None:
+        params['utm_source'] = short_link.utm_source
+    if short_link.utm_content is not None:
+        params['utm_content'] = short_link.utm_content
+    if short_link.utm_medium is not None:
+        params['utm_medium'] = short_link.utm_medium
+    if short_link.utm_campaign is not None:
+        params['utm_campaign'] = short_link.utm_campaign
+
+    destination_params = {}
+    url_parts = short_link.destination.split('?')
+    if len(url_parts) > 1:
+        destination_params = dict(parse.parse_qsl(url_parts[1]))
+
+    params = {**destination_params, **params}
+    return url_parts[0] + '?' + parse.urlencode(params)
+
+
+def register_link_click(link_id) -> bool:
+    """Count a click in the cache, it returns True if a flush must be scheduled"""
+
+    LinkClicksCache().add(link_id)
+
+    # one flush per interval instead of one task per click
+    return cache.add('ShortLink__flush_scheduled', True, timeout=LINK_CLICKS_FLUSH_INTERVAL)
+
+
+def flush_link_clicks() -> int:
+    """
+    Save the clicks counted in the cache using one bulk update, just the links that got clicks are
+    read, it returns the number of clicks
+    """
+
+    clicks = LinkClicksCache().take()
+    if not clicks:
+        return 0
+
+    hits = Case(*[When(id=k, then=Value(v)) for k, (v, _) in clicks.items()], output_field=IntegerField())
+    lastclick_at = Case(*[When(id=k, then=Value(v)) for k, (_, v) in clicks.items()],
+                        output_field=DateTimeField())
+
+    ShortLink.objects.filter(id__in=clicks.keys()).update(hits=F('hits') + hits, lastclick_at=lastclick_at)
+
+    return sum([count for count, _ in clicks.values()])
+
+
+def check_link_destinations(limit=LINK_CHECK_LIMIT, max_workers=LINK_CHECK_MAX_WORKERS) -> int:
+    """
+    Test the destination of the links that were clicked since their last test, each link is tested once
+    per LINK_CHECK_INTERVAL at most, it returns the number of links tested.
+    """
+
+    now = timezone.now()
+    links = list(
+        ShortLink.objects.filter(active=True, lastclick_at__isnull=False).filter(
+            Q(destination_checked_at__isnull=True)
+            | Q(destination_checked_at__lte=now - timedelta(seconds=LINK_CHECK_INTERVAL),
+                lastclick_at__gt=F('destination_checked_at'))).order_by(
+                    F('destination_checked_at').asc(nulls_first=True))[:limit])
+
+    if not links:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(links)))) as executor:
+        results = list(executor.map(lambda link: test_link(url=link.destination), links))
+
+    for link, result in zip(links, results):
+        if result['status_code'] < 200 or result['status_code'] > 299:
+            link.destination_status = 'ERROR'
+        else:
+            link.destination_status = 'ACTIVE'
+
+        link.destination_status_text = result['status_text']
+        link.destination_checked_at = now
+
+    ShortLink.objects.bulk_update(links,
+                                  ['destination_status', 'destination_status_text', 'destination_checked_at'])
+
+    return len(links)
+
+
+def add_lead_to_rollup(key: tuple, amount: int) -> None:
+    """Add `amount` leads to the rollup of `key`, a tuple with the day and the dimensions of the leads"""
+
+    date, *dimensions = key
+    fields = {'date': date, **dict(zip(LEAD_ROLLUP_FIELDS, dimensions))}
+
+    # it could have duplicates created by concurrent leads, they are summed by the report
+    pk = LeadRollup.objects.filter(**fields).order_by('id').values_list('id', flat=True).first()
+    if pk is not None:
+        total_leads = F('total_leads') + amount
+        LeadRollup.objects.filter(id=pk).update(total_leads=total_leads, updated_at=timezone.now())
+
+    elif amount > 0:
+        LeadRollup.objects.create(**fields, total_leads=amount)
+
+
+def move_lead_in_rollups(old_key: Optional[tuple], new_key: Optional[tuple]) -> None:
+    """Move a lead from the rollup of its old dimensions to the new one, any of them can be None"""
+
+    if old_key is not None:
+        add_lead_to_rollup(old_key, -1)
+
+    if new_key is not None:
+        add_lead_to_rollup(new_key, 1)
+
+
+def reconcile_lead_rollups(days=LEAD_ROLLUP_RECONCILE_DAYS) -> int:
+    """
+    Rebuild the rollups of the last `days` days and today from FormEntry, it fixes the leads that
+    were changed without save(), like with update() or bulk_create(), it returns the number of rollups.
+    """
+
+    start = timezone.localdate() - timedelta(days=days)
+
+    rows = FormEntry.objects.filter(created_at__date__gte=start)
+    rows = rows.values('created_at__date', *LEAD_ROLLUP_FIELDS).annotate(total_leads=Count('id')).order_by()
+
+    rollups = [
+        LeadRollup(date=row['created_at__date'],
+                   total_leads=row['total_leads'],
+                   **{x: row[x]
+                      for x in LEAD_ROLLUP_FIELDS}) for row in rows
+    ]
+
+    with transaction.atomic():
+        LeadRollup.objects.filter(date__gte=start).delete()
+        LeadRollup.objects.bulk_create(rollups, batch_size=LEAD_ROLLUP_BATCH_SIZE)
+
+    return len(rollups)
+
+
+def get_leads_report(group_by: list[str],
+                     academy_ids: Optional[list[int]] = None,
+                     locations: Optional[list[str]] = None,
+                     start: Optional[date] = None,
+                     end: Optional[date] = None) -> list[dict]:
+    """
+    Count the leads grouped by `group_by`, the closed days are read from the rollups and just the
+    leads of today and of the days before the first rollup are counted from FormEntry, the group-bys
+    that the rollups do not cover are counted from FormEntry as well.
+    """
+
+    entries = FormEntry.objects.all()
+    if academy_ids is not None:
+        entries = entries.filter(academy__id__in=academy_ids)
+
+    if locations is not None:
+        entries = entries.filter(location__in=locations)
+
+    if [x for x in group_by if x not in LEAD_REPORT_FIELDS]:
+        if start is not None:
+            entries = entries.filter(created_at__gte=start)
+
+        if end is not None:
+            entries = entries.filter(created_at__lte=end)
+
+        rows = entries.values(*group_by).annotate(total_leads=Count('id')).order_by()
+        return [
+            format_leads_report_row(group_by, [row[x] for x in group_by], row['total_leads']) for row in rows
+        ]
+
+    today = timezone.localdate()
+    fields = [LEAD_REPORT_FIELDS[x] for x in group_by]
+
+    # the days before the first rollup were never rolled up
+    covered_since = LeadRollup.objects.aggregate(date=Min('date'))['date'] or today
+    covered_since = min(covered_since, today)
+
+    rollups = LeadRollup.objects.filter(date__gte=covered_since, date__lt=today)
+    if academy_ids is not None:
+        rollups = rollups.filter(academy__id__in=academy_ids)
+
+    if locations is not None:
+        rollups = rollups.filter(location__in=locations)
+
+    if start is not None:
+        rollups = rollups.filter(date__gte=start)
+
+    if end is not None:
+        rollups = rollups.filter(date__lt=end)
+
+    totals = {}
+    for row in rollups.values(*fields).annotate(total_leads=Sum('total_leads')).order_by(*fields):
+        key = tuple([row[x] for x in fields])
+        totals[key] = totals.get(key, 0) + row['total_leads']
+
+    # the rollups of today are still changing
+    entries = entries.filter(Q(created_at__date__lt=covered_since) | Q(created_at__date=today))
+    if start is not None:
+        entries = entries.filter(created_at__date__gte=start)
+
+    if end is not None:
+        entries = entries.filter(created_at__date__lt=end)
+
+    rows = entries.values(*group_by).annotate(total_leads=Count('id'))
+    for row in rows.order_by():
+        key = tuple([row[x] for x in group_by])
+        totals[key] = totals.get(key, 0) + row['total_leads']
+
+    return [format_leads_report_row(group_by, key, total) for key, total in totals.items() if total > 0]
+
+
+def format_leads_report_row(group_by: list[str], values: list, total: int) -> dict:
+    row = {**dict(zip(group_by, values)), 'total_leads': total}
+    if row.get('created_at__date') is not None:
+        row['created_date'] = row['created_at__date'].strftime('%Y%m%d')
+
+    return row
@@ -2,7 +2,7 @@ import logging, secrets
 from django.contrib import admin, messages
 from django import forms
 from .models import (FormEntry, Tag, Automation, ShortLink, ActiveCampaignAcademy, ActiveCampaignWebhook,
-                     AcademyAlias, Downloadable, LeadGenerationApp, UTMField)
+                     AcademyAlias, Downloadable, LeadGenerationApp, UTMField, LeadRollup)
 from .actions import (register_new_lead, save_get_geolocal, get_facebook_lead_info, test_ac_connection,
                       sync_tags, sync_automations, acp_ids, delete_tag)
 from breathecode.services.activecampaign import ActiveCampaign
@@ -400,3 +400,10 @@ class UTMFieldAdmin(admin.ModelAdmin):
     list_display = ('slug', 'name', 'utm_type')
     list_filter = ['utm_type', 'academy__slug']
     actions = change_field(['SOURCE', 'MEDIUM', 'CAMPAIGN', 'CONTENT'], name='utm_type')
+
+
+@admin.register(LeadRollup)
+class LeadRollupAdmin(admin.ModelAdmin):
+    list_display = ('date', 'academy', 'location', 'course', 'utm_source', 'utm_medium', 'total_leads')
+    list_filter = ['academy__slug', 'location']
+    date_hierarchy = 'date'
@@ -0,0 +1,157 @@
+import os, uuid
+from datetime import datetime
+from typing import Optional
+from django.core.cache import cache
+from django.utils import timezone
+
+__all__ = ['ShortLinkCache', 'LinkClicksCache']
+
+SHORT_LINK_TTL = int(os.getenv('SHORT_LINK_CACHE_TTL', 60 * 60 * 24))
+
+# the slugs that don't exist are cached for less time, it protects the database from the scanners
+NOT_FOUND_TTL = 60
+
+
+class ShortLinkCache:
+    """
+    Precomputed redirect of each short link, keyed by slug.
+
+    The entry keeps the id of the link and its destination with the utm params already merged, so a
+    click is one cache lookup without hit the database, it's removed when the link is saved or deleted.
+    """
+    def __generate_key__(self, slug: str) -> str:
+        return f'ShortLink__slug={slug}'
+
+    def __load__(self, slug: str) -> dict:
+        from .actions import get_short_link_destination
+        from .models import ShortLink
+
+        short_link = ShortLink.objects.filter(slug=slug, active=True).first()
+        if short_link is None:
+            return {'id': None, 'url': None}
+
+        return {'id': short_link.id, 'url': get_short_link_destination(short_link)}
+
+    def get(self, slug: str) -> Optional[dict]:
+        """Get the id and the destination of an active link, it returns None if it was not found."""
+
+        key = self.__generate_key__(slug)
+        link = cache.get(key)
+
+        if link is None:
+            link = self.__load__(slug)
+            cache.set(key, link, timeout=SHORT_LINK_TTL if link['id'] else NOT_FOUND_TTL)
+
+        return link if link['id'] else None
+
+    def clear(self, *slugs: str) -> None:
+        cache.delete_many([self.__generate_key__(slug) for slug in slugs if slug])
+
+
+class LinkClicksCache:
+    """
+    Clicks of the short links waiting to be saved in the database.
+
+    Each link has a counter and the date of its last click, and the ids of the clicked links are kept
+    in a set, so a flush just reads the links that got clicks. With Redis the set is taken with RENAME
+    and the counters are read and removed in one transaction, so two flushes can't save the same
+    clicks, the other backends (like the one of the tests) are not atomic.
+    """
+
+    dirty_key: str = 'ShortLink__clicked'
+
+    def __clicks_key__(self, link_id: int) -> str:
+        return f'ShortLink__clicks__id={link_id}'
+
+    def __lastclick_key__(self, link_id: int) -> str:
+        return f'ShortLink__lastclick__id={link_id}'
+
+    def __redis__(self):
+        try:
+            from django_redis import get_redis_connection
+            return get_redis_connection('default')
+
+        except (ImportError, NotImplementedError):
+            return None
+
+    def add(self, link_id: int) -> None:
+        """Count a click of the link."""
+
+        now = timezone.now()
+        redis = self.__redis__()
+
+        if redis is not None:
+            pipe = redis.pipeline()
+            pipe.incr(self.__clicks_key__(link_id))
+            pipe.set(self.__lastclick_key__(link_id), now.isoformat())
+            pipe.sadd(self.dirty_key, link_id)
+            pipe.execute()
+            return
+
+        key = self.__clicks_key__(link_id)
+        if not cache.add(key, 1, timeout=None):
+            try:
+                cache.incr(key)
+
+            # it was evicted between both calls
+            except ValueError:
+                cache.add(key, 1, timeout=None)
+
+        cache.set(self.__lastclick_key__(link_id), now, timeout=None)
+
+        ids = cache.get(self.dirty_key) or []
+        if link_id not in ids:
+            cache.set(self.dirty_key, [*ids, link_id], timeout=None)
+
+    def take(self) -> dict[int, tuple[int, datetime]]:
+        """Take the clicks counted since the last call, it returns `{link_id: (clicks, lastclick_at)}`."""
+
+        redis = self.__redis__()
+
+        if redis is not None:
+            import redis as redis_lib
+
+            # the clicks registered from now are added to a new set
+            taken_key = f'{self.dirty_key}__taken={uuid.uuid4().hex}'
+            try:
+                redis.rename(self.dirty_key, taken_key)
+
+            except redis_lib.ResponseError:
+                return {}
+
+            ids = [int(x) for x in redis.smembers(taken_key)]
+            redis.delete(taken_key)
+
+            pipe = redis.pipeline()
+            for link_id in ids:
+                pipe.get(self.__clicks_key__(link_id))
+                pipe.get(self.__lastclick_key__(link_id))
+                pipe.delete(self.__clicks_key__(link_id), self.__lastclick_key__(link_id))
+
+            values = pipe.execute()
+
+            result = {}
+            for index, link_id in enumerate(ids):
+                count, lastclick, _ = values[index * 3:index * 3 + 3]
+                if not count or not int(count):
+                    continue
+
+                lastclick = datetime.fromisoformat(lastclick.decode('utf-8')) if lastclick else None
+                result[link_id] = (int(count), lastclick or timezone.now())
+
+            return result
+
+        ids = cache.get(self.dirty_key) or []
+        cache.delete(self.dirty_key)
+
+        counts = cache.get_many([self.__clicks_key__(x) for x in ids])
+        dates = cache.get_many([self.__lastclick_key__(x) for x in ids])
+        cache.delete_many([self.__clicks_key__(x) for x in ids] + [self.__lastclick_key__(x) for x in ids])
+
+        result = {}
+        for link_id in ids:
+            count = counts.get(self.__clicks_key__(link_id))
+            if count:
+                result[link_id] = (count, dates.get(self.__lastclick_key__(link_id)) or timezone.now())
+
+        return result
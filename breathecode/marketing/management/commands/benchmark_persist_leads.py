@@ -0,0 +1,99 @@
+import json, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from django.core.management.base import BaseCommand
+from activecampaign.client import Client
+from breathecode.services.activecampaign import AC_Old_Client, AC_Client, get_session
+from ...actions import send_lead
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Fake Active Campaign, it answers every request after `latency` seconds"""
+    protocol_version = 'HTTP/1.1'
+    latency = 0.05
+
+    def __respond__(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        time.sleep(self.latency)
+
+        body = json.dumps({'subscriber_id': 1, 'result_code': 1, 'contacts': [{'id': 1}]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = __respond__
+    do_POST = __respond__
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeTag:
+    def __init__(self, id):
+        self.id = id
+        self.acp_id = id
+
+
+class Command(BaseCommand):
+    help = 'Compare the serial lead registration against the pooled one using a local stub of Active Campaign'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--leads', type=int, default=100)
+        parser.add_argument('--tags', type=int, default=2)
+        parser.add_argument('--latency',
+                            type=float,
+                            default=0.05,
+                            help='Seconds that the stub waits per request')
+        parser.add_argument('--workers', type=int, default=8)
+
+    def handle(self, *args, **options):
+        StubHandler.latency = options['latency']
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        url = f'http://127.0.0.1:{server.server_address[1]}'
+        jobs = [({
+            'email': f'lead{i}@example.com',
+            'first_name': 'Lead',
+            'last_name': str(i),
+            'phone': '123456789',
+        }, [1], [FakeTag(x) for x in range(options['tags'])]) for i in range(options['leads'])]
+
+        try:
+            start = time.perf_counter()
+            for contact, automations, tags in jobs:
+                old_client = AC_Old_Client(url, 'key')
+                client = Client(url, 'key')
+                send_lead(contact, automations, tags, old_client, client)
+
+            serial = time.perf_counter() - start
+
+            start = time.perf_counter()
+            session = get_session(pool_size=options['workers'])
+            old_client = AC_Old_Client(url, 'key', session=session)
+            client = AC_Client(url, 'key', session=session)
+
+            with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+                results = list(executor.map(lambda job: send_lead(*job, old_client, client), jobs))
+
+            pooled = time.perf_counter() - start
+            session.close()
+
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        errors = len([x for x in results if x['error'] is not None])
+        requests = options['leads'] * (2 + options['tags'])
+
+        self.stdout.write(f'{options["leads"]} leads, {requests} requests, {options["latency"]}s of latency')
+        self.stdout.write(f'serial: {serial:.2f}s ({options["leads"] / serial:.1f} leads/s)')
+        self.stdout.write(f'pooled: {pooled:.2f}s ({options["leads"] / pooled:.1f} leads/s), '
+                          f'{options["workers"]} workers, {errors} errors')
+        self.stdout.write(self.style.SUCCESS(f'speedup: {serial / pooled:.1f}x'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from ...actions import reconcile_lead_rollups, LEAD_ROLLUP_RECONCILE_DAYS
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily lead rollups of the last days from the form entries, it is meant to run nightly'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days',
+                            type=int,
+                            default=LEAD_ROLLUP_RECONCILE_DAYS,
+                            help='Days before today to rebuild, use a big number to backfill the rollups')
+
+    def handle(self, *args, **options):
+        rollups = reconcile_lead_rollups(days=options['days'])
+        self.stdout.write(self.style.SUCCESS(f'{rollups} lead rollups were rebuilt'))
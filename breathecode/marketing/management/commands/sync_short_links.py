@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from ...actions import flush_link_clicks, check_link_destinations, LINK_CHECK_LIMIT
+
+
+class Command(BaseCommand):
+    help = 'Save the clicks counted in the cache and test the destinations of the clicked links'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit',
+                            type=int,
+                            default=LINK_CHECK_LIMIT,
+                            help='Max number of destinations tested in this run')
+
+    def handle(self, *args, **options):
+        clicks = flush_link_clicks()
+        self.stdout.write(self.style.SUCCESS(f'{clicks} clicks were saved'))
+
+        links = check_link_destinations(limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f'{links} destinations were tested'))
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-18 19:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0055_alter_utmfield_utm_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shortlink',
+            name='destination_checked_at',
+            field=models.DateTimeField(blank=True,
+                                       default=None,
+                                       help_text='Last time the destination was tested',
+                                       null=True),
+        ),
+    ]
@@ -0,0 +1,13 @@
+from django.db import migrations
+from breathecode.utils.search import create_search_indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0056_shortlink_destination_checked_at'),
+    ]
+
+    operations = [
+        create_search_indexes('marketing_shortlink', ['slug']),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 3.2.25 on 2026-10-18 21:38
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count
+
+ROLLUP_FIELDS = [
+    'academy_id', 'location', 'course', 'utm_source', 'utm_medium', 'utm_campaign', 'utm_content'
+]
+BATCH_SIZE = 1000
+
+
+def fill_lead_rollups(apps, schema_editor):
+    """Roll up all the leads saved before the table existed, like reconcile_lead_rollups does"""
+
+    FormEntry = apps.get_model('marketing', 'FormEntry')
+    LeadRollup = apps.get_model('marketing', 'LeadRollup')
+
+    rows = FormEntry.objects.values('created_at__date', *ROLLUP_FIELDS).annotate(total_leads=Count('id'))
+
+    rollups = []
+    for row in rows.order_by().iterator():
+        rollups.append(
+            LeadRollup(date=row['created_at__date'],
+                       total_leads=row['total_leads'],
+                       **{x: row[x]
+                          for x in ROLLUP_FIELDS}))
+
+        if len(rollups) == BATCH_SIZE:
+            LeadRollup.objects.bulk_create(rollups)
+            rollups = []
+
+    if rollups:
+        LeadRollup.objects.bulk_create(rollups)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admissions', '0040_cohort_search_indexes'),
+        ('marketing', '0057_shortlink_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadRollup',
+            fields=[
+                ('id',
+                 models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('location', models.CharField(blank=True, default=None, max_length=70, null=True)),
+                ('course', models.CharField(default=None, max_length=70, null=True)),
+                ('utm_source', models.CharField(blank=True, default=None, max_length=70, null=True)),
+                ('utm_medium', models.CharField(blank=True, default=None, max_length=70, null=True)),
+                ('utm_campaign', models.CharField(blank=True, default=None, max_length=70, null=True)),
+                ('utm_content', models.CharField(blank=True, default=None, max_length=70, null=True)),
+                ('total_leads', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('academy',
+                 models.ForeignKey(default=None,
+                                   null=True,
+                                   on_delete=django.db.models.deletion.CASCADE,
+                                   to='admissions.academy')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='leadrollup',
+            index=models.Index(fields=['date', 'academy'], name='marketing_l_date_8bb471_idx'),
+        ),
+        migrations.RunPython(fill_lead_rollups, migrations.RunPython.noop),
+    ]
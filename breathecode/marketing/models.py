@@ -1,5 +1,6 @@
 import secrets
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import User
 from breathecode.admissions.models import Academy, Cohort
 from django.core.validators import RegexValidator
@@ -276,9 +277,18 @@ DEAL_SENTIMENT = (
     (BAD, 'Bad'),
 )
 
+# dimensions of the daily lead rollups
+LEAD_ROLLUP_FIELDS = [
+    'academy_id', 'location', 'course', 'utm_source', 'utm_medium', 'utm_campaign', 'utm_content'
+]
+
 
 # Create your models here.
 class FormEntry(models.Model):
+    def __init__(self, *args, **kwargs):
+        super(FormEntry, self).__init__(*args, **kwargs)
+        self.__old_rollup_key = self.get_rollup_key()
+
     contact = models.ForeignKey(Contact, on_delete=models.CASCADE, null=True, default=None, blank=True)
 
     fb_leadgen_id = models.BigIntegerField(null=True, default=None, blank=True)
@@ -389,6 +399,28 @@ class FormEntry(models.Model):
     def __str__(self):
         return self.first_name + ' ' + self.last_name
 
+    def get_rollup_key(self):
+        """Day and dimensions of the rollup that counts this lead, None if it was not saved or they were deferred"""
+
+        if self.pk is None or self.created_at is None:
+            return None
+
+        if self.get_deferred_fields().intersection([*LEAD_ROLLUP_FIELDS, 'created_at']):
+            return None
+
+        return (timezone.localdate(self.created_at), *[getattr(self, x) for x in LEAD_ROLLUP_FIELDS])
+
+    def save(self, *args, **kwargs):
+        from .actions import move_lead_in_rollups
+
+        super().save(*args, **kwargs)
+
+        # the rollups are kept up to date when a lead is created or its dimensions change
+        rollup_key = self.get_rollup_key()
+        if rollup_key != self.__old_rollup_key:
+            move_lead_in_rollups(self.__old_rollup_key, rollup_key)
+            self.__old_rollup_key = rollup_key
+
     def toFormData(self):
         _entry = {
             'id': self.id,
@@ -423,6 +455,10 @@ DESTINATION_STATUS = (
 
 
 class ShortLink(models.Model):
+    def __init__(self, *args, **kwargs):
+        super(ShortLink, self).__init__(*args, **kwargs)
+        self.__old_slug = self.slug
+
     slug = models.SlugField(max_length=150, unique=True)
     destination = models.URLField()
     hits = models.IntegerField(default=0)
@@ -431,6 +467,10 @@ class ShortLink(models.Model):
 
     destination_status = models.CharField(max_length=15, choices=DESTINATION_STATUS, default=_ACTIVE)
     destination_status_text = models.CharField(max_length=250, default=None, blank=True, null=True)
+    destination_checked_at = models.DateTimeField(blank=True,
+                                                  null=True,
+                                                  default=None,
+                                                  help_text='Last time the destination was tested')
 
     utm_content = models.CharField(max_length=250, null=True, default=None, blank=True)
     utm_medium = models.CharField(max_length=50, blank=True, null=True, default=None)
@@ -452,6 +492,15 @@ class ShortLink(models.Model):
     def __str__(self):
         return f'{str(self.hits)} {self.slug}'
 
+    def save(self, *args, **kwargs):
+        from .caches import ShortLinkCache
+
+        super().save(*args, **kwargs)
+
+        # the redirects are cached by slug, the old one must be removed if it was renamed
+        ShortLinkCache().clear(self.__old_slug, self.slug)
+        self.__old_slug = self.slug
+
 
 PENDING = 'PENDING'
 DONE = 'DONE'
@@ -520,6 +569,30 @@ class Downloadable(models.Model):
             downloadable_saved.send(instance=self, sender=self.__class__, created=created)
 
 
+class LeadRollup(models.Model):
+    """Leads of a day grouped by their dimensions, `get_leads_report` reads them instead of FormEntry"""
+
+    date = models.DateField()
+    academy = models.ForeignKey(Academy, on_delete=models.CASCADE, null=True, default=None)
+    location = models.CharField(max_length=70, blank=True, null=True, default=None)
+    course = models.CharField(max_length=70, null=True, default=None)
+    utm_source = models.CharField(max_length=70, blank=True, null=True, default=None)
+    utm_medium = models.CharField(max_length=70, blank=True, null=True, default=None)
+    utm_campaign = models.CharField(max_length=70, blank=True, null=True, default=None)
+    utm_content = models.CharField(max_length=70, blank=True, null=True, default=None)
+
+    total_leads = models.IntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+
+    class Meta:
+        indexes = [models.Index(fields=['date', 'academy'])]
+
+    def __str__(self):
+        return f'{self.date} {self.location} {self.course}: {self.total_leads}'
+
+
 SOURCE = 'SOURCE'
 MEDIUM = 'MEDIUM'
 CONTENT = 'CONTENT'
@@ -1,4 +1,5 @@
 import logging
+from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from breathecode.authenticate.signals import invite_accepted
 from breathecode.events.signals import event_saved
@@ -6,7 +7,9 @@ from breathecode.authenticate.models import ProfileAcademy
 from breathecode.admissions.models import CohortUser, Cohort
 from breathecode.events.models import Event
 from breathecode.admissions.signals import student_edu_status_updated, cohort_saved
-from .models import FormEntry, ActiveCampaignAcademy
+from .models import FormEntry, ActiveCampaignAcademy, ShortLink
+from .caches import ShortLinkCache
+from .actions import move_lead_in_rollups
 import breathecode.marketing.tasks as tasks
 from .models import Downloadable
 from .signals import downloadable_saved
@@ -55,3 +58,13 @@ def downloadable_post_save(sender, instance, created, *args, **kwargs):
         ac_academy = ActiveCampaignAcademy.objects.filter(academy__id=instance.academy.id).first()
         if ac_academy is not None:
             add_downloadable_slug_as_acp_tag.delay(instance.id, instance.academy.id)
+
+
+@receiver(post_delete, sender=ShortLink)
+def post_delete_short_link(sender, instance, **kwargs):
+    ShortLinkCache().clear(instance.slug)
+
+
+@receiver(post_delete, sender=FormEntry)
+def post_delete_form_entry(sender, instance, **kwargs):
+    move_lead_in_rollups(instance.get_rollup_key(), None)
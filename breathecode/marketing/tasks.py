@@ -1,14 +1,15 @@
 from typing import Optional
 from celery import shared_task, Task
+from django.db.models import F
 from django.utils import timezone
 from django.contrib.auth.models import User
 from breathecode.admissions.models import Academy, Cohort
 from breathecode.events.models import Event
 from breathecode.services.activecampaign import ActiveCampaign
-from breathecode.monitoring.actions import test_link
 from breathecode.utils import getLogger
 from .models import FormEntry, ShortLink, ActiveCampaignWebhook, ActiveCampaignAcademy, Tag, Downloadable
-from .actions import register_new_lead, save_get_geolocal, acp_ids
+from .actions import register_new_lead, register_leads_in_bulk, save_get_geolocal, acp_ids
+from . import actions
 
 logger = getLogger(__name__)
 
@@ -24,11 +25,8 @@ class BaseTaskWithRetry(Task):
 def persist_leads():
     logger.debug('Starting persist_leads')
     entries = FormEntry.objects.filter(storage_status='PENDING')
-    for entry in entries:
-        form_data = entry.toFormData()
-        result = register_new_lead(form_data)
-        if result is not None and result != False:
-            save_get_geolocal(entry, form_data)
+    stats = register_leads_in_bulk(entries)
+    logger.debug(f'{stats["persisted"]} leads persisted and {stats["failed"]} failed')
 
     return True
 
@@ -45,26 +43,42 @@ def persist_single_lead(self, form_data):
 
 @shared_task(bind=True, base=BaseTaskWithRetry)
 def update_link_viewcount(self, slug):
+    """Kept for the messages enqueued before the clicks were counted in the cache"""
     logger.debug('Starting update_link_viewcount')
 
-    sl = ShortLink.objects.filter(slug=slug).first()
-    if sl is None:
+    if not ShortLink.objects.filter(slug=slug).update(hits=F('hits') + 1, lastclick_at=timezone.now()):
         logger.debug(f'ShortLink with slug {slug} not found')
         return False
 
-    sl.hits = sl.hits + 1
-    sl.lastclick_at = timezone.now()
-    sl.save()
 
-    result = test_link(url=sl.destination)
-    if result['status_code'] < 200 or result['status_code'] > 299:
-        sl.destination_status_text = result['status_text']
-        sl.destination_status = 'ERROR'
-        sl.save()
-    else:
-        sl.destination_status = 'ACTIVE'
-        sl.destination_status_text = result['status_text']
-        sl.save()
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def flush_link_clicks(self):
+    logger.debug('Starting flush_link_clicks')
+
+    clicks = actions.flush_link_clicks()
+    logger.debug(f'{clicks} clicks were saved')
+
+    if clicks:
+        check_link_destinations.delay()
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def check_link_destinations(self):
+    logger.debug('Starting check_link_destinations')
+
+    links = actions.check_link_destinations()
+    logger.debug(f'{links} destinations were tested')
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def reconcile_lead_rollups(self, days=None):
+    logger.debug('Starting reconcile_lead_rollups')
+
+    if days is None:
+        days = actions.LEAD_ROLLUP_RECONCILE_DAYS
+
+    rollups = actions.reconcile_lead_rollups(days=days)
+    logger.debug(f'{rollups} lead rollups were rebuilt')
 
 
 @shared_task(bind=True, base=BaseTaskWithRetry)
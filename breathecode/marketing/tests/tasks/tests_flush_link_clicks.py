@@ -0,0 +1,118 @@
+"""
+Test flush_link_clicks
+"""
+from datetime import timedelta
+from unittest.mock import patch
+from django.utils import timezone
+from breathecode.marketing import actions
+from breathecode.marketing.actions import register_link_click
+from breathecode.marketing.caches import LinkClicksCache
+from breathecode.marketing.tasks import flush_link_clicks
+from breathecode.tests.mocks import REQUESTS_PATH, apply_requests_get_mock
+from ..mixins import MarketingTestCase
+
+
+class FlushLinkClicksTestSuite(MarketingTestCase):
+    def setUp(self):
+        super().setUp()
+        self.clear_cache()
+
+    """
+    🔽🔽🔽 without clicks
+    """
+
+    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([]))
+    def test_flush_link_clicks__without_clicks(self):
+        import requests
+
+        model = self.generate_models(short_link=True, short_link_kwargs={'hits': 5, 'lastclick_at': None})
+
+        flush_link_clicks.delay()
+
+        self.assertEqual(self.bc.database.list_of('marketing.ShortLink'),
+                         [self.model_to_dict(model, 'short_link')])
+        self.assertEqual(requests.get.call_args_list, [])
+
+    """
+    🔽🔽🔽 with clicks
+    """
+
+    @patch(REQUESTS_PATH['get'],
+           apply_requests_get_mock([(200, 'https://potato.io', 'ok'),
+                                    (404, 'https://broken.io', 'not found')]))
+    def test_flush_link_clicks__with_clicks(self):
+        import requests
+
+        kwargs = {'hits': 5, 'lastclick_at': None, 'active': True}
+        model1 = self.generate_models(short_link=True,
+                                      short_link_kwargs={
+                                          **kwargs, 'destination': 'https://potato.io'
+                                      })
+        model2 = self.generate_models(short_link=True,
+                                      short_link_kwargs={
+                                          **kwargs, 'destination': 'https://broken.io'
+                                      })
+
+        for _ in range(0, 3):
+            register_link_click(model1.short_link.id)
+
+        register_link_click(model2.short_link.id)
+
+        # the ids of the clicked links are in the cache, just one bulk update
+        with self.assertNumQueries(1):
+            self.assertEqual(actions.flush_link_clicks(), 4)
+
+        links = self.bc.database.list_of('marketing.ShortLink')
+        self.assertEqual([x['hits'] for x in links], [8, 6])
+        self.assertEqual([x['lastclick_at'] is not None for x in links], [True, True])
+
+        # the counters were emptied
+        self.assertEqual(actions.flush_link_clicks(), 0)
+
+        register_link_click(model1.short_link.id)
+        flush_link_clicks.delay()
+
+        links = self.bc.database.list_of('marketing.ShortLink')
+        self.assertEqual([(x['hits'], x['destination_status']) for x in links], [(9, 'ACTIVE'), (6, 'ERROR')])
+        self.assertEqual(len(requests.get.call_args_list), 2)
+
+    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([]))
+    def test_flush_link_clicks__just_the_clicked_links(self):
+        kwargs = {'hits': 5, 'lastclick_at': None}
+        models = [self.generate_models(short_link=True, short_link_kwargs=kwargs) for _ in range(0, 3)]
+
+        register_link_click(models[1].short_link.id)
+        clicks = LinkClicksCache().take()
+
+        self.assertEqual([(k, v[0]) for k, v in clicks.items()], [(models[1].short_link.id, 1)])
+
+        # the clicks were taken, another flush can't save them again
+        self.assertEqual(actions.flush_link_clicks(), 0)
+
+        register_link_click(models[2].short_link.id)
+        self.assertEqual(actions.flush_link_clicks(), 1)
+
+        links = self.bc.database.list_of('marketing.ShortLink')
+        self.assertEqual([x['hits'] for x in links], [5, 5, 6])
+
+    """
+    🔽🔽🔽 rate limit of the destination tests
+    """
+
+    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', 'ok')]))
+    def test_flush_link_clicks__destination_tested_recently(self):
+        import requests
+
+        now = timezone.now()
+        self.generate_models(short_link=True,
+                             short_link_kwargs={
+                                 'destination': 'https://potato.io',
+                                 'active': True,
+                                 'lastclick_at': now - timedelta(minutes=10),
+                                 'destination_checked_at': now - timedelta(minutes=5),
+                             })
+
+        register_link_click(1)
+        flush_link_clicks.delay()
+
+        self.assertEqual(requests.get.call_args_list, [])
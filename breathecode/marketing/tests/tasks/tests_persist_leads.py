@@ -0,0 +1,195 @@
+"""
+Test persist_leads
+"""
+import os
+from unittest.mock import MagicMock, patch
+from breathecode.marketing.tasks import persist_leads
+from breathecode.tests.mocks import (
+    GOOGLE_CLOUD_PATH,
+    apply_google_cloud_client_mock,
+    apply_google_cloud_bucket_mock,
+    apply_google_cloud_blob_mock,
+    REQUESTS_PATH,
+    apply_requests_get_mock,
+)
+from breathecode.tests.mocks.old_breathecode.requests_mock import ResponseMock
+from ..mixins import MarketingTestCase
+
+GOOGLE_CLOUD_KEY = os.getenv('GOOGLE_CLOUD_KEY', None)
+AC_URL = 'https://ac.potato.io'
+GEOCODE_URL = ('https://maps.googleapis.com/maps/api/geocode/json?latlng=15,15' f'&key={GOOGLE_CLOUD_KEY}')
+
+
+def active_campaign_mock(fail_emails=[]):
+    def side_effect(method, url, params=None, data=None, headers=None, **kwargs):
+        if url == f'{AC_URL}/admin/api.php':
+            if data['email'] in fail_emails:
+                return ResponseMock(data={'result_code': 0, 'result_message': 'Invalid email'})
+
+            return ResponseMock(data={'subscriber_id': 1, 'result_code': 1})
+
+        if url in [f'{AC_URL}/api/3/contactAutomations', f'{AC_URL}/api/3/contactTags']:
+            return ResponseMock(data={'contacts': [{'id': 1}]})
+
+        return ResponseMock(data={'ok': False, 'status': 'not found'}, status_code=404)
+
+    return MagicMock(side_effect=side_effect)
+
+
+def form_entry_kwargs(academy, tag, automation, email='konan@potato.io'):
+    return {
+        'location': academy.slug,
+        'tags': tag.slug,
+        'automations': automation.slug,
+        'email': email,
+        'first_name': 'Konan',
+        'last_name': 'Amegakure',
+        'phone': '123123123',
+        'latitude': 15,
+        'longitude': 15,
+        'storage_status': 'PENDING',
+    }
+
+
+class PersistLeadsTestSuite(MarketingTestCase):
+    """
+    🔽🔽🔽 without entries
+    """
+    @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
+    @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
+    @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
+    @patch('requests.Session.request', active_campaign_mock())
+    def test_persist_leads__without_entries(self):
+        import requests
+
+        self.assertEqual(persist_leads(), True)
+        self.assertEqual(requests.Session.request.call_args_list, [])
+
+    """
+    🔽🔽🔽 with entries
+    """
+
+    @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
+    @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
+    @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
+    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, GEOCODE_URL, {
+        'status': 'OK',
+        'results': []
+    })]))
+    @patch('requests.Session.request', active_campaign_mock())
+    def test_persist_leads__with_entries(self):
+        import requests
+
+        base = self.generate_models(academy=True,
+                                    active_campaign_academy=True,
+                                    tag=True,
+                                    tag_kwargs={'tag_type': 'STRONG'},
+                                    automation=True,
+                                    active_campaign_academy_kwargs={'ac_url': AC_URL})
+
+        kwargs = form_entry_kwargs(base.academy, base.tag, base.automation)
+        models = [
+            self.generate_models(form_entry=True, form_entry_kwargs=kwargs, models=base) for _ in range(0, 3)
+        ]
+
+        self.assertEqual(persist_leads(), True)
+
+        self.assertEqual([(x['storage_status'], x['ac_contact_id']) for x in self.all_form_entry_dict()],
+                         [('PERSISTED', '1')] * 3)
+
+        for model in models:
+            model.form_entry.refresh_from_db()
+            self.assertEqual([x.id for x in model.form_entry.tag_objects.all()], [base.tag.id])
+            self.assertEqual([x.id for x in model.form_entry.automation_objects.all()], [base.automation.id])
+
+        # 1 contact, 1 automation and 1 tag per lead
+        self.assertEqual(len(requests.Session.request.call_args_list), 9)
+
+    @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
+    @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
+    @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
+    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, GEOCODE_URL, {
+        'status': 'OK',
+        'results': []
+    })]))
+    @patch('requests.Session.request', active_campaign_mock(fail_emails=['bad@potato.io']))
+    def test_persist_leads__one_entry_fails(self):
+        base = self.generate_models(academy=True,
+                                    active_campaign_academy=True,
+                                    tag=True,
+                                    tag_kwargs={'tag_type': 'STRONG'},
+                                    automation=True,
+                                    active_campaign_academy_kwargs={'ac_url': AC_URL})
+
+        good_kwargs = form_entry_kwargs(base.academy, base.tag, base.automation)
+        bad_kwargs = form_entry_kwargs(base.academy, base.tag, base.automation, email='bad@potato.io')
+        self.generate_models(form_entry=True, form_entry_kwargs=good_kwargs, models=base)
+        self.generate_models(form_entry=True, form_entry_kwargs=bad_kwargs, models=base)
+
+        self.assertEqual(persist_leads(), True)
+
+        self.assertEqual([(x['email'], x['storage_status'], x['ac_contact_id'])
+                          for x in self.all_form_entry_dict()], [
+                              ('konan@potato.io', 'PERSISTED', '1'),
+                              ('bad@potato.io', 'PENDING', None),
+                          ])
+
+    @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
+    @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
+    @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
+    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, GEOCODE_URL, {
+        'status': 'OK',
+        'results': []
+    })]))
+    @patch('requests.Session.request', active_campaign_mock())
+    @patch('requests.Session.close')
+    def test_persist_leads__one_entry_raise_saving(self, session_close_mock):
+        from breathecode.marketing import actions
+
+        base = self.generate_models(academy=True,
+                                    active_campaign_academy=True,
+                                    tag=True,
+                                    tag_kwargs={'tag_type': 'STRONG'},
+                                    automation=True,
+                                    active_campaign_academy_kwargs={'ac_url': AC_URL})
+
+        kwargs = form_entry_kwargs(base.academy, base.tag, base.automation)
+        models = [
+            self.generate_models(form_entry=True, form_entry_kwargs=kwargs, models=base) for _ in range(0, 3)
+        ]
+
+        save_lead = actions.save_lead
+
+        def side_effect(ac_academy, entry, result):
+            if entry.id == models[0].form_entry.id:
+                raise Exception('Database is gone')
+
+            return save_lead(ac_academy, entry, result)
+
+        with patch('breathecode.marketing.actions.save_lead', MagicMock(side_effect=side_effect)):
+            self.assertEqual(persist_leads(), True)
+
+        self.assertEqual([(x['storage_status'], x['ac_contact_id']) for x in self.all_form_entry_dict()], [
+            ('PENDING', None),
+            ('PERSISTED', '1'),
+            ('PERSISTED', '1'),
+        ])
+        self.assertEqual(session_close_mock.call_count, 1)
+
+    @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
+    @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
+    @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
+    @patch('requests.Session.request', active_campaign_mock())
+    def test_persist_leads__academy_not_found(self):
+        import requests
+
+        model = self.generate_models(form_entry=True,
+                                     form_entry_kwargs={
+                                         'location': 'they-killed-kenny',
+                                         'storage_status': 'PENDING'
+                                     })
+
+        self.assertEqual(persist_leads(), True)
+
+        self.assertEqual([x['storage_status'] for x in self.all_form_entry_dict()], ['PENDING'])
+        self.assertEqual(requests.Session.request.call_args_list, [])
@@ -0,0 +1,91 @@
+"""
+Test reconcile_lead_rollups
+"""
+from datetime import timedelta
+from django.utils import timezone
+from breathecode.marketing.models import FormEntry, LeadRollup
+from breathecode.marketing.tasks import reconcile_lead_rollups
+from ..mixins import MarketingTestCase
+
+
+def get_rollups():
+    rollups = LeadRollup.objects.order_by('date', 'location')
+    return [(x.date, x.academy_id, x.location, x.course, x.total_leads) for x in rollups]
+
+
+class ReconcileLeadRollupsTestSuite(MarketingTestCase):
+    """
+    🔽🔽🔽 Incremental rollups
+    """
+    def test_lead_rollups__created_with_the_leads(self):
+        form_entries = [{'location': 'downtown-miami', 'course': 'full-stack'} for _ in range(2)]
+        form_entries.append({'location': 'santiago-chile', 'course': 'full-stack'})
+
+        self.bc.database.create(academy=1, form_entry=form_entries)
+
+        today = timezone.localdate()
+        self.assertEqual(get_rollups(), [
+            (today, 1, 'downtown-miami', 'full-stack', 2),
+            (today, 1, 'santiago-chile', 'full-stack', 1),
+        ])
+
+    def test_lead_rollups__moved_when_the_dimensions_change(self):
+        form_entries = [{'location': 'downtown-miami', 'course': 'full-stack'} for _ in range(2)]
+        self.bc.database.create(academy=1, form_entry=form_entries)
+
+        # other fields do not touch the rollups
+        form_entry = FormEntry.objects.get(id=1)
+        form_entry.first_name = 'Kenny'
+        form_entry.save()
+
+        form_entry.location = 'santiago-chile'
+        form_entry.save()
+
+        today = timezone.localdate()
+        self.assertEqual(get_rollups(), [
+            (today, 1, 'downtown-miami', 'full-stack', 1),
+            (today, 1, 'santiago-chile', 'full-stack', 1),
+        ])
+
+        FormEntry.objects.filter(id=2).delete()
+
+        self.assertEqual(get_rollups(), [
+            (today, 1, 'downtown-miami', 'full-stack', 0),
+            (today, 1, 'santiago-chile', 'full-stack', 1),
+        ])
+
+    """
+    🔽🔽🔽 Reconciliation
+    """
+
+    def test_reconcile_lead_rollups(self):
+        today = timezone.localdate()
+        form_entries = [{'location': 'downtown-miami', 'course': 'full-stack'} for _ in range(3)]
+        lead_rollups = [
+            # out of the reconciled days
+            {
+                'date': today - timedelta(days=10),
+                'location': 'downtown-miami',
+                'total_leads': 5
+            },
+            # wrong count
+            {
+                'date': today - timedelta(days=1),
+                'location': 'downtown-miami',
+                'total_leads': 7
+            },
+        ]
+
+        self.bc.database.create(academy=1, form_entry=form_entries, lead_rollup=lead_rollups)
+
+        # the leads changed without save() are not counted by the incremental rollups
+        yesterday = timezone.now() - timedelta(days=1)
+        FormEntry.objects.filter(id__in=[1, 2]).update(created_at=yesterday, course='web-development')
+
+        reconcile_lead_rollups.delay()
+
+        self.assertEqual(get_rollups(), [
+            (today - timedelta(days=10), 1, 'downtown-miami', None, 5),
+            (today - timedelta(days=1), 1, 'downtown-miami', 'web-development', 2),
+            (today, 1, 'downtown-miami', 'full-stack', 1),
+        ])
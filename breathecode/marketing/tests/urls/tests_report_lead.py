@@ -0,0 +1,136 @@
+"""
+Test /report/lead
+"""
+from datetime import timedelta
+from django.urls.base import reverse_lazy
+from django.utils import timezone
+from rest_framework import status
+from breathecode.marketing.models import FormEntry, LeadRollup
+from ..mixins import MarketingTestCase
+
+
+def sort_rows(rows):
+    return sorted(rows, key=lambda x: sorted([(k, str(v)) for k, v in x.items()]))
+
+
+class ReportLeadTestSuite(MarketingTestCase):
+    """
+    🔽🔽🔽 Auth
+    """
+    def test_report_lead__without_auth(self):
+        url = reverse_lazy('marketing:report_lead')
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    """
+    🔽🔽🔽 From the rollups
+    """
+
+    def test_report_lead__rollups_with_the_leads_of_today(self):
+        today = timezone.localdate()
+        yesterday = today - timedelta(days=1)
+        lead_rollups = [
+            {
+                'date': yesterday,
+                'location': 'downtown-miami',
+                'course': 'full-stack',
+                'total_leads': 5,
+                'academy_id': 1,
+            },
+            # other academy
+            {
+                'date': yesterday,
+                'location': 'santiago-chile',
+                'course': 'full-stack',
+                'total_leads': 7,
+                'academy_id': 2,
+            },
+        ]
+        form_entries = [{'location': 'downtown-miami', 'course': 'full-stack', 'academy_id': 1}] * 2
+
+        model = self.bc.database.create(academy=2,
+                                        profile_academy=1,
+                                        form_entry=form_entries,
+                                        lead_rollup=lead_rollups)
+
+        self.bc.request.authenticate(model.user)
+        url = reverse_lazy('marketing:report_lead')
+
+        # today is counted from the leads, its rollup is not read
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sort_rows(response.json()), [
+            {
+                'location': 'downtown-miami',
+                'created_at__date': str(yesterday),
+                'course': 'full-stack',
+                'total_leads': 5,
+                'created_date': yesterday.strftime('%Y%m%d'),
+            },
+            {
+                'location': 'downtown-miami',
+                'created_at__date': str(today),
+                'course': 'full-stack',
+                'total_leads': 2,
+                'created_date': today.strftime('%Y%m%d'),
+            },
+        ])
+
+        response = self.client.get(f'{url}?by=location&start={yesterday}&end={yesterday}')
+        self.assertEqual(response.json(), [])
+
+        response = self.client.get(f'{url}?by=location&start={yesterday}')
+        self.assertEqual(response.json(), [{'location': 'downtown-miami', 'total_leads': 7}])
+
+    def test_report_lead__days_before_the_first_rollup(self):
+        today = timezone.localdate()
+        yesterday = today - timedelta(days=1)
+        form_entries = [{'location': 'downtown-miami', 'course': 'full-stack', 'academy_id': 1}] * 3
+
+        model = self.bc.database.create(profile_academy=1, form_entry=form_entries)
+
+        # leads saved before the rollups existed
+        created_at = timezone.now() - timedelta(days=1)
+        FormEntry.objects.update(created_at=created_at)
+        LeadRollup.objects.all().delete()
+
+        self.bc.request.authenticate(model.user)
+        url = reverse_lazy('marketing:report_lead')
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [
+            {
+                'location': 'downtown-miami',
+                'created_at__date': str(yesterday),
+                'course': 'full-stack',
+                'total_leads': 3,
+                'created_date': yesterday.strftime('%Y%m%d'),
+            },
+        ])
+
+    """
+    🔽🔽🔽 From the leads
+    """
+
+    def test_report_lead__group_by_not_covered_by_the_rollups(self):
+        form_entries = [{'country': 'USA', 'academy_id': 1}] * 2 + [{'country': 'Chile', 'academy_id': 1}]
+
+        model = self.bc.database.create(profile_academy=1, form_entry=form_entries)
+
+        self.bc.request.authenticate(model.user)
+        url = reverse_lazy('marketing:report_lead') + '?by=country'
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sort_rows(response.json()), [
+            {
+                'country': 'Chile',
+                'total_leads': 1,
+            },
+            {
+                'country': 'USA',
+                'total_leads': 2,
+            },
+        ])
@@ -0,0 +1,98 @@
+"""
+Test /s/<slug>
+"""
+from unittest.mock import MagicMock, patch
+from django.urls.base import reverse_lazy
+from breathecode.tests.mocks import REQUESTS_PATH, apply_requests_get_mock
+from ..mixins import MarketingTestCase
+
+DESTINATION = 'https://potato.io/landing?ref=1'
+
+
+class ShortLinkTestSuite(MarketingTestCase):
+    def setUp(self):
+        super().setUp()
+        self.clear_cache()
+
+    """
+    🔽🔽🔽 Not found
+    """
+
+    def test_slug__not_found(self):
+        url = reverse_lazy('marketing_shortner:slug', kwargs={'link_slug': 'they-killed-kenny'})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.bc.database.list_of('marketing.ShortLink'), [])
+
+    def test_slug__inactive(self):
+        model = self.generate_models(short_link=True, short_link_kwargs={'active': False})
+
+        url = reverse_lazy('marketing_shortner:slug', kwargs={'link_slug': model.short_link.slug})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 404)
+
+    """
+    🔽🔽🔽 Redirect
+    """
+
+    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, DESTINATION, 'ok')]))
+    def test_slug__redirect(self):
+        model = self.generate_models(short_link=True,
+                                     short_link_kwargs={
+                                         'destination': DESTINATION,
+                                         'utm_source': 'potato',
+                                         'utm_content': None,
+                                         'utm_medium': None,
+                                         'utm_campaign': None,
+                                         'hits': 0,
+                                     })
+
+        url = reverse_lazy('marketing_shortner:slug', kwargs={'link_slug': model.short_link.slug})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], 'https://potato.io/landing?ref=1&utm_source=potato')
+
+        short_link = self.bc.database.list_of('marketing.ShortLink')[0]
+        self.assertEqual(short_link['hits'], 1)
+        self.assertEqual(short_link['destination_status'], 'ACTIVE')
+        self.assertNotEqual(short_link['lastclick_at'], None)
+        self.assertNotEqual(short_link['destination_checked_at'], None)
+
+    @patch('breathecode.marketing.tasks.flush_link_clicks.apply_async', MagicMock())
+    def test_slug__cached_redirect__without_queries(self):
+        from breathecode.marketing.tasks import flush_link_clicks
+
+        model = self.generate_models(short_link=True, short_link_kwargs={'destination': DESTINATION})
+        url = reverse_lazy('marketing_shortner:slug', kwargs={'link_slug': model.short_link.slug})
+
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            for _ in range(0, 3):
+                response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 302)
+
+        # the clicks wait in the cache and one flush is scheduled
+        self.assertEqual(self.bc.database.list_of('marketing.ShortLink')[0]['hits'], model.short_link.hits)
+        self.assertEqual(len(flush_link_clicks.apply_async.call_args_list), 1)
+
+    @patch('breathecode.marketing.tasks.flush_link_clicks.apply_async', MagicMock())
+    def test_slug__cache_is_cleared_on_save(self):
+        model = self.generate_models(short_link=True, short_link_kwargs={'destination': DESTINATION})
+        old_url = reverse_lazy('marketing_shortner:slug', kwargs={'link_slug': model.short_link.slug})
+
+        self.client.get(old_url)
+
+        model.short_link.slug = 'new-slug'
+        model.short_link.destination = 'https://potato.io/new'
+        model.short_link.save()
+
+        response = self.client.get(old_url)
+        self.assertEqual(response.status_code, 404)
+
+        url = reverse_lazy('marketing_shortner:slug', kwargs={'link_slug': 'new-slug'})
+        response = self.client.get(url)
+        self.assertEqual(response['Location'].startswith('https://potato.io/new?'), True)
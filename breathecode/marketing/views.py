@@ -1,5 +1,4 @@
 import os, re, datetime, logging, csv, pytz, secrets, json
-from urllib import parse
 from django.utils import timezone
 from datetime import timedelta
 from rest_framework_csv.renderers import CSVRenderer
@@ -12,9 +11,8 @@ from rest_framework import status
 from django.db.models import Q
 from rest_framework.permissions import AllowAny
 from rest_framework.decorators import api_view, permission_classes
-from django.db.models import Count, F, Func, Value, CharField
 from breathecode.utils import (APIException, localize_query, capable_of, ValidationException,
-                               GenerateLookupsMixin, HeaderLimitOffsetPagination)
+                               GenerateLookupsMixin, HeaderLimitOffsetPagination, SearchBackend)
 from .serializers import (
     PostFormEntrySerializer,
     FormEntrySerializer,
@@ -28,13 +26,16 @@ from .serializers import (
     UTMSmallSerializer,
 )
 from breathecode.services.activecampaign import ActiveCampaign
-from .actions import sync_tags, sync_automations
-from .tasks import persist_single_lead, update_link_viewcount, async_activecampaign_webhook
+from .actions import sync_tags, sync_automations, register_link_click, LINK_CLICKS_FLUSH_INTERVAL
+from .caches import ShortLinkCache
+from .tasks import persist_single_lead, flush_link_clicks, async_activecampaign_webhook
 from .models import ShortLink, ActiveCampaignAcademy, FormEntry, Tag, Automation, Downloadable, LeadGenerationApp, UTMField
 from breathecode.admissions.models import Academy
+from breathecode.authenticate.models import ProfileAcademy
 from breathecode.utils.find_by_full_name import query_like_by_full_name
 from rest_framework.views import APIView
 import breathecode.marketing.tasks as tasks
+import breathecode.marketing.actions as actions
 
 logger = logging.getLogger(__name__)
 
@@ -265,29 +266,14 @@ def sync_automations_with_active_campaign(request, academy_id):
 
 
 def redirect_link(request, link_slug):
-    short_link = ShortLink.objects.filter(slug=link_slug, active=True).first()
-    if short_link is None:
+    link = ShortLinkCache().get(link_slug)
+    if link is None:
         return HttpResponseNotFound('URL not found')
 
-    update_link_viewcount.delay(short_link.slug)
+    if register_link_click(link['id']):
+        flush_link_clicks.apply_async(countdown=LINK_CLICKS_FLUSH_INTERVAL)
 
-    params = {}
-    if short_link.utm_source is not None:
-        params['utm_source'] = short_link.utm_source
-    if short_link.utm_content is not None:
-        params['utm_content'] = short_link.utm_content
-    if short_link.utm_medium is not None:
-        params['utm_medium'] = short_link.utm_medium
-    if short_link.utm_campaign is not None:
-        params['utm_campaign'] = short_link.utm_campaign
-
-    destination_params = {}
-    url_parts = short_link.destination.split('?')
-    if len(url_parts) > 1:
-        destination_params = dict(parse.parse_qsl(url_parts[1]))
-
-    params = {**destination_params, **params}
-    return HttpResponseRedirect(redirect_to=url_parts[0] + '?' + parse.urlencode(params))
+    return HttpResponseRedirect(redirect_to=link['url'])
 
 
 @api_view(['GET'])
@@ -312,18 +298,24 @@ def get_leads(request, id=None):
         items = items.filter(created_at__lte=end_date)
 
     items = items.order_by('created_at')
-    serializer = FormEntrySerializer(items, many=True)
-    return Response(serializer.data)
+
+    paginator = HeaderLimitOffsetPagination()
+    page = paginator.paginate_queryset(items, request)
+    serializer = FormEntrySerializer(page, many=True)
+    if paginator.is_paginate(request):
+        return paginator.get_paginated_response(serializer.data)
+    else:
+        return Response(serializer.data)
 
 
 @api_view(['GET'])
 def get_leads_report(request, id=None):
 
-    items = FormEntry.objects.all()
-
+    academy_ids = None
     if isinstance(request.user, AnonymousUser) == False:
         # filter only to the local academy
-        items = localize_query(items, request)
+        academy_ids = list(
+            ProfileAcademy.objects.filter(user=request.user).values_list('academy__id', flat=True))
 
     group_by = request.GET.get('by', 'location,created_at__date,course')
     if group_by != '':
@@ -331,26 +323,26 @@ def get_leads_report(request, id=None):
     else:
         group_by = ['location', 'created_at__date', 'course']
 
+    locations = None
     academy = request.GET.get('academy', None)
     if academy is not None:
-        items = items.filter(location__in=academy.split(','))
+        locations = academy.split(',')
 
+    start_date = None
     start = request.GET.get('start', None)
     if start is not None:
         start_date = datetime.datetime.strptime(start, '%Y-%m-%d').date()
-        items = items.filter(created_at__gte=start_date)
 
+    end_date = None
     end = request.GET.get('end', None)
     if end is not None:
         end_date = datetime.datetime.strptime(end, '%Y-%m-%d').date()
-        items = items.filter(created_at__lte=end_date)
 
-    items = items.values(*group_by).annotate(total_leads=Count('location'))
-
-    if 'created_at__date' in group_by:
-        items = items.annotate(created_date=Func(
-            F('created_at'), Value('YYYYMMDD'), function='to_char', output_field=CharField()))
-    # items = items.order_by('created_at')
+    items = actions.get_leads_report(group_by,
+                                     academy_ids=academy_ids,
+                                     locations=locations,
+                                     start=start_date,
+                                     end=end_date)
     return Response(items)
 
 
@@ -484,6 +476,8 @@ class AcademyLeadView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMixin
     """
     List all snippets, or create a new snippet.
     """
+    cursor_count = 'cached'
+
     @capable_of('read_lead')
     def get(self, request, format=None, academy_id=None):
 
@@ -556,6 +550,8 @@ class ShortLinkView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMixin):
     """
     List all snippets, or create a new snippet.
     """
+    search_backend = SearchBackend(['slug'])
+
     @capable_of('read_shortlink')
     def get(self, request, slug=None, academy_id=None):
 
@@ -580,9 +576,9 @@ class ShortLinkView(APIView, HeaderLimitOffsetPagination, GenerateLookupsMixin):
 
         items = items.filter(**lookup).order_by(sort_by)
 
-        like = request.GET.get('like', None)
-        if like is not None:
-            items = items.filter(slug__icontains=like)
+        # an explicit sort has priority over the relevance
+        like = request.GET.get('search', request.GET.get('like', None))
+        items = self.search_backend.filter(items, like, rank=not self.request.GET.get('sort'))
 
         page = self.paginate_queryset(items, request)
         serializer = ShortlinkSmallSerializer(page, many=True)
@@ -1,16 +1,28 @@
-import os, re, json, logging, time, datetime, requests
+import os, re, json, logging, time, datetime, requests, threading
 from itertools import chain
-from django.db.models import Q
+from typing import Optional
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 from datetime import timedelta
 from django.shortcuts import render
 from breathecode.services.daily.client import DailyClient
 from rest_framework.exceptions import APIException, ValidationError, PermissionDenied
-from .models import MentorshipSession, MentorshipBill
+from .models import AVAILABLE, CLAIMED, DailyRoom, MentorProfile, MentorshipService, MentorshipSession, MentorshipBill
 from breathecode.utils.datetime_interger import duration_to_str
 
 logger = logging.getLogger(__name__)
 
+# rooms kept ready in the pool of each service duration
+DAILY_ROOM_POOL_SIZE = int(os.getenv('DAILY_ROOM_POOL_SIZE', 3))
+
+# a pooled room lives this long beyond the duration of the session, it's the time it can wait in the pool
+DAILY_ROOM_POOL_TTL = int(os.getenv('DAILY_ROOM_POOL_TTL', 60 * 60 * 6))
+
+_pool_lock = threading.Lock()
+_pool_stats = {'claims': 0, 'hits': 0, 'misses': 0, 'claim_seconds': 0.0, 'max_claim_seconds': 0.0}
+
 
 def get_pending_sessions_or_create(token, mentor, mentee=None):
 
@@ -67,30 +79,146 @@ def get_pending_sessions_or_create(token, mentor, mentee=None):
                                 mentee=mentee,
                                 is_online=True,
                                 ends_at=timezone.now() + duration)
-    daily = DailyClient()
-    room = daily.create_room(exp_in_seconds=mentor.service.duration.seconds)
-    session.online_meeting_url = room['url']
-    session.name = room['name']
+
+    room = claim_daily_room(duration)
+    if room is not None:
+        from .tasks import extend_daily_room
+
+        session.online_meeting_url = room.url
+        session.name = room.name
+
+        # the rooms of the pool live longer than the session, it must be cut off when the session ends
+        extend_daily_room.delay(room.name, exp_in_epoch=int(session.ends_at.timestamp()))
+
+    # the pool is empty, the room is created right now
+    else:
+        daily = DailyClient()
+        room = daily.create_room(exp_in_seconds=duration.seconds)
+        session.online_meeting_url = room['url']
+        session.name = room['name']
+
     session.mentee = mentee
     session.save()
 
     return MentorshipSession.objects.filter(id=session.id)
 
 
+def claim_daily_room(duration: timedelta) -> Optional[DailyRoom]:
+    """
+    Claim one room of the pool of this duration, the rows locked by a concurrent claim are skipped
+    and the room must live for the whole session, the pool is replenished in background.
+    """
+    from .tasks import replenish_daily_rooms
+
+    started = time.perf_counter()
+    now = timezone.now()
+
+    rooms = DailyRoom.objects.filter(status=AVAILABLE, duration=duration, expires_at__gte=now + duration)
+
+    with transaction.atomic():
+        room = rooms.select_for_update(skip_locked=True).order_by('expires_at').first()
+
+        if room is not None:
+            room.status = CLAIMED
+            room.claimed_at = now
+            room.save()
+
+    elapsed = time.perf_counter() - started
+
+    with _pool_lock:
+        _pool_stats['claims'] += 1
+        _pool_stats['hits' if room else 'misses'] += 1
+        _pool_stats['claim_seconds'] += elapsed
+        _pool_stats['max_claim_seconds'] = max(_pool_stats['max_claim_seconds'], elapsed)
+
+    logger.debug(f'Daily room claimed in {round(elapsed * 1000, 2)}ms, pool hit: {room is not None}')
+    replenish_daily_rooms.delay(duration.total_seconds())
+
+    return room
+
+
+def replenish_daily_rooms(duration: timedelta, size=DAILY_ROOM_POOL_SIZE) -> int:
+    """Create the rooms that the pool of this duration is missing, it returns how many were created."""
+
+    # only one replenishment of each pool at the same time
+    lock_key = f'DailyRoom__replenish__{int(duration.total_seconds())}'
+    if not cache.add(lock_key, True, timeout=60):
+        return 0
+
+    try:
+        now = timezone.now()
+        rooms = DailyRoom.objects.filter(status=AVAILABLE, duration=duration)
+
+        # these rooms would expire before the end of a session
+        rooms.filter(expires_at__lt=now + duration).delete()
+
+        missing = size - rooms.count()
+        if missing <= 0:
+            return 0
+
+        daily = DailyClient()
+        expires_at = now + duration + timedelta(seconds=DAILY_ROOM_POOL_TTL)
+        new_rooms = []
+
+        for _ in range(missing):
+            data = daily.create_room(exp_in_epoch=int(expires_at.timestamp()))
+            room = DailyRoom(name=data['name'], url=data['url'], duration=duration, expires_at=expires_at)
+            new_rooms.append(room)
+
+        DailyRoom.objects.bulk_create(new_rooms)
+        return len(new_rooms)
+
+    finally:
+        cache.delete(lock_key)
+
+
+def replenish_all_daily_rooms(size=DAILY_ROOM_POOL_SIZE) -> dict:
+    """Replenish the pools of the durations of the active services and forget the expired rooms."""
+
+    DailyRoom.objects.filter(status=CLAIMED, expires_at__lt=timezone.now()).delete()
+
+    durations = MentorshipService.objects.filter(status='ACTIVE').exclude(duration=None).values_list(
+        'duration', flat=True).distinct()
+
+    return {duration: replenish_daily_rooms(duration, size=size) for duration in durations}
+
+
+def get_daily_room_pool_stats() -> dict:
+    """Depth of each pool and the claims of this process, the latencies are in milliseconds."""
+
+    now = timezone.now()
+    rooms = DailyRoom.objects.filter(status=AVAILABLE, expires_at__gte=now)
+    depth = rooms.values('duration').annotate(total=Count('id')).order_by('duration')
+
+    with _pool_lock:
+        stats = {**_pool_stats}
+
+    claims = stats.pop('claims')
+    claim_seconds = stats.pop('claim_seconds')
+    max_claim_seconds = stats.pop('max_claim_seconds')
+
+    return {
+        'depth': dict([(str(x['duration']), x['total']) for x in depth]),
+        'claims': claims,
+        **stats,
+        'avg_claim_ms': round(claim_seconds / claims * 1000, 2) if claims else None,
+        'max_claim_ms': round(max_claim_seconds * 1000, 2) if claims else None,
+    }
+
+
 def extend_session(session, duration_in_minutes=None, exp_in_epoch=None):
+    from .tasks import extend_daily_room
 
     # make 30min default for both
     if duration_in_minutes is None and exp_in_epoch is None:
         duration_in_minutes = 30
 
-    # default duration can be ovveriden by service
-    daily = DailyClient()
-
+    # the room is extended in background, the session does not wait for daily.co
     if duration_in_minutes is not None:
-        room = daily.extend_room(name=session.name, exp_in_seconds=duration_in_minutes * 3600)
+        extend_daily_room.delay(session.name, exp_in_seconds=duration_in_minutes * 3600)
         session.ends_at = session.ends_at + timedelta(minutes=duration_in_minutes)
     elif exp_in_epoch is not None:
-        room = daily.extend_room(name=session.name, exp_in_epoch=exp_in_epoch)
+        extend_daily_room.delay(session.name, exp_in_epoch=exp_in_epoch)
         session.ends_at = datetime.datetime.fromtimestamp(exp_in_epoch)
 
     session.save()
@@ -127,12 +255,12 @@ def close_mentoring_session(session, data):
 
 
 def get_accounted_time(_session):
-    def get_duration(session):
+    def get_duration(session, service):
         response = {'accounted_duration': 0, 'status_message': ''}
         if session.started_at is None and session.mentor_joined_at is not None:
             response['status_message'] = 'Mentor joined but mentee never did, '
-            if session.mentor.service.missed_meeting_duration.seconds > 0:
-                response['accounted_duration'] = session.mentor.service.missed_meeting_duration
+            if service.missed_meeting_duration.seconds > 0:
+                response['accounted_duration'] = service.missed_meeting_duration
                 response[
                     'status_message'] += f'{duration_to_str(response["accounted_duration"])} will be accounted for the bill.'
             else:
@@ -165,7 +293,7 @@ def get_accounted_time(_session):
                         'status_message'] = f'The session never ended, accounting duration based on the time where the mentor left the meeting {duration_to_str(response["accounted_duration"])}.'
                     return response
                 else:
-                    response['accounted_duration'] = session.mentor.service.duration
+                    response['accounted_duration'] = service.duration
                     response[
                         'status_message'] = f'The session never ended, accounting for the standard duration {duration_to_str(response["accounted_duration"])}.'
                     return response
@@ -183,20 +311,20 @@ def get_accounted_time(_session):
                         'status_message'] = f'The lasted way more than it should, accounting duration based on the time where the mentee left the meeting {duration_to_str(response["accounted_duration"])}.'
                     return response
                 else:
-                    response['accounted_duration'] = session.mentor.service.duration
+                    response['accounted_duration'] = service.duration
                     response[
                         'status_message'] = f'This session lasted more than a day, no one ever left, was probably never closed, accounting for standard duration {duration_to_str(response["accounted_duration"])}.'
                     return response
 
             response['accounted_duration'] = session.ended_at - session.started_at
-            if response['accounted_duration'] > session.mentor.service.max_duration:
-                if session.mentor.service.max_duration.seconds == 0:
-                    response['accounted_duration'] = session.mentor.service.duration
+            if response['accounted_duration'] > service.max_duration:
+                if service.max_duration.seconds == 0:
+                    response['accounted_duration'] = service.duration
                     response[
                         'status_message'] = f'No extra time is allowed for session, accounting for stantard duration of {duration_to_str(response["accounted_duration"])}.'
                     return response
                 else:
-                    response['accounted_duration'] = session.mentor.service.max_duration
+                    response['accounted_duration'] = service.max_duration
                     response[
                         'status_message'] = f'The duration of the session is bigger than the maximun allowed, accounting for max duration of {duration_to_str(response["accounted_duration"])}.'
                     return response
@@ -209,31 +337,46 @@ def get_accounted_time(_session):
             response['status_message'] = f'No one joined this session, nothing will be accounted for.'
             return response
 
-    _duration = get_duration(_session)
-    if _duration['accounted_duration'] > _session.mentor.service.max_duration:
-        _duration['accounted_duration'] = session.mentor.service.max_duration
+    service = _session.mentor.service
+    _duration = get_duration(_session, service)
+    if _duration['accounted_duration'] > service.max_duration:
+        _duration['accounted_duration'] = service.max_duration
         _duration[
             'status_message'] += f' The session accounted duration was limited to the maximum allowed {duration_to_str(_duration["accounted_duration"])}'
     return _duration
 
 
-def generate_mentor_bill(mentor, reset=False):
+# fields written by the bill engine, the sessions are saved with one bulk_update per bill
+MENTOR_BILL_SESSION_FIELDS = [
+    'bill', 'suggested_accounted_duration', 'status_message', 'accounted_duration', 'updated_at'
+]
+BILL_BATCH_SIZE = int(os.getenv('BILL_BATCH_SIZE', 500))
+
+
+def get_unpaid_sessions(mentors, academy):
+    """Unpaid sessions of the mentors, loaded with their mentor and service in one query"""
+
+    sessions = MentorshipSession.objects.filter(allow_billing=True,
+                                                mentor__in=mentors,
+                                                status__in=['COMPLETED', 'FAILED'])
+
+    sessions = sessions.filter(Q(bill__isnull=True) | Q(bill__status='DUE', bill__academy=academy))
+    return sessions.select_related('mentor__service').order_by('id')
 
-    open_bill = MentorshipBill.objects.filter(mentor__id=mentor.id,
-                                              academy__id=mentor.service.academy.id,
-                                              status='DUE').first()
-    if open_bill is None:
-        open_bill = MentorshipBill(mentor=mentor, academy=mentor.service.academy)
-        open_bill.save()
 
-    unpaid_sessions = MentorshipSession.objects.filter(
-        allow_billing=True, mentor__id=mentor.id, status__in=[
-            'COMPLETED', 'FAILED'
-        ]).filter(Q(bill__isnull=True) | Q(bill__status='DUE', bill__academy=mentor.service.academy))
+def bill_mentor_sessions(mentor, open_bill, sessions, reset=False):
+    """
+    Account the sessions of a bill in one pass and save the sessions and the bill totals in one
+    transaction, the sessions must be loaded with `get_unpaid_sessions`.
+    """
+
+    utc_now = timezone.now()
+    duration = mentor.service.duration
     total = {'minutes': 0, 'overtime_minutes': 0}
 
-    for session in unpaid_sessions:
+    for session in sessions:
         session.bill = open_bill
+        session.updated_at = utc_now
 
         _result = get_accounted_time(session)
         session.suggested_accounted_duration = _result['accounted_duration']
@@ -243,14 +386,12 @@ def generate_mentor_bill(mentor, reset=False):
             session.accounted_duration = _result['accounted_duration']
 
         extra_minutes = 0
-        if session.accounted_duration > session.mentor.service.duration:
-            extra_minutes = (session.accounted_duration - session.mentor.service.duration).seconds / 60
+        if session.accounted_duration > duration:
+            extra_minutes = (session.accounted_duration - duration).seconds / 60
 
         total['minutes'] = total['minutes'] + (session.accounted_duration.seconds / 60)
         total['overtime_minutes'] = total['overtime_minutes'] + extra_minutes
 
-        session.save()
-
     total['hours'] = round(total['minutes'] / 60, 2)
     total['price'] = total['hours'] * mentor.price_per_hour
 
@@ -258,11 +399,60 @@ def generate_mentor_bill(mentor, reset=False):
     open_bill.total_duration_in_minutes = total['minutes']
     open_bill.overtime_minutes = total['overtime_minutes']
     open_bill.total_price = total['price']
-    open_bill.save()
+
+    with transaction.atomic():
+        MentorshipSession.objects.bulk_update(sessions,
+                                              MENTOR_BILL_SESSION_FIELDS,
+                                              batch_size=BILL_BATCH_SIZE)
+        open_bill.save()
 
     return open_bill
 
 
+def generate_mentor_bill(mentor, reset=False):
+
+    open_bill = MentorshipBill.objects.filter(mentor__id=mentor.id,
+                                              academy__id=mentor.service.academy.id,
+                                              status='DUE').first()
+    if open_bill is None:
+        open_bill = MentorshipBill(mentor=mentor, academy=mentor.service.academy)
+        open_bill.save()
+
+    unpaid_sessions = list(get_unpaid_sessions([mentor], mentor.service.academy))
+    return bill_mentor_sessions(mentor, open_bill, unpaid_sessions, reset=reset)
+
+
+def generate_mentor_bills(academy, reset=False):
+    """
+    Generate the bills of all the mentors of the academy, the mentors, their open bills and their
+    unpaid sessions are loaded with one query each.
+    """
+
+    mentors = MentorProfile.objects.filter(service__academy=academy).select_related('service').order_by('id')
+    mentors = {x.id: x for x in mentors}
+
+    # the oldest due bill of each mentor, like generate_mentor_bill
+    open_bills = {}
+    for bill in MentorshipBill.objects.filter(mentor__id__in=mentors, academy=academy,
+                                              status='DUE').order_by('id'):
+        open_bills.setdefault(bill.mentor_id, bill)
+
+    sessions = {}
+    for session in get_unpaid_sessions(mentors.values(), academy):
+        sessions.setdefault(session.mentor_id, []).append(session)
+
+    bills = []
+    for mentor_id, mentor in mentors.items():
+        open_bill = open_bills.get(mentor_id)
+        if open_bill is None:
+            open_bill = MentorshipBill(mentor=mentor, academy=academy)
+            open_bill.save()
+
+        bills.append(bill_mentor_sessions(mentor, open_bill, sessions.get(mentor_id, []), reset=reset))
+
+    return bills
+
+
 def mentor_is_ready(mentor):
 
     if mentor.online_meeting_url is None or mentor.online_meeting_url == '':
@@ -1,7 +1,7 @@
 import json, pytz, logging, requests, re
 from django.contrib import admin, messages
 from django import forms
-from .models import MentorProfile, MentorshipService, MentorshipSession, MentorshipBill
+from .models import DailyRoom, MentorProfile, MentorshipService, MentorshipSession, MentorshipBill
 from .actions import generate_mentor_bill, mentor_is_ready
 from django.utils.html import format_html
 from breathecode.utils.admin import change_field
@@ -190,3 +190,10 @@ class MentorshipBillAdmin(admin.ModelAdmin):
         return format_html(
             "<a rel='noopener noreferrer' target='_blank' href='/v1/mentorship/academy/bill/{id}/html'>open</a>",
             id=obj.id)
+
+
+@admin.register(DailyRoom)
+class DailyRoomAdmin(admin.ModelAdmin):
+    list_display = ['name', 'duration', 'status', 'expires_at', 'claimed_at']
+    search_fields = ['name']
+    list_filter = ['status', 'duration']
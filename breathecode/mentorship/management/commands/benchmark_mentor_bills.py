@@ -0,0 +1,136 @@
+import random, time
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from breathecode.admissions.models import Academy
+from ...actions import generate_mentor_bills, get_accounted_time
+from ...models import MentorProfile, MentorshipBill, MentorshipService, MentorshipSession
+
+
+def legacy_generate_mentor_bill(mentor, reset=False):
+    """The old engine, it saves every session with its own query"""
+
+    open_bill = MentorshipBill(mentor=mentor, academy=mentor.service.academy)
+    open_bill.save()
+
+    unpaid_sessions = MentorshipSession.objects.filter(
+        allow_billing=True, mentor__id=mentor.id, status__in=[
+            'COMPLETED', 'FAILED'
+        ]).filter(Q(bill__isnull=True) | Q(bill__status='DUE', bill__academy=mentor.service.academy))
+    total = {'minutes': 0, 'overtime_minutes': 0}
+
+    for session in unpaid_sessions:
+        session.bill = open_bill
+
+        _result = get_accounted_time(session)
+        session.suggested_accounted_duration = _result['accounted_duration']
+        session.status_message = _result['status_message']
+        if session.accounted_duration is None or reset == True:
+            session.accounted_duration = _result['accounted_duration']
+
+        extra_minutes = 0
+        if session.accounted_duration > session.mentor.service.duration:
+            extra_minutes = (session.accounted_duration - session.mentor.service.duration).seconds / 60
+
+        total['minutes'] = total['minutes'] + (session.accounted_duration.seconds / 60)
+        total['overtime_minutes'] = total['overtime_minutes'] + extra_minutes
+
+        session.save()
+
+    open_bill.total_duration_in_hours = round(total['minutes'] / 60, 2)
+    open_bill.total_duration_in_minutes = total['minutes']
+    open_bill.overtime_minutes = total['overtime_minutes']
+    open_bill.total_price = open_bill.total_duration_in_hours * mentor.price_per_hour
+    open_bill.save()
+
+    return open_bill
+
+
+def get_session(mentor, started_at):
+    """A synthetic session, a few of them never ended or were never joined by the mentee"""
+
+    kind = random.random()
+    session = MentorshipSession(mentor=mentor,
+                                status='COMPLETED',
+                                allow_billing=True,
+                                starts_at=started_at,
+                                ends_at=started_at + timedelta(hours=1),
+                                mentor_joined_at=started_at)
+
+    if kind < 0.1:
+        session.status = 'FAILED'
+        return session
+
+    session.started_at = started_at
+    if kind < 0.2:
+        session.mentee_left_at = started_at + timedelta(minutes=random.randint(10, 50))
+        return session
+
+    session.ended_at = started_at + timedelta(minutes=random.randint(20, 150))
+    return session
+
+
+def measure(function, *args, **kwargs):
+    with CaptureQueriesContext(connection) as context:
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - start
+
+    return result, seconds, len(context.captured_queries)
+
+
+class Command(BaseCommand):
+    help = 'Compare the legacy mentor bills against the bulk engine on a synthetic month of sessions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mentors', type=int, default=20)
+        parser.add_argument('--sessions', type=int, default=60, help='Sessions per mentor in the month')
+
+    def handle(self, *args, **options):
+        random.seed(0)
+        utc_now = timezone.now()
+        slug = f'benchmark-{int(utc_now.timestamp())}'
+        sessions = options['mentors'] * options['sessions']
+
+        # everything is rolled back at the end
+        with transaction.atomic():
+            academy = Academy.objects.create(slug=slug, name='Benchmark', logo_url='', street_address='')
+            service = MentorshipService.objects.create(slug=slug, name='Benchmark', academy=academy)
+
+            for n in range(options['mentors']):
+                user = User.objects.create(username=f'{slug}-{n}')
+                mentor = MentorProfile.objects.create(slug=f'{slug}-{n}',
+                                                      price_per_hour=20,
+                                                      service=service,
+                                                      user=user)
+
+                MentorshipSession.objects.bulk_create([
+                    get_session(mentor, utc_now - timedelta(minutes=random.randint(60, 60 * 24 * 30)))
+                    for _ in range(options['sessions'])
+                ])
+
+            mentors = MentorProfile.objects.filter(service=service).select_related('service__academy')
+            legacy_bills, legacy, legacy_queries = measure(
+                lambda: [legacy_generate_mentor_bill(x, reset=True) for x in mentors])
+
+            MentorshipBill.objects.filter(academy=academy).delete()
+            bills, bulk, bulk_queries = measure(generate_mentor_bills, academy, reset=True)
+
+            legacy_total = sum([x.total_price for x in legacy_bills])
+            total = sum([x.total_price for x in bills])
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f'{options["mentors"]} mentors, {sessions} sessions')
+        self.stdout.write(
+            f'legacy: {legacy:.2f}s ({sessions / legacy:.0f} sessions/s), {legacy_queries} queries')
+        self.stdout.write(f'bulk: {bulk:.2f}s ({sessions / bulk:.0f} sessions/s), {bulk_queries} queries')
+
+        if round(legacy_total, 2) != round(total, 2):
+            self.stdout.write(self.style.ERROR(f'the totals do not match, {legacy_total} != {total}'))
+
+        self.stdout.write(self.style.SUCCESS(f'speedup: {legacy / bulk:.1f}x'))
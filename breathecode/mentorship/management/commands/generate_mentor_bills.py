@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from breathecode.admissions.models import Academy
+from ...actions import generate_mentor_bills
+
+
+class Command(BaseCommand):
+    help = 'Generate the bills of the mentors of each academy with mentorship services'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--academy',
+                            action='append',
+                            dest='academies',
+                            type=int,
+                            default=None,
+                            help='Id of the academy, it can be repeated, all of them by default')
+        parser.add_argument('--reset',
+                            action='store_true',
+                            dest='reset',
+                            default=False,
+                            help='Account again the duration of the sessions that were already accounted')
+
+    def handle(self, *args, **options):
+        academies = Academy.objects.filter(mentorshipservice__isnull=False).distinct().order_by('id')
+        if options['academies']:
+            academies = academies.filter(id__in=options['academies'])
+
+        for academy in academies:
+            try:
+                bills = generate_mentor_bills(academy, reset=options['reset'])
+                self.stdout.write(f'{len(bills)} mentor bills were generated for {academy.slug}')
+
+            except Exception as e:
+                self.stderr.write(f'The mentor bills of {academy.slug} could not be generated: {str(e)}')
+
+        self.stdout.write(self.style.SUCCESS('Mentor bills generated'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from ...actions import DAILY_ROOM_POOL_SIZE, get_daily_room_pool_stats, replenish_all_daily_rooms
+
+
+class Command(BaseCommand):
+    help = 'Fill the pools of pre-created daily.co rooms of the active mentorship services'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size',
+                            action='store',
+                            dest='size',
+                            type=int,
+                            default=DAILY_ROOM_POOL_SIZE,
+                            help='How many rooms keep ready for each duration')
+
+    def handle(self, *args, **options):
+        created = replenish_all_daily_rooms(size=options['size'])
+        for duration, count in created.items():
+            self.stdout.write(f'{count} rooms were created for the pool of {duration}')
+
+        stats = get_daily_room_pool_stats()
+        self.stdout.write(self.style.SUCCESS(f'Pool depth: {stats["depth"]}'))
@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-18 21:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mentorship', '0013_auto_20220408_2052'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRoom',
+            fields=[
+                ('id',
+                 models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Room name, used on daily.co',
+                                          max_length=255,
+                                          unique=True)),
+                ('url', models.URLField(max_length=255)),
+                ('duration',
+                 models.DurationField(help_text='Duration of the services that can use this room')),
+                ('expires_at', models.DateTimeField(help_text='Expiration of the room on daily.co')),
+                ('status',
+                 models.CharField(choices=[('AVAILABLE', 'Available'), ('CLAIMED', 'Claimed')],
+                                  default='AVAILABLE',
+                                  max_length=15)),
+                ('claimed_at', models.DateTimeField(blank=True, default=None, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='dailyroom',
+            index=models.Index(fields=['status', 'duration', 'expires_at'],
+                               name='mentorship__status_f91485_idx'),
+        ),
+    ]
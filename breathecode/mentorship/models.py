@@ -318,3 +318,36 @@ class MentorshipSession(models.Model):
 
         if self.__old_status != self.status:
             signals.mentorship_session_status.send(instance=self, sender=MentorshipSession)
+
+
+AVAILABLE = 'AVAILABLE'
+CLAIMED = 'CLAIMED'
+DAILY_ROOM_STATUS = (
+    (AVAILABLE, 'Available'),
+    (CLAIMED, 'Claimed'),
+)
+
+
+class DailyRoom(models.Model):
+    """
+    Room pre-created on daily.co, a new session claims one from the pool of its duration and takes
+    its name, so the meeting can be rendered without waiting for the daily.co API.
+    """
+
+    name = models.CharField(max_length=255, unique=True, help_text='Room name, used on daily.co')
+    url = models.URLField(max_length=255)
+
+    duration = models.DurationField(help_text='Duration of the services that can use this room')
+    expires_at = models.DateTimeField(help_text='Expiration of the room on daily.co')
+
+    status = models.CharField(max_length=15, choices=DAILY_ROOM_STATUS, default=AVAILABLE)
+    claimed_at = models.DateTimeField(blank=True, null=True, default=None)
+
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'duration', 'expires_at'])]
+
+    def __str__(self):
+        return f'{self.name} ({self.status})'
@@ -0,0 +1,32 @@
+import logging
+from datetime import timedelta
+from celery import shared_task, Task
+from breathecode.services.daily.client import DailyClient
+
+logger = logging.getLogger(__name__)
+
+
+class BaseTaskWithRetry(Task):
+    autoretry_for = (Exception, )
+    #                                           seconds
+    retry_kwargs = {'max_retries': 5, 'countdown': 60 * 5}
+    retry_backoff = True
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def replenish_daily_rooms(self, duration_in_seconds):
+    from .actions import replenish_daily_rooms
+
+    created = replenish_daily_rooms(timedelta(seconds=duration_in_seconds))
+    logger.debug(f'{created} daily rooms were added to the pool of {duration_in_seconds} seconds')
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def extend_daily_room(self, name, exp_in_seconds=None, exp_in_epoch=None):
+    logger.debug(f'Extending the daily room {name}')
+
+    daily = DailyClient()
+    if exp_in_seconds is not None:
+        daily.extend_room(name=name, exp_in_seconds=exp_in_seconds)
+    else:
+        daily.extend_room(name=name, exp_in_epoch=exp_in_epoch)
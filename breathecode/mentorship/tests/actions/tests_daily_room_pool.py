@@ -0,0 +1,114 @@
+"""
+Test the pool of daily rooms
+"""
+from datetime import timedelta
+from unittest.mock import MagicMock, call, patch
+from django.core.cache import cache
+from django.utils import timezone
+from breathecode.tests.mocks.requests import REQUESTS_PATH, apply_requests_request_mock
+from ..mixins import MentorshipTestCase
+from ... import actions
+from ...actions import claim_daily_room, get_daily_room_pool_stats, replenish_daily_rooms
+
+daily_url = '/v1/rooms'
+daily_payload = {'url': 'https://4geeks.daily.com/asdasd', 'name': 'asdasd'}
+
+UTC_NOW = timezone.now()
+DURATION = timedelta(seconds=3600)
+
+
+def get_daily_room(name, **kwargs):
+    return {
+        'name': name,
+        'url': f'https://4geeks.daily.com/{name}',
+        'duration': DURATION,
+        'expires_at': UTC_NOW + timedelta(hours=3),
+        **kwargs,
+    }
+
+
+class DailyRoomPoolTestSuite(MentorshipTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+        for key in actions._pool_stats:
+            actions._pool_stats[key] = 0
+
+    """
+    🔽🔽🔽 claim_daily_room
+    """
+
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
+    @patch('django.utils.timezone.now', MagicMock(return_value=UTC_NOW))
+    def test_claim_daily_room__empty_pool(self):
+        from breathecode.mentorship.tasks import replenish_daily_rooms
+
+        self.assertEqual(claim_daily_room(DURATION), None)
+        self.assertEqual(replenish_daily_rooms.delay.call_args_list, [call(3600.0)])
+
+        stats = get_daily_room_pool_stats()
+        self.assertEqual((stats['claims'], stats['hits'], stats['misses']), (1, 0, 1))
+
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
+    @patch('django.utils.timezone.now', MagicMock(return_value=UTC_NOW))
+    def test_claim_daily_room__skip_the_rooms_that_cannot_be_used(self):
+        daily_rooms = [
+            # it expires before the end of the session
+            get_daily_room('kenny', expires_at=UTC_NOW + timedelta(minutes=30)),
+            get_daily_room('cartman', status='CLAIMED'),
+            get_daily_room('stan', duration=timedelta(minutes=30)),
+            get_daily_room('kyle'),
+        ]
+        self.bc.database.create(daily_room=daily_rooms)
+
+        room = claim_daily_room(DURATION)
+
+        self.assertEqual(room.name, 'kyle')
+        self.assertEqual([(x['name'], x['status']) for x in self.bc.database.list_of('mentorship.DailyRoom')],
+                         [('kenny', 'AVAILABLE'), ('cartman', 'CLAIMED'), ('stan', 'AVAILABLE'),
+                          ('kyle', 'CLAIMED')])
+
+        stats = get_daily_room_pool_stats()
+        self.assertEqual((stats['claims'], stats['hits'], stats['misses']), (1, 1, 0))
+        self.assertEqual(stats['depth'], {'0:30:00': 1, '1:00:00': 1})
+
+    """
+    🔽🔽🔽 replenish_daily_rooms
+    """
+
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('django.utils.timezone.now', MagicMock(return_value=UTC_NOW))
+    def test_replenish_daily_rooms__create_the_missing_rooms(self):
+        import requests
+
+        daily_rooms = [
+            get_daily_room('kenny', expires_at=UTC_NOW + timedelta(minutes=30)),
+            get_daily_room('kyle'),
+        ]
+        self.bc.database.create(daily_room=daily_rooms)
+
+        self.assertEqual(replenish_daily_rooms(DURATION, size=2), 1)
+
+        expires_at = UTC_NOW + DURATION + timedelta(seconds=actions.DAILY_ROOM_POOL_TTL)
+        self.assertEqual([(x['name'], x['status'], x['expires_at'])
+                          for x in self.bc.database.list_of('mentorship.DailyRoom')], [
+                              ('kyle', 'AVAILABLE', UTC_NOW + timedelta(hours=3)),
+                              ('asdasd', 'AVAILABLE', expires_at),
+                          ])
+
+        self.assertEqual(len(requests.Session.request.call_args_list), 1)
+        self.assertEqual(requests.Session.request.call_args_list[0][1]['json'],
+                         {'properties': {
+                             'exp': str(int(expires_at.timestamp()))
+                         }})
+
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    def test_replenish_daily_rooms__other_replenishment_is_running(self):
+        import requests
+
+        cache.set('DailyRoom__replenish__3600', True)
+
+        self.assertEqual(replenish_daily_rooms(DURATION, size=1), 0)
+        self.assertEqual(self.bc.database.list_of('mentorship.DailyRoom'), [])
+        self.assertEqual(requests.Session.request.call_args_list, [])
@@ -0,0 +1,177 @@
+"""
+Test the mentor bills
+"""
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from django.core.management import call_command
+from django.utils import timezone
+from ..mixins import MentorshipTestCase
+from ...models import MentorshipSession
+from ...actions import generate_mentor_bill, generate_mentor_bills
+
+UTC_NOW = timezone.now()
+
+
+def get_session(minutes, **kwargs):
+    return {
+        'status': 'COMPLETED',
+        'mentor_joined_at': UTC_NOW,
+        'started_at': UTC_NOW,
+        'ended_at': UTC_NOW + timedelta(minutes=minutes),
+        **kwargs,
+    }
+
+
+class GenerateMentorBillTestSuite(MentorshipTestCase):
+    """
+    🔽🔽🔽 generate_mentor_bill
+    """
+    def test_generate_mentor_bill__without_sessions(self):
+        model = self.bc.database.create(mentor_profile={'price_per_hour': 20})
+
+        bill = generate_mentor_bill(model.mentor_profile)
+
+        bills = self.bc.database.list_of('mentorship.MentorshipBill')
+        self.assertEqual(bills, [self.bc.format.to_dict(bill)])
+
+        fields = ['mentor_id', 'academy_id', 'status', 'total_duration_in_minutes', 'total_price']
+        self.assertEqual([tuple(x[field] for field in fields) for x in bills], [(1, 1, 'DUE', 0, 0)])
+
+    @patch('django.utils.timezone.now', MagicMock(return_value=UTC_NOW))
+    def test_generate_mentor_bill__with_sessions(self):
+        mentorship_sessions = [
+            get_session(30),
+            # the overtime is accounted
+            get_session(90),
+            # the service allows at most two hours
+            get_session(300),
+            # mentee never joined
+            get_session(0, started_at=None, ended_at=None, status='FAILED'),
+            # not billed
+            get_session(60, allow_billing=False),
+            get_session(60, status='PENDING'),
+        ]
+
+        model = self.bc.database.create(mentor_profile={'price_per_hour': 20},
+                                        mentorship_service={
+                                            'duration': timedelta(hours=1),
+                                            'max_duration': timedelta(hours=2),
+                                            'missed_meeting_duration': timedelta(minutes=10),
+                                        },
+                                        mentorship_session=mentorship_sessions)
+
+        # the bill, the sessions, and one bulk update and the bill in a transaction
+        with self.assertNumQueries(7):
+            bill = generate_mentor_bill(model.mentor_profile)
+
+        self.assertEqual(bill.total_duration_in_minutes, 30 + 90 + 120 + 10)
+        self.assertEqual(bill.total_duration_in_hours, 4.17)
+        self.assertEqual(bill.overtime_minutes, 30 + 60)
+        self.assertEqual(bill.total_price, 4.17 * 20)
+
+        sessions = self.bc.database.list_of('mentorship.MentorshipSession')
+        self.assertEqual([(x['bill_id'], x['accounted_duration']) for x in sessions], [
+            (1, timedelta(minutes=30)),
+            (1, timedelta(minutes=90)),
+            (1, timedelta(hours=2)),
+            (1, timedelta(minutes=10)),
+            (None, None),
+            (None, None),
+        ])
+
+        updated_at = MentorshipSession.objects.order_by('id').values_list('updated_at', flat=True)
+        self.assertEqual(list(updated_at[:4]), [UTC_NOW] * 4)
+        self.assertEqual(sessions[3]['status_message'],
+                         'Mentor joined but mentee never did, 10 min will be accounted for the bill.')
+
+    def test_generate_mentor_bill__keep_the_accounted_duration(self):
+        mentorship_session = get_session(30, accounted_duration=timedelta(minutes=45))
+        model = self.bc.database.create(mentor_profile={'price_per_hour': 20},
+                                        mentorship_session=mentorship_session)
+
+        bill = generate_mentor_bill(model.mentor_profile)
+        self.assertEqual(bill.total_duration_in_minutes, 45)
+
+        bill = generate_mentor_bill(model.mentor_profile, reset=True)
+        self.assertEqual(bill.total_duration_in_minutes, 30)
+
+        sessions = self.bc.database.list_of('mentorship.MentorshipSession')
+        self.assertEqual([(x['accounted_duration'], x['suggested_accounted_duration']) for x in sessions],
+                         [(timedelta(minutes=30), timedelta(minutes=30))])
+
+    """
+    🔽🔽🔽 generate_mentor_bills
+    """
+
+    def test_generate_mentor_bills(self):
+        mentorship_sessions = [get_session(30, mentor_id=1), get_session(60, mentor_id=2)]
+        mentor_profiles = [{'price_per_hour': 20}, {'price_per_hour': 40}]
+        mentorship_bill = {'mentor_id': 2, 'total_price': 100}
+        model = self.bc.database.create(mentor_profile=mentor_profiles,
+                                        mentorship_bill=mentorship_bill,
+                                        mentorship_session=mentorship_sessions)
+
+        # mentors, due bills and sessions, one bill created, and one transaction by bill
+        with self.assertNumQueries(12):
+            bills = generate_mentor_bills(model.academy)
+
+        self.assertEqual([(x.id, x.mentor_id, x.total_price) for x in bills], [(2, 1, 10.0), (1, 2, 40.0)])
+
+        sessions = self.bc.database.list_of('mentorship.MentorshipSession')
+        self.assertEqual([x['bill_id'] for x in sessions], [2, 1])
+
+    def test_generate_mentor_bills__other_academy(self):
+        model = self.bc.database.create(academy=2,
+                                        mentorship_service={'academy_id': 2},
+                                        mentor_profile={'price_per_hour': 20},
+                                        mentorship_session=get_session(30))
+
+        self.assertEqual(generate_mentor_bills(model.academy[0]), [])
+        self.assertEqual(self.bc.database.list_of('mentorship.MentorshipBill'), [])
+
+    """
+    🔽🔽🔽 generate_mentor_bills command
+    """
+
+    def test_generate_mentor_bills__command(self):
+        mentorship_services = [{'academy_id': 1}, {'academy_id': 2}]
+        mentor_profiles = [{'price_per_hour': 20, 'service_id': 1}, {'price_per_hour': 40, 'service_id': 2}]
+        mentorship_sessions = [get_session(30, mentor_id=1), get_session(60, mentor_id=2)]
+        self.bc.database.create(academy=2,
+                                mentorship_service=mentorship_services,
+                                mentor_profile=mentor_profiles,
+                                mentorship_session=mentorship_sessions)
+
+        call_command('generate_mentor_bills', stdout=MagicMock())
+
+        self.assertEqual([(x['academy_id'], x['mentor_id'], x['total_price'])
+                          for x in self.bc.database.list_of('mentorship.MentorshipBill')], [
+                              (1, 1, 10.0),
+                              (2, 2, 40.0),
+                          ])
+
+    def test_generate_mentor_bills__command__one_academy(self):
+        mentorship_services = [{'academy_id': 1}, {'academy_id': 2}]
+        mentor_profiles = [{'price_per_hour': 20, 'service_id': 1}, {'price_per_hour': 40, 'service_id': 2}]
+        mentorship_sessions = [get_session(30, mentor_id=1), get_session(60, mentor_id=2)]
+        self.bc.database.create(academy=2,
+                                mentorship_service=mentorship_services,
+                                mentor_profile=mentor_profiles,
+                                mentorship_session=mentorship_sessions)
+
+        call_command('generate_mentor_bills', academies=[2], stdout=MagicMock())
+
+        self.assertEqual([(x['academy_id'], x['mentor_id'], x['total_price'])
+                          for x in self.bc.database.list_of('mentorship.MentorshipBill')], [
+                              (2, 2, 40.0),
+                          ])
+
+    """
+    🔽🔽🔽 benchmark_mentor_bills
+    """
+
+    def test_benchmark_mentor_bills(self):
+        call_command('benchmark_mentor_bills', mentors=2, sessions=5, stdout=MagicMock())
+
+        self.assertEqual(self.bc.database.list_of('mentorship.MentorshipSession'), [])
+        self.assertEqual(self.bc.database.list_of('admissions.Academy'), [])
@@ -51,7 +51,8 @@ def format_mentorship_session_attrs(attrs={}):
 
 
 class GetOrCreateSessionTestSuite(MentorshipTestCase):
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     def test_create_session_mentor_first_no_previous_nothing(self):
@@ -83,7 +84,8 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
             }),
         ])
 
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     def test_create_session_mentor_first_previous_pending_without_mentee(self):
@@ -115,7 +117,8 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
             }),
         ])
 
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     def test_create_session_mentor_first_previous_pending_with_mentee(self):
@@ -147,7 +150,8 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
             }),
         ])
 
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     #TODO: without mentee or with mentee?
@@ -179,7 +183,8 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
             }),
         ])
 
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     def test_create_session_mentee_first_no_previous_nothing(self):
@@ -211,7 +216,8 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
             }),
         ])
 
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     def test_create_session_mentee_first_with_wihout_mentee(self):
@@ -240,7 +246,8 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
             }),
         ])
 
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     def test_create_session_mentee_first_with_another_mentee(self):
@@ -290,7 +297,8 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
             }),
         ])
 
-    @patch(REQUESTS_PATH['request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
     @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
     @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
     def test_create_session_mentee_first_with_another_same_mentee(self):
@@ -330,3 +338,55 @@ class GetOrCreateSessionTestSuite(MentorshipTestCase):
                 'ends_at': None,
             }),
         ])
+
+    """
+    🔽🔽🔽 Room from the pool
+    """
+
+    @patch(REQUESTS_PATH['session_request'], apply_requests_request_mock([(200, daily_url, daily_payload)]))
+    @patch('breathecode.mentorship.tasks.replenish_daily_rooms.delay', MagicMock())
+    @patch('breathecode.mentorship.signals.mentorship_session_status.send', MagicMock())
+    @patch('django.utils.timezone.now', MagicMock(return_value=ENDS_AT))
+    @patch('breathecode.mentorship.tasks.extend_daily_room.delay', MagicMock())
+    def test_create_session_mentor_first__with_a_room_in_the_pool(self):
+        """
+        When there is a room ready in the pool, the session takes it without requesting daily.co
+        """
+        import requests
+        from breathecode.mentorship.tasks import extend_daily_room, replenish_daily_rooms
+
+        daily_room = {
+            'name': 'kenny',
+            'url': 'https://4geeks.daily.com/kenny',
+            'duration': timedelta(seconds=3600),
+            'expires_at': ENDS_AT + timedelta(hours=3),
+        }
+        models = self.bc.database.create(mentor_profile=1, user=1, daily_room=daily_room)
+
+        mentor = models.mentor_profile
+        mentor_token, created = Token.get_or_create(mentor.user, token_type='permanent')
+
+        pending_sessions = get_pending_sessions_or_create(mentor_token, mentor, mentee=None)
+
+        self.bc.check.queryset_with_pks(pending_sessions, [1])
+        self.assertEqual(self.bc.database.list_of('mentorship.MentorshipSession'), [
+            format_mentorship_session_attrs({
+                'id': 1,
+                'status': 'PENDING',
+                'mentor_id': 1,
+                'mentee_id': None,
+                'is_online': True,
+                'name': 'kenny',
+                'online_meeting_url': 'https://4geeks.daily.com/kenny',
+                'ends_at': ENDS_AT + timedelta(seconds=3600),
+            }),
+        ])
+
+        claimed_room = self.bc.format.to_dict(models.daily_room)
+        claimed_room.update({'status': 'CLAIMED', 'claimed_at': ENDS_AT})
+        self.assertEqual(self.bc.database.list_of('mentorship.DailyRoom'), [claimed_room])
+
+        self.assertEqual(requests.Session.request.call_args_list, [])
+        self.assertEqual(replenish_daily_rooms.delay.call_args_list, [call(3600.0)])
+        self.assertEqual(extend_daily_room.delay.call_args_list,
+                         [call('kenny', exp_in_epoch=int((ENDS_AT + timedelta(seconds=3600)).timestamp()))])
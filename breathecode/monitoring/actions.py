@@ -1,15 +1,25 @@
-import logging, time, datetime, hashlib, requests, csv
+import logging, time, datetime, hashlib, requests, csv, functools, gzip, io
 from io import StringIO
 import json, re, os, subprocess, sys
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from django.utils import timezone
 from breathecode.utils import ScriptNotification
 from breathecode.admissions.models import Academy
 from .models import Endpoint, CSVDownload
+from .script_worker import SCRIPT_WORKERS, get_script_pool
 from breathecode.services.slack.actions.monitoring import render_snooze_text_endpoint, render_snooze_script
 
 logger = logging.getLogger(__name__)
 
 USER_AGENT = 'BreathecodeMonitoring/1.0'
+PROBE_TIMEOUT = float(os.getenv('MONITORING_PROBE_TIMEOUT', 5))
+PROBE_MAX_BYTES = int(os.getenv('MONITORING_PROBE_MAX_BYTES', 1024 * 1024))
+PROBE_MAX_WORKERS = int(os.getenv('MONITORING_PROBE_MAX_WORKERS', 10))
+PROBE_CHUNK_SIZE = 16 * 1024
+LATENCY_WINDOW = 100
+SCRIPT_CODE_CACHE = {}
+CSV_CHUNK_SIZE = 2000
 SCRIPT_HEADER = """
 # from django.conf import settings
 # import breathecode.settings as app_settings
@@ -60,10 +70,114 @@ def test_link(url, test_pattern=None):
     return result
 
 
-def get_website_text(endp):
-    """Make a request to get the content of the given URL."""
+def get_probe_session(pool_size: int = PROBE_MAX_WORKERS) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def probe_link(session, url, test_pattern=None, timeout=PROBE_TIMEOUT, max_bytes=PROBE_MAX_BYTES):
+    """
+    Same as test_link but it reuses the connections of the session, the body is read in chunks,
+    up to `max_bytes`, and the download stops as soon as `test_pattern` matches.
+    """
+
+    headers = {'User-Agent': USER_AGENT}
+
+    result = {
+        'url': url,
+        'status_code': 404,
+        'status_text': '',
+        'payload': None,
+        'latency': None,
+    }
+
+    start = time.perf_counter()
+
+    try:
+        pattern = re.compile(test_pattern.encode('utf-8')) if test_pattern else None
+        r = session.get(url, headers=headers, timeout=timeout, stream=True)
+
+        try:
+            length = 0
+            if 'content-length' in r.headers:
+                length = r.headers['content-length']
+            result['status_code'] = r.status_code
+
+            body = bytearray()
+            for chunk in r.iter_content(chunk_size=PROBE_CHUNK_SIZE):
+                body += chunk
+                if len(body) >= max_bytes:
+                    del body[max_bytes:]
+                    break
+
+                if pattern and r.status_code == 200 and pattern.search(body):
+                    break
+
+        finally:
+            r.close()
+
+        result['latency'] = (time.perf_counter() - start) * 1000
+
+        # if status is one error, we should need see the status text
+        result['payload'] = body.decode('utf-8', errors='replace')
+
+        if (test_pattern is None and not (result['status_code'] >= 200 and result['status_code'] <= 299)
+                and int(length) > 3000):
+            result['status_code'] = 400
+            result['status_text'] = ('Timeout: The payload of this request is too long '
+                                     '(more than 3 MB), remove the test_pattern to avoid timeout')
+
+    except requests.Timeout:
+        result['status_code'] = 500
+        result['status_text'] = 'Connection Timeout'
+    except requests.ConnectionError:
+        result['status_code'] = 404
+        result['status_text'] = f'Connection Error 404'
+
+    # the probes run together, one bad endpoint can't stop the others
+    except re.error as e:
+        result['status_code'] = 500
+        result['status_text'] = f'Invalid test_pattern: {str(e)}'
+    except requests.RequestException as e:
+        result['status_code'] = 500
+        result['status_text'] = f'Request Error: {str(e)}'
+    except Exception as e:
+        logger.exception(f'Error testing {url}')
+        result['status_code'] = 500
+        result['status_text'] = f'Unexpected Error: {str(e)}'
+
+    logger.debug(f'Tested {url} {result["status_text"]} with {result["status_code"]}')
+    return result
+
+
+def get_percentile(samples: list, percentile: int) -> float:
+    """Nearest-rank percentile"""
+
+    ordered = sorted(samples)
+    index = max(0, -(-len(ordered) * percentile // 100) - 1)
+    return ordered[index]
+
+
+def save_latency(endp, latency: float) -> None:
+    samples = (endp.latency_samples or []) + [round(latency, 2)]
+    samples = samples[-LATENCY_WINDOW:]
+
+    endp.latency = round(latency, 2)
+    endp.latency_samples = samples
+    endp.latency_p50 = get_percentile(samples, 50)
+    endp.latency_p95 = get_percentile(samples, 95)
+    endp.latency_p99 = get_percentile(samples, 99)
+
+
+def get_website_text(endp, res=None):
+    """Make a request to get the content of the given URL, `res` is the result of a previous probe."""
+
+    if res is None:
+        res = test_link(endp.url, endp.test_pattern)
 
-    res = test_link(endp.url, endp.test_pattern)
     status_code = res['status_code']
     status_text = res['status_text']
     payload = res['payload']
@@ -104,6 +218,15 @@ def get_website_text(endp):
     else:
         endp.response_text = None
 
+    if res.get('latency') is not None:
+        save_latency(endp, res['latency'])
+
+        if endp.status == 'OPERATIONAL' and endp.latency_threshold and endp.latency_p95 > endp.latency_threshold:
+            endp.status = 'MINOR'
+            endp.severity_level = 5
+            endp.status_text = (f'Status withing the 2xx range but the latency p95 ({endp.latency_p95}ms) is '
+                                f'above {endp.latency_threshold}ms')
+
     endp.status_code = status_code
     endp.save()
 
@@ -169,7 +292,6 @@ def run_app_diagnostic(app, report=False):
 
 def run_endpoint_diagnostic(endpoint_id):
     endpoint = Endpoint.objects.get(id=endpoint_id)
-    results = {'severity_level': 0, 'details': '', 'log': ''}
 
     logger.debug(f'Testing endpoint {endpoint.url}')
     now = timezone.now()
@@ -193,15 +315,21 @@ def run_endpoint_diagnostic(endpoint_id):
     endpoint.save()
 
     e = get_website_text(endpoint)
-    results['text'] = e.response_text
-    if e.status != 'OPERATIONAL':
-        if e.severity_level > results['severity_level']:
-            results['severity_level'] = e.severity_level
-        if e.special_status_text:
-            results['details'] += e.special_status_text
-        if e.status not in results:
-            results[e.status] = []
-        results[e.status].append(e.url)
+    return get_endpoint_results(e)
+
+
+def get_endpoint_results(endpoint):
+    results = {'severity_level': 0, 'details': '', 'log': ''}
+
+    results['text'] = endpoint.response_text
+    if endpoint.status != 'OPERATIONAL':
+        if endpoint.severity_level > results['severity_level']:
+            results['severity_level'] = endpoint.severity_level
+        if endpoint.special_status_text:
+            results['details'] += endpoint.special_status_text
+        if endpoint.status not in results:
+            results[endpoint.status] = []
+        results[endpoint.status].append(endpoint.url)
 
     if results['severity_level'] == 0:
         results['status'] = 'OPERATIONAL'
@@ -219,99 +347,210 @@ def run_endpoint_diagnostic(endpoint_id):
     return results
 
 
+def run_endpoints_diagnostic(endpoints, max_workers: int = PROBE_MAX_WORKERS) -> list:
+    """
+    Check many endpoints at once, the requests run in a bounded thread pool that shares one
+    keep-alive session, the database is only touched from the caller thread, it returns a list
+    of `(endpoint, results)` of the endpoints that were checked.
+    """
+
+    now = timezone.now()
+    pending = []
+
+    for endpoint in endpoints:
+        if endpoint.paused_until and endpoint.paused_until > now:
+            logger.debug(f'Ignoring endpoint:{endpoint.url} monitor because its paused')
+            continue
+
+        if (endpoint.last_check
+                and endpoint.last_check > now - timezone.timedelta(minutes=endpoint.frequency_in_minutes)):
+            logger.debug(f'Ignoring {endpoint.url} because frequency hast not been met')
+            endpoint.status_text = 'Ignored because its paused'
+            endpoint.save()
+            continue
+
+        pending.append(endpoint)
+
+    if not pending:
+        return []
+
+    Endpoint.objects.filter(id__in=[x.id for x in pending]).update(status='LOADING')
+
+    checked = []
+    session = get_probe_session(max_workers)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            probes = executor.map(lambda x: probe_link(session, x.url, x.test_pattern), pending)
+
+            for endpoint, res in zip(pending, probes):
+                e = get_website_text(endpoint, res)
+                checked.append((e, get_endpoint_results(e)))
+
+    finally:
+        session.close()
+
+    return checked
+
+
+def get_script_code(script_slug=None, script_body=None):
+    """
+    Compiled code of the script, the built-in scripts are compiled once for each version of the
+    file (its mtime) and the bodies once for each content.
+    """
+
+    if script_slug and script_slug != 'other':
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        path = f'{dir_path}/scripts/{script_slug}.py'
+
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+
+        cached = SCRIPT_CODE_CACHE.get(path)
+        if mtime is not None and cached and cached[0] == mtime:
+            return cached[1]
+
+        code = compile(SCRIPT_HEADER + open(path).read(), path, 'exec')
+        if mtime is not None:
+            SCRIPT_CODE_CACHE[path] = (mtime, code)
+
+        return code
+
+    return compile_script_body(script_body)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_script_body(script_body):
+    return compile(script_body, '<script_body>', 'exec')
+
+
+def get_script_exception_outcome(e: Exception) -> dict:
+    import traceback
+
+    return {
+        'script': {
+            'special_status_text': str(e)[:255],
+            'response_text': ''.join(traceback.format_exception(None, e, e.__traceback__)),
+            'status_code': 1,
+            'status': 'CRITICAL',
+        },
+        'results': {
+            'error_slug': 'unknown',
+            'btn': None,
+            'severity_level': 100,
+        },
+    }
+
+
+def execute_script(script_slug, script_body, academy) -> dict:
+    """
+    Run a script and return the fields that must be updated in the MonitorScript, the output of
+    `print` is captured for each execution instead of replacing `sys.stdout`, then many scripts
+    can run at the same time.
+    """
+
+    stdout = StringIO()
+
+    def script_print(*args, **kwargs):
+        kwargs.setdefault('file', stdout)
+        print(*args, **kwargs)
+
+    local = {'result': {'status': 'OPERATIONAL'}}
+    try:
+        code = get_script_code(script_slug, script_body)
+        exec(
+            code, {
+                'academy': academy,
+                'ADMIN_URL': os.getenv('ADMIN_URL', ''),
+                'API_URL': os.getenv('API_URL', ''),
+                'print': script_print,
+            }, local)
+
+        return {
+            'script': {
+                'status_code': 0,
+                'status': 'OPERATIONAL',
+                'special_status_text': 'OK',
+                'response_text': stdout.getvalue(),
+            },
+            'results': {
+                'severity_level': 5,
+            },
+        }
+
+    except ScriptNotification as e:
+        outcome = {'script': {'status_code': 1, 'response_text': str(e)}, 'results': {}}
+        if e.title is not None:
+            outcome['script']['special_status_text'] = e.title
+
+        if e.btn_url is not None:
+            outcome['results']['btn'] = {'url': e.btn_url, 'label': 'More details'}
+            if e.btn_label is not None:
+                outcome['results']['btn']['label'] = e.btn_label
+        else:
+            outcome['results']['btn'] = None
+
+        if e.status is not None:
+            outcome['script']['status'] = e.status
+            outcome['results']['severity_level'] = 5 if e.status != 'CRITICAL' else 100
+        else:
+            outcome['script']['status'] = 'MINOR'
+            outcome['results']['severity_level'] = 5
+        outcome['results']['error_slug'] = e.slug
+
+        return outcome
+
+    except Exception as e:
+        return get_script_exception_outcome(e)
+
+
 def run_script(script):
     results = {
         'severity_level': 0,
     }
 
-    from io import StringIO
-    import contextlib
+    if not (script.script_slug and script.script_slug != 'other') and not script.script_body:
+        raise Exception(f'Script not found or its body is empty: {script.script_slug}')
 
-    @contextlib.contextmanager
-    def stdoutIO(stdout=None):
-        old = sys.stdout
-        if stdout is None:
-            stdout = StringIO()
-        sys.stdout = stdout
-        yield stdout
-        sys.stdout = old
+    try:
+        if script.application is None:
+            raise Exception(f'Script {script.script_slug} does not belong to any application')
 
-    content = None
-    if script.script_slug and script.script_slug != 'other':
-        dir_path = os.path.dirname(os.path.realpath(__file__))
-        header = SCRIPT_HEADER
-        content = header + \
-            open(f'{dir_path}/scripts/{script.script_slug}.py').read()
+        academy = script.application.academy
 
-    elif script.script_body:
-        content = script.script_body
+        # run it in one of the Django initialized subprocesses with its own CPU and time limits
+        if SCRIPT_WORKERS:
+            outcome = get_script_pool().execute({
+                'script_slug': script.script_slug,
+                'script_body': script.script_body,
+                'academy_id': academy.id if academy else None,
+            })
 
-    else:
-        raise Exception(f'Script not found or its body is empty: {script.script_slug}')
+        else:
+            outcome = execute_script(script.script_slug, script.script_body, academy)
+
+    except Exception as e:
+        outcome = get_script_exception_outcome(e)
+
+    for key, value in outcome['script'].items():
+        setattr(script, key, value)
 
-    if content:
-        local = {'result': {'status': 'OPERATIONAL'}}
-        with stdoutIO() as s:
-            try:
-                if script.application is None:
-                    raise Exception(f'Script {script.script_slug} does not belong to any application')
-                exec(
-                    content, {
-                        'academy': script.application.academy,
-                        'ADMIN_URL': os.getenv('ADMIN_URL', ''),
-                        'API_URL': os.getenv('API_URL', ''),
-                    }, local)
-                script.status_code = 0
-                script.status = 'OPERATIONAL'
-                script.special_status_text = 'OK'
-                results['severity_level'] = 5
-                script.response_text = s.getvalue()
-
-            except ScriptNotification as e:
-                script.status_code = 1
-                script.response_text = str(e)
-                if e.title is not None:
-                    script.special_status_text = e.title
-
-                if e.btn_url is not None:
-                    results['btn'] = {'url': e.btn_url, 'label': 'More details'}
-                    if e.btn_label is not None:
-                        results['btn']['label'] = e.btn_label
-                else:
-                    results['btn'] = None
-
-                if e.status is not None:
-                    script.status = e.status
-                    results['severity_level'] = 5 if e.status != 'CRITICAL' else 100
-                else:
-                    script.status = 'MINOR'
-                    results['severity_level'] = 5
-                results['error_slug'] = e.slug
-
-            except Exception as e:
-                import traceback
-                script.special_status_text = str(e)[:255]
-                script.response_text = ''.join(traceback.format_exception(None, e, e.__traceback__))
-                script.status_code = 1
-                script.status = 'CRITICAL'
-                results['error_slug'] = 'unknown'
-                results['btn'] = None
-                results['severity_level'] = 100
-
-        script.last_run = timezone.now()
-        script.save()
-
-        results['status'] = script.status
-        results['text'] = script.response_text
-        results['title'] = script.special_status_text
-        results['slack_payload'] = render_snooze_script([script])  # converting to json to send to slack
-
-        return results
-
-    return content is not None and script.status_code == 0
-
-
-def download_csv(module, model_name, ids_to_download, academy_id=None):
+    results.update(outcome['results'])
+
+    script.last_run = timezone.now()
+    script.save()
+
+    results['status'] = script.status
+    results['text'] = script.response_text
+    results['title'] = script.special_status_text
+    results['slack_payload'] = render_snooze_script([script])  # converting to json to send to slack
+
+    return results
+
+
+def download_csv(module, model_name, ids_to_download, academy_id=None, compress=False):
 
     download = CSVDownload()
 
@@ -333,25 +572,49 @@ def download_csv(module, model_name, ids_to_download, academy_id=None):
 
         # finish the file name with <academy_slug>+<model_name>+<epoc_time>.csv
         download.name = model_name + str(int(time.time())) + '.csv'
+        download.total_rows = len(ids_to_download)
         download.save()
 
-        meta = model._meta
-        field_names = [field.name for field in meta.fields]
-        # rebuild query from the admin
-        queryset = model.objects.filter(pk__in=ids_to_download)
+        # the foreign keys are exported as their ids, that avoids instantiate the models, the header says
+        # it, like `academy_id`
+        attnames = [field.attname for field in model._meta.fields]
 
-        #write csv
-        buffer = StringIO()
-        writer = csv.writer(buffer)
-        writer.writerow(field_names)
-        for obj in queryset:
-            writer.writerow((getattr(obj, field) for field in field_names))
+        # rebuild query from the admin
+        rows = model.objects.filter(pk__in=ids_to_download).order_by('pk').values_list(*attnames)
 
-        # upload to google cloud bucket
+        # upload to google cloud bucket while the rows are being read
         from ..services.google_cloud import Storage
         storage = Storage()
         cloud_file = storage.file(os.getenv('DOWNLOADS_BUCKET', None), download.name)
-        cloud_file.upload(buffer.getvalue(), content_type='text/csv')
+        upload = cloud_file.stream_upload(content_type='text/csv',
+                                          content_encoding='gzip' if compress else None)
+
+        stream = gzip.GzipFile(fileobj=upload, mode='wb') if compress else upload
+        buffer = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+
+        try:
+            writer = csv.writer(buffer)
+            writer.writerow(attnames)
+
+            processed = 0
+            for row in rows.iterator(chunk_size=CSV_CHUNK_SIZE):
+                writer.writerow(row)
+                processed += 1
+
+                if processed % CSV_CHUNK_SIZE == 0:
+                    CSVDownload.objects.filter(id=download.id).update(processed_rows=processed)
+
+        except Exception:
+            # cancel the resumable upload, closing it would save a partial file in the bucket
+            upload.terminate()
+            raise
+
+        buffer.close()
+
+        # the gzip file doesn't close the file that it wraps
+        upload.close()
+
+        download.processed_rows = processed
         download.url = cloud_file.url()
         download.status = 'DONE'
         download.save()
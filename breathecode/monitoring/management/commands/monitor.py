@@ -5,7 +5,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import models as DM
 from django.db.models import Q, F
 from ...models import Application, MonitorScript
-from ...tasks import monitor_app, execute_scripts
+from ...tasks import monitor_app, monitor_apps, execute_scripts
 from ...actions import run_script
 
 
@@ -59,6 +59,11 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS(f'Enqueued {len(apps)} apps for diagnostic'))
 
+    def endpoints(self, options):
+        monitor_apps.delay()
+
+        self.stdout.write(self.style.SUCCESS('Enqueued all the endpoints for diagnostic'))
+
     def scripts(self, options):
         now = timezone.now()
         scripts = MonitorScript.objects\
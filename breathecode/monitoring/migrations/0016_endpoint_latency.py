@@ -0,0 +1,55 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0015_alter_csvdownload_academy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='endpoint',
+            name='latency',
+            field=models.FloatField(blank=True,
+                                    default=None,
+                                    editable=False,
+                                    help_text='Milliseconds of the last check',
+                                    null=True),
+        ),
+        migrations.AddField(
+            model_name='endpoint',
+            name='latency_p50',
+            field=models.FloatField(blank=True, default=None, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='endpoint',
+            name='latency_p95',
+            field=models.FloatField(blank=True, default=None, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='endpoint',
+            name='latency_p99',
+            field=models.FloatField(blank=True, default=None, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='endpoint',
+            name='latency_samples',
+            field=models.JSONField(blank=True,
+                                   default=list,
+                                   editable=False,
+                                   help_text='Milliseconds of the last checks, used to get the percentiles'),
+        ),
+        migrations.AddField(
+            model_name='endpoint',
+            name='latency_threshold',
+            field=models.FloatField(
+                blank=True,
+                default=None,
+                help_text=
+                'If the p95 latency goes above this value (in milliseconds) the endpoint will be marked as MINOR',
+                null=True),
+        ),
+    ]
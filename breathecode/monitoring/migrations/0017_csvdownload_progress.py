@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0016_endpoint_latency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='csvdownload',
+            name='processed_rows',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='csvdownload',
+            name='total_rows',
+            field=models.IntegerField(blank=True, default=None, null=True),
+        ),
+    ]
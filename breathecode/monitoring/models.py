@@ -69,6 +69,26 @@ class Endpoint(models.Model):
     response_text = models.TextField(default=None, null=True, blank=True)
     last_check = models.DateTimeField(default=None, null=True, blank=True)
 
+    latency = models.FloatField(default=None,
+                                null=True,
+                                blank=True,
+                                editable=False,
+                                help_text='Milliseconds of the last check')
+    latency_p50 = models.FloatField(default=None, null=True, blank=True, editable=False)
+    latency_p95 = models.FloatField(default=None, null=True, blank=True, editable=False)
+    latency_p99 = models.FloatField(default=None, null=True, blank=True, editable=False)
+    latency_samples = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        help_text='Milliseconds of the last checks, used to get the percentiles')
+    latency_threshold = models.FloatField(
+        default=None,
+        null=True,
+        blank=True,
+        help_text=
+        'If the p95 latency goes above this value (in milliseconds) the endpoint will be marked as MINOR')
+
     status = models.CharField(max_length=20, choices=STATUS, default=OPERATIONAL)
 
     application = models.ForeignKey(Application, on_delete=models.CASCADE)
@@ -144,6 +164,9 @@ class CSVDownload(models.Model):
     status = models.CharField(max_length=20, choices=DOWNLOAD_STATUS, default=LOADING)
     status_message = models.TextField(null=True, blank=True, default=None)
 
+    total_rows = models.IntegerField(null=True, blank=True, default=None)
+    processed_rows = models.IntegerField(default=0)
+
     academy = models.ForeignKey(Academy, on_delete=models.CASCADE, null=True, blank=True, default=None)
 
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
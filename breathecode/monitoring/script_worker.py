@@ -0,0 +1,195 @@
+"""
+Pool of Django initialized subprocesses that run the monitor scripts.
+
+Each worker reads one JSON request per line from its stdin and writes one JSON outcome per line
+to its stdout, a script that goes over its time or CPU limit is stopped inside the worker, and if
+the worker doesn't answer in time it's killed and replaced.
+"""
+import atexit, json, logging, os, queue, select, signal, subprocess, sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['ScriptWorker', 'ScriptWorkerPool', 'get_script_pool']
+
+SCRIPT_WORKERS = int(os.getenv('MONITORING_SCRIPT_WORKERS', 0))
+SCRIPT_TIMEOUT = int(os.getenv('MONITORING_SCRIPT_TIMEOUT', 60))
+SCRIPT_CPU_LIMIT = int(os.getenv('MONITORING_SCRIPT_CPU_LIMIT', 30))
+STARTUP_TIMEOUT = 60
+
+# the worker is killed if it doesn't answer after the time limit plus this
+GRACE_PERIOD = 5
+
+PROJECT_DIR = str(Path(__file__).resolve().parent.parent.parent)
+
+
+class ScriptLimitExceeded(Exception):
+    pass
+
+
+class ScriptWorker:
+    def __init__(self):
+        env = {
+            **os.environ,
+            'PYTHONPATH': os.pathsep.join([PROJECT_DIR, os.getenv('PYTHONPATH', '')]),
+        }
+
+        self.process = subprocess.Popen([sys.executable, '-m', 'breathecode.monitoring.script_worker'],
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        env=env,
+                                        cwd=PROJECT_DIR,
+                                        text=True,
+                                        bufsize=1)
+
+        # wait until Django was initialized
+        self.__read__(STARTUP_TIMEOUT)
+
+    def __read__(self, timeout: float) -> dict:
+        ready, _, _ = select.select([self.process.stdout], [], [], timeout)
+        if not ready:
+            raise ScriptLimitExceeded('The script exceeded its time limit')
+
+        line = self.process.stdout.readline()
+        if not line:
+            raise Exception('The script worker was stopped')
+
+        return json.loads(line)
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def execute(self, payload: dict, timeout: float) -> dict:
+        self.process.stdin.write(json.dumps(payload) + '\n')
+        self.process.stdin.flush()
+
+        return self.__read__(timeout)
+
+    def kill(self):
+        if self.is_alive():
+            self.process.kill()
+
+        self.process.wait()
+
+
+class ScriptWorkerPool:
+    def __init__(self, size: int, timeout: int = SCRIPT_TIMEOUT, cpu_limit: int = SCRIPT_CPU_LIMIT):
+        self.timeout = timeout
+        self.cpu_limit = cpu_limit
+        self.workers = []
+        self.idle = queue.Queue()
+
+        for _ in range(size):
+            worker = ScriptWorker()
+            self.workers.append(worker)
+            self.idle.put(worker)
+
+    def execute(self, payload: dict) -> dict:
+        payload = {**payload, 'timeout': self.timeout, 'cpu_limit': self.cpu_limit}
+        worker = self.idle.get()
+
+        try:
+            if not worker.is_alive():
+                worker = self.__replace__(worker)
+
+            return worker.execute(payload, self.timeout + GRACE_PERIOD)
+
+        except Exception:
+            worker = self.__replace__(worker)
+            raise
+
+        finally:
+            self.idle.put(worker)
+
+    def __replace__(self, worker: ScriptWorker) -> ScriptWorker:
+        worker.kill()
+        if worker in self.workers:
+            self.workers.remove(worker)
+
+        worker = ScriptWorker()
+        self.workers.append(worker)
+        return worker
+
+    def close(self):
+        for worker in self.workers:
+            worker.kill()
+
+        self.workers = []
+
+
+pool = None
+
+
+def get_script_pool() -> ScriptWorkerPool:
+    global pool
+
+    if pool is None:
+        pool = ScriptWorkerPool(max(SCRIPT_WORKERS, 1))
+        atexit.register(pool.close)
+
+    return pool
+
+
+def raise_limit_exceeded(signum, frame):
+    if signum == signal.SIGXCPU:
+        raise ScriptLimitExceeded('The script exceeded its CPU limit')
+
+    raise ScriptLimitExceeded('The script exceeded its time limit')
+
+
+def execute_with_limits(payload: dict) -> dict:
+    import resource
+    from django.db import close_old_connections
+    from breathecode.admissions.models import Academy
+    from .actions import execute_script
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    limit = int(usage.ru_utime + usage.ru_stime + payload['cpu_limit']) + 1
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    signal.setitimer(signal.ITIMER_REAL, payload['timeout'])
+
+    try:
+        academy = Academy.objects.filter(id=payload['academy_id']).first() if payload['academy_id'] else None
+        return execute_script(payload['script_slug'], payload['script_body'], academy)
+
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        close_old_connections()
+
+
+def main():
+    # the stdout is reserved to the outcomes
+    output = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    sys.stdout = sys.stderr
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'breathecode.settings')
+
+    import django
+    django.setup()
+
+    signal.signal(signal.SIGALRM, raise_limit_exceeded)
+    signal.signal(signal.SIGXCPU, raise_limit_exceeded)
+
+    output.write(json.dumps({'ready': True}) + '\n')
+    output.flush()
+
+    from .actions import get_script_exception_outcome
+
+    for line in sys.stdin:
+        try:
+            outcome = execute_with_limits(json.loads(line))
+
+        except Exception as e:
+            outcome = get_script_exception_outcome(e)
+
+        output.write(json.dumps(outcome) + '\n')
+        output.flush()
+
+
+if __name__ == '__main__':
+    main()
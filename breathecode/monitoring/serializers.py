@@ -13,3 +13,5 @@ class CSVDownloadSmallSerializer(serpy.Serializer):
     name = serpy.Field()
     url = serpy.Field()
     status = serpy.Field()
+    total_rows = serpy.Field()
+    processed_rows = serpy.Field()
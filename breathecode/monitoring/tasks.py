@@ -1,6 +1,7 @@
 from django.utils import timezone
 from celery import shared_task, Task
-from .actions import run_app_diagnostic, run_script, run_endpoint_diagnostic, download_csv
+from .actions import (run_app_diagnostic, run_script, run_endpoint_diagnostic, run_endpoints_diagnostic,
+                      download_csv)
 from .models import Application, MonitorScript, Endpoint, CSVDownload
 from breathecode.notify.actions import send_email_message, send_slack_raw
 import logging
@@ -16,6 +17,25 @@ class BaseTaskWithRetry(Task):
     retry_backoff = True
 
 
+def notify_endpoint_errors(endpoint, result):
+    if endpoint.application.notify_email:
+        send_email_message(
+            'diagnostic', endpoint.application.notify_email, {
+                'subject': f'Errors found on app {endpoint.application.title} endpoint {endpoint.url}',
+                'details': result['details']
+            })
+
+    if (endpoint.application.notify_slack_channel and endpoint.application.academy
+            and hasattr(endpoint.application.academy, 'slackteam')
+            and hasattr(endpoint.application.academy.slackteam.owner, 'credentialsslack')):
+        send_slack_raw(
+            'diagnostic', endpoint.application.academy.slackteam.owner.credentialsslack.token,
+            endpoint.application.notify_slack_channel.slack_id, {
+                'subject': f'Errors found on app {endpoint.application.title} endpoint {endpoint.url}',
+                **result,
+            })
+
+
 @shared_task(bind=True, base=BaseTaskWithRetry)
 def test_endpoint(self, endpoint_id):
     logger.debug('Starting monitor_app')
@@ -33,30 +53,25 @@ def test_endpoint(self, endpoint_id):
         return False
 
     if result['status'] != 'OPERATIONAL':
-        if endpoint.application.notify_email:
-            send_email_message(
-                'diagnostic', endpoint.application.notify_email, {
-                    'subject': f'Errors found on app {endpoint.application.title} endpoint {endpoint.url}',
-                    'details': result['details']
-                })
-
-        if (endpoint.application.notify_slack_channel and endpoint.application.academy
-                and hasattr(endpoint.application.academy, 'slackteam')
-                and hasattr(endpoint.application.academy.slackteam.owner, 'credentialsslack')):
-            send_slack_raw(
-                'diagnostic', endpoint.application.academy.slackteam.owner.credentialsslack.token,
-                endpoint.application.notify_slack_channel.slack_id, {
-                    'subject': f'Errors found on app {endpoint.application.title} endpoint {endpoint.url}',
-                    **result,
-                })
+        notify_endpoint_errors(endpoint, result)
 
 
 @shared_task(bind=True, base=BaseTaskWithRetry)
 def monitor_app(self, app_id):
     logger.debug('Starting monitor_app')
-    endpoints = Endpoint.objects.filter(application__id=app_id).values_list('id', flat=True)
-    for endpoint_id in endpoints:
-        test_endpoint.delay(endpoint_id)
+    endpoints = Endpoint.objects.filter(application__id=app_id).select_related('application')
+    for endpoint, result in run_endpoints_diagnostic(endpoints):
+        if result['status'] != 'OPERATIONAL':
+            notify_endpoint_errors(endpoint, result)
+
+
+@shared_task(bind=True, base=BaseTaskWithRetry)
+def monitor_apps(self):
+    logger.debug('Starting monitor_apps')
+    endpoints = Endpoint.objects.all().select_related('application')
+    for endpoint, result in run_endpoints_diagnostic(endpoints):
+        if result['status'] != 'OPERATIONAL':
+            notify_endpoint_errors(endpoint, result)
 
 
 @shared_task(bind=True, base=BaseTaskWithRetry)
@@ -111,6 +126,6 @@ def execute_scripts(self, script_id):
 
 
 @shared_task(bind=True, base=BaseTaskWithRetry)
-def async_download_csv(self, module, model_name, ids_to_download):
+def async_download_csv(self, module, model_name, ids_to_download, compress=False):
     logger.debug('Starting to download csv for ')
-    return download_csv(module, model_name, ids_to_download)
+    return download_csv(module, model_name, ids_to_download, compress=compress)
@@ -0,0 +1,113 @@
+"""
+Test download_csv
+"""
+import gzip, os
+from io import BytesIO
+from unittest.mock import MagicMock, patch, call
+from ..mixins import MonitoringTestCase
+from ...actions import download_csv
+
+
+class UploadMock(BytesIO):
+    content = None
+    terminated = False
+
+    def close(self):
+        if not self.closed:
+            UploadMock.content = self.getvalue()
+
+        super().close()
+
+    def terminate(self):
+        UploadMock.terminated = True
+        super().close()
+
+
+def storage_mock():
+    cloud_file = MagicMock()
+    cloud_file.stream_upload.side_effect = lambda **kwargs: UploadMock()
+    cloud_file.url.return_value = 'https://storage.potato.io/Academy.csv'
+
+    storage = MagicMock()
+    storage.return_value.file.return_value = cloud_file
+    return storage
+
+
+class DownloadCSVTestSuite(MonitoringTestCase):
+    """
+    🔽🔽🔽 without DOWNLOADS_BUCKET
+    """
+    @patch.dict(os.environ, {'DOWNLOADS_BUCKET': ''})
+    def test_download_csv__without_bucket(self):
+        del os.environ['DOWNLOADS_BUCKET']
+
+        self.assertEqual(download_csv('breathecode.admissions.models', 'Academy', []), False)
+        self.assertEqual([(x['status'], x['status_message'])
+                          for x in self.bc.database.list_of('monitoring.CSVDownload')], [
+                              ('ERROR', 'Uknown DOWNLOADS_BUCKET configuration, please set env variable'),
+                          ])
+
+    """
+    🔽🔽🔽 with rows
+    """
+
+    @patch.dict(os.environ, {'DOWNLOADS_BUCKET': 'potato'})
+    @patch('breathecode.services.google_cloud.Storage', storage_mock())
+    def test_download_csv__with_rows(self):
+        model = self.generate_models(academy=2)
+        ids = [x.id for x in model.academy]
+
+        self.assertEqual(download_csv('breathecode.admissions.models', 'Academy', ids), True)
+
+        lines = UploadMock.content.decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith('id,slug,name,'))
+        self.assertIn(',city_id,country_id,', lines[0])
+        self.assertTrue(lines[1].startswith(f'{ids[0]},{model.academy[0].slug},'))
+
+        self.assertEqual([(x['status'], x['total_rows'], x['processed_rows'], x['url'])
+                          for x in self.bc.database.list_of('monitoring.CSVDownload')], [
+                              ('DONE', 2, 2, 'https://storage.potato.io/Academy.csv'),
+                          ])
+
+    @patch.dict(os.environ, {'DOWNLOADS_BUCKET': 'potato'})
+    @patch('breathecode.services.google_cloud.Storage', storage_mock())
+    def test_download_csv__with_rows__compressed(self):
+        from breathecode.services.google_cloud import Storage
+
+        model = self.generate_models(academy=2)
+        ids = [x.id for x in model.academy]
+
+        self.assertEqual(download_csv('breathecode.admissions.models', 'Academy', ids, compress=True), True)
+
+        lines = gzip.decompress(UploadMock.content).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 3)
+
+        cloud_file = Storage.return_value.file.return_value
+        self.assertEqual(cloud_file.stream_upload.call_args_list,
+                         [call(content_type='text/csv', content_encoding='gzip')])
+
+    """
+    🔽🔽🔽 with errors
+    """
+
+    @patch.dict(os.environ, {'DOWNLOADS_BUCKET': 'potato'})
+    @patch('breathecode.services.google_cloud.Storage', storage_mock())
+    def test_download_csv__the_rows_raise(self):
+        model = self.generate_models(academy=2)
+        ids = [x.id for x in model.academy]
+
+        UploadMock.content = None
+        UploadMock.terminated = False
+
+        writer = MagicMock()
+        writer.writerow.side_effect = [None, Exception('Database is gone')]
+
+        with patch('csv.writer', MagicMock(return_value=writer)):
+            self.assertEqual(download_csv('breathecode.admissions.models', 'Academy', ids), False)
+
+        self.assertEqual((UploadMock.content, UploadMock.terminated), (None, True))
+        self.assertEqual([(x['status'], x['status_message'], x['url'])
+                          for x in self.bc.database.list_of('monitoring.CSVDownload')], [
+                              ('ERROR', 'Database is gone', ''),
+                          ])
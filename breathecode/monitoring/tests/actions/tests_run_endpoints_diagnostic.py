@@ -0,0 +1,168 @@
+"""
+Test run_endpoints_diagnostic
+"""
+import requests
+from unittest.mock import MagicMock, patch
+from breathecode.tests.mocks import apply_requests_get_mock
+from ..mixins import MonitoringTestCase
+from ...actions import run_endpoints_diagnostic, probe_link, get_percentile
+
+
+def session_get_mock(endpoints, broken_url):
+    """`requests.Session.get` that fails for `broken_url` like a request without schema"""
+
+    get_mock = apply_requests_get_mock(endpoints)
+
+    def side_effect(url, *args, **kwargs):
+        if url == broken_url:
+            raise requests.exceptions.MissingSchema(f'Invalid URL {url!r}: No schema supplied')
+
+        return get_mock(url, *args, **kwargs)
+
+    return MagicMock(side_effect=side_effect)
+
+
+class StreamResponseMock():
+    status_code = 200
+    headers = {'content-type': 'text/html'}
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = 0
+
+    def iter_content(self, chunk_size=1):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self):
+        pass
+
+
+class RunEndpointsDiagnosticTestSuite(MonitoringTestCase):
+    """
+    🔽🔽🔽 probe_link
+    """
+    def test_probe_link__stop_when_the_pattern_match(self):
+        response = StreamResponseMock([b'<html>', b'<h1>ok</h1>', b'<p>a lot of html</p>', b'</html>'])
+        session = MagicMock()
+        session.get.return_value = response
+
+        result = probe_link(session, 'https://potato.io', test_pattern='<h1>ok</h1>')
+
+        self.assertEqual(response.read, 2)
+        self.assertEqual(result['status_code'], 200)
+        self.assertEqual(result['payload'], '<html><h1>ok</h1>')
+        self.assertTrue(isinstance(result['latency'], float))
+
+    def test_probe_link__stop_when_the_body_is_too_big(self):
+        response = StreamResponseMock([b'12345', b'67890', b'12345'])
+        session = MagicMock()
+        session.get.return_value = response
+
+        result = probe_link(session, 'https://potato.io', max_bytes=7)
+
+        self.assertEqual(response.read, 2)
+        self.assertEqual(result['payload'], '1234567')
+
+    def test_probe_link__bad_test_pattern(self):
+        session = MagicMock()
+
+        result = probe_link(session, 'https://potato.io', test_pattern='[potato')
+
+        self.assertEqual(session.get.call_args_list, [])
+        self.assertEqual(result['status_code'], 500)
+        self.assertTrue(result['status_text'].startswith('Invalid test_pattern: '))
+
+    """
+    🔽🔽🔽 get_percentile
+    """
+
+    def test_get_percentile(self):
+        samples = list(range(1, 101))
+
+        self.assertEqual(get_percentile(samples, 50), 50)
+        self.assertEqual(get_percentile(samples, 95), 95)
+        self.assertEqual(get_percentile(samples, 99), 99)
+        self.assertEqual(get_percentile([7], 99), 7)
+
+    """
+    🔽🔽🔽 run_endpoints_diagnostic
+    """
+
+    @patch('requests.Session.get',
+           apply_requests_get_mock([(200, 'https://potato.io', 'ok'), (500, 'https://tomato.io', 'error')]))
+    def test_run_endpoints_diagnostic__many_endpoints(self):
+        base = self.generate_models(application=True)
+        models = [
+            self.generate_models(endpoint=True, endpoint_kwargs={'url': url}, models=base)
+            for url in ['https://potato.io', 'https://tomato.io']
+        ]
+
+        result = run_endpoints_diagnostic([x.endpoint for x in models])
+
+        self.assertEqual([(x.url, y['status']) for x, y in result], [
+            ('https://potato.io', 'OPERATIONAL'),
+            ('https://tomato.io', 'CRITICAL'),
+        ])
+        self.assertEqual([(x['status'], x['status_code']) for x in self.all_endpoint_dict()], [
+            ('OPERATIONAL', 200),
+            ('CRITICAL', 500),
+        ])
+
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', 'ok')]))
+    def test_run_endpoints_diagnostic__latency_above_the_threshold(self):
+        endpoint_kwargs = {
+            'url': 'https://potato.io',
+            'latency_samples': [900.0] * 20,
+            'latency_threshold': 500,
+        }
+        model = self.generate_models(application=True, endpoint=True, endpoint_kwargs=endpoint_kwargs)
+
+        result = run_endpoints_diagnostic([model.endpoint])
+
+        self.assertEqual(result[0][1]['status'], 'MINOR')
+
+        endpoint = self.all_endpoint_dict()[0]
+        self.assertEqual(len(endpoint['latency_samples']), 21)
+        self.assertEqual(endpoint['latency_p95'], 900.0)
+        self.assertEqual(endpoint['status'], 'MINOR')
+        self.assertEqual(endpoint['status_text'],
+                         'Status withing the 2xx range but the latency p95 (900.0ms) is above 500.0ms')
+
+    @patch('requests.Session.get',
+           session_get_mock([(200, 'https://potato.io', 'ok'), (200, 'https://tomato.io', 'ok')],
+                            broken_url='potato.io'))
+    def test_run_endpoints_diagnostic__one_endpoint_raise(self):
+        base = self.generate_models(application=True)
+        endpoints = [
+            {
+                'url': 'https://potato.io'
+            },
+            {
+                'url': 'potato.io'
+            },
+            {
+                'url': 'https://tomato.io',
+                'test_pattern': '[tomato'
+            },
+            {
+                'url': 'https://tomato.io'
+            },
+        ]
+        models = [self.generate_models(endpoint=True, endpoint_kwargs=x, models=base) for x in endpoints]
+
+        result = run_endpoints_diagnostic([x.endpoint for x in models])
+
+        self.assertEqual([(x.url, y['status']) for x, y in result], [
+            ('https://potato.io', 'OPERATIONAL'),
+            ('potato.io', 'CRITICAL'),
+            ('https://tomato.io', 'CRITICAL'),
+            ('https://tomato.io', 'OPERATIONAL'),
+        ])
+        self.assertEqual([(x['status'], x['status_code']) for x in self.all_endpoint_dict()], [
+            ('OPERATIONAL', 200),
+            ('CRITICAL', 500),
+            ('CRITICAL', 500),
+            ('OPERATIONAL', 200),
+        ])
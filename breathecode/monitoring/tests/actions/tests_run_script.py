@@ -0,0 +1,100 @@
+"""
+Test run_script
+"""
+import sys
+from unittest.mock import patch
+from ..mixins import MonitoringTestCase
+from ...actions import get_script_code, execute_script, run_script, SCRIPT_CODE_CACHE
+from ...script_worker import ScriptWorkerPool
+
+
+class RunScriptTestSuite(MonitoringTestCase):
+    """
+    🔽🔽🔽 get_script_code
+    """
+    def test_get_script_code__compiled_once(self):
+        SCRIPT_CODE_CACHE.clear()
+
+        code1 = get_script_code('alert_pending_leads')
+        code2 = get_script_code('alert_pending_leads')
+
+        self.assertTrue(code1 is code2)
+
+    def test_get_script_code__compiled_again_if_the_file_changes(self):
+        SCRIPT_CODE_CACHE.clear()
+
+        with patch('os.path.getmtime', lambda x: 1):
+            code1 = get_script_code('alert_pending_leads')
+
+        with patch('os.path.getmtime', lambda x: 2):
+            code2 = get_script_code('alert_pending_leads')
+
+        self.assertFalse(code1 is code2)
+
+    """
+    🔽🔽🔽 execute_script
+    """
+
+    def test_execute_script__capture_the_output_without_replace_the_stdout(self):
+        script_body = 'import sys\nprint(id(sys.stdout))'
+
+        outcome = execute_script(None, script_body, None)
+
+        self.assertEqual(outcome['script']['status'], 'OPERATIONAL')
+        self.assertEqual(outcome['script']['response_text'], f'{id(sys.stdout)}\n')
+
+    def test_execute_script__syntax_error(self):
+        outcome = execute_script(None, 'print(', None)
+
+        self.assertEqual(outcome['script']['status'], 'CRITICAL')
+        self.assertEqual(outcome['results']['severity_level'], 100)
+
+    """
+    🔽🔽🔽 ScriptWorkerPool
+    """
+
+    def test_script_worker_pool(self):
+        pool = ScriptWorkerPool(1, timeout=1, cpu_limit=1)
+
+        try:
+            outcome = pool.execute({'script_slug': None, 'script_body': 'print("ok")', 'academy_id': None})
+            self.assertEqual(outcome['script']['response_text'], 'ok\n')
+
+            script_body = 'import time\ntime.sleep(3)'
+            outcome = pool.execute({'script_slug': None, 'script_body': script_body, 'academy_id': None})
+            self.assertEqual(outcome['script']['status'], 'CRITICAL')
+            self.assertEqual(outcome['script']['special_status_text'], 'The script exceeded its time limit')
+
+            outcome = pool.execute({'script_slug': None, 'script_body': 'print("ok")', 'academy_id': None})
+            self.assertEqual(outcome['script']['response_text'], 'ok\n')
+
+        finally:
+            pool.close()
+
+    """
+    🔽🔽🔽 run_script with a subprocess pool
+    """
+
+    def test_run_script__in_a_subprocess(self):
+        class PoolMock:
+            def execute(self, payload):
+                self.payload = payload
+                return {'script': {'status': 'MINOR', 'status_code': 1, 'response_text': 'x'}, 'results': {}}
+
+        pool = PoolMock()
+        model = self.generate_models(monitor_script=True,
+                                     monitor_script_kwargs={'script_body': 'print("ok")'})
+
+        with patch('breathecode.monitoring.actions.SCRIPT_WORKERS', 1), \
+                patch('breathecode.monitoring.actions.get_script_pool', lambda: pool):
+            result = run_script(model.monitor_script)
+
+        self.assertEqual(
+            pool.payload, {
+                'script_slug': model.monitor_script.script_slug,
+                'script_body': 'print("ok")',
+                'academy_id': model.academy.id,
+            })
+        self.assertEqual((result['status'], result['text']), ('MINOR', 'x'))
+        self.assertEqual([(x['status'], x['status_code']) for x in self.all_monitor_script_dict()],
+                         [('MINOR', 1)])
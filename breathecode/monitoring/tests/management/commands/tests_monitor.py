@@ -11,6 +11,21 @@ from ...mixins import MonitoringTestCase
 from ....management.commands.monitor import Command
 
 
+def clean_latency(endpoint):
+    """The latency changes in each execution, then it just check that it was saved"""
+    assert isinstance(endpoint['latency'], float)
+    assert endpoint['latency_samples'] == [endpoint['latency']]
+    assert endpoint['latency_p50'] == endpoint['latency']
+
+    return {
+        'latency': None,
+        'latency_p50': None,
+        'latency_p95': None,
+        'latency_p99': None,
+        'latency_samples': [],
+    }
+
+
 class AcademyCohortTestSuite(MonitoringTestCase):
     """
     🔽🔽🔽 With bad entity 🔽🔽🔽
@@ -20,7 +35,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_without_entity(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -49,7 +64,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_with_bad_entity(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -82,7 +97,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_without_application(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -101,7 +116,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         self.assertEqual(self.all_endpoint_dict(), [])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
         mock_breathecode.call_args_list = []
 
         self.assertEqual(mock_mailgun.call_args_list, [])
@@ -113,7 +128,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_without_endpoints(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -135,7 +150,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         self.assertEqual(self.all_endpoint_dict(), [])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
         mock_breathecode.call_args_list = []
 
         self.assertEqual(mock_mailgun.call_args_list, [])
@@ -147,7 +162,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_with_bad_endpoint_paused_until(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -181,7 +196,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
                          }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
         mock_breathecode.call_args_list = []
 
         self.assertEqual(mock_mailgun.call_args_list, [])
@@ -193,7 +208,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_with_endpoint_paused_until(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -219,7 +234,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -230,7 +246,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
         mock_breathecode.call_args_list = []
 
         self.assertEqual(mock_mailgun.call_args_list, [])
@@ -242,7 +258,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_with_bad_application_paused_until(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -275,7 +291,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
                          }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
@@ -286,7 +302,7 @@ class AcademyCohortTestSuite(MonitoringTestCase):
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(100, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(100, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_100(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -309,7 +325,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -325,18 +342,21 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         self.assertEqual(mock_slack.call_args_list, [])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_200(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -359,7 +379,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -370,20 +391,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', 'is not ok')]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', 'is not ok')]))
     def tests_monitor_with_entity_apps_status_200_with_bad_regex(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -406,7 +430,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -418,20 +443,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(200, 'https://potato.io', 'ok')]))
+    @patch('requests.Session.get', apply_requests_get_mock([(200, 'https://potato.io', 'ok')]))
     def tests_monitor_with_entity_apps_status_200_with_regex(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -454,7 +482,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -464,20 +493,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(300, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(300, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_300(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -500,7 +532,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -513,20 +546,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(400, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(400, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_400(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -549,7 +585,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -562,20 +599,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(404, 'https://potato.io', 'ok')]))
+    @patch('requests.Session.get', apply_requests_get_mock([(404, 'https://potato.io', 'ok')]))
     def tests_monitor_with_entity_apps_status_404_with_regex(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -598,7 +638,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -611,20 +652,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(500, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(500, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_500(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -647,7 +691,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -660,20 +705,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(500, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(500, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_500_with_email(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -701,7 +749,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -714,20 +763,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(len(mock_mailgun.call_args_list), 1)
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(500, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(500, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_500_with_notify_slack_channel_without_slack_team(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -757,7 +809,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -770,20 +823,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(500, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(500, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_500_with_notify_slack_channel_without_slack_models(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -811,7 +867,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -824,20 +881,23 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(mock_slack.call_args_list, [])
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
     @patch(GOOGLE_CLOUD_PATH['bucket'], apply_google_cloud_bucket_mock())
     @patch(GOOGLE_CLOUD_PATH['blob'], apply_google_cloud_blob_mock())
     @patch(MAILGUN_PATH['post'], apply_mailgun_requests_post_mock())
     @patch(SLACK_PATH['request'], apply_slack_requests_request_mock())
-    @patch(REQUESTS_PATH['get'], apply_requests_get_mock([(500, 'https://potato.io', {})]))
+    @patch('requests.Session.get', apply_requests_get_mock([(500, 'https://potato.io', {})]))
     def tests_monitor_with_entity_apps_status_500_with_notify_slack_channel_with_slack_models(self):
         mock_mailgun = MAILGUN_INSTANCES['post']
         mock_mailgun.call_args_list = []
@@ -867,7 +927,8 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         endpoints = [{
-            **endpoint, 'last_check': None
+            **endpoint, 'last_check': None,
+            **clean_latency(endpoint)
         } for endpoint in self.all_endpoint_dict() if self.assertDatetime(endpoint['last_check'])]
         self.assertEqual(endpoints, [{
             **self.model_to_dict(model, 'endpoint'),
@@ -880,13 +941,16 @@ class AcademyCohortTestSuite(MonitoringTestCase):
         }])
 
         import requests
-        mock_breathecode = requests.get
+        mock_breathecode = requests.Session.get
 
         self.assertEqual(mock_mailgun.call_args_list, [])
         self.assertEqual(len(mock_slack.call_args_list), 1)
-        self.assertEqual(
-            mock_breathecode.call_args_list,
-            [call('https://potato.io', headers={'User-Agent': 'BreathecodeMonitoring/1.0'}, timeout=2)])
+        self.assertEqual(mock_breathecode.call_args_list, [
+            call('https://potato.io',
+                 headers={'User-Agent': 'BreathecodeMonitoring/1.0'},
+                 timeout=5,
+                 stream=True)
+        ])
 
     """
     🔽🔽🔽 Scripts entity 🔽🔽🔽
@@ -1,4 +1,6 @@
-import logging, json, os, re
+import base64, logging, json, os, re, time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from breathecode.utils.validation_exception import ValidationException
 from django.db.models import Q
 from django.contrib.auth.models import User
@@ -10,6 +12,8 @@ from breathecode.utils import APIException
 from breathecode.assessment.models import Assessment
 from breathecode.assessment.actions import create_from_json
 from breathecode.authenticate.models import CredentialsGithub
+from breathecode.services.github import GithubClient, get_session
+from .caches import GithubSyncCache
 from .models import Asset, AssetTechnology, AssetAlias, AssetErrorLog
 from .serializers import AssetBigSerializer
 from .utils import LessonValidator, ExerciseValidator, QuizValidator, AssetException, ProjectValidator
@@ -17,6 +21,10 @@ from github import Github, GithubException
 
 logger = logging.getLogger(__name__)
 
+GITHUB_SYNC_MAX_WORKERS = int(os.getenv('GITHUB_SYNC_MAX_WORKERS', 4))
+GITHUB_RATE_LIMIT_RESERVE = int(os.getenv('GITHUB_RATE_LIMIT_RESERVE', 100))
+LEARNPACK_CONFIG_FILES = ['learn.json', '.learn/learn.json', 'bc.json', '.learn/bc.json']
+
 
 def generate_external_readme(a):
 
@@ -25,10 +33,39 @@ def generate_external_readme(a):
 
     readme = get_template('external.md')
     a.set_readme(readme.render(AssetBigSerializer(a).data))
+    pre_render_asset_readme(a)
     a.save()
     return True
 
 
+def pre_render_asset_readme(asset):
+    """
+    Parse the readme once at sync time, the html and frontmatter are stored in the ReadmeCache by
+    content hash, so the public endpoints don't convert the markdown again.
+    """
+    if asset.readme is None:
+        return asset
+
+    # the format is taken from the extension of the readme url, the lessons fall back to the url
+    if asset.readme_url is None and asset.asset_type != 'LESSON' and not asset.external:
+        return asset
+
+    try:
+        # get_readme would save the lessons without readme_url before the caller does it
+        readme_url = asset.readme_url or asset.url
+        readme = {
+            'raw': asset.readme,
+            'decoded': base64.b64decode(asset.readme.encode('utf-8')).decode('utf-8'),
+        }
+        readme = asset.parse(readme, format=asset.get_readme_format(readme_url))
+        asset.html = readme['html']
+
+    except Exception as e:
+        logger.error(f'Error pre-rendering the readme of {asset.slug}: {str(e)}')
+
+    return asset
+
+
 def create_asset(data, asset_type, force=False):
     slug = data['slug']
     created = False
@@ -287,10 +324,15 @@ def sync_github_lesson(github, asset):
     logger.debug(f'Fetching readme: {file_path}')
 
     try:
-        asset.readme = repo.get_contents(file_path).content
+        content = repo.get_contents(file_path).content
     except GithubException as e:
-        asset.readme = get_blob_content(repo, file_path, branch=branch_name).content
+        content = get_blob_content(repo, file_path, branch=branch_name).content
 
+    return set_lesson_readme(asset, content, org_name, repo_name)
+
+
+def set_lesson_readme(asset, content, org_name, repo_name):
+    asset.readme = content
     readme = asset.get_readme(parse=True)
     asset.html = readme['html']
 
@@ -307,7 +349,8 @@ def sync_github_lesson(github, asset):
             logger.debug(f'New slug {fm["slug"]} found for lesson {asset.slug}')
             asset.slug = fm['slug']
 
-    return asset
+    # the images were replaced, so the html is rendered again from the final content
+    return pre_render_asset_readme(asset)
 
 
 def clean_asset_readme(asset):
@@ -335,7 +378,7 @@ def clean_asset_readme(asset):
 
     replaced += content[startIndex:]
     asset.set_readme(replaced)
-    return asset
+    return pre_render_asset_readme(asset)
 
 
 def sync_learnpack_asset(github, asset):
@@ -377,41 +420,340 @@ def sync_learnpack_asset(github, asset):
 
     if learn_file is not None:
         config = json.loads(learn_file.decoded_content.decode('utf-8'))
-        asset.config = config
+        set_learnpack_config(asset, config)
+
+    return asset
 
-        if 'title' in config:
-            asset.title = config['title']
-        if 'description' in config:
-            asset.description = config['description']
 
-        if 'preview' in config:
-            asset.preview = config['preview']
-        else:
-            raise Exception(f'Missing preview URL')
-
-        if 'video-id' in config:
-            asset.solution_video_url = 'https://www.youtube.com/watch?v=' + str(config['video-id'])
-            asset.with_video = True
-
-        if 'duration' in config:
-            asset.duration = config['duration']
-        if 'difficulty' in config:
-            asset.difficulty = config['difficulty'].upper()
-        if 'solution' in config:
-            asset.solution = config['solution']
-            asset.with_solutions = True
-
-        if 'technologies' in config:
-            for tech_slug in config['technologies']:
-                _slug = slugify(tech_slug)
-                technology = AssetTechnology.objects.filter(slug__iexact=_slug).first()
-                if technology is None:
-                    technology = AssetTechnology(slug=_slug, title=tech_slug)
-                    technology.save()
-                asset.technologies.add(technology)
+def set_learnpack_config(asset, config):
+    asset.config = config
+
+    if 'title' in config:
+        asset.title = config['title']
+    if 'description' in config:
+        asset.description = config['description']
+
+    if 'preview' in config:
+        asset.preview = config['preview']
+    else:
+        raise Exception(f'Missing preview URL')
+
+    if 'video-id' in config:
+        asset.solution_video_url = 'https://www.youtube.com/watch?v=' + str(config['video-id'])
+        asset.with_video = True
+
+    if 'duration' in config:
+        asset.duration = config['duration']
+    if 'difficulty' in config:
+        asset.difficulty = config['difficulty'].upper()
+    if 'solution' in config:
+        asset.solution = config['solution']
+        asset.with_solutions = True
+
+    if 'technologies' in config:
+        for tech_slug in config['technologies']:
+            _slug = slugify(tech_slug)
+            technology = AssetTechnology.objects.filter(slug__iexact=_slug).first()
+            if technology is None:
+                technology = AssetTechnology(slug=_slug, title=tech_slug)
+                technology.save()
+            asset.technologies.add(technology)
     return asset
 
 
+def get_asset_github_files(asset) -> tuple[str, str, str, str, list[str]]:
+    """Owner, repository, branch, readme path and config paths of one asset inside its github tree."""
+
+    if asset.asset_type == 'LESSON':
+        if asset.readme_url is None:
+            raise Exception('Missing Readme URL for lesson ' + asset.slug + '.')
+
+        org_name, repo_name, branch_name = get_url_info(asset.readme_url)
+        if branch_name is None:
+            raise Exception('Lesson URL must include branch name after blob')
+
+        result = re.search(r'\/blob\/([\w\d_\-]+)\/(.+)', asset.readme_url)
+        branch, file_path = result.groups()
+        return org_name, repo_name, branch, file_path, []
+
+    org_name, repo_name, branch_name = get_url_info(asset.url)
+
+    lang = asset.lang
+    if lang is None or lang == '':
+        raise Exception('Language for this asset is not defined, imposible to retrieve readme')
+    elif lang in ['us', 'en']:
+        lang = ''
+    else:
+        lang = '.' + lang
+
+    return org_name, repo_name, branch_name or 'HEAD', f'README{lang}.md', LEARNPACK_CONFIG_FILES
+
+
+def fetch_github_repository(client: GithubClient,
+                            owner: str,
+                            repo: str,
+                            branch: str,
+                            files: dict,
+                            etag: Optional[str] = None,
+                            signatures: Optional[dict] = None) -> dict:
+    """
+    Fetch the files of the assets of one repository, `files` is a dict of slug to (readme path,
+    config paths). The tree is requested once, with `If-None-Match` if `etag` is provided, and only
+    the blobs whose sha is not in the signature of the last sync are downloaded.
+    """
+
+    if client.rate_limit_remaining is not None and client.rate_limit_remaining < GITHUB_RATE_LIMIT_RESERVE:
+        return {'status': 'RATE_LIMITED'}
+
+    if signatures is None:
+        signatures = {}
+
+    _, tree, etag = client.get_tree(owner, repo, branch, etag=etag)
+    if tree is None:
+        return {'status': 'NOT_MODIFIED'}
+
+    if tree.get('truncated'):
+        return {'status': 'TRUNCATED'}
+
+    shas = {x['path']: x['sha'] for x in tree['tree'] if x['type'] == 'blob'}
+    blobs = {}
+    assets = {}
+
+    for slug, (readme_path, config_paths) in files.items():
+        readme_sha = shas.get(readme_path)
+        if readme_sha is None:
+            assets[slug] = {'error': f'Readme file {readme_path} not found'}
+            continue
+
+        config_path = next((x for x in config_paths if x in shas), None)
+        if config_paths and config_path is None:
+            assets[slug] = {'error': 'No configuration learn.json or bc.json file was found'}
+            continue
+
+        config_sha = shas[config_path] if config_path else None
+        signature = f'{readme_sha}:{config_sha or ""}'
+
+        if signatures.get(slug) == signature:
+            assets[slug] = {'unchanged': True}
+            continue
+
+        try:
+            for sha in [readme_sha, config_sha]:
+                if sha and sha not in blobs:
+                    blobs[sha] = client.get_blob(owner, repo, sha)[1]['content']
+
+            config = None
+            if config_sha:
+                config = json.loads(base64.b64decode(blobs[config_sha]).decode('utf-8'))
+
+            assets[slug] = {'signature': signature, 'readme': blobs[readme_sha], 'config': config}
+
+        except Exception as e:
+            assets[slug] = {'error': str(e)}
+
+    return {'status': 'OK', 'etag': etag, 'assets': assets}
+
+
+def set_sync_error(asset, message):
+    asset.status_text = str(message)
+    asset.sync_status = 'ERROR'
+    asset.save()
+    logger.error(f'Error updating {asset.url} from github: ' + str(message))
+
+
+def bulk_sync_with_github(assets, author_id=None, max_workers=GITHUB_SYNC_MAX_WORKERS, force=False) -> dict:
+    """
+    Sync many assets with github, the assets are grouped by repository and the repositories are
+    fetched concurrently, each one with one request of its tree. A tree that was not modified
+    since the last sync does not count against the rate limit, and the readmes and configs are
+    only downloaded if their sha changed. With `force` the tree etags and the signatures of the
+    last sync are ignored and every readme is downloaded again. It returns the stats of the run.
+    """
+
+    started = time.perf_counter()
+    now = timezone.now()
+    assets = list(assets)
+
+    stats = {
+        'assets': len(assets),
+        'repositories': 0,
+        'synced': 0,
+        'unchanged': 0,
+        'skipped': 0,
+        'errors': 0,
+    }
+
+    sync_cache = GithubSyncCache()
+    by_slug = {x.slug: x for x in assets}
+    groups = {}
+
+    for asset in assets:
+        if asset.external:
+            generate_external_readme(asset)
+            asset.status_text = 'Readme file for external asset generated, not github sync'
+            asset.sync_status = 'OK'
+            asset.last_synch_at = None
+            asset.save()
+            stats['synced'] += 1
+            continue
+
+        author = asset.owner_id or author_id
+        if author is None:
+            set_sync_error(
+                asset,
+                f'System does not know what github credentials to use to retrive asset info for: {asset.slug}'
+            )
+            stats['errors'] += 1
+            continue
+
+        try:
+            if asset.url is None or 'github.com' not in asset.url:
+                raise Exception(f'Missing or invalid URL on {asset.slug}, it does not belong to github.com')
+
+            owner, repo, branch, readme_path, config_paths = get_asset_github_files(asset)
+
+        except Exception as e:
+            set_sync_error(asset, e)
+            stats['errors'] += 1
+            continue
+
+        groups.setdefault((owner, repo, branch, author), {})[asset.slug] = (readme_path, config_paths)
+
+    authors = {key[3] for key in groups}
+    tokens = {
+        x.user_id: x.token
+        for x in CredentialsGithub.objects.filter(user__id__in=authors).only('user_id', 'token')
+    }
+
+    for key in [key for key in groups if key[3] not in tokens]:
+        for slug in groups.pop(key):
+            set_sync_error(by_slug[slug],
+                           f'Github credentials for this user {key[3]} not found when sync asset {slug}')
+            stats['errors'] += 1
+
+    stats['repositories'] = len(groups)
+    session = get_session(max_workers)
+    clients = {token: GithubClient(token, session) for token in set(tokens.values())}
+    signatures = sync_cache.get_signatures(list(by_slug)) if not force else {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for key, files in groups.items():
+            owner, repo, branch, author = key
+
+            # a tree not modified only says something about the assets that were synced with it
+            complete = all(slug in signatures for slug in files)
+            etag = sync_cache.get_tree_etag(owner, repo, branch) if complete else None
+
+            future = executor.submit(fetch_github_repository, clients[tokens[author]], owner, repo, branch,
+                                     files, etag, signatures)
+            futures[future] = key
+
+        results = [(futures[future], future) for future in futures]
+
+    new_signatures = {}
+    unchanged = []
+    rate_limited = []
+
+    for (owner, repo, branch, author), future in results:
+        files = groups[(owner, repo, branch, author)]
+
+        try:
+            result = future.result()
+
+        except Exception as e:
+            for slug in files:
+                set_sync_error(by_slug[slug], e)
+                stats['errors'] += 1
+            continue
+
+        if result['status'] == 'RATE_LIMITED':
+            logger.warning(f'Github rate limit reserve reached, {owner}/{repo} was skipped')
+            rate_limited += [by_slug[slug].id for slug in files]
+            continue
+
+        if result['status'] == 'NOT_MODIFIED':
+            unchanged += [by_slug[slug].id for slug in files]
+            continue
+
+        # the tree is too big to be listed, those assets are synced one by one
+        if result['status'] == 'TRUNCATED':
+            for slug in files:
+                if sync_with_github(slug, author_id=author) == 'OK':
+                    stats['synced'] += 1
+                else:
+                    stats['errors'] += 1
+            continue
+
+        if result['etag']:
+            sync_cache.set_tree_etag(owner, repo, branch, result['etag'])
+
+        for slug, data in result['assets'].items():
+            asset = by_slug[slug]
+
+            if 'error' in data:
+                set_sync_error(asset, data['error'])
+                stats['errors'] += 1
+                continue
+
+            if 'unchanged' in data:
+                unchanged.append(asset.id)
+                continue
+
+            try:
+                if asset.asset_type == 'LESSON':
+                    asset = set_lesson_readme(asset, data['readme'], owner, repo)
+
+                else:
+                    asset.readme = data['readme']
+                    asset = clean_asset_readme(asset)
+                    if data['config'] is not None:
+                        set_learnpack_config(asset, data['config'])
+
+                asset.status_text = 'Successfully Synched'
+                asset.sync_status = 'OK'
+                asset.last_synch_at = now
+                asset.save()
+
+                new_signatures[slug] = data['signature']
+                stats['synced'] += 1
+
+            except Exception as e:
+                set_sync_error(asset, e)
+                stats['errors'] += 1
+
+    if unchanged:
+        Asset.objects.filter(id__in=unchanged).update(status_text='Successfully Synched',
+                                                      sync_status='OK',
+                                                      last_synch_at=now)
+        stats['unchanged'] = len(unchanged)
+
+    # the admin action left them as PENDING
+    if rate_limited:
+        Asset.objects.filter(id__in=rate_limited).update(
+            status_text='Skipped because the github rate limit was reached, try again later',
+            sync_status='WARNING')
+        stats['skipped'] = len(rate_limited)
+
+    if new_signatures:
+        sync_cache.set_signatures(new_signatures)
+
+    seconds = time.perf_counter() - started
+    remaining = [x.rate_limit_remaining for x in clients.values() if x.rate_limit_remaining is not None]
+
+    stats['requests'] = sum(x.requests for x in clients.values())
+    stats['not_modified'] = sum(x.not_modified for x in clients.values())
+    stats['rate_limit_remaining'] = min(remaining) if remaining else None
+    stats['seconds'] = round(seconds, 3)
+    stats['assets_per_second'] = round(len(assets) / seconds, 2) if seconds else None
+
+    logger.info(f'Github bulk sync of {stats["assets"]} assets in {stats["repositories"]} repositories: '
+                f'{stats["synced"]} synced, {stats["unchanged"]} unchanged, {stats["skipped"]} skipped, '
+                f'{stats["errors"]} errors, {stats["requests"]} requests in {stats["seconds"]}s')
+
+    return stats
+
+
 def test_asset(asset):
     try:
         validator = None
@@ -11,7 +11,7 @@ from breathecode.assessment.models import Assessment
 from breathecode.assessment.actions import create_from_json
 from breathecode.utils.admin import change_field
 from .models import Asset, AssetTechnology, AssetAlias, AssetErrorLog
-from .tasks import async_sync_with_github, async_test_asset
+from .tasks import async_bulk_sync_with_github, async_test_asset
 from .actions import sync_with_github, get_user_from_github_username, test_asset
 
 logger = logging.getLogger(__name__)
@@ -54,10 +54,10 @@ make_internal.short_description = 'Make it an INTERNAL resource (same window)'
 
 def pull_from_github(modeladmin, request, queryset):
     queryset.update(sync_status='PENDING', status_text='Starting to sync...')
-    assets = queryset.all()
-    for a in assets:
-        async_sync_with_github.delay(a.slug, request.user.id)
-        # sync_with_github(a.slug)  # uncomment for testing purposes
+    ids = list(queryset.values_list('id', flat=True))
+    # the admin always pull the readmes again, even if they were not changed in github
+    async_bulk_sync_with_github.delay(ids, request.user.id, force=True)
+    # bulk_sync_with_github(queryset.all(), request.user.id, force=True)  # uncomment for testing purposes
 
 
 def make_me_author(modeladmin, request, queryset):
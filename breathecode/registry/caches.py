@@ -0,0 +1,50 @@
+import hashlib, os
+from typing import Optional
+from django.core.cache import cache
+
+__all__ = ['ReadmeCache', 'GithubSyncCache', 'get_content_hash']
+
+README_CACHE_TTL = int(os.getenv('README_CACHE_TTL', 60 * 60 * 24 * 7))
+GITHUB_SYNC_CACHE_TTL = int(os.getenv('GITHUB_SYNC_CACHE_TTL', 60 * 60 * 24 * 30))
+
+
+def get_content_hash(content: str) -> str:
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class ReadmeCache:
+    """
+    Rendered readmes of the assets.
+
+    The key is the hash of the content of the readme, so a readme that was changed never hits the
+    rendering of its old content and nothing has to be invalidated, the old entries just expire.
+    """
+    def __generate_key__(self, content: str, format: str) -> str:
+        return f'Readme__{format}__{get_content_hash(content)}'
+
+    def get(self, content: str, format: str) -> Optional[dict]:
+        return cache.get(self.__generate_key__(content, format))
+
+    def set(self, content: str, format: str, data: dict) -> None:
+        cache.set(self.__generate_key__(content, format), data, timeout=README_CACHE_TTL)
+
+
+class GithubSyncCache:
+    """
+    State of the last bulk sync with github, the etag of the tree of each repository and the sha
+    of the files of each asset, if it's lost the next sync just downloads the files again.
+    """
+    def get_tree_etag(self, owner: str, repo: str, branch: str) -> Optional[str]:
+        return cache.get(f'GithubSync__tree__{owner}/{repo}@{branch}')
+
+    def set_tree_etag(self, owner: str, repo: str, branch: str, etag: str) -> None:
+        cache.set(f'GithubSync__tree__{owner}/{repo}@{branch}', etag, timeout=GITHUB_SYNC_CACHE_TTL)
+
+    def get_signatures(self, slugs: list[str]) -> dict[str, str]:
+        data = cache.get_many([f'GithubSync__asset__{slug}' for slug in slugs])
+        return {key.replace('GithubSync__asset__', '', 1): value for key, value in data.items()}
+
+    def set_signatures(self, signatures: dict[str, str]) -> None:
+        cache.set_many({f'GithubSync__asset__{slug}': value
+                        for slug, value in signatures.items()},
+                       timeout=GITHUB_SYNC_CACHE_TTL)
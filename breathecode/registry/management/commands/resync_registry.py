@@ -1,7 +1,6 @@
 import os, requests, logging
 from django.core.management.base import BaseCommand, CommandError
-from ...actions import create_asset, sync_with_github
-from ...tasks import async_sync_with_github
+from ...actions import bulk_sync_with_github, create_asset, sync_with_github
 from ...models import Asset
 
 logger = logging.getLogger(__name__)
@@ -35,5 +34,6 @@ class Command(BaseCommand):
 
     def projects(self, *args, **options):
         projects = Asset.objects.filter(asset_type='PROJECT')
-        for p in projects:
-            async_sync_with_github.delay(p.slug)
+        stats = bulk_sync_with_github(projects)
+
+        self.stdout.write(', '.join([f'{key}: {value}' for key, value in stats.items()]))
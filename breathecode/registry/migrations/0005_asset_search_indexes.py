@@ -0,0 +1,14 @@
+from django.db import migrations
+from breathecode.utils.search import create_search_indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registry', '0004_auto_20220415_1515'),
+    ]
+
+    operations = [
+        create_search_indexes('registry_asset', ['slug', 'title']),
+        create_search_indexes('registry_assetalias', ['slug']),
+    ]
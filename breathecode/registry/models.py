@@ -6,6 +6,7 @@ from django.template.loader import get_template
 from breathecode.admissions.models import Academy, Cohort
 from breathecode.events.models import Event
 from django.db.models import Q
+from .caches import ReadmeCache
 from .signals import asset_slug_modified
 from breathecode.assessment.models import Assessment
 
@@ -209,18 +210,30 @@ class Asset(models.Model):
             'decoded': base64.b64decode(self.readme.encode('utf-8')).decode('utf-8')
         }
         if parse is not None:
-            # external assets will have a default markdown readme generated internally
-            extension = pathlib.Path(self.readme_url).suffix if not self.external else '.md'
-            if extension in ['.md', '.mdx', '.txt']:
-                readme = self.parse(readme, format='markdown')
-            elif extension in ['.ipynb']:
-                readme = self.parse(readme, format='notebook')
-            else:
-                raise Exception('Uknown readme file extension ' + extension + ' for ' + self.asset_type +
-                                ': ' + self.slug)
+            readme = self.parse(readme, format=self.get_readme_format())
         return readme
 
+    def get_readme_format(self, readme_url=None):
+        # external assets will have a default markdown readme generated internally
+        extension = pathlib.Path(readme_url or self.readme_url).suffix if not self.external else '.md'
+        if extension in ['.md', '.mdx', '.txt']:
+            return 'markdown'
+        if extension in ['.ipynb']:
+            return 'notebook'
+
+        raise Exception('Uknown readme file extension ' + extension + ' for ' + self.asset_type + ': ' +
+                        self.slug)
+
     def parse(self, readme, format='markdown'):
+        # the readme is rendered once per content, see ReadmeCache
+        cache = ReadmeCache()
+        rendered = cache.get(readme['raw'], format)
+
+        if rendered is not None:
+            readme['frontmatter'] = rendered['frontmatter']
+            readme['html'] = rendered['html']
+            return readme
+
         if format == 'markdown':
             _data = frontmatter.loads(readme['decoded'])
             readme['frontmatter'] = _data.metadata
@@ -238,6 +251,13 @@ class Asset(models.Model):
             readme['frontmatter'] = resources
             readme['frontmatter']['format'] = format
             readme['html'] = body
+
+        if 'html' in readme:
+            cache.set(readme['raw'], format, {
+                'frontmatter': dict(readme['frontmatter']),
+                'html': readme['html']
+            })
+
         return readme
 
     def set_readme(self, content):
@@ -1,7 +1,7 @@
 import logging
 from celery import shared_task, Task
 from .models import Asset
-from .actions import sync_with_github, test_asset
+from .actions import bulk_sync_with_github, sync_with_github, test_asset
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,13 @@ def async_sync_with_github(asset_slug, user_id=None):
     return sync_with_github(asset_slug)
 
 
+@shared_task
+def async_bulk_sync_with_github(asset_ids, user_id=None, force=False):
+    logger.debug(f'Synching {len(asset_ids)} assets with data found on github')
+    assets = Asset.objects.filter(id__in=asset_ids)
+    return bulk_sync_with_github(assets, author_id=user_id, force=force)
+
+
 @shared_task
 def async_test_asset(asset_slug):
     a = Asset.objects.filter(slug=asset_slug).first()
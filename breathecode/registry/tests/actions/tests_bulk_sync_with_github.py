@@ -0,0 +1,290 @@
+"""
+Test bulk_sync_with_github
+"""
+import base64, json
+from unittest.mock import MagicMock, call, patch
+from breathecode.registry.actions import bulk_sync_with_github
+from breathecode.registry.models import Asset
+from ..mixins import RegistryTestCase
+
+LESSONS_URL = 'https://github.com/breatheco-de/lessons/blob/master'
+EXERCISE_URL = 'https://github.com/breatheco-de/exercise-potato'
+
+
+def encode(content: str) -> str:
+    return base64.b64encode(content.encode('utf-8')).decode('utf-8')
+
+
+def tree(*files, truncated=False):
+    return {
+        'tree': [{
+            'path': path,
+            'type': 'blob',
+            'sha': sha
+        } for path, sha in files],
+        'truncated': truncated,
+    }
+
+
+class GithubClientMock():
+    """GithubClient that answers the trees and the blobs from memory"""
+    def __init__(self, trees={}, blobs={}, rate_limit_remaining=None):
+        # (owner, repo, branch) -> (etag, tree)
+        self.trees = trees
+        self.blobs = blobs
+        self.rate_limit_remaining = rate_limit_remaining
+        self.requests = 0
+        self.not_modified = 0
+        self.tree_calls = []
+        self.blob_calls = []
+
+    def get_tree(self, owner, repo, branch='HEAD', etag=None):
+        self.requests += 1
+        self.tree_calls.append(call(owner, repo, branch, etag=etag))
+
+        current_etag, current_tree = self.trees[(owner, repo, branch)]
+        if etag is not None and etag == current_etag:
+            self.not_modified += 1
+            return 304, None, etag
+
+        return 200, current_tree, current_etag
+
+    def get_blob(self, owner, repo, sha):
+        self.requests += 1
+        self.blob_calls.append(sha)
+
+        blob = self.blobs[sha]
+        if isinstance(blob, Exception):
+            raise blob
+
+        return 200, {'content': blob}, None
+
+
+class BulkSyncWithGithubTestSuite(RegistryTestCase):
+    def __create_lesson__(self, slug, path, owner_id=1):
+        url = f'{LESSONS_URL}/{path}'
+        return Asset.objects.create(slug=slug,
+                                    asset_type='LESSON',
+                                    lang='us',
+                                    url=url,
+                                    readme_url=url,
+                                    owner_id=owner_id)
+
+    def __create_exercise__(self, slug, url=EXERCISE_URL, owner_id=1):
+        return Asset.objects.create(slug=slug, asset_type='EXERCISE', lang='us', url=url, owner_id=owner_id)
+
+    def __sync__(self, client, assets, **kwargs):
+        with patch('breathecode.registry.actions.GithubClient', MagicMock(return_value=client)):
+            return bulk_sync_with_github(assets, **kwargs)
+
+    def __statuses__(self):
+        return [(x.slug, x.sync_status) for x in Asset.objects.order_by('id')]
+
+    """
+    🔽🔽🔽 Grouped by repository
+    """
+
+    def test_bulk_sync_with_github__one_tree_per_repository(self):
+        self.bc.database.create(user=1, credentials_github=1)
+
+        lessons = [
+            self.__create_lesson__('potato', 'potato.md'),
+            self.__create_lesson__('tomato', 'tomato.md'),
+        ]
+        exercise = self.__create_exercise__('exercise-potato')
+
+        client = GithubClientMock(trees={
+            ('breatheco-de', 'lessons', 'master'): ('"1"', tree(('potato.md', 's1'), ('tomato.md', 's2'))),
+            ('breatheco-de', 'exercise-potato', 'HEAD'):
+            ('"2"', tree(('README.md', 's3'), ('learn.json', 's4'))),
+        },
+                                  blobs={
+                                      's1': encode('# Potato'),
+                                      's2': encode('# Tomato'),
+                                      's3': encode('# Exercise'),
+                                      's4': encode(json.dumps({'preview': 'https://potato.io/preview.png'})),
+                                  })
+
+        stats = self.__sync__(client, [*lessons, exercise])
+
+        self.assertEqual(len(client.tree_calls), 2)
+        self.assertEqual(sorted(client.blob_calls), ['s1', 's2', 's3', 's4'])
+        self.assertEqual((stats['repositories'], stats['synced'], stats['errors']), (2, 3, 0))
+        self.assertEqual(self.__statuses__(), [('potato', 'OK'), ('tomato', 'OK'), ('exercise-potato', 'OK')])
+
+        exercise = Asset.objects.get(slug='exercise-potato')
+        self.assertEqual(exercise.preview, 'https://potato.io/preview.png')
+
+    """
+    🔽🔽🔽 Not modified
+    """
+
+    def test_bulk_sync_with_github__tree_not_modified(self):
+        self.bc.database.create(user=1, credentials_github=1)
+
+        lessons = [
+            self.__create_lesson__('potato', 'potato.md'),
+            self.__create_lesson__('tomato', 'tomato.md'),
+        ]
+
+        client = GithubClientMock(trees={
+            ('breatheco-de', 'lessons', 'master'): ('"1"', tree(('potato.md', 's1'), ('tomato.md', 's2')))
+        },
+                                  blobs={
+                                      's1': encode('# Potato'),
+                                      's2': encode('# Tomato'),
+                                  })
+
+        self.__sync__(client, lessons)
+        client.blob_calls = []
+
+        stats = self.__sync__(client, Asset.objects.order_by('id'))
+
+        self.assertEqual(client.tree_calls[-1], call('breatheco-de', 'lessons', 'master', etag='"1"'))
+        self.assertEqual(client.blob_calls, [])
+        self.assertEqual((stats['synced'], stats['unchanged']), (0, 2))
+        self.assertEqual(self.__statuses__(), [('potato', 'OK'), ('tomato', 'OK')])
+
+    def test_bulk_sync_with_github__same_signature_without_download_the_blobs(self):
+        self.bc.database.create(user=1, credentials_github=1)
+
+        lessons = [
+            self.__create_lesson__('potato', 'potato.md'),
+            self.__create_lesson__('tomato', 'tomato.md'),
+        ]
+
+        files = [('potato.md', 's1'), ('tomato.md', 's2')]
+        client = GithubClientMock(trees={('breatheco-de', 'lessons', 'master'): ('"1"', tree(*files))},
+                                  blobs={
+                                      's1': encode('# Potato'),
+                                      's2': encode('# Tomato'),
+                                      's3': encode('# Tomato 2'),
+                                  })
+
+        self.__sync__(client, lessons)
+        client.blob_calls = []
+
+        # other commit that just changed one of the lessons
+        client.trees[('breatheco-de', 'lessons', 'master')] = ('"2"',
+                                                               tree(('potato.md', 's1'), ('tomato.md', 's3')))
+
+        stats = self.__sync__(client, Asset.objects.order_by('id'))
+
+        self.assertEqual(client.blob_calls, ['s3'])
+        self.assertEqual((stats['synced'], stats['unchanged']), (1, 1))
+        self.assertEqual(
+            base64.b64decode(Asset.objects.get(slug='tomato').readme).decode('utf-8'), '# Tomato 2')
+
+    def test_bulk_sync_with_github__force__download_the_blobs_again(self):
+        self.bc.database.create(user=1, credentials_github=1)
+
+        lessons = [self.__create_lesson__('potato', 'potato.md')]
+        client = GithubClientMock(trees={
+            ('breatheco-de', 'lessons', 'master'): ('"1"', tree(('potato.md', 's1')))
+        },
+                                  blobs={'s1': encode('# Potato')})
+
+        self.__sync__(client, lessons)
+        client.blob_calls = []
+
+        # the readme was edited in the admin
+        Asset.objects.filter(slug='potato').update(readme=encode('# Tomato'))
+
+        stats = self.__sync__(client, Asset.objects.order_by('id'), force=True)
+
+        self.assertEqual(client.tree_calls[-1], call('breatheco-de', 'lessons', 'master', etag=None))
+        self.assertEqual(client.blob_calls, ['s1'])
+        self.assertEqual((stats['synced'], stats['unchanged']), (1, 0))
+        self.assertEqual(
+            base64.b64decode(Asset.objects.get(slug='potato').readme).decode('utf-8'), '# Potato')
+
+    """
+    🔽🔽🔽 Rate limit
+    """
+
+    def test_bulk_sync_with_github__rate_limit_reserve_reached(self):
+        self.bc.database.create(user=1, credentials_github=1)
+
+        lessons = [
+            self.__create_lesson__('potato', 'potato.md'),
+            self.__create_lesson__('tomato', 'tomato.md'),
+        ]
+        Asset.objects.update(sync_status='PENDING', status_text='Starting to sync...')
+
+        client = GithubClientMock(rate_limit_remaining=10)
+
+        stats = self.__sync__(client, lessons)
+
+        self.assertEqual(client.tree_calls, [])
+        self.assertEqual((stats['skipped'], stats['synced'], stats['errors']), (2, 0, 0))
+        self.assertEqual(self.__statuses__(), [('potato', 'WARNING'), ('tomato', 'WARNING')])
+        self.assertEqual([x.status_text for x in Asset.objects.order_by('id')],
+                         ['Skipped because the github rate limit was reached, try again later'] * 2)
+
+    """
+    🔽🔽🔽 Truncated tree
+    """
+
+    @patch('breathecode.registry.actions.sync_with_github', MagicMock(return_value='OK'))
+    def test_bulk_sync_with_github__truncated_tree(self):
+        from breathecode.registry.actions import sync_with_github
+
+        self.bc.database.create(user=1, credentials_github=1)
+
+        lessons = [
+            self.__create_lesson__('potato', 'potato.md'),
+            self.__create_lesson__('tomato', 'tomato.md'),
+        ]
+
+        client = GithubClientMock(
+            trees={('breatheco-de', 'lessons', 'master'): ('"1"', tree(('potato.md', 's1'), truncated=True))})
+
+        stats = self.__sync__(client, lessons)
+
+        self.assertEqual(client.blob_calls, [])
+        self.assertEqual(stats['synced'], 2)
+        self.assertEqual(sync_with_github.call_args_list, [
+            call('potato', author_id=1),
+            call('tomato', author_id=1),
+        ])
+
+    """
+    🔽🔽🔽 Errors
+    """
+
+    def test_bulk_sync_with_github__errors_per_asset(self):
+        self.bc.database.create(user=1, credentials_github=1)
+
+        lessons = [
+            self.__create_lesson__('potato', 'potato.md'),
+            self.__create_lesson__('tomato', 'tomato.md'),
+            self.__create_lesson__('onion', 'onion.md'),
+        ]
+
+        client = GithubClientMock(trees={
+            ('breatheco-de', 'lessons', 'master'): ('"1"', tree(('potato.md', 's1'), ('onion.md', 's3')))
+        },
+                                  blobs={
+                                      's1': encode('# Potato'),
+                                      's3': Exception('Github returned 500 for onion.md'),
+                                  })
+
+        stats = self.__sync__(client, lessons)
+
+        self.assertEqual((stats['synced'], stats['errors']), (1, 2))
+        self.assertEqual(self.__statuses__(), [('potato', 'OK'), ('tomato', 'ERROR'), ('onion', 'ERROR')])
+        self.assertEqual([x.status_text for x in Asset.objects.order_by('id')], [
+            'Successfully Synched',
+            'Readme file tomato.md not found',
+            'Github returned 500 for onion.md',
+        ])
+
+    def test_bulk_sync_with_github__without_credentials(self):
+        lessons = [self.__create_lesson__('potato', 'potato.md', owner_id=None)]
+        client = GithubClientMock()
+
+        stats = self.__sync__(client, lessons)
+
+        self.assertEqual(client.tree_calls, [])
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(self.__statuses__(), [('potato', 'ERROR')])
@@ -0,0 +1,55 @@
+"""
+Test pre_render_asset_readme
+"""
+import base64
+from breathecode.registry.actions import pre_render_asset_readme
+from breathecode.registry.caches import ReadmeCache
+from breathecode.registry.models import Asset
+from ..mixins import RegistryTestCase
+
+LESSON_URL = 'https://github.com/breatheco-de/lessons/blob/master/potato.md'
+
+
+def encode(content: str) -> str:
+    return base64.b64encode(content.encode('utf-8')).decode('utf-8')
+
+
+class PreRenderAssetReadmeTestSuite(RegistryTestCase):
+    """
+    🔽🔽🔽 Without readme
+    """
+    def test_pre_render_asset_readme__without_readme(self):
+        asset = Asset(slug='potato', asset_type='LESSON', url=LESSON_URL)
+
+        pre_render_asset_readme(asset)
+
+        self.assertEqual(asset.html, None)
+
+    """
+    🔽🔽🔽 With readme
+    """
+
+    def test_pre_render_asset_readme__lesson_without_readme_url__it_is_not_saved(self):
+        asset = Asset.objects.create(slug='potato', asset_type='LESSON', lang='us', url=LESSON_URL)
+        asset.title = 'Potato'
+        asset.set_readme('# Potato')
+
+        pre_render_asset_readme(asset)
+
+        self.assertEqual(asset.html, '<h1>Potato</h1>')
+        self.assertEqual(asset.readme_url, None)
+        self.assertEqual(ReadmeCache().get(asset.readme, 'markdown')['html'], '<h1>Potato</h1>')
+
+        saved = Asset.objects.get(id=asset.id)
+        self.assertEqual((saved.title, saved.readme, saved.readme_url, saved.html), ('', None, None, None))
+
+    def test_pre_render_asset_readme__unknown_extension(self):
+        asset = Asset(slug='potato',
+                      asset_type='LESSON',
+                      url=LESSON_URL,
+                      readme_url='https://github.com/breatheco-de/lessons/blob/master/potato.pdf',
+                      readme=encode('# Potato'))
+
+        pre_render_asset_readme(asset)
+
+        self.assertEqual(asset.html, None)
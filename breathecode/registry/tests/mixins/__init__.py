@@ -0,0 +1,4 @@
+"""
+Mixins
+"""
+from .registry_test_case import RegistryTestCase
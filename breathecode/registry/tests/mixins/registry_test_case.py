@@ -0,0 +1,18 @@
+"""
+Collections of mixins used to login in authorize microservice
+"""
+from rest_framework.test import APITestCase
+from breathecode.tests.mixins import (GenerateModelsMixin, CacheMixin, GenerateQueriesMixin, HeadersMixin,
+                                      DatetimeMixin, BreathecodeMixin)
+
+
+class RegistryTestCase(APITestCase, GenerateModelsMixin, CacheMixin, GenerateQueriesMixin, HeadersMixin,
+                       DatetimeMixin, BreathecodeMixin):
+    """RegistryTestCase with auth methods"""
+    def setUp(self):
+        self.generate_queries()
+        self.set_test_instance(self)
+        self.clear_cache()
+
+    def tearDown(self):
+        self.clear_cache()
@@ -0,0 +1,58 @@
+"""
+Test Asset
+"""
+import base64
+from unittest.mock import MagicMock, patch
+from breathecode.registry.caches import ReadmeCache
+from breathecode.registry.models import Asset
+from ..mixins import RegistryTestCase
+
+
+def create_asset(slug, readme):
+    url = f'https://github.com/breatheco-de/lessons/blob/master/{slug}.md'
+    return Asset.objects.create(slug=slug,
+                                asset_type='LESSON',
+                                lang='us',
+                                url=url,
+                                readme_url=url,
+                                readme=base64.b64encode(readme.encode('utf-8')).decode('utf-8'))
+
+
+class AssetTestSuite(RegistryTestCase):
+    """
+    🔽🔽🔽 parse
+    """
+    def test_parse__saved_in_the_cache(self):
+        asset = create_asset('potato', '---\ntitle: Potato\n---\n# Potato')
+
+        readme = asset.get_readme(parse=True)
+
+        self.assertEqual(readme['html'], '<h1>Potato</h1>')
+        self.assertEqual(ReadmeCache().get(asset.readme, 'markdown'), {
+            'frontmatter': {
+                'title': 'Potato',
+                'format': 'markdown',
+            },
+            'html': '<h1>Potato</h1>',
+        })
+
+    def test_parse__same_content_from_the_cache(self):
+        content = '---\ntitle: Potato\n---\n# Potato'
+        create_asset('potato', content).get_readme(parse=True)
+
+        asset = create_asset('tomato', content)
+
+        with patch('markdown.markdown', MagicMock()) as markdown_mock:
+            readme = asset.get_readme(parse=True)
+
+            self.assertEqual(markdown_mock.call_args_list, [])
+
+        self.assertEqual(readme['html'], '<h1>Potato</h1>')
+        self.assertEqual(readme['frontmatter'], {'title': 'Potato', 'format': 'markdown'})
+
+    def test_parse__other_content_is_rendered(self):
+        create_asset('potato', '# Potato').get_readme(parse=True)
+
+        readme = create_asset('tomato', '# Tomato').get_readme(parse=True)
+
+        self.assertEqual(readme['html'], '<h1>Tomato</h1>')
@@ -0,0 +1,86 @@
+"""
+Test /asset/<slug>.<extension>
+"""
+import base64
+from unittest.mock import MagicMock, patch
+from rest_framework import status
+from breathecode.registry.models import Asset
+from ..mixins import RegistryTestCase
+
+URL = '/v1/registry/asset/potato.html'
+
+
+def create_asset(readme):
+    url = 'https://github.com/breatheco-de/lessons/blob/master/potato.md'
+    return Asset.objects.create(slug='potato',
+                                asset_type='LESSON',
+                                lang='us',
+                                url=url,
+                                readme_url=url,
+                                readme=base64.b64encode(readme.encode('utf-8')).decode('utf-8'))
+
+
+class AssetSlugExtensionTestSuite(RegistryTestCase):
+    """
+    🔽🔽🔽 Conditional GET
+    """
+    def test_asset_slug_extension__with_etag(self):
+        create_asset('# Potato')
+
+        response = self.client.get(URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content.decode('utf-8'), '<h1>Potato</h1>')
+        self.assertTrue(response['ETag'])
+        self.assertTrue(response['Last-Modified'])
+
+    def test_asset_slug_extension__if_none_match(self):
+        create_asset('# Potato')
+
+        etag = self.client.get(URL)['ETag']
+
+        with patch.object(Asset, 'get_readme', MagicMock()):
+            response = self.client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response.content, b'')
+            self.assertEqual(response['ETag'], etag)
+            self.assertEqual(Asset.get_readme.call_args_list, [])
+
+    def test_asset_slug_extension__etag_changed_with_the_readme(self):
+        asset = create_asset('# Potato')
+
+        etag = self.client.get(URL)['ETag']
+
+        asset.set_readme('# Tomato')
+        asset.save()
+
+        response = self.client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content.decode('utf-8'), '<h1>Tomato</h1>')
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_asset_slug_extension__etag_changed_with_updated_at(self):
+        asset = create_asset('# Potato')
+
+        etag = self.client.get(URL)['ETag']
+
+        asset.title = 'Potato'
+        asset.save()
+
+        response = self.client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_asset_slug_extension__etag_changed_with_the_extension(self):
+        create_asset('# Potato')
+
+        etag = self.client.get(URL)['ETag']
+
+        response = self.client.get('/v1/registry/asset/potato.md', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content.decode('utf-8'), '# Potato')
+        self.assertNotEqual(response['ETag'], etag)
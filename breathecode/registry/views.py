@@ -1,10 +1,13 @@
-import requests, logging, os
+import hashlib, requests, logging, os
 from pathlib import Path
 from django.shortcuts import render
 from django.utils import timezone
 from django.db.models import Q
 from django.http import HttpResponse
 from django.core.validators import URLValidator
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from .caches import get_content_hash
 from .models import Asset, AssetAlias, AssetTechnology, AssetErrorLog
 from .actions import test_syllabus, test_asset
 from breathecode.notify.actions import send_email_message
@@ -13,7 +16,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from .serializers import (AssetSerializer, AssetBigSerializer, AssetMidSerializer, AssetTechnologySerializer,
                           PostAssetSerializer)
-from breathecode.utils import ValidationException, capable_of
+from breathecode.utils import ValidationException, SearchBackend, capable_of
 from breathecode.utils.views import private_view, render_message, set_query_parameter
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
@@ -64,6 +67,27 @@ def forward_asset_url(request, asset_slug=None):
         return render_message(request, msg)
 
 
+def readme_response(request, asset, render, *args):
+    """
+    Serve a rendered readme with conditional-GET headers, the etag is the hash of the stored readme
+    plus the render arguments, so `render` is not called if the client has the same version.
+    """
+
+    signature = '__'.join([get_content_hash(asset.readme or ''), str(asset.updated_at), *args])
+    etag = quote_etag(hashlib.sha1(signature.encode('utf-8')).hexdigest())
+    last_modified = int(asset.updated_at.timestamp()) if asset.updated_at else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = render()
+
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+
+    return response
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 @xframe_options_exempt
@@ -75,12 +99,19 @@ def render_preview_html(request, asset_slug):
     if asset.asset_type == 'QUIZ':
         return render_message(request, f'Quiz cannot be previewed')
 
+    theme = request.GET.get('theme', 'light')
+    plain = request.GET.get('plain', 'false')
+    return readme_response(request, asset, lambda: render_preview(request, asset, theme, plain), 'preview',
+                           theme, plain)
+
+
+def render_preview(request, asset, theme, plain):
     readme = asset.get_readme(parse=True)
     return render(
         request, readme['frontmatter']['format'] + '.html', {
             **AssetBigSerializer(asset).data, 'html': readme['html'],
-            'theme': request.GET.get('theme', 'light'),
-            'plain': request.GET.get('plain', 'false'),
+            'theme': theme,
+            'plain': plain,
             'styles':
             readme['frontmatter']['inlining']['css'][0] if 'inlining' in readme['frontmatter'] else None,
             'frontmatter': readme['frontmatter'].items()
@@ -127,6 +158,10 @@ def render_readme(request, asset_slug, extension='raw'):
     if asset is None:
         raise ValidationException('Asset {asset_slug} not found', status.HTTP_404_NOT_FOUND)
 
+    return readme_response(request, asset, lambda: render_readme_extension(asset, extension), extension)
+
+
+def render_readme_extension(asset, extension):
     readme = asset.get_readme(parse=True)
 
     response = HttpResponse('Invalid extension format', content_type='text/html')
@@ -191,6 +226,7 @@ class AssetView(APIView):
     List all snippets, or create a new snippet.
     """
     permission_classes = [AllowAny]
+    search_backend = SearchBackend(['slug', 'title'], related=[(AssetAlias, 'asset', 'slug')])
 
     def get(self, request, asset_slug=None):
 
@@ -209,12 +245,6 @@ class AssetView(APIView):
             param = self.request.GET.get('author')
             lookup['author__id'] = param
 
-        like = request.GET.get('like', None)
-        if like is not None:
-            items = items.filter(
-                Q(slug__icontains=like) | Q(title__icontains=like)
-                | Q(assetalias__slug__icontains=like))
-
         if 'type' in self.request.GET:
             param = self.request.GET.get('type')
             lookup['asset_type__iexact'] = param
@@ -265,6 +295,9 @@ class AssetView(APIView):
 
         items = items.filter(**lookup).order_by('-created_at')
 
+        like = request.GET.get('search', request.GET.get('like', None))
+        items = self.search_backend.filter(items, like)
+
         if 'big' in self.request.GET:
             serializer = AssetMidSerializer(items, many=True)
         else:
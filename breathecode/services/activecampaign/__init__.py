@@ -1,2 +1,2 @@
-from .client import AC_Old_Client, Contacts, ActiveCampaign
+from .client import AC_Old_Client, AC_Client, Contacts, ActiveCampaign, get_session
 from .actions import deal_update
@@ -3,6 +3,9 @@ import requests
 import json
 import logging
 import breathecode.services.activecampaign.actions as actions
+from typing import Optional
+from activecampaign.client import Client
+from requests.adapters import HTTPAdapter
 from breathecode.utils import APIException
 from slugify import slugify
 
@@ -326,14 +329,43 @@ class Contacts(object):
         return self.client._get('contact_delete', aditional_data=[('id', id)])
 
 
+def get_session(pool_size: int = 10) -> requests.Session:
+    """Keep-alive session with a connection pool, it should be shared by all the clients of one academy"""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class AC_Client(Client):
+    """ActiveCampaign API v3 client that reuse the connections of a `requests.Session`"""
+    def __init__(self, url, api_key, session: Optional[requests.Session] = None):
+        super().__init__(url, api_key)
+        self.session = session or get_session()
+
+    def _request(self, method, endpoint, headers=None, **kwargs):
+        _headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Api-Token': self.api_key,
+        }
+        if headers:
+            _headers.update(headers)
+
+        return self._parse(self.session.request(method, self.BASE_URL + endpoint, headers=_headers, **kwargs))
+
+
 class AC_Old_Client(object):
-    def __init__(self, url, apikey):
+    def __init__(self, url, apikey, session: Optional[requests.Session] = None):
 
         if url is None:
             raise Exception('Invalid URL for active campaign API, have you setup your env variables?')
 
         self._base_url = f'https://{url}' if not url.startswith('http') else url
         self._apikey = apikey
+        self._session = session
         self.contacts = Contacts(self)
         # self.account = Account(self)
         # self.lists = Lists(self)
@@ -360,7 +392,8 @@ class AC_Old_Client(object):
         if aditional_data is not None:
             for aditional in aditional_data:
                 params.append(aditional)
-        response = requests.request(method, self._base_url + '/admin/api.php', params=params, data=data)
+        request = self._session.request if self._session else requests.request
+        response = request(method, self._base_url + '/admin/api.php', params=params, data=data)
         if response.status_code >= 200 and response.status_code < 400:
             data = response.json()
             return self._parse(data)
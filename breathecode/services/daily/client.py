@@ -1,8 +1,32 @@
-import re, logging, os, urllib, time
+import re, logging, os, urllib, time, threading
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+DAILY_POOL_SIZE = int(os.getenv('DAILY_POOL_SIZE', 10))
+
+_lock = threading.Lock()
+_session = None
+_session_pid = None
+
+
+def get_session():
+    """Get the keep-alive session of this process, it is shared by all the Daily clients"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    global _session, _session_pid
+
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            adapter = HTTPAdapter(pool_connections=DAILY_POOL_SIZE, pool_maxsize=DAILY_POOL_SIZE)
+
+            _session = requests.Session()
+            _session.mount('https://', adapter)
+            _session_pid = os.getpid()
+
+        return _session
+
 
 class DailyClient:
     headers = {}
@@ -16,15 +40,12 @@ class DailyClient:
         self.headers = {'Authorization': f'Bearer {token}'}
 
     def request(self, _type, url, headers={}, query_string=None, data=None):
-        # wonderful way to fix one poor mocking system
-        import requests
-
         _headers = {**self.headers, **headers}
         _query_string = ''
         if query_string is not None:
             _query_string = '?' + urllib.parse.urlencode(query_string)
 
-        response = requests.request(_type, self.host + url + _query_string, headers=_headers, json=data)
+        response = get_session().request(_type, self.host + url + _query_string, headers=_headers, json=data)
         result = response.json()
 
         if result is None:
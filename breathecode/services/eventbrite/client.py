@@ -43,21 +43,19 @@ class Eventbrite:
         if 'status_code' in result and result['status_code'] >= 400:
             raise Exception(result['error_description'])
 
-        if 'pagination' in result:
-            print('has more items?', result['pagination']['has_more_items'])
-            if result['pagination']['has_more_items']:
-                print('Continuation: ', result['pagination']['continuation'])
-                new_result = self.request(_type,
-                                          url,
-                                          query_string={
-                                              **query_string, 'continuation':
-                                              result['pagination']['continuation']
-                                          })
-                for key in new_result:
-                    print(key, type(new_result[key]) == 'list')
-                    if type(new_result[key]) == 'list':
-                        new_result[key] = result[key] + new_result[key]
-                result.update(new_result)
+        if 'pagination' in result and result['pagination']['has_more_items']:
+            new_result = self.request(_type,
+                                      url,
+                                      query_string={
+                                          **(query_string or {}), 'continuation':
+                                          result['pagination']['continuation']
+                                      })
+
+            for key in new_result:
+                if isinstance(new_result[key], list) and isinstance(result.get(key), list):
+                    new_result[key] = result[key] + new_result[key]
+
+            result.update(new_result)
 
         return result
 
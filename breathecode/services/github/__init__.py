@@ -0,0 +1 @@
+from .client import GithubClient, get_session
@@ -0,0 +1,84 @@
+import os, logging, threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['GithubClient', 'get_session']
+
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+GITHUB_TIMEOUT = int(os.getenv('GITHUB_TIMEOUT', 30))
+
+
+def get_session(pool_size: int = 10) -> requests.Session:
+    """Keep-alive session with a connection pool, it can be shared by the clients of every token"""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class GithubClient:
+    """
+    Minimal GitHub REST client with conditional requests, a `304 Not Modified` does not count
+    against the rate limit, it keeps the remaining budget of the token that was returned by
+    the last response.
+    """
+    def __init__(self, token=None, session: Optional[requests.Session] = None):
+        self.token = token
+        self.session = session or get_session()
+        self.headers = {'Accept': 'application/vnd.github.v3+json'}
+        if token:
+            self.headers['Authorization'] = f'token {token}'
+
+        self.rate_limit_remaining: Optional[int] = None
+        self.requests = 0
+        self.not_modified = 0
+        self.__lock = threading.Lock()
+
+    def request(self, method, url, etag=None, **kwargs) -> tuple[int, Optional[dict], Optional[str]]:
+        """Returns the status code, the json body and the etag, the body is None if it was not modified."""
+
+        headers = {**self.headers}
+        if etag:
+            headers['If-None-Match'] = etag
+
+        response = self.session.request(method,
+                                        GITHUB_API_URL + url,
+                                        headers=headers,
+                                        timeout=GITHUB_TIMEOUT,
+                                        **kwargs)
+
+        with self.__lock:
+            self.requests += 1
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            if remaining is not None:
+                self.rate_limit_remaining = int(remaining)
+
+            if response.status_code == 304:
+                self.not_modified += 1
+
+        if response.status_code == 304:
+            return 304, None, etag
+
+        if response.status_code >= 400:
+            try:
+                message = response.json().get('message', '')
+            except ValueError:
+                message = response.text
+
+            raise Exception(f'Github returned {response.status_code} for {url}: {message}')
+
+        return response.status_code, response.json(), response.headers.get('ETag')
+
+    def get_tree(self, owner, repo, branch='HEAD', etag=None):
+        return self.request('GET',
+                            f'/repos/{owner}/{repo}/git/trees/{branch}',
+                            etag=etag,
+                            params={'recursive': 1})
+
+    def get_blob(self, owner, repo, sha):
+        return self.request('GET', f'/repos/{owner}/{repo}/git/blobs/{sha}')
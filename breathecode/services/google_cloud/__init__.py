@@ -6,3 +6,4 @@ from .function import *
 from .storage import *
 from .file import *
 from .credentials import *
+from .clients import *
@@ -0,0 +1,154 @@
+"""
+Google Cloud Clients
+"""
+import os
+import time
+import logging
+import threading
+
+from .credentials import resolve_credentials
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['get_client', 'get_id_token', 'get_client_stats', 'reset_clients']
+
+# the id tokens are renewed this seconds before they expire
+ID_TOKEN_EXPIRATION_MARGIN = int(os.getenv('GOOGLE_CLOUD_ID_TOKEN_EXPIRATION_MARGIN', 300))
+
+# the id tokens without exp claim are kept this seconds
+ID_TOKEN_DEFAULT_TTL = 3600
+
+_lock = threading.RLock()
+_pid = None
+_clients = {}
+_id_tokens = {}
+_stats = {}
+
+
+def _check_pid():
+    """Drop the clients inherited from the parent process, the gRPC and HTTP channels are not fork safe"""
+    global _pid
+
+    pid = os.getpid()
+    if _pid == pid:
+        return
+
+    _pid = pid
+    _clients.clear()
+    _id_tokens.clear()
+    _stats.clear()
+
+
+def _get_stats(name):
+    if name not in _stats:
+        _stats[name] = {'constructions': 0, 'construction_seconds': 0.0, 'hits': 0}
+
+    return _stats[name]
+
+
+def get_client(name, factory, *args, **kwargs):
+    """Get the client of this process, it is created just once per worker and reused after that
+
+    Args:
+        name (str): Name of the client, like `storage` or `datastore`.
+        factory (callable): Class or function that creates the client, like `storage.Client`.
+
+    Returns:
+        object: The client returned by the factory.
+    """
+    # the factory is part of the key to get a new client when it was replaced, for instance by a mock
+    key = (name, factory, args, tuple(sorted(kwargs.items())))
+
+    with _lock:
+        _check_pid()
+        stats = _get_stats(name)
+
+        if key in _clients:
+            stats['hits'] += 1
+            return _clients[key]
+
+        start = time.perf_counter()
+
+        resolve_credentials()
+        client = factory(*args, **kwargs)
+
+        stats['constructions'] += 1
+        stats['construction_seconds'] += time.perf_counter() - start
+
+        logger.debug(f'Google Cloud client {name} was created in the process {_pid}')
+
+        _clients[key] = client
+        return client
+
+
+def _get_id_token_expiration(token):
+    from google.auth import jwt
+
+    try:
+        payload = jwt.decode(token, verify=False)
+
+    except Exception:
+        payload = {}
+
+    if 'exp' in payload:
+        return payload['exp'] - ID_TOKEN_EXPIRATION_MARGIN
+
+    return time.time() + ID_TOKEN_DEFAULT_TTL
+
+
+def get_id_token(audience):
+    """Get a ID token for the audience, it is fetched again shortly before expire
+
+    Args:
+        audience (str): URL of the service that receives the token.
+
+    Returns:
+        str: ID token.
+    """
+    from google.auth.transport.requests import Request as GCRequest
+    from google.oauth2.id_token import fetch_id_token
+
+    with _lock:
+        _check_pid()
+        stats = _get_stats('id_token')
+
+        if audience in _id_tokens:
+            token, expires_at = _id_tokens[audience]
+            if time.time() < expires_at:
+                stats['hits'] += 1
+                return token
+
+        start = time.perf_counter()
+
+        resolve_credentials()
+        token = fetch_id_token(GCRequest(), audience)
+
+        stats['constructions'] += 1
+        stats['construction_seconds'] += time.perf_counter() - start
+
+        _id_tokens[audience] = (token, _get_id_token_expiration(token))
+        return token
+
+
+def get_client_stats():
+    """Get the number of constructions, the seconds spent on them and the reuses of each client"""
+    with _lock:
+        _check_pid()
+
+        return {
+            name: {
+                **value,
+                'average_construction_seconds':
+                value['construction_seconds'] / value['constructions'] if value['constructions'] else 0.0,
+            }
+            for name, value in _stats.items()
+        }
+
+
+def reset_clients():
+    """Drop all the clients and the ID tokens of this process"""
+    global _pid
+
+    with _lock:
+        _pid = None
+        _check_pid()
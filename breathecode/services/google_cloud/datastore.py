@@ -2,7 +2,7 @@ import logging
 
 import google.cloud.datastore as datastore
 
-from .credentials import resolve_credentials
+from .clients import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +14,7 @@ class Datastore:
     client = None
 
     def __init__(self):
-        resolve_credentials()
-        self.client = datastore.Client()
+        self.client = get_client('datastore', datastore.Client)
 
     def fetch(self, order_by=None, **kwargs):
         """Get Fetch object
@@ -61,18 +60,116 @@ class Datastore:
         entity.update(data)
         self.client.put(entity)
 
+    def allocate_ids(self, key: str, count: int) -> list:
+        """Reserve the ids of `count` entities before save them
+
+        Args:
+            key (str): Kind of the entities.
+            count (int): Number of ids.
+
+        Returns:
+            list: the ids.
+        """
+        if not count:
+            return []
+
+        return [x.id for x in self.client.allocate_ids(self.client.key(key), count)]
+
+    def update_multi(self, key: str, data: list, chunk_size=500, ids=None):
+        """Save many entities with one request per chunk, Datastore accepts up to 500 entities per commit
+
+        Args:
+            key (str): Kind of the entities.
+            data (list): Properties of each entity.
+            chunk_size (int): Max number of entities per request.
+            ids (list): Ids got from `allocate_ids`, with them save again the same data overwrites the
+                entities instead of duplicate them.
+        """
+        entities = []
+        for index, fields in enumerate(data):
+            entity = datastore.Entity(self.client.key(key, ids[index]) if ids else self.client.key(key))
+            entity.update(fields)
+            entities.append(entity)
+
+        for index in range(0, len(entities), chunk_size):
+            self.client.put_multi(entities[index:index + chunk_size])
+
+    def fetch_page(self, order_by=None, cursor=None, limit=100, **kwargs):
+        """Get a page of entities starting at the cursor, it doesn't skip the previous entities like `offset`
+
+        Args:
+            cursor (str): Cursor returned in the previous page, None for the first page.
+            limit (int): Max number of entities in the page.
+            **kwargs: Arguments to Google Cloud Datastore
+
+        Returns:
+            tuple: the entities and the cursor of the next page, the cursor is None in the last page.
+        """
+        query = self.__query__(order_by, **kwargs)
+        iterator = query.fetch(limit=limit, start_cursor=cursor or None)
+
+        page = next(iterator.pages, [])
+        entities = list(page)
+
+        next_cursor = iterator.next_page_token
+        if isinstance(next_cursor, bytes):
+            next_cursor = next_cursor.decode('utf-8')
+
+        if len(entities) < limit:
+            next_cursor = None
+
+        return entities, next_cursor
+
+    def iterate(self, order_by=None, batch_size=100, **kwargs):
+        """Iterate over the entities, they are requested in batches while they are being consumed
+
+        Args:
+            batch_size (int): Number of entities requested per batch.
+            **kwargs: Arguments to Google Cloud Datastore
+
+        Returns:
+            generator: Entities.
+        """
+        cursor = None
+
+        while True:
+            entities, cursor = self.fetch_page(order_by=order_by, cursor=cursor, limit=batch_size, **kwargs)
+            yield from entities
+
+            if not cursor:
+                break
+
     def count(self, order_by=None, **kwargs):
         """
         Count method for total entities on a query
 
         """
 
+        query = self.__query__(**kwargs)
+
+        # COUNT aggregation, the server returns the total instead of all the keys
+        if hasattr(self.client, 'aggregation_query'):
+            aggregation = self.client.aggregation_query(query).count(alias='total')
+
+            for results in aggregation.fetch():
+                for result in results:
+                    if result.alias == 'total':
+                        return result.value
+
+            return 0
+
+        query.keys_only()
+
+        return len(list(query.fetch()))
+
+    def __query__(self, order_by=None, **kwargs):
         kind = kwargs.pop('kind')
         query = self.client.query(kind=kind)
 
         for key in kwargs:
             query.add_filter(key, '=', kwargs[key])
 
-        query.keys_only()
+        if order_by:
+            query.order = order_by
 
-        return len(list(query.fetch()))
+        return query
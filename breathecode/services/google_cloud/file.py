@@ -37,6 +37,22 @@ class File:
         if public:
             self.blob.make_public()
 
+    def stream_upload(self,
+                      content_type: str = 'text/plain',
+                      content_encoding: str = None,
+                      chunk_size: int = 8 * 1024 * 1024):
+        """Writable file that upload the Blob in chunks using a resumable upload"""
+        self.blob = self.bucket.blob(self.file_name)
+
+        if content_encoding:
+            self.blob.content_encoding = content_encoding
+
+        return self.blob.open('wb', chunk_size=chunk_size, content_type=content_type)
+
+    def stream_read(self, chunk_size: int = 8 * 1024 * 1024):
+        """Readable file that download the Blob in chunks"""
+        return self.bucket.blob(self.file_name).open('rb', chunk_size=chunk_size)
+
     def url(self) -> str:
         """Delete Blob from Bucker"""
         # TODO Private url
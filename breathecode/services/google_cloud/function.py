@@ -1,6 +1,6 @@
 import logging, json, requests
-from google.auth.transport.requests import Request as GCRequest
 from .credentials import resolve_credentials
+from .clients import get_id_token
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +29,7 @@ class Function:
             Returns:
                 Response (dict): Google Cloud Function response
         """
-        from google.oauth2.id_token import fetch_id_token
-
-        auth_req = GCRequest()
-        id_token = fetch_id_token(auth_req, 'https://' + self.service_url)
+        id_token = get_id_token('https://' + self.service_url)
         headers = {'Authorization': f'Bearer {id_token}'}
 
         if data:
@@ -1,8 +1,11 @@
 from datetime import datetime
 from typing import Any
 from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.db import connection
 from django.db.models import Model
 from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
 from ..sha256_mixin import Sha256Mixin
 from ..token_mixin import TokenMixin
 
@@ -155,3 +158,44 @@ class Check:
             self._parent.fail('The first argument is not a QuerySet')
 
         self._parent.assertEqual([x.pk for x in query], pks)
+
+    def constant_queries(self, function: callable, grow: callable) -> None:
+        """
+        Check that the number of queries of `function` doesn't depend on the number of rows, it runs
+        `function`, then `grow` to add more rows and then `function` again, the cache is cleared before
+        each measured run to avoid that a cached response hides the queries.
+
+        Usage:
+
+        ```py
+        url = reverse_lazy('admissions:academy_cohort')
+        self.bc.database.create(cohort=1, ...)
+
+        # pass because the serializer relations are joined or prefetched
+        self.bc.check.constant_queries(lambda: self.client.get(url),
+                                       lambda: self.bc.database.create(cohort=10, ...))  # 🟢
+
+        # fail if the view runs one query per cohort
+        self.bc.check.constant_queries(lambda: self.client.get(url),
+                                       lambda: self.bc.database.create(cohort=10, ...))  # 🔴
+        ```
+        """
+
+        # warm up the caches that live in memory, like the capabilities
+        function()
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as before:
+            function()
+
+        grow()
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as after:
+            function()
+
+        if len(before) != len(after):
+            queries = '\n'.join(x['sql'] for x in after.captured_queries)
+            self._parent.fail(
+                f'The queries grew from {len(before)} to {len(after)} when more rows were added:'
+                f'\n{queries}')
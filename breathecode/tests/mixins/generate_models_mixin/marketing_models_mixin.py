@@ -28,6 +28,8 @@ class MarketingModelsMixin(ModelsMixin):
                                   lead_generation_app_kwargs={},
                                   downloadable=False,
                                   downloadable_kwargs={},
+                                  lead_rollup=False,
+                                  lead_rollup_kwargs={},
                                   models={},
                                   **kwargs):
         """Generate models"""
@@ -162,4 +164,15 @@ class MarketingModelsMixin(ModelsMixin):
                 **short_link_kwargs
             })
 
+        if not 'lead_rollup' in models and is_valid(lead_rollup):
+            kargs = {}
+
+            if 'academy' in models:
+                kargs['academy'] = just_one(models['academy'])
+
+            models['lead_rollup'] = create_models(lead_rollup, 'marketing.LeadRollup', **{
+                **kargs,
+                **lead_rollup_kwargs
+            })
+
         return models
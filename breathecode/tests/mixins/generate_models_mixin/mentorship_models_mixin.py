@@ -11,6 +11,7 @@ class MentorshipModelsMixin(ModelsMixin):
                                    mentor_profile=False,
                                    mentorship_bill=False,
                                    mentorship_session=False,
+                                   daily_room=False,
                                    models={},
                                    **kwargs):
         models = models.copy()
@@ -65,4 +66,7 @@ class MentorshipModelsMixin(ModelsMixin):
             models['mentorship_session'] = create_models(mentorship_session, 'mentorship.MentorshipSession',
                                                          **kargs)
 
+        if not 'daily_room' in models and is_valid(daily_room):
+            models['daily_room'] = create_models(daily_room, 'mentorship.DailyRoom')
+
         return models
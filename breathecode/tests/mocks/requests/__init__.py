@@ -18,6 +18,7 @@ REQUESTS_PATH = {
     'delete': 'requests.delete',
     'head': 'requests.head',
     'request': 'requests.request',
+    'session_request': 'requests.Session.request',
 }
 
 REQUESTS_INSTANCES = {
@@ -33,3 +33,11 @@ class ResponseMock():
     def json(self) -> dict:
         """Convert Response to JSON"""
         return self.data
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        content = self.content.encode('utf-8') if isinstance(self.content, str) else self.content
+        for index in range(0, len(content), chunk_size):
+            yield content[index:index + chunk_size]
+
+    def close(self):
+        pass
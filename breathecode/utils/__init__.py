@@ -11,6 +11,7 @@ from .header_limit_offset_pagination import *
 from .localize_query import *
 from .permissions import *
 from .script_notification import *
+from .search import *
 from .validation_exception import *
 from .generate_lookups_mixin import *
 from .num_to_roman import *
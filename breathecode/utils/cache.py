@@ -1,62 +1,99 @@
-import urllib.parse, json, re, os
-from django.core.cache import cache, caches
+import urllib.parse, json, time
+from django.core.cache import cache
 from datetime import datetime
 from breathecode.tests.mixins import DatetimeMixin
 
 __all__ = ['Cache']
 
+# one week, the generation counters invalidate the keys long before of that
+DEFAULT_TTL = 60 * 60 * 24 * 7
+
 
 class Cache(DatetimeMixin):
+    """
+    Versioned namespace cache.
+
+    Each model has a generation counter stored in the cache, every key embeds the generation of its
+    model and the generations of the models declared in `depends`, so invalidate a model is one
+    atomic INCR per model instead of remove each key, the old entries are unreachable and they will
+    expire through its TTL.
+    """
+
     model: str
-    parents: list[str]
+    depends: list[str] = []
+    parents: list[str] = []
+    ttl: int = DEFAULT_TTL
 
-    def __generate_key__(self, storage_key=False, parent='', **kwargs):
-        key = self.model if not parent else parent
+    # process-wide counters, shared by all the instances of the same model
+    __stats__: dict[str, dict[str, int]] = {}
 
-        if storage_key:
-            return f'{key}__keys'
+    def __generate_version_key__(self, model: str) -> str:
+        return f'{model}__version'
 
-        credentials = urllib.parse.urlencode(kwargs)
-        return f'{key}__{credentials}'
+    def __new_version__(self) -> int:
+        # it use the time as seed, so if the counter was evicted the old keys continue being unreachable
+        return int(time.time() * 1000)
 
-    def __add_key_to_storage__(self, key: str):
-        storage_key = self.__generate_key__(storage_key=True)
+    def __get_versions__(self) -> list[int]:
+        models = [self.model, *self.depends]
+        version_keys = [self.__generate_version_key__(model) for model in models]
+        versions = cache.get_many(version_keys)
 
-        json_data = cache.get(storage_key)
-        keys = json.loads(json_data) if json_data else []
+        result = []
+        for version_key in version_keys:
+            version = versions.get(version_key)
 
-        keys.append(key)
+            if version is None:
+                cache.add(version_key, self.__new_version__(), timeout=None)
+                version = cache.get(version_key)
 
-        json_data = json.dumps(keys)
-        cache.set(storage_key, json_data)
+            result.append(version)
 
-    def keys(self):
-        # we get key from cache to support multiprocess
-        key = self.__generate_key__(storage_key=True)
-        json_data = cache.get(key)
-        return json.loads(json_data) if json_data else []
+        return result
+
+    def __generate_key__(self, **kwargs) -> str:
+        versions = '.'.join([str(x) for x in self.__get_versions__()])
+        credentials = urllib.parse.urlencode(kwargs)
+        return f'{self.model}__v{versions}__{credentials}'
 
-    def __clear_one__(self, parent=''):
-        # we get key from cache to support multiprocess
-        storage_key = self.__generate_key__(storage_key=True, parent=parent)
-        keys = self.keys()
+    def __bump__(self, model: str) -> None:
+        version_key = self.__generate_version_key__(model)
 
-        for key in keys:
-            cache.set(key, None)
+        try:
+            cache.incr(version_key)
 
-        cache.set(storage_key, None)
+        except ValueError:
+            # the counter does not exists yet or it was evicted
+            if not cache.add(version_key, self.__new_version__(), timeout=None):
+                cache.incr(version_key)
+
+    def __count__(self, name: str) -> None:
+        if self.model not in Cache.__stats__:
+            Cache.__stats__[self.model] = {'hits': 0, 'misses': 0}
+
+        Cache.__stats__[self.model][name] += 1
+
+    def stats(self) -> dict[str, int]:
+        """Get the hits and misses of this model in the current process."""
+        return {'hits': 0, 'misses': 0, **Cache.__stats__.get(self.model, {})}
 
     def clear(self):
-        # we get key from cache to support multiprocess
+        # we bump the counters in the cache to support multiprocess
         for parent in self.parents:
-            self.__clear_one__(parent)
+            self.__bump__(parent)
 
-        self.__clear_one__()
+        self.__bump__(self.model)
 
     def get(self, **kwargs) -> dict:
         key = self.__generate_key__(**kwargs)
         json_data = cache.get(key)
-        return json.loads(json_data) if json_data else None
+
+        if json_data:
+            self.__count__('hits')
+            return json.loads(json_data)
+
+        self.__count__('misses')
+        return None
 
     def __fix_fields__(self, data):
         for key in data.keys():
@@ -95,6 +132,4 @@ class Cache(DatetimeMixin):
         data = self.__fix_fields_in_array__(data)
 
         json_data = json.dumps(data)
-        cache.set(key, json_data)
-
-        self.__add_key_to_storage__(key)
+        cache.set(key, json_data, timeout=self.ttl)
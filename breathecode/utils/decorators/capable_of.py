@@ -1,5 +1,5 @@
 from rest_framework.exceptions import PermissionDenied
-from breathecode.authenticate.models import ProfileAcademy
+from breathecode.authenticate.caches import CapabilityCache
 from django.contrib.auth.models import AnonymousUser
 
 from breathecode.utils.exceptions import ProgramingError
@@ -65,11 +65,7 @@ def get_academy_from_capability(kwargs, request, capability):
     if isinstance(request.user, AnonymousUser):
         raise PermissionDenied('Invalid user')
 
-    capable = ProfileAcademy.objects.filter(user=request.user.id,
-                                            academy__id=academy_id,
-                                            role__capabilities__slug=capability)
-
-    if capable.count() == 0:
+    if not CapabilityCache().has_capability(request.user.id, academy_id, capability):
         raise PermissionDenied(
             f"You (user: {request.user.id}) don't have this capability: {capability} for academy {academy_id}"
         )
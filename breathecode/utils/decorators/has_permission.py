@@ -3,17 +3,14 @@ from rest_framework.views import APIView
 
 from ..validation_exception import ValidationException
 from ..exceptions import ProgramingError
-from breathecode.authenticate.models import Permission, User
+from breathecode.authenticate.caches import CapabilityCache
+from breathecode.authenticate.models import User
 
 __all__ = ['has_permission', 'validate_permission']
 
 
 def validate_permission(user: User, permission: str) -> bool:
-    found = Permission.objects.filter(codename=permission).first()
-    if not found:
-        return False
-
-    return found.user_set.filter(id=user.id).count() or found.group_set.filter(user__id=user.id).count()
+    return CapabilityCache().has_permission(user.id, permission)
 
 
 def has_permission(permission: str):
@@ -1,4 +1,11 @@
+import base64, hashlib, json
 from collections import OrderedDict
+from typing import Optional
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db import connection
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.utils.urls import replace_query_param, remove_query_param
@@ -7,10 +14,23 @@ __all__ = ['HeaderLimitOffsetPagination']
 
 
 class HeaderLimitOffsetPagination(LimitOffsetPagination):
+    use_cursor = False
+    cursor_query_param = 'cursor'
+
+    # the cursor mode don't count the rows, set it to 'estimate' or 'cached' to get the x-total-count header,
+    # 'estimate' reads the row estimate of the table so it just applies to the lists without filters
+    cursor_count: Optional[str] = None
+    cursor_count_ttl = 60 * 5
+
     def paginate_queryset(self, queryset, request, view=None):
         self.use_envelope = True
         if str(request.GET.get('envelope')).lower() in ['false', '0']:
             self.use_envelope = False
+
+        self.use_cursor = self.cursor_query_param in request.GET and hasattr(queryset, 'filter')
+        if self.use_cursor:
+            return self.__paginate_by_cursor__(queryset, request)
+
         result = super().paginate_queryset(queryset, request, view)
         if hasattr(queryset, 'filter'):
             return result
@@ -26,10 +46,17 @@ class HeaderLimitOffsetPagination(LimitOffsetPagination):
         if count:
             self.count = count
 
-        next_url = self.__parse_comma__(self.get_next_link())
-        previous_url = self.__parse_comma__(self.get_previous_link())
-        first_url = self.__parse_comma__(self.get_first_link())
-        last_url = self.__parse_comma__(self.get_last_link())
+        if self.use_cursor:
+            next_url = self.__parse_comma__(self.__next_cursor_link__)
+            previous_url = self.__parse_comma__(self.__previous_cursor_link__)
+            first_url = self.__parse_comma__(self.__first_cursor_link__)
+            last_url = self.__parse_comma__(self.__last_cursor_link__)
+
+        else:
+            next_url = self.__parse_comma__(self.get_next_link())
+            previous_url = self.__parse_comma__(self.get_previous_link())
+            first_url = self.__parse_comma__(self.get_first_link())
+            last_url = self.__parse_comma__(self.get_last_link())
 
         links = []
         for label, url in (
@@ -42,7 +69,8 @@ class HeaderLimitOffsetPagination(LimitOffsetPagination):
                 links.append('<{}>; rel="{}"'.format(url, label))
 
         headers = {'Link': ', '.join(links)} if links else {}
-        headers['x-total-count'] = self.count
+        if self.count is not None:
+            headers['x-total-count'] = self.count
 
         if self.use_envelope:
             data = OrderedDict([('count', self.count), ('first', first_url), ('next', next_url),
@@ -70,10 +98,168 @@ class HeaderLimitOffsetPagination(LimitOffsetPagination):
         return replace_query_param(url, self.offset_query_param, offset)
 
     def is_paginate(self, request):
-        return (request.GET.get(self.limit_query_param) or request.GET.get(self.offset_query_param))
+        return (request.GET.get(self.limit_query_param) or request.GET.get(self.offset_query_param)
+                or self.cursor_query_param in request.GET)
 
     def pagination_params(self, request):
-        return {
+        params = {
             self.limit_query_param: request.GET.get(self.limit_query_param),
             self.offset_query_param: request.GET.get(self.offset_query_param),
         }
+
+        if self.cursor_query_param in request.GET:
+            params[self.cursor_query_param] = request.GET.get(self.cursor_query_param)
+
+        return params
+
+    def __get_cursor_fields__(self, queryset) -> list[str]:
+        pk = queryset.model._meta.pk.name
+
+        try:
+            queryset.model._meta.get_field('created_at')
+            return ['created_at', pk]
+
+        except FieldDoesNotExist:
+            return [pk]
+
+    def __encode_cursor__(self, item, fields: list[str], reverse=False) -> str:
+        position = [getattr(item, field) for field in fields] if item else []
+        position = [x.isoformat() if hasattr(x, 'isoformat') else x for x in position]
+
+        data = json.dumps({'p': position, 'r': reverse}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('utf-8')
+
+    def __decode_cursor__(self, cursor: str, fields: list[str]) -> tuple[list, bool]:
+        if not cursor:
+            return [], False
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8'))
+            position = data['p']
+            reverse = bool(data['r'])
+
+        except (ValueError, KeyError, TypeError):
+            return [], False
+
+        if position and len(position) != len(fields):
+            return [], False
+
+        if position and fields[0] == 'created_at':
+            position[0] = parse_datetime(position[0])
+
+        return position, reverse
+
+    def __cursor_lookup__(self, fields: list[str], position: list, operator: str) -> Q:
+        # (a, b) < (x, y) is equal to a < x or (a = x and b < y)
+        query = Q()
+        for index, field in enumerate(fields):
+            equals = {fields[i]: position[i] for i in range(index)}
+            query |= Q(**equals, **{f'{field}__{operator}': position[index]})
+
+        return query
+
+    def __cursor_link__(self, cursor: Optional[str]) -> str:
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.cursor_query_param, cursor or '')
+
+    def __paginate_by_cursor__(self, queryset, request):
+        """
+        Keyset pagination, the rows are sorted descending by `(created_at, id)` and each page starts
+        after the last row of the previous one, so it does not need `OFFSET` nor `COUNT(*)`.
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = 0
+
+        fields = self.__get_cursor_fields__(queryset)
+        position, reverse = self.__decode_cursor__(request.GET.get(self.cursor_query_param), fields)
+
+        self.count = self.__get_total_count__(queryset)
+
+        if reverse:
+            ordering = fields
+            if position:
+                queryset = queryset.filter(self.__cursor_lookup__(fields, position, 'gt'))
+
+        else:
+            ordering = [f'-{field}' for field in fields]
+            if position:
+                queryset = queryset.filter(self.__cursor_lookup__(fields, position, 'lt'))
+
+        items = list(queryset.order_by(*ordering)[:self.limit + 1])
+        has_more = len(items) > self.limit
+        items = items[:self.limit]
+
+        if reverse:
+            items.reverse()
+            has_next = bool(position)
+            has_previous = has_more
+
+        else:
+            has_next = has_more
+            has_previous = bool(position)
+
+        self.__first_cursor_link__ = self.__cursor_link__(None) if has_previous else None
+        self.__previous_cursor_link__ = (self.__cursor_link__(
+            self.__encode_cursor__(items[0], fields, reverse=True)) if has_previous and items else None)
+        self.__next_cursor_link__ = (self.__cursor_link__(self.__encode_cursor__(items[-1], fields))
+                                     if has_next and items else None)
+        self.__last_cursor_link__ = (self.__cursor_link__(self.__encode_cursor__(None, fields, reverse=True))
+                                     if has_next else None)
+
+        return items
+
+    def paginate_cursor_page(self, items: list, request, next_cursor: Optional[str], count=None):
+        """
+        Pagination of a page that was got with the cursor of other storage, like Datastore, it only
+        can move forward, so it just has the `first` and `next` links.
+        """
+        self.use_envelope = True
+        if str(request.GET.get('envelope')).lower() in ['false', '0']:
+            self.use_envelope = False
+
+        self.use_cursor = True
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = 0
+        self.count = count
+
+        cursor = request.GET.get(self.cursor_query_param)
+
+        self.__first_cursor_link__ = self.__cursor_link__(None) if cursor else None
+        self.__previous_cursor_link__ = None
+        self.__next_cursor_link__ = self.__cursor_link__(next_cursor) if next_cursor else None
+        self.__last_cursor_link__ = None
+
+        return items
+
+    def __get_total_count__(self, queryset) -> Optional[int]:
+        if self.cursor_count is None:
+            return None
+
+        has_filters = bool(queryset.query.where)
+        if self.cursor_count == 'estimate' and not has_filters and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                               [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+
+            # the table was never analyzed
+            if row and row[0] >= 0:
+                return row[0]
+
+        try:
+            signature = str(queryset.query)
+
+        except EmptyResultSet:
+            return 0
+
+        key = 'Pagination__count__' + hashlib.sha1(signature.encode('utf-8')).hexdigest()
+        count = cache.get(key)
+
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, timeout=self.cursor_count_ttl)
+
+        return count
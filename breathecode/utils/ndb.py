@@ -1,4 +1,4 @@
-from breathecode.services.google_cloud.credentials import resolve_credentials
+from breathecode.services.google_cloud.clients import get_client
 
 __all__ = ['NDB']
 
@@ -6,24 +6,17 @@ __all__ = ['NDB']
 class NDB:
     def __init__(self, Model):
         from google.cloud import ndb
-        resolve_credentials()
-        self.client = ndb.Client()
+        self.client = get_client('ndb', ndb.Client)
         self.Model = Model
 
     def fetch(self, query, **kwargs):
-        from google.cloud import ndb
-        client = ndb.Client()
-
-        with client.context():
+        with self.client.context():
             query = self.Model.query().filter(*query)
 
             elements = query.fetch(**kwargs)
             return [c.to_dict() for c in elements]
 
     def count(self, query):
-        from google.cloud import ndb
-        client = ndb.Client()
-
-        with client.context():
+        with self.client.context():
             query = self.Model.query().filter(*query)
             return query.count()
@@ -0,0 +1,96 @@
+from typing import Optional
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db import connection, migrations
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.models.functions import Greatest
+
+__all__ = ['SearchBackend', 'create_search_indexes']
+
+SEARCH_CONFIG = 'simple'
+
+
+class SearchBackend:
+    """
+    Search of the list endpoints.
+
+    On postgres the query is matched with the full-text vector of the fields and with a
+    substring lookup backed by trigram indexes, and the results are sorted by rank, the indexes
+    are created in the migrations with `create_search_indexes`. Other databases, like sqlite in
+    the tests, fall back to the substring lookup and keep the order of the queryset.
+    """
+    def __init__(self, fields: list[str], related: Optional[list[tuple]] = None, config=SEARCH_CONFIG):
+        self.fields = fields
+
+        # (model, field that points to the searched model, field), they are matched with EXISTS, a
+        # join would return one row per related row
+        self.related = related or []
+        self.config = config
+
+    def is_full_text(self) -> bool:
+        return connection.vendor == 'postgresql'
+
+    def __lookup__(self, query: str) -> Q:
+        lookup = Q()
+        for field in self.fields:
+            lookup |= Q(**{f'{field}__icontains': query})
+
+        for model, foreign_key, field in self.related:
+            related = model.objects.filter(**{foreign_key: OuterRef('pk'), f'{field}__icontains': query})
+            lookup |= Q(Exists(related))
+
+        return lookup
+
+    def filter(self, queryset: QuerySet, query: Optional[str], rank=True) -> QuerySet:
+        """Filter the queryset by the query, if `rank` the results are sorted by relevance."""
+
+        if not query:
+            return queryset
+
+        lookup = self.__lookup__(query)
+        if not self.is_full_text():
+            return queryset.filter(lookup)
+
+        vector = SearchVector(*self.fields, config=self.config)
+        search_query = SearchQuery(query, config=self.config, search_type='websearch')
+
+        queryset = queryset.annotate(search_vector=vector).filter(Q(search_vector=search_query) | lookup)
+        if not rank:
+            return queryset
+
+        similarities = [TrigramSimilarity(field, query) for field in self.fields]
+        similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+
+        search_rank = SearchRank(vector, search_query) + similarity
+        return queryset.annotate(search_rank=search_rank).order_by('-search_rank')
+
+
+def create_search_indexes(table: str, fields: list[str], config=SEARCH_CONFIG) -> migrations.RunPython:
+    """
+    Migration operation that creates the gin indexes used by SearchBackend, a trigram index by
+    field, over the same `UPPER(field::text)` that icontains uses, and one index of the full-text
+    vector of all the fields. It does nothing outside of postgres.
+    """
+
+    names = [f'{table}_{field}_trgm' for field in fields] + [f'{table}_search']
+    vector = " || ' ' || ".join([f"COALESCE({field}, '')" for field in fields])
+
+    def forwards(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for field in fields:
+            schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {table}_{field}_trgm ON {table} '
+                                  f'USING gin (UPPER({field}::text) gin_trgm_ops)')
+
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {table}_search ON {table} '
+                              f"USING gin (to_tsvector('{config}'::regconfig, {vector}))")
+
+    def backwards(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+
+        for name in names:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+    return migrations.RunPython(forwards, backwards)
@@ -1 +1,2 @@
 from .serpy_extensions import *
+from .prefetch_serializer import *
@@ -0,0 +1,111 @@
+import copy
+import serpy
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, QuerySet
+
+__all__ = ['prefetch_serializer', 'get_serializer_relations']
+
+
+def get_serializer_relations(serializer, prefix: str = '') -> list[str | Prefetch]:
+    """
+    Get the relations that a serializer walks, the nested serializers are followed automatically and the
+    relations used by `MethodField` must be declared in the `relations` attribute of the serializer.
+
+    Usage:
+
+    ```py
+    class CohortSerializer(serpy.Serializer):
+        relations = [Prefetch('cohorttimeslot_set')]
+        academy = AcademySerializer()
+        timeslots = serpy.MethodField()
+
+    get_serializer_relations(CohortSerializer)  # ['academy', ..., Prefetch('cohorttimeslot_set')]
+    ```
+    """
+
+    if not isinstance(serializer, type):
+        serializer = type(serializer)
+
+    relations = []
+
+    for name, field in serializer._field_map.items():
+        if not isinstance(field, serpy.Serializer):
+            continue
+
+        lookup = prefix + (field.attr or name)
+        relations.append(lookup)
+        relations += get_serializer_relations(field, f'{lookup}__')
+
+    for relation in getattr(serializer, 'relations', []):
+        if isinstance(relation, Prefetch):
+            relation = copy.copy(relation)
+            if prefix:
+                relation.add_prefix(prefix[:-2])
+
+            relations.append(relation)
+
+        else:
+            relations.append(prefix + relation)
+
+    return relations
+
+
+def is_single_valued(model: Model, lookup: str) -> bool | None:
+    """Return True if it can be joined, False if it must be prefetched and None if it is not a relation"""
+
+    result = True
+
+    for part in lookup.split('__'):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+
+        if not field.is_relation:
+            return None
+
+        if field.many_to_many or field.one_to_many:
+            result = False
+
+        model = field.related_model
+
+    return result
+
+
+def prefetch_serializer(queryset: QuerySet, serializer) -> QuerySet:
+    """
+    Apply the `select_related` and `prefetch_related` that the serializer needs to avoid one query per row.
+
+    Usage:
+
+    ```py
+    items = prefetch_serializer(Cohort.objects.filter(academy__id=1), GetCohortSerializer)
+    serializer = GetCohortSerializer(items, many=True)
+    ```
+    """
+
+    select_related = []
+    prefetch_related = []
+
+    for relation in get_serializer_relations(serializer):
+        if isinstance(relation, Prefetch):
+            prefetch_related.append(relation)
+            continue
+
+        single_valued = is_single_valued(queryset.model, relation)
+        if single_valued is None:
+            continue
+
+        if single_valued:
+            select_related.append(relation)
+
+        else:
+            prefetch_related.append(relation)
+
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+
+    return queryset
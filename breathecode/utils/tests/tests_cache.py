@@ -0,0 +1,89 @@
+from breathecode.utils import Cache
+from .mixins import UtilsTestCase
+
+
+class KennyCache(Cache):
+    model = 'Kenny'
+    depends = ['SouthPark']
+    parents = ['Cartman']
+
+
+class CartmanCache(Cache):
+    model = 'Cartman'
+
+
+class SouthParkCache(Cache):
+    model = 'SouthPark'
+
+
+class CacheTestSuite(UtilsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.bc.cache.clear()
+
+    """
+    🔽🔽🔽 get and set
+    """
+
+    def test_get__without_data(self):
+        cache = KennyCache()
+        self.assertEqual(cache.get(slug='kenny'), None)
+
+    def test_set__and_get(self):
+        cache = KennyCache()
+        cache.set({'name': 'Kenny'}, slug='kenny')
+
+        self.assertEqual(cache.get(slug='kenny'), {'name': 'Kenny'})
+        self.assertEqual(cache.get(slug='stan'), None)
+
+    """
+    🔽🔽🔽 clear
+    """
+
+    def test_clear(self):
+        cache = KennyCache()
+        cache.set({'name': 'Kenny'}, slug='kenny')
+        cache.clear()
+
+        self.assertEqual(cache.get(slug='kenny'), None)
+
+    def test_clear__invalidate_parents(self):
+        cache = KennyCache()
+        cartman_cache = CartmanCache()
+        cartman_cache.set({'name': 'Cartman'}, slug='cartman')
+        cache.clear()
+
+        self.assertEqual(cartman_cache.get(slug='cartman'), None)
+
+    def test_clear__of_depends_invalidate_the_dependents(self):
+        cache = KennyCache()
+        cache.set({'name': 'Kenny'}, slug='kenny')
+        SouthParkCache().clear()
+
+        self.assertEqual(cache.get(slug='kenny'), None)
+
+    def test_clear__does_not_invalidate_others(self):
+        cache = CartmanCache()
+        kenny_cache = KennyCache()
+        kenny_cache.set({'name': 'Kenny'}, slug='kenny')
+        cache.clear()
+
+        self.assertEqual(kenny_cache.get(slug='kenny'), {'name': 'Kenny'})
+
+    """
+    🔽🔽🔽 stats
+    """
+
+    def test_stats(self):
+        cache = SouthParkCache()
+        before = cache.stats()
+
+        cache.get(slug='south-park')
+        cache.set({'name': 'South Park'}, slug='south-park')
+        cache.get(slug='south-park')
+        cache.get(slug='south-park')
+
+        self.assertEqual(cache.stats(), {
+            'hits': before['hits'] + 2,
+            'misses': before['misses'] + 1,
+        })
@@ -0,0 +1,90 @@
+import os
+import time
+from unittest.mock import MagicMock, call, patch
+from breathecode.services.google_cloud import Storage, Datastore, Function
+from breathecode.services.google_cloud import clients
+from breathecode.tests.mocks import (
+    GOOGLE_CLOUD_PATH,
+    apply_google_cloud_client_mock,
+    REQUESTS_PATH,
+    apply_requests_post_mock,
+)
+from .mixins import UtilsTestCase
+
+FUNCTION_URL = 'https://us-central1-potato.cloudfunctions.net/resize-image'
+
+
+class GoogleCloudClientsTestSuite(UtilsTestCase):
+    def setUp(self):
+        super().setUp()
+        clients.reset_clients()
+
+    """
+    🔽🔽🔽 get_client
+    """
+
+    @patch('breathecode.services.google_cloud.clients.resolve_credentials', MagicMock())
+    @patch(GOOGLE_CLOUD_PATH['client'], apply_google_cloud_client_mock())
+    def test_storage__client_is_reused(self):
+        from google.cloud.storage import Client
+        Client.call_args_list = []
+
+        storage1 = Storage()
+        storage2 = Storage()
+
+        self.assertIs(storage1.client, storage2.client)
+        self.assertEqual(Client.call_args_list, [call()])
+        self.assertEqual(clients.resolve_credentials.call_args_list, [call()])
+
+        stats = clients.get_client_stats()
+        self.assertEqual(stats['storage']['constructions'], 1)
+        self.assertEqual(stats['storage']['hits'], 1)
+
+    @patch('breathecode.services.google_cloud.clients.resolve_credentials', MagicMock())
+    @patch('google.cloud.datastore.Client', MagicMock())
+    def test_datastore__client_is_reused(self):
+        from google.cloud.datastore import Client
+
+        self.assertIs(Datastore().client, Datastore().client)
+        self.assertEqual(Client.call_args_list, [call()])
+
+    @patch('breathecode.services.google_cloud.clients.resolve_credentials', MagicMock())
+    def test_get_client__new_client_after_fork(self):
+        factory = MagicMock(side_effect=lambda: object())
+
+        client = clients.get_client('storage', factory)
+
+        with patch('os.getpid', MagicMock(return_value=os.getpid() + 1)):
+            self.assertIsNot(clients.get_client('storage', factory), client)
+
+        self.assertEqual(factory.call_args_list, [call(), call()])
+
+    """
+    🔽🔽🔽 get_id_token
+    """
+
+    @patch('breathecode.services.google_cloud.clients.resolve_credentials', MagicMock())
+    @patch('breathecode.services.google_cloud.function.resolve_credentials', MagicMock())
+    @patch('google.auth.jwt.decode', MagicMock(return_value={'exp': time.time() + 3600}))
+    @patch('google.oauth2.id_token.fetch_id_token', MagicMock(return_value='blablabla'))
+    @patch(REQUESTS_PATH['post'], apply_requests_post_mock([(200, FUNCTION_URL, {})]))
+    def test_function__id_token_is_reused(self):
+        from google.oauth2.id_token import fetch_id_token
+
+        function = Function(region='us-central1', project_id='potato', name='resize-image')
+        function.call()
+        function.call()
+
+        self.assertEqual(len(fetch_id_token.call_args_list), 1)
+        self.assertEqual(clients.get_client_stats()['id_token']['hits'], 1)
+
+    @patch('breathecode.services.google_cloud.clients.resolve_credentials', MagicMock())
+    @patch('google.auth.jwt.decode', MagicMock(return_value={'exp': time.time() + 60}))
+    @patch('google.oauth2.id_token.fetch_id_token', MagicMock(return_value='blablabla'))
+    def test_get_id_token__about_to_expire(self):
+        from google.oauth2.id_token import fetch_id_token
+
+        clients.get_id_token('https://potato.io')
+        clients.get_id_token('https://potato.io')
+
+        self.assertEqual(len(fetch_id_token.call_args_list), 2)
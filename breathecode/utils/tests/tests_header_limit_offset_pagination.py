@@ -0,0 +1,110 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.permissions import AllowAny
+from breathecode.admissions.models import Cohort
+from breathecode.utils import HeaderLimitOffsetPagination
+from .mixins import UtilsTestCase
+
+
+class CohortView(APIView, HeaderLimitOffsetPagination):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        items = Cohort.objects.all().order_by('-kickoff_date')
+        page = self.paginate_queryset(items, request)
+        data = [x.id for x in page]
+
+        if self.is_paginate(request):
+            return self.get_paginated_response(data)
+
+        return Response(data)
+
+
+class CountedCohortView(CohortView):
+    cursor_count = 'cached'
+
+
+def get_links(response) -> dict[str, str]:
+    links = {}
+    for link in response['Link'].split(', '):
+        url, rel = link.split('; ')
+        links[rel[5:-1]] = url[1:-1]
+
+    return links
+
+
+class HeaderLimitOffsetPaginationTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 cursor mode
+    """
+    def test_cursor__first_page(self):
+        self.bc.database.create(cohort=5)
+        factory = APIRequestFactory()
+        request = factory.get('/cohort?cursor=&limit=2&envelope=false')
+
+        with self.assertNumQueries(1):
+            response = CohortView.as_view()(request)
+
+        links = get_links(response)
+
+        self.assertEqual(response.data, [5, 4])
+        self.assertEqual(sorted(links.keys()), ['last', 'next'])
+        self.assertFalse(response.has_header('x-total-count'))
+
+    def test_cursor__walk_forward_and_backward(self):
+        self.bc.database.create(cohort=5)
+        factory = APIRequestFactory()
+
+        response = CohortView.as_view()(factory.get('/cohort?cursor=&limit=2&envelope=false'))
+        response = CohortView.as_view()(factory.get(get_links(response)['next']))
+        self.assertEqual(response.data, [3, 2])
+        self.assertEqual(sorted(get_links(response).keys()), ['first', 'last', 'next', 'previous'])
+
+        response = CohortView.as_view()(factory.get(get_links(response)['next']))
+        self.assertEqual(response.data, [1])
+        self.assertEqual(sorted(get_links(response).keys()), ['first', 'previous'])
+
+        response = CohortView.as_view()(factory.get(get_links(response)['previous']))
+        self.assertEqual(response.data, [3, 2])
+
+        response = CohortView.as_view()(factory.get(get_links(response)['previous']))
+        self.assertEqual(response.data, [5, 4])
+        self.assertEqual(sorted(get_links(response).keys()), ['last', 'next'])
+
+    def test_cursor__last_page(self):
+        self.bc.database.create(cohort=5)
+        factory = APIRequestFactory()
+
+        response = CohortView.as_view()(factory.get('/cohort?cursor=&limit=2&envelope=false'))
+        response = CohortView.as_view()(factory.get(get_links(response)['last']))
+
+        self.assertEqual(response.data, [2, 1])
+        self.assertEqual(sorted(get_links(response).keys()), ['first', 'previous'])
+
+    def test_cursor__with_envelope(self):
+        self.bc.database.create(cohort=3)
+        factory = APIRequestFactory()
+
+        response = CohortView.as_view()(factory.get('/cohort?cursor=&limit=2'))
+
+        self.assertEqual(response.data['count'], None)
+        self.assertEqual(response.data['results'], [3, 2])
+        self.assertEqual(response.data['first'], None)
+        self.assertEqual(response.data['previous'], None)
+
+    """
+    🔽🔽🔽 cursor mode with count
+    """
+
+    def test_cursor__with_cached_count(self):
+        self.bc.database.create(cohort=3)
+        factory = APIRequestFactory()
+
+        response = CountedCohortView.as_view()(factory.get('/cohort?cursor=&limit=2&envelope=false'))
+        self.assertEqual(response['x-total-count'], '3')
+
+        with self.assertNumQueries(1):
+            response = CountedCohortView.as_view()(factory.get('/cohort?cursor=&limit=2&envelope=false'))
+
+        self.assertEqual(response['x-total-count'], '3')
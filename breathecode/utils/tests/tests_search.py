@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, call, patch
+from breathecode.admissions.models import Cohort
+from breathecode.registry.models import Asset, AssetAlias
+from breathecode.utils import SearchBackend, create_search_indexes
+from .mixins import UtilsTestCase
+
+
+class SearchBackendTestSuite(UtilsTestCase):
+    """
+    🔽🔽🔽 Fallback without full-text
+    """
+    def test_filter__without_query(self):
+        cohort_kwargs = {'slug': 'south-park', 'name': 'South Park'}
+        self.generate_models(cohort=True, cohort_kwargs=cohort_kwargs)
+
+        backend = SearchBackend(['slug', 'name'])
+        queryset = Cohort.objects.all()
+
+        self.assertIs(backend.filter(queryset, None), queryset)
+        self.assertIs(backend.filter(queryset, ''), queryset)
+
+    def test_filter__match_any_field(self):
+        self.bc.database.create(cohort=[
+            {
+                'slug': 'kenny',
+                'name': 'South Park'
+            },
+            {
+                'slug': 'cartman',
+                'name': 'Eric Cartman'
+            },
+            {
+                'slug': 'stan',
+                'name': 'Stan Marsh'
+            },
+        ])
+
+        backend = SearchBackend(['slug', 'name'])
+
+        items = backend.filter(Cohort.objects.order_by('id'), 'CARTMAN')
+        self.assertEqual([x.slug for x in items], ['cartman'])
+
+        items = backend.filter(Cohort.objects.order_by('id'), 'par')
+        self.assertEqual([x.slug for x in items], ['kenny'])
+
+    def test_filter__related_fields_without_duplicates(self):
+        asset = Asset.objects.create(slug='kenny',
+                                     title='Kenny',
+                                     asset_type='LESSON',
+                                     url='https://4geeks.co')
+        AssetAlias.objects.create(slug='kenny-dies', asset=asset)
+        AssetAlias.objects.create(slug='kenny-dies-again', asset=asset)
+
+        backend = SearchBackend(['slug', 'title'], related=[(AssetAlias, 'asset', 'slug')])
+
+        self.assertEqual([x.slug for x in backend.filter(Asset.objects.all(), 'dies')], ['kenny'])
+        self.assertEqual([x.slug for x in backend.filter(Asset.objects.all(), 'stan')], [])
+
+    """
+    🔽🔽🔽 Full-text
+    """
+
+    @patch.object(SearchBackend, 'is_full_text', MagicMock(return_value=True))
+    def test_filter__full_text(self):
+        backend = SearchBackend(['slug', 'name'])
+        queryset = backend.filter(Cohort.objects.all(), 'south park')
+
+        self.assertEqual(queryset.query.order_by, ('-search_rank', ))
+        self.assertIn('search_vector', queryset.query.annotations)
+        self.assertIn('search_rank', queryset.query.annotations)
+
+    @patch.object(SearchBackend, 'is_full_text', MagicMock(return_value=True))
+    def test_filter__full_text_without_rank(self):
+        backend = SearchBackend(['slug', 'name'])
+        queryset = backend.filter(Cohort.objects.order_by('-kickoff_date'), 'south park', rank=False)
+
+        self.assertEqual(queryset.query.order_by, ('-kickoff_date', ))
+        self.assertNotIn('search_rank', queryset.query.annotations)
+
+    """
+    🔽🔽🔽 create_search_indexes
+    """
+
+    def test_create_search_indexes__outside_of_postgres(self):
+        schema_editor = MagicMock()
+        schema_editor.connection.vendor = 'sqlite'
+
+        operation = create_search_indexes('admissions_cohort', ['slug', 'name'])
+        operation.code(None, schema_editor)
+
+        self.assertEqual(schema_editor.execute.call_args_list, [])
+
+    def test_create_search_indexes__postgres(self):
+        schema_editor = MagicMock()
+        schema_editor.connection.vendor = 'postgresql'
+
+        operation = create_search_indexes('admissions_cohort', ['slug', 'name'])
+        operation.code(None, schema_editor)
+        operation.reverse_code(None, schema_editor)
+
+        self.assertEqual(schema_editor.execute.call_args_list, [
+            call('CREATE EXTENSION IF NOT EXISTS pg_trgm'),
+            call('CREATE INDEX IF NOT EXISTS admissions_cohort_slug_trgm ON admissions_cohort '
+                 'USING gin (UPPER(slug::text) gin_trgm_ops)'),
+            call('CREATE INDEX IF NOT EXISTS admissions_cohort_name_trgm ON admissions_cohort '
+                 'USING gin (UPPER(name::text) gin_trgm_ops)'),
+            call('CREATE INDEX IF NOT EXISTS admissions_cohort_search ON admissions_cohort '
+                 "USING gin (to_tsvector('simple'::regconfig, COALESCE(slug, '') || ' ' || "
+                 "COALESCE(name, '')))"),
+            call('DROP INDEX IF EXISTS admissions_cohort_slug_trgm'),
+            call('DROP INDEX IF EXISTS admissions_cohort_name_trgm'),
+            call('DROP INDEX IF EXISTS admissions_cohort_search'),
+        ])